@@ -0,0 +1,77 @@
+"""Pre-rasterize the built-in GUI icons into an embedded PNG atlas.
+
+Renders every named icon in ``gui/icons.py`` at each of ``ATLAS_SIZES`` in
+the default icon color and writes the PNGs (base64) to
+``src/antidetect_launcher/gui/icons_atlas.py``. Re-run after changing any
+icon SVG or the rasterization settings:
+
+    python scripts/generate_icon_atlas.py
+"""
+
+import base64
+import importlib.util
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QBuffer, QIODevice
+from PyQt6.QtGui import QGuiApplication
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+GUI_DIR = PROJECT_ROOT / "src" / "antidetect_launcher" / "gui"
+OUTPUT = GUI_DIR / "icons_atlas.py"
+
+HEADER = '''"""Pre-rasterized PNG atlas for the built-in GUI icons.
+
+Generated by scripts/generate_icon_atlas.py - do not edit by hand.
+"""
+
+import base64
+
+_ENCODED: dict[str, dict[int, str]] = {
+'''
+
+FOOTER = '''}
+
+# name -> {pixel size -> PNG bytes}
+ATLAS: dict[str, dict[int, bytes]] = {
+    name: {size: base64.b64decode(data) for size, data in sizes.items()}
+    for name, sizes in _ENCODED.items()
+}
+'''
+
+
+def _load_icons_module():
+    """Load gui/icons.py standalone so the SVG path is always used."""
+    spec = importlib.util.spec_from_file_location("_icons", GUI_DIR / "icons.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def main() -> int:
+    app = QGuiApplication(sys.argv)  # noqa: F841 - required for QPixmap
+    icons = _load_icons_module()
+
+    lines = [HEADER]
+    for name in icons._ICONS:
+        lines.append(f"    \"{name}\": {{\n")
+        for size in icons.ATLAS_SIZES:
+            image = icons._rasterize(icons._get_renderer(name), size)
+            buffer = QBuffer()
+            buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+            image.save(buffer, "PNG")
+            encoded = base64.b64encode(bytes(buffer.data())).decode("ascii")
+            lines.append(f"        {size}: \"{encoded}\",\n")
+        lines.append("    },\n")
+    lines.append(FOOTER)
+
+    OUTPUT.write_text("".join(lines), encoding="utf-8")
+    print(f"Wrote {OUTPUT.relative_to(PROJECT_ROOT)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,7 +2,9 @@
 
 import asyncio
 import signal
+import sys
 from pathlib import Path
+from typing import Any, Coroutine
 
 import click
 
@@ -19,6 +21,23 @@ from .infrastructure import (
 from .application import TaskRunner
 
 
+def _run(main: Coroutine[Any, Any, None]) -> None:
+    """Run a worker coroutine, on uvloop when it is installed.
+
+    Only the headless commands go through here - the GUI runs on qasync's
+    Qt-integrated loop, which uvloop cannot replace.
+    """
+    if sys.platform != "win32":
+        try:
+            import uvloop
+
+            uvloop.run(main)
+            return
+        except ImportError:
+            pass
+    asyncio.run(main)
+
+
 class Application:
     """Main application container."""
 
@@ -28,6 +47,7 @@ class Application:
 
         self._redis: RedisClient | None = None
         self._browser_pool: BrowserPool | None = None
+        self._proxy_manager: ProxyManager | None = None
         self._task_runner: TaskRunner | None = None
         self._running = False
 
@@ -62,6 +82,7 @@ class Application:
             max_retries=self._config.proxy.max_retries,
             retry_delay=self._config.proxy.retry_delay,
         )
+        self._proxy_manager = proxy_manager
 
         proxy_file = Path(self._config.proxy.list_file)
         if proxy_file.exists():
@@ -117,6 +138,9 @@ class Application:
             await self._browser_pool.shutdown()
             self._logger.info("Browser pool closed")
 
+        if self._proxy_manager:
+            await self._proxy_manager.close()
+
         if self._redis:
             await self._redis.disconnect()
             self._logger.info("Redis disconnected")
@@ -171,7 +195,7 @@ def run(ctx: click.Context) -> None:
         finally:
             await app.stop()
 
-    asyncio.run(main())
+    _run(main())
 
 
 @cli.command()
@@ -218,7 +242,7 @@ def execute(ctx: click.Context, script: str, profile: str | None, count: int) ->
         finally:
             await app.stop()
 
-    asyncio.run(main())
+    _run(main())
 
 
 @cli.command()
@@ -246,13 +270,16 @@ def validate_proxies(ctx: click.Context) -> None:
         click.echo(f"Loaded {count} proxies")
 
         click.echo("Validating proxies...")
-        stats = await proxy_manager.validate_all()
+        try:
+            stats = await proxy_manager.validate_all()
+        finally:
+            await proxy_manager.close()
 
         click.echo("\nResults:")
         for status, count in stats.items():
             click.echo(f"  {status.value}: {count}")
 
-    asyncio.run(main())
+    _run(main())
 
 
 def main() -> None:
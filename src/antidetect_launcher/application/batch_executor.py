@@ -259,15 +259,13 @@ class BatchExecutor:
                 result.duration_seconds = time.time() - start_time
                 result.session_id = session.id
 
-                if result.status == RegistrationStatus.SUCCESS:
-                    result.cookies = await page.context.cookies()
-
-                    if self._config.screenshot_on_success:
-                        path = f"/data/screenshots/{session.id}_success.png"
-                        await page.screenshot(path=path)
-                        result.screenshots.append(path)
-
-                return result
+                if (
+                    result.status == RegistrationStatus.SUCCESS
+                    and self._config.screenshot_on_success
+                ):
+                    path = f"/data/screenshots/{session.id}_success.png"
+                    await page.screenshot(path=path)
+                    result.screenshots.append(path)
 
             except Exception as e:
                 if self._config.screenshot_on_error:
@@ -289,6 +287,13 @@ class BatchExecutor:
                     screenshots=screenshots,
                 )
 
+        if result.status == RegistrationStatus.SUCCESS:
+            # The pool exports the cookie jar into the profile when the
+            # context closes; reuse it rather than dumping it twice over IPC
+            result.cookies = session.profile.cookies
+
+        return result
+
     def _create_cancelled_result(self, task_id: str) -> RegistrationResult:
         """Create result for cancelled task."""
         return RegistrationResult(
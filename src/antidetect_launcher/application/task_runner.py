@@ -129,9 +129,9 @@ class TaskRunner:
         """Worker loop that processes tasks."""
         while self._running:
             try:
+                # dequeue() blocks briefly on an empty queue - no extra sleep
                 task = await self._task_queue.dequeue()
                 if not task:
-                    await asyncio.sleep(0.5)
                     continue
 
                 result = await self._execute_task(task)
@@ -30,6 +30,8 @@ class BrowserPoolPort(ABC):
     ) -> AsyncIterator[BrowserContext]:
         """Acquire a browser context from pool.
 
+        On exit, the context's cookies are written back to ``profile.cookies``.
+
         Args:
             profile: Browser profile to use for context.
 
@@ -29,14 +29,14 @@ from PyQt6.QtWidgets import (
     QStackedWidget,
 )
 from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QShortcut, QKeySequence
+from PyQt6.QtGui import QShortcut, QKeySequence, QPixmapCache
 import qasync
 
 from .models import BrowserProfile, ProfileStatus
 from .storage import Storage, StorageError, ProfileNotFoundError
 from .launcher import BrowserLauncher
 from .theme import Theme
-from .icons import get_icon
+from .icons import get_icon, prewarm_icons
 from .security import install_secure_logging
 from .paths import get_data_dir
 from .tray import SystemTray, find_icon
@@ -58,7 +58,13 @@ from .dialogs_popup import (
     show_settings_popup,
 )
 from .modal import confirm_dialog, info_dialog
-from .proxy_utils import ping_proxy, detect_proxy_geo
+from .proxy_utils import (
+    ping_proxy,
+    ping_many,
+    detect_proxy_geo,
+    detect_geo_many,
+    close_session as close_proxy_session,
+)
 from .components import MiniSidebar
 from .pages import ProfilesPage, ProxyPage, TagsPage, TrashPage
 
@@ -71,7 +77,8 @@ class MainWindow(QMainWindow):
 
         # Use platform-specific data directory
         data_dir = get_data_dir()
-        self.storage = Storage()  # Uses get_data_dir() automatically
+        # Uses get_data_dir() automatically; file writes run off the GUI thread
+        self.storage = Storage(background_io=True)
         self.settings = self.storage.get_settings()
         self.launcher = BrowserLauncher(data_dir / "browser_data", self.settings)
 
@@ -934,22 +941,24 @@ class MainWindow(QMainWindow):
 
     def _on_tag_deleted(self, tag: str):
         """Handle tag deletion - remove from pool and all profiles."""
-        self.storage.remove_tag_from_pool(tag)
-        for profile in self.storage.get_profiles():
-            if tag in profile.tags:
-                profile.tags.remove(tag)
-                self.storage.update_profile(profile)
+        with self.storage.batch():
+            self.storage.remove_tag_from_pool(tag)
+            for profile in self.storage.get_profiles():
+                if tag in profile.tags:
+                    profile.tags.remove(tag)
+                    self.storage.update_profile(profile)
         self._refresh_table()
         self._refresh_tags()
 
     def _on_tag_renamed(self, old_name: str, new_name: str):
         """Handle tag rename - update pool and all profiles."""
-        self.storage.rename_tag_in_pool(old_name, new_name)
-        for profile in self.storage.get_profiles():
-            if old_name in profile.tags:
-                profile.tags.remove(old_name)
-                profile.tags.append(new_name)
-                self.storage.update_profile(profile)
+        with self.storage.batch():
+            self.storage.rename_tag_in_pool(old_name, new_name)
+            for profile in self.storage.get_profiles():
+                if old_name in profile.tags:
+                    profile.tags.remove(old_name)
+                    profile.tags.append(new_name)
+                    self.storage.update_profile(profile)
         self._refresh_table()
         self._refresh_tags()
 
@@ -1032,9 +1041,10 @@ class MainWindow(QMainWindow):
 
         new_tags = show_tags_edit_popup(self, profiles[0].tags, self.storage.get_all_tags())
         if new_tags is not None:
-            for profile in profiles:
-                profile.tags = new_tags
-                self.storage.update_profile(profile)
+            with self.storage.batch():
+                for profile in profiles:
+                    profile.tags = new_tags
+                    self.storage.update_profile(profile)
             self._refresh_table()
             self._refresh_tags()
 
@@ -1052,9 +1062,10 @@ class MainWindow(QMainWindow):
             note_templates=self.storage.get_note_templates_pool(),
         )
         if new_notes is not None:
-            for profile in profiles:
-                profile.notes = new_notes
-                self.storage.update_profile(profile)
+            with self.storage.batch():
+                for profile in profiles:
+                    profile.notes = new_notes
+                    self.storage.update_profile(profile)
             self._refresh_table()
 
     def _batch_ping_profiles(self, profile_ids: list[str]):
@@ -1131,11 +1142,12 @@ class MainWindow(QMainWindow):
                     await self._stop_profile(profile)
 
             # Then delete
-            for pid in profile_ids:
-                try:
-                    self.storage.delete_profile(pid)
-                except (ValueError, ProfileNotFoundError, StorageError) as e:
-                    logger.warning("Failed to delete profile %s: %s", pid, e)
+            with self.storage.batch():
+                for pid in profile_ids:
+                    try:
+                        self.storage.delete_profile(pid)
+                    except (ValueError, ProfileNotFoundError, StorageError) as e:
+                        logger.warning("Failed to delete profile %s: %s", pid, e)
             self._refresh_folders()
             self._refresh_table()
             self._refresh_trash()
@@ -1150,16 +1162,18 @@ class MainWindow(QMainWindow):
 
     def _restore_profiles_from_trash(self, profile_ids: list[str]):
         """Restore profiles from trash."""
-        for pid in profile_ids:
-            self.storage.restore_from_trash(pid)
+        with self.storage.batch():
+            for pid in profile_ids:
+                self.storage.restore_from_trash(pid)
         self._refresh_folders()
         self._refresh_table()
         self._refresh_trash()
 
     def _permanently_delete_profiles(self, profile_ids: list[str]):
         """Permanently delete profiles from trash."""
-        for pid in profile_ids:
-            self.storage.permanently_delete(pid)
+        with self.storage.batch():
+            for pid in profile_ids:
+                self.storage.permanently_delete(pid)
         self._refresh_trash()
 
     def _empty_trash(self):
@@ -1183,21 +1197,19 @@ class MainWindow(QMainWindow):
 
     async def _do_batch_ping_proxies(self, proxies: list):
         """Perform batch proxy ping with concurrency limit."""
-        # Limit concurrent pings to avoid overwhelming network
-        semaphore = asyncio.Semaphore(10)  # Max 10 simultaneous pings
-
-        async def ping_one(proxy) -> None:
-            async with semaphore:
-                ping_ms = await ping_proxy(proxy)
-                proxy.ping_ms = ping_ms
-                if ping_ms > 0 and not proxy.country_code:
-                    geo = await detect_proxy_geo(proxy)
-                    if geo:
-                        proxy.country_code = geo.get("country_code", "")
-                        proxy.country_name = geo.get("country_name", "")
-
-        tasks = [ping_one(p) for p in proxies]
-        await asyncio.gather(*tasks, return_exceptions=True)
+        # Limit concurrent pings and geo lookups to avoid overwhelming network
+        latencies = await ping_many(proxies, concurrency=10)
+        needs_geo = []
+        for proxy, ping_ms in zip(proxies, latencies, strict=True):
+            proxy.ping_ms = ping_ms
+            if ping_ms > 0 and not proxy.country_code:
+                needs_geo.append(proxy)
+
+        geos = await detect_geo_many(needs_geo, concurrency=10)
+        for proxy, geo in zip(needs_geo, geos, strict=True):
+            if geo:
+                proxy.country_code = geo.get("country_code", "")
+                proxy.country_name = geo.get("country_name", "")
         self.proxy_page._refresh_table()
 
     def _batch_delete_proxies(self, indices: list[int]):
@@ -1231,12 +1243,13 @@ class MainWindow(QMainWindow):
             "Delete Tags",
             f"Delete {len(tag_names)} selected tags?",
         ):
-            for tag in tag_names:
-                self.storage.remove_tag_from_pool(tag)
-                for profile in self.storage.get_profiles():
-                    if tag in profile.tags:
-                        profile.tags.remove(tag)
-                        self.storage.update_profile(profile)
+            with self.storage.batch():
+                for tag in tag_names:
+                    self.storage.remove_tag_from_pool(tag)
+                    for profile in self.storage.get_profiles():
+                        if tag in profile.tags:
+                            profile.tags.remove(tag)
+                            self.storage.update_profile(profile)
             self._refresh_tags()
             self._refresh_table()
             self.tags_page._deselect_all_tags()
@@ -1327,17 +1340,17 @@ class MainWindow(QMainWindow):
         self.storage.update_settings(self.settings)
 
         # Graceful shutdown all running browsers
+        from PyQt6.QtCore import QTimer, QEventLoop
+
+        loop = asyncio.get_event_loop()
         running_count = self.launcher.get_running_count()
         if running_count > 0:
             logger.info("Closing %d running browsers before exit...", running_count)
-            loop = asyncio.get_event_loop()
             if loop.is_running():
                 # Schedule cleanup and wait for it with timeout
                 cleanup_future = asyncio.ensure_future(self.launcher.cleanup())
 
                 # Process events until cleanup is done (max 15s)
-                from PyQt6.QtCore import QTimer, QEventLoop
-
                 wait_loop = QEventLoop()
                 cleanup_future.add_done_callback(lambda _: wait_loop.quit())
                 QTimer.singleShot(15000, wait_loop.quit)  # Safety timeout
@@ -1346,6 +1359,18 @@ class MainWindow(QMainWindow):
             # Stop watchdog even if no browsers running
             self.launcher.stop_watchdog()
 
+        # Release the shared proxy-check HTTP session
+        if loop.is_running():
+            close_future = asyncio.ensure_future(close_proxy_session())
+            wait_loop = QEventLoop()
+            close_future.add_done_callback(lambda _: wait_loop.quit())
+            QTimer.singleShot(2000, wait_loop.quit)  # Safety timeout
+            wait_loop.exec()
+
+        # Settings/profile saves above may still be queued on the I/O thread
+        if not self.storage.wait_for_writes(5000):
+            logger.warning("Timed out waiting for storage writes to finish")
+
         # Hide tray icon before exit
         self._tray.hide()
         event.accept()
@@ -1374,6 +1399,11 @@ def main():
 
     app = QApplication(sys.argv)
     app.setStyle("Fusion")
+    # Rasterized icons live in the shared pixmap cache (limit in KiB)
+    QPixmapCache.setCacheLimit(10240)
+    # Sizes used by toolbars, table rows and the sidebar, plus the extra
+    # sizes every QIcon carries
+    prewarm_icons(sizes=(14, 16, 20, 24, 32))
     app.setProperty("inline_alert_ttl_ms", config.gui.inline_alert_ttl_ms)
 
     # Set application icon (works in dev, pip, and PyInstaller modes)
@@ -53,8 +53,11 @@ class ProfileDialog(QDialog):
         self.is_new = profile is None
         self.storage = storage
         self._regenerate_on_save = False  # Flag for fingerprint regeneration
+        # Build the whole widget tree before the first paint
+        self.setUpdatesEnabled(False)
         self._setup_ui()
         self._load_data()
+        self.setUpdatesEnabled(True)
 
     def _setup_ui(self):
         self.setWindowTitle("New Profile" if self.is_new else "Edit Profile")
@@ -338,7 +341,9 @@ class QuickProfileDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.profile = BrowserProfile()
+        self.setUpdatesEnabled(False)
         self._setup_ui()
+        self.setUpdatesEnabled(True)
 
     def _setup_ui(self):
         self.setWindowTitle("Quick Profile")
@@ -401,8 +406,10 @@ class FolderDialog(QDialog):
     def __init__(self, folder: Folder | None = None, parent=None):
         super().__init__(parent)
         self.folder = folder or Folder()
+        self.setUpdatesEnabled(False)
         self._setup_ui()
         self._load_data()
+        self.setUpdatesEnabled(True)
 
     def _setup_ui(self):
         self.setWindowTitle("New Folder" if not self.folder.name else "Edit Folder")
@@ -499,10 +506,17 @@ class TagsEditDialog(QDialog):
 
     def __init__(self, current_tags: list[str], all_tags: list[str], parent=None):
         super().__init__(parent)
-        self.current_tags = list(current_tags)
+        # Caller's list is never mutated; it is read as-is until the first
+        # edit, which copies it once into a working list (+ set for lookups)
+        self._original = current_tags
+        self._original_set = set(current_tags)
+        self._edited: list[str] | None = None
+        self._edited_set: set[str] | None = None
         self.all_tags = all_tags
-        self.available_tags = [t for t in self.all_tags if t not in self.current_tags]
+        self.available_tags = [t for t in self.all_tags if t not in self._original_set]
+        self.setUpdatesEnabled(False)
         self._setup_ui()
+        self.setUpdatesEnabled(True)
 
     def _setup_ui(self):
         self.setWindowTitle("Edit Tags")
@@ -584,9 +598,35 @@ class TagsEditDialog(QDialog):
 
         layout.addLayout(btn_layout)
 
+    def _current_tags(self) -> list[str]:
+        """Tags as currently edited (read-only view when nothing changed)."""
+        return self._original if self._edited is None else self._edited
+
+    def _has_tag(self, tag: str) -> bool:
+        tags = self._original_set if self._edited_set is None else self._edited_set
+        return tag in tags
+
+    def _edit_tags(self) -> tuple[list[str], set[str]]:
+        """Working list and set, copied from the original on first edit."""
+        if self._edited is None:
+            self._edited = list(self._original)
+            self._edited_set = set(self._original_set)
+        return self._edited, self._edited_set
+
+    def _add_edited_tag(self, tag: str) -> None:
+        tags, tag_set = self._edit_tags()
+        tags.append(tag)
+        tag_set.add(tag)
+
+    def _remove_edited_tag(self, tag: str) -> None:
+        tags, tag_set = self._edit_tags()
+        tags.remove(tag)
+        if tag not in tags:  # Duplicates in the original keep it present
+            tag_set.discard(tag)
+
     def _refresh_tags_list(self):
         self.tags_list.clear()
-        for tag in self.current_tags:
+        for tag in self._current_tags():
             item = QListWidgetItem(f"✕  {tag}")
             item.setData(Qt.ItemDataRole.UserRole, tag)
             self.tags_list.addItem(item)
@@ -619,10 +659,10 @@ class TagsEditDialog(QDialog):
         tag = item.text().strip()
         if not tag:
             return
-        if tag in self.current_tags:
+        if self._has_tag(tag):
             self._alert.show_error("Duplicate", f"Tag '{tag}' already added.")
             return
-        self.current_tags.append(tag)
+        self._add_edited_tag(tag)
         if tag in self.available_tags:
             self.available_tags.remove(tag)
         self._refresh_tags_list()
@@ -632,10 +672,10 @@ class TagsEditDialog(QDialog):
         tag = self.new_tag_input.text().strip()
         if not tag:
             return
-        if tag in self.current_tags:
+        if self._has_tag(tag):
             self._alert.show_error("Duplicate", f"Tag '{tag}' already added.")
             return
-        self.current_tags.append(tag)
+        self._add_edited_tag(tag)
         if tag in self.available_tags:
             self.available_tags.remove(tag)
         self._refresh_tags_list()
@@ -644,8 +684,8 @@ class TagsEditDialog(QDialog):
 
     def _remove_tag(self, item: QListWidgetItem):
         tag = item.data(Qt.ItemDataRole.UserRole)
-        if tag in self.current_tags:
-            self.current_tags.remove(tag)
+        if self._has_tag(tag):
+            self._remove_edited_tag(tag)
             self._refresh_tags_list()
             if tag in self.all_tags and tag not in self.available_tags:
                 self.available_tags.append(tag)
@@ -653,7 +693,9 @@ class TagsEditDialog(QDialog):
                 self._refresh_available_list()
 
     def get_tags(self) -> list[str]:
-        return self.current_tags
+        if self.result() != QDialog.DialogCode.Accepted:
+            return list(self._original)
+        return list(self._current_tags())
 
 
 class NotesEditDialog(QDialog):
@@ -668,7 +710,9 @@ class NotesEditDialog(QDialog):
         super().__init__(parent)
         self.notes = notes
         self._note_templates = list(note_templates or [])
+        self.setUpdatesEnabled(False)
         self._setup_ui()
+        self.setUpdatesEnabled(True)
 
     def _setup_ui(self):
         self.setWindowTitle("Edit Notes")
@@ -800,7 +844,9 @@ class ProxyPoolDialog(QDialog):
     def __init__(self, proxies: list[ProxyConfig], parent=None):
         super().__init__(parent)
         self.proxies = list(proxies)
+        self.setUpdatesEnabled(False)
         self._setup_ui()
+        self.setUpdatesEnabled(True)
 
     def _setup_ui(self):
         self.setWindowTitle("Proxy Pool")
@@ -904,7 +950,9 @@ class StatusEditDialog(QDialog):
         super().__init__(parent)
         self._name = name
         self._color = color
+        self.setUpdatesEnabled(False)
         self._setup_ui()
+        self.setUpdatesEnabled(True)
 
     def _setup_ui(self):
         self.setWindowTitle("Edit Status")
@@ -1996,8 +2044,10 @@ class ProfileDataDialog(QDialog):
 
     def _import_cookies(self):
         """Import cookies from JSON file."""
+        import contextlib
         import sqlite3
         import json
+        import time
         from PyQt6.QtWidgets import QFileDialog
 
         file_path, _ = QFileDialog.getOpenFileName(
@@ -2015,34 +2065,46 @@ class ProfileDataDialog(QDialog):
             if not isinstance(cookies, list):
                 raise ValueError("Invalid cookies format")
 
-            conn = sqlite3.connect(str(cookies_db))
-            cursor = conn.cursor()
-
-            imported = 0
+            # Drop expired cookies and duplicates before touching the database;
+            # session cookies (expires -1/0/missing) are kept
+            now = time.time()
+            scalar = (str, int, float, type(None))  # What sqlite can bind
+            rows = {}  # (name, domain, path) -> row; last one wins like REPLACE
             for cookie in cookies:
-                try:
-                    cursor.execute(
-                        """
-                        INSERT OR REPLACE INTO moz_cookies 
-                        (host, name, value, path, expiry, isSecure, isHttpOnly, sameSite, rawSameSite, schemeMap)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, 0, 0, 0)
-                    """,
-                        (
-                            cookie.get("domain", ""),
-                            cookie.get("name", ""),
-                            cookie.get("value", ""),
-                            cookie.get("path", "/"),
-                            cookie.get("expires") or cookie.get("expiry", 0),
-                            1 if cookie.get("secure") else 0,
-                            1 if cookie.get("httpOnly") else 0,
-                        ),
-                    )
-                    imported += 1
-                except Exception:
-                    pass
+                if not isinstance(cookie, dict):
+                    continue
+                expires = cookie.get("expires") or cookie.get("expiry", 0)
+                name = cookie.get("name", "")
+                domain = cookie.get("domain", "")
+                path = cookie.get("path", "/")
+                value = cookie.get("value", "")
+                # Skip malformed entries (nested values) instead of failing
+                # the whole import on them
+                if not all(isinstance(v, scalar) for v in (expires, name, domain, path, value)):
+                    continue
+                if isinstance(expires, (int, float)) and 0 < expires < now:
+                    continue
+                rows[(name, domain, path)] = (
+                    domain,
+                    name,
+                    value,
+                    path,
+                    expires,
+                    1 if cookie.get("secure") else 0,
+                    1 if cookie.get("httpOnly") else 0,
+                )
 
-            conn.commit()
-            conn.close()
+            with contextlib.closing(sqlite3.connect(str(cookies_db))) as conn:
+                conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO moz_cookies 
+                    (host, name, value, path, expiry, isSecure, isHttpOnly, sameSite, rawSameSite, schemeMap)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, 0, 0, 0)
+                """,
+                    rows.values(),
+                )
+                conn.commit()
+            imported = len(rows)
 
             info_dialog(self, "Imported", f"Imported {imported} cookies")
             self._load_cookies()
@@ -37,8 +37,11 @@ class FolderDialog(BaseDialog):
         """
         super().__init__(parent)
         self.folder: Folder = folder or Folder()
+        # Build the whole widget tree before the first paint
+        self.setUpdatesEnabled(False)
         self._setup_ui()
         self._load_data()
+        self.setUpdatesEnabled(True)
 
     def _setup_ui(self) -> None:
         """Setup dialog UI components."""
@@ -1,207 +1,402 @@
 """SVG icons for GUI."""
 
-from PyQt6.QtCore import QSize, Qt
-from PyQt6.QtGui import QIcon, QPainter, QPixmap, QColor
+import functools
+from collections.abc import Iterable
+
+from PyQt6.QtCore import QObject, QRectF, QRunnable, QSize, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QGuiApplication, QIcon, QImage, QPainter, QPixmap, QPixmapCache, QColor
 from PyQt6.QtSvg import QSvgRenderer
 from PyQt6.QtCore import QByteArray
 
 # Icon color for dark theme - white
 ICON_COLOR = "#ffffff"  # White icons for dark theme
 
+# Logical sizes attached to every built QIcon, besides the requested one
+ICON_SIZES = (16, 20, 24, 32)
+
+# Pixel sizes pre-rasterized into icons_atlas.py (scripts/generate_icon_atlas.py);
+# 28/40 cover the 14/20 px icons on 2x screens
+ATLAS_SIZES = (14, 16, 20, 24, 28, 32, 40, 48)
+
+try:
+    from .icons_atlas import ATLAS as _ATLAS
+except ImportError:  # Atlas not generated, or module loaded standalone
+    _ATLAS: dict[str, dict[int, bytes]] = {}
+
 
+@functools.lru_cache(maxsize=512)
 def svg_icon(svg_data: str, size: int = 16, color: str = None) -> QIcon:
-    """Create QIcon from SVG string with proper color for dark theme."""
+    """Create QIcon from SVG string with proper color for dark theme.
+
+    Results are cached by ``(svg_data, size, color)``; QIcon is implicitly
+    shared so handing out the same instance is safe. The cache fills lazily,
+    so the first call must happen after QApplication is constructed.
+    """
+    # Built-in icons reuse the pre-encoded bytes / atlas / mask pipeline
+    name = _NAME_BY_SVG.get(svg_data)
+    if name is not None:
+        return _build_icon(name, size, color or ICON_COLOR, _device_pixel_ratio())
+
     # Replace currentColor with actual color
     actual_color = color or ICON_COLOR
     colored_svg = svg_data.replace("currentColor", actual_color)
-
     renderer = QSvgRenderer(QByteArray(colored_svg.encode()))
-    pixmap = QPixmap(size, size)
-    pixmap.fill(Qt.GlobalColor.transparent)  # Transparent background
-    painter = QPainter(pixmap)
+    dpr = _device_pixel_ratio()
+    icon = QIcon()
+    for pixmap_size in (size, *(s for s in ICON_SIZES if s != size)):
+        pixmap = QPixmap.fromImage(_rasterize(renderer, _pixel_size(pixmap_size, dpr)))
+        pixmap.setDevicePixelRatio(dpr)
+        icon.addPixmap(pixmap)
+    return icon
+
+
+def _device_pixel_ratio() -> float:
+    """Device pixel ratio of the primary screen (1.0 without a screen)."""
+    screen = QGuiApplication.primaryScreen()
+    return screen.devicePixelRatio() if screen is not None else 1.0
+
+
+def _pixel_size(size: int, dpr: float) -> int:
+    """Physical pixel size for a logical icon size."""
+    return max(1, round(size * dpr))
+
+
+def _cache_key(name: str, size: int, color: str, dpr: float) -> str:
+    """QPixmapCache key for a logical-size icon rendered at ``dpr``."""
+    return f"icon:{name}:{size}:{color}:{dpr:g}"
+
+
+def _rasterize(renderer: QSvgRenderer, size: int) -> QImage:
+    """Render a parsed SVG into a square transparent image of ``size`` pixels.
+
+    Renders into a premultiplied QImage rather than a QPixmap: the raster
+    buffer is cleared with a plain zero fill instead of a color fill, the
+    mask path reads it without a pixmap -> image round trip, and the
+    result is safe to produce off the GUI thread.
+    """
+    image = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(0)  # QImage memory is uninitialized
+    painter = QPainter(image)
     painter.setRenderHint(QPainter.RenderHint.Antialiasing)
     renderer.render(painter)
     painter.end()
-    return QIcon(pixmap)
+    return image
 
 
 # === Action Icons ===
 
-ICON_EDIT = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-<path d="M11 4H4a2 2 0 0 0-2 2v14a2 2 0 0 0 2 2h14a2 2 0 0 0 2-2v-7"/>
-<path d="M18.5 2.5a2.121 2.121 0 0 1 3 3L12 15l-4 1 1-4 9.5-9.5z"/>
-</svg>"""
-
-ICON_PLAY = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="currentColor">
-<polygon points="5,3 19,12 5,21"/>
-</svg>"""
-
-ICON_STOP = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="currentColor">
-<rect x="4" y="4" width="16" height="16" rx="2"/>
-</svg>"""
-
-ICON_DELETE = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-<path d="M3 6h18"/>
-<path d="M19 6v14a2 2 0 0 1-2 2H7a2 2 0 0 1-2-2V6"/>
-<path d="M8 6V4a2 2 0 0 1 2-2h4a2 2 0 0 1 2 2v2"/>
-</svg>"""
-
-ICON_REFRESH = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-<path d="M23 4v6h-6"/>
-<path d="M1 20v-6h6"/>
-<path d="M3.51 9a9 9 0 0 1 14.85-3.36L23 10M1 14l4.64 4.36A9 9 0 0 0 20.49 15"/>
-</svg>"""
-
-ICON_PING = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-<path d="M5 12.55a11 11 0 0 1 14.08 0"/>
-<path d="M1.42 9a16 16 0 0 1 21.16 0"/>
-<path d="M8.53 16.11a6 6 0 0 1 6.95 0"/>
-<circle cx="12" cy="20" r="1"/>
-</svg>"""
-
-ICON_SWAP = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-<path d="M16 3l4 4-4 4"/>
-<path d="M20 7H4"/>
-<path d="M8 21l-4-4 4-4"/>
-<path d="M4 17h16"/>
-</svg>"""
-
-ICON_PLUS = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-<line x1="12" y1="5" x2="12" y2="19"/>
-<line x1="5" y1="12" x2="19" y2="12"/>
-</svg>"""
-
-ICON_FOLDER = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-<path d="M22 19a2 2 0 0 1-2 2H4a2 2 0 0 1-2-2V5a2 2 0 0 1 2-2h5l2 3h9a2 2 0 0 1 2 2z"/>
-</svg>"""
-
-ICON_FOLDER_OPEN = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-<path d="M22 19a2 2 0 0 1-2 2H4a2 2 0 0 1-2-2V5a2 2 0 0 1 2-2h5l2 3h9a2 2 0 0 1 2 2v1"/>
-<path d="M4 10h16l-2 9H6z"/>
-</svg>"""
-
-ICON_TAG = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-<path d="M20.59 13.41l-7.17 7.17a2 2 0 0 1-2.83 0L2 12V2h10l8.59 8.59a2 2 0 0 1 0 2.82z"/>
-<circle cx="7" cy="7" r="1"/>
-</svg>"""
-
-ICON_SETTINGS = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-<circle cx="12" cy="12" r="3"/>
-<path d="M19.4 15a1.65 1.65 0 0 0 .33 1.82l.06.06a2 2 0 0 1 0 2.83 2 2 0 0 1-2.83 0l-.06-.06a1.65 1.65 0 0 0-1.82-.33 1.65 1.65 0 0 0-1 1.51V21a2 2 0 0 1-2 2 2 2 0 0 1-2-2v-.09A1.65 1.65 0 0 0 9 19.4a1.65 1.65 0 0 0-1.82.33l-.06.06a2 2 0 0 1-2.83 0 2 2 0 0 1 0-2.83l.06-.06a1.65 1.65 0 0 0 .33-1.82 1.65 1.65 0 0 0-1.51-1H3a2 2 0 0 1-2-2 2 2 0 0 1 2-2h.09A1.65 1.65 0 0 0 4.6 9a1.65 1.65 0 0 0-.33-1.82l-.06-.06a2 2 0 0 1 0-2.83 2 2 0 0 1 2.83 0l.06.06a1.65 1.65 0 0 0 1.82.33H9a1.65 1.65 0 0 0 1-1.51V3a2 2 0 0 1 2-2 2 2 0 0 1 2 2v.09a1.65 1.65 0 0 0 1 1.51 1.65 1.65 0 0 0 1.82-.33l.06-.06a2 2 0 0 1 2.83 0 2 2 0 0 1 0 2.83l-.06.06a1.65 1.65 0 0 0-.33 1.82V9a1.65 1.65 0 0 0 1.51 1H21a2 2 0 0 1 2 2 2 2 0 0 1-2 2h-.09a1.65 1.65 0 0 0-1.51 1z"/>
-</svg>"""
-
-ICON_PROXY = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-<circle cx="12" cy="12" r="10"/>
-<line x1="2" y1="12" x2="22" y2="12"/>
-<path d="M12 2a15.3 15.3 0 0 1 4 10 15.3 15.3 0 0 1-4 10 15.3 15.3 0 0 1-4-10 15.3 15.3 0 0 1 4-10z"/>
-</svg>"""
-
-ICON_CHEVRON_LEFT = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-<polyline points="15 18 9 12 15 6"/>
-</svg>"""
-
-ICON_CHEVRON_RIGHT = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-<polyline points="9 18 15 12 9 6"/>
-</svg>"""
-
-ICON_SEARCH = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-<circle cx="11" cy="11" r="8"/>
-<line x1="21" y1="21" x2="16.65" y2="16.65"/>
-</svg>"""
-
-ICON_COPY = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-<rect x="9" y="9" width="13" height="13" rx="2" ry="2"/>
-<path d="M5 15H4a2 2 0 0 1-2-2V4a2 2 0 0 1 2-2h9a2 2 0 0 1 2 2v1"/>
-</svg>"""
-
-ICON_NOTE = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-<path d="M14.5 2H6a2 2 0 0 0-2 2v16a2 2 0 0 0 2 2h12a2 2 0 0 0 2-2V7.5L14.5 2z"/>
-<polyline points="14 2 14 8 20 8"/>
-<line x1="16" y1="13" x2="8" y2="13"/>
-<line x1="16" y1="17" x2="8" y2="17"/>
-</svg>"""
-
-ICON_CLOSE = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-<line x1="18" y1="6" x2="6" y2="18"/>
-<line x1="6" y1="6" x2="18" y2="18"/>
-</svg>"""
-
-ICON_CHECK = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-<polyline points="20 6 9 17 4 12"/>
-</svg>"""
-
-ICON_TRASH = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-<polyline points="3 6 5 6 21 6"/>
-<path d="M19 6v14a2 2 0 0 1-2 2H7a2 2 0 0 1-2-2V6m3 0V4a2 2 0 0 1 2-2h4a2 2 0 0 1 2 2v2"/>
-<line x1="10" y1="11" x2="10" y2="17"/>
-<line x1="14" y1="11" x2="14" y2="17"/>
-</svg>"""
-
-ICON_RESTORE = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-<path d="M3 12a9 9 0 1 0 9-9 9.75 9.75 0 0 0-6.74 2.74L3 8"/>
-<path d="M3 3v5h5"/>
-</svg>"""
-
-ICON_USER = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-<path d="M20 21v-2a4 4 0 0 0-4-4H8a4 4 0 0 0-4 4v2"/>
-<circle cx="12" cy="7" r="4"/>
-</svg>"""
-
-ICON_STATUS = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-<rect x="3" y="3" width="7" height="7"/>
-<rect x="14" y="3" width="7" height="7"/>
-<rect x="14" y="14" width="7" height="7"/>
-<rect x="3" y="14" width="7" height="7"/>
-</svg>"""
-
-ICON_WINDOWS = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="currentColor">
-<path d="M0 3.449L9.75 2.1v9.451H0m10.949-9.602L24 0v11.4H10.949M0 12.6h9.75v9.451L0 20.699M10.949 12.6H24V24l-12.9-1.801"/>
-</svg>"""
-
-ICON_APPLE = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="currentColor">
-<path d="M18.71 19.5c-.83 1.24-1.71 2.45-3.05 2.47-1.34.03-1.77-.79-3.29-.79-1.53 0-2 .77-3.27.82-1.31.05-2.3-1.32-3.14-2.53C4.25 17 2.94 12.45 4.7 9.39c.87-1.52 2.43-2.48 4.12-2.51 1.28-.02 2.5.87 3.29.87.78 0 2.26-1.07 3.81-.91.65.03 2.47.26 3.64 1.98-.09.06-2.17 1.28-2.15 3.81.03 3.02 2.65 4.03 2.68 4.04-.03.07-.42 1.44-1.38 2.83M13 3.5c.73-.83 1.94-1.46 2.94-1.5.13 1.17-.34 2.35-1.04 3.19-.69.85-1.83 1.51-2.95 1.42-.15-1.15.41-2.35 1.05-3.11z"/>
-</svg>"""
-
-ICON_LINUX = """<svg fill="currentColor" viewBox="0 0 24 24" role="img" xmlns="http://www.w3.org/2000/svg"><g id="SVGRepo_bgCarrier" stroke-width="0"></g><g id="SVGRepo_tracerCarrier" stroke-linecap="round" stroke-linejoin="round"></g><g id="SVGRepo_iconCarrier"><path d="M12.504 0c-.155 0-.315.008-.48.021-4.226.333-3.105 4.807-3.17 6.298-.076 1.092-.3 1.953-1.05 3.02-.885 1.051-2.127 2.75-2.716 4.521-.278.832-.41 1.684-.287 2.489a.424.424 0 0 0-.11.135c-.26.268-.45.6-.663.839-.199.199-.485.267-.797.4-.313.136-.658.269-.864.68-.09.189-.136.394-.132.602 0 .199.027.4.055.536.058.399.116.728.04.97-.249.68-.28 1.145-.106 1.484.174.334.535.47.94.601.81.2 1.91.135 2.774.6.926.466 1.866.67 2.616.47.526-.116.97-.464 1.208-.946.587-.003 1.23-.269 2.26-.334.699-.058 1.574.267 2.577.2.025.134.063.198.114.333l.003.003c.391.778 1.113 1.132 1.884 1.071.771-.06 1.592-.536 2.257-1.306.631-.765 1.683-1.084 2.378-1.503.348-.199.629-.469.649-.853.023-.4-.2-.811-.714-1.376v-.097l-.003-.003c-.17-.2-.25-.535-.338-.926-.085-.401-.182-.786-.492-1.046h-.003c-.059-.054-.123-.067-.188-.135a.357.357 0 0 0-.19-.064c.431-1.278.264-2.55-.173-3.694-.533-1.41-1.465-2.638-2.175-3.483-.796-1.005-1.576-1.957-1.56-3.368.026-2.152.236-6.133-3.544-6.139zm.529 3.405h.013c.213 0 .396.062.584.198.19.135.33.332.438.533.105.259.158.459.166.724 0-.02.006-.04.006-.06v.105a.086.086 0 0 1-.004-.021l-.004-.024a1.807 1.807 0 0 1-.15.706.953.953 0 0 1-.213.335.71.71 0 0 0-.088-.042c-.104-.045-.198-.064-.284-.133a1.312 1.312 0 0 0-.22-.066c.05-.06.146-.133.183-.198.053-.128.082-.264.088-.402v-.02a1.21 1.21 0 0 0-.061-.4c-.045-.134-.101-.2-.183-.333-.084-.066-.167-.132-.267-.132h-.016c-.093 0-.176.03-.262.132a.8.8 0 0 0-.205.334 1.18 1.18 0 0 0-.09.4v.019c.002.089.008.179.02.267-.193-.067-.438-.135-.607-.202a1.635 1.635 0 0 1-.018-.2v-.02a1.772 1.772 0 0 1 .15-.768 1.08 1.08 0 0 1 .43-.533.985.985 0 0 1 .594-.2zm-2.962.059h.036c.142 0 .27.048.399.135.146.129.264.288.344.465.09.199.14.4.153.667v.004c.007.134.006.2-.002.266v.08c-.03.007-.056.018-.083.024-.152.055-.274.135-.393.2.012-.09.013-.18.003-.267v-.015c-.012-.133-.04-.2-.082-.333a.613.613 0 0 0-.166-.267.248.248 0 0 0-.183-.064h-.021c-.071.006-.13.04-.186.132a.552.552 0 0 0-.12.27.944.944 0 0 0-.023.33v.015c.012.135.037.2.08.334.046.134.098.2.166.268.01.009.02.018.034.024-.07.057-.117.07-.176.136a.304.304 0 0 1-.131.068 2.62 2.62 0 0 1-.275-.402 1.772 1.772 0 0 1-.155-.667 1.759 1.759 0 0 1 .08-.668 1.43 1.43 0 0 1 .283-.535c.128-.133.26-.2.418-.2zm1.37 1.706c.332 0 .733.065 1.216.399.293.2.523.269 1.052.468h.003c.255.136.405.266.478.399v-.131a.571.571 0 0 1 .016.47c-.123.31-.516.643-1.063.842v.002c-.268.135-.501.333-.775.465-.276.135-.588.292-1.012.267a1.139 1.139 0 0 1-.448-.067 3.566 3.566 0 0 1-.322-.198c-.195-.135-.363-.332-.612-.465v-.005h-.005c-.4-.246-.616-.512-.686-.71-.07-.268-.005-.47.193-.6.224-.135.38-.271.483-.336.104-.074.143-.102.176-.131h.002v-.003c.169-.202.436-.47.839-.601.139-.036.294-.065.466-.065zm2.8 2.142c.358 1.417 1.196 3.475 1.735 4.473.286.534.855 1.659 1.102 3.024.156-.005.33.018.513.064.646-1.671-.546-3.467-1.089-3.966-.22-.2-.232-.335-.123-.335.59.534 1.365 1.572 1.646 2.757.13.535.16 1.104.021 1.67.067.028.135.06.205.067 1.032.534 1.413.938 1.23 1.537v-.043c-.06-.003-.12 0-.18 0h-.016c.151-.467-.182-.825-1.065-1.224-.915-.4-1.646-.336-1.77.465-.008.043-.013.066-.018.135-.068.023-.139.053-.209.064-.43.268-.662.669-.793 1.187-.13.533-.17 1.156-.205 1.869v.003c-.02.334-.17.838-.319 1.35-1.5 1.072-3.58 1.538-5.348.334a2.645 2.645 0 0 0-.402-.533 1.45 1.45 0 0 0-.275-.333c.182 0 .338-.03.465-.067a.615.615 0 0 0 .314-.334c.108-.267 0-.697-.345-1.163-.345-.467-.931-.995-1.788-1.521-.63-.4-.986-.87-1.15-1.396-.165-.534-.143-1.085-.015-1.645.245-1.07.873-2.11 1.274-2.763.107-.065.037.135-.408.974-.396.751-1.14 2.497-.122 3.854a8.123 8.123 0 0 1 .647-2.876c.564-1.278 1.743-3.504 1.836-5.268.048.036.217.135.289.202.218.133.38.333.59.465.21.201.477.335.876.335.039.003.075.006.11.006.412 0 .73-.134.997-.268.29-.134.52-.334.74-.4h.005c.467-.135.835-.402 1.044-.7zm2.185 8.958c.037.6.343 1.245.882 1.377.588.134 1.434-.333 1.791-.765l.211-.01c.315-.007.577.01.847.268l.003.003c.208.199.305.53.391.876.085.4.154.78.409 1.066.486.527.645.906.636 1.14l.003-.007v.018l-.003-.012c-.015.262-.185.396-.498.595-.63.401-1.746.712-2.457 1.57-.618.737-1.37 1.14-2.036 1.191-.664.053-1.237-.2-1.574-.898l-.005-.003c-.21-.4-.12-1.025.056-1.69.176-.668.428-1.344.463-1.897.037-.714.076-1.335.195-1.814.12-.465.308-.797.641-.984l.045-.022zm-10.814.049h.01c.053 0 .105.005.157.014.376.055.706.333 1.023.752l.91 1.664.003.003c.243.533.754 1.064 1.189 1.637.434.598.77 1.131.729 1.57v.006c-.057.744-.48 1.148-1.125 1.294-.645.135-1.52.002-2.395-.464-.968-.536-2.118-.469-2.857-.602-.369-.066-.61-.2-.723-.4-.11-.2-.113-.602.123-1.23v-.004l.002-.003c.117-.334.03-.752-.027-1.118-.055-.401-.083-.71.043-.94.16-.334.396-.4.69-.533.294-.135.64-.202.915-.47h.002v-.002c.256-.268.445-.601.668-.838.19-.201.38-.336.663-.336zm7.159-9.074c-.435.201-.945.535-1.488.535-.542 0-.97-.267-1.28-.466-.154-.134-.28-.268-.373-.335-.164-.134-.144-.333-.074-.333.109.016.129.134.199.2.096.066.215.2.36.333.292.2.68.467 1.167.467.485 0 1.053-.267 1.398-.466.195-.135.445-.334.648-.467.156-.136.149-.267.279-.267.128.016.034.134-.147.332a8.097 8.097 0 0 1-.69.468zm-1.082-1.583V5.64c-.006-.02.013-.042.029-.05.074-.043.18-.027.26.004.063 0 .16.067.15.135-.006.049-.085.066-.135.066-.055 0-.092-.043-.141-.068-.052-.018-.146-.008-.163-.065zm-.551 0c-.02.058-.113.049-.166.066-.047.025-.086.068-.14.068-.05 0-.13-.02-.136-.068-.01-.066.088-.133.15-.133.08-.031.184-.047.259-.005.019.009.036.03.03.05v.02h.003z"></path></g></svg>"""
-
-ICON_MORE = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="currentColor">
-<circle cx="12" cy="5" r="2"/>
-<circle cx="12" cy="12" r="2"/>
-<circle cx="12" cy="19" r="2"/>
-</svg>"""
+ICON_EDIT = """<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M11 4H4a2 2 0 0 0-2 2v14a2 2 0 0 0 2 2h14a2 2 0 0 0 2-2v-7"/><path d="M18.5 2.5a2.121 2.121 0 0 1 3 3L12 15l-4 1 1-4 9.5-9.5z"/></svg>"""
+
+ICON_PLAY = """<svg viewBox="0 0 24 24" fill="currentColor"><polygon points="5,3 19,12 5,21"/></svg>"""
+
+ICON_STOP = """<svg viewBox="0 0 24 24" fill="currentColor"><rect x="4" y="4" width="16" height="16" rx="2"/></svg>"""
+
+ICON_DELETE = """<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M3 6h18"/><path d="M19 6v14a2 2 0 0 1-2 2H7a2 2 0 0 1-2-2V6"/><path d="M8 6V4a2 2 0 0 1 2-2h4a2 2 0 0 1 2 2v2"/></svg>"""
+
+ICON_REFRESH = """<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M23 4v6h-6"/><path d="M1 20v-6h6"/><path d="M3.51 9a9 9 0 0 1 14.85-3.36L23 10M1 14l4.64 4.36A9 9 0 0 0 20.49 15"/></svg>"""
+
+ICON_PING = """<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M5 12.55a11 11 0 0 1 14.08 0"/><path d="M1.42 9a16 16 0 0 1 21.16 0"/><path d="M8.53 16.11a6 6 0 0 1 6.95 0"/><circle cx="12" cy="20" r="1"/></svg>"""
+
+ICON_SWAP = """<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M16 3l4 4-4 4"/><path d="M20 7H4"/><path d="M8 21l-4-4 4-4"/><path d="M4 17h16"/></svg>"""
+
+ICON_PLUS = """<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><line x1="12" y1="5" x2="12" y2="19"/><line x1="5" y1="12" x2="19" y2="12"/></svg>"""
+
+ICON_FOLDER = """<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M22 19a2 2 0 0 1-2 2H4a2 2 0 0 1-2-2V5a2 2 0 0 1 2-2h5l2 3h9a2 2 0 0 1 2 2z"/></svg>"""
+
+ICON_FOLDER_OPEN = """<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M22 19a2 2 0 0 1-2 2H4a2 2 0 0 1-2-2V5a2 2 0 0 1 2-2h5l2 3h9a2 2 0 0 1 2 2v1"/><path d="M4 10h16l-2 9H6z"/></svg>"""
+
+ICON_TAG = """<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M20.59 13.41l-7.17 7.17a2 2 0 0 1-2.83 0L2 12V2h10l8.59 8.59a2 2 0 0 1 0 2.82z"/><circle cx="7" cy="7" r="1"/></svg>"""
+
+ICON_SETTINGS = """<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><circle cx="12" cy="12" r="3"/><path d="M19.4 15a1.65 1.65 0 0 0 .33 1.82l.06.06a2 2 0 0 1 0 2.83 2 2 0 0 1-2.83 0l-.06-.06a1.65 1.65 0 0 0-1.82-.33 1.65 1.65 0 0 0-1 1.51V21a2 2 0 0 1-2 2 2 2 0 0 1-2-2v-.09A1.65 1.65 0 0 0 9 19.4a1.65 1.65 0 0 0-1.82.33l-.06.06a2 2 0 0 1-2.83 0 2 2 0 0 1 0-2.83l.06-.06a1.65 1.65 0 0 0 .33-1.82 1.65 1.65 0 0 0-1.51-1H3a2 2 0 0 1-2-2 2 2 0 0 1 2-2h.09A1.65 1.65 0 0 0 4.6 9a1.65 1.65 0 0 0-.33-1.82l-.06-.06a2 2 0 0 1 0-2.83 2 2 0 0 1 2.83 0l.06.06a1.65 1.65 0 0 0 1.82.33H9a1.65 1.65 0 0 0 1-1.51V3a2 2 0 0 1 2-2 2 2 0 0 1 2 2v.09a1.65 1.65 0 0 0 1 1.51 1.65 1.65 0 0 0 1.82-.33l.06-.06a2 2 0 0 1 2.83 0 2 2 0 0 1 0 2.83l-.06.06a1.65 1.65 0 0 0-.33 1.82V9a1.65 1.65 0 0 0 1.51 1H21a2 2 0 0 1 2 2 2 2 0 0 1-2 2h-.09a1.65 1.65 0 0 0-1.51 1z"/></svg>"""
+
+ICON_PROXY = """<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><circle cx="12" cy="12" r="10"/><line x1="2" y1="12" x2="22" y2="12"/><path d="M12 2a15.3 15.3 0 0 1 4 10 15.3 15.3 0 0 1-4 10 15.3 15.3 0 0 1-4-10 15.3 15.3 0 0 1 4-10z"/></svg>"""
+
+ICON_CHEVRON_LEFT = """<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><polyline points="15 18 9 12 15 6"/></svg>"""
+
+ICON_CHEVRON_RIGHT = """<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><polyline points="9 18 15 12 9 6"/></svg>"""
+
+ICON_SEARCH = """<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><circle cx="11" cy="11" r="8"/><line x1="21" y1="21" x2="16.65" y2="16.65"/></svg>"""
+
+ICON_COPY = """<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><rect x="9" y="9" width="13" height="13" rx="2" ry="2"/><path d="M5 15H4a2 2 0 0 1-2-2V4a2 2 0 0 1 2-2h9a2 2 0 0 1 2 2v1"/></svg>"""
+
+ICON_NOTE = """<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M14.5 2H6a2 2 0 0 0-2 2v16a2 2 0 0 0 2 2h12a2 2 0 0 0 2-2V7.5L14.5 2z"/><polyline points="14 2 14 8 20 8"/><line x1="16" y1="13" x2="8" y2="13"/><line x1="16" y1="17" x2="8" y2="17"/></svg>"""
+
+ICON_CLOSE = """<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><line x1="18" y1="6" x2="6" y2="18"/><line x1="6" y1="6" x2="18" y2="18"/></svg>"""
+
+ICON_CHECK = """<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><polyline points="20 6 9 17 4 12"/></svg>"""
+
+ICON_TRASH = """<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><polyline points="3 6 5 6 21 6"/><path d="M19 6v14a2 2 0 0 1-2 2H7a2 2 0 0 1-2-2V6m3 0V4a2 2 0 0 1 2-2h4a2 2 0 0 1 2 2v2"/><line x1="10" y1="11" x2="10" y2="17"/><line x1="14" y1="11" x2="14" y2="17"/></svg>"""
+
+ICON_RESTORE = """<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M3 12a9 9 0 1 0 9-9 9.75 9.75 0 0 0-6.74 2.74L3 8"/><path d="M3 3v5h5"/></svg>"""
+
+ICON_USER = """<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M20 21v-2a4 4 0 0 0-4-4H8a4 4 0 0 0-4 4v2"/><circle cx="12" cy="7" r="4"/></svg>"""
+
+ICON_STATUS = """<svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><rect x="3" y="3" width="7" height="7"/><rect x="14" y="3" width="7" height="7"/><rect x="14" y="14" width="7" height="7"/><rect x="3" y="14" width="7" height="7"/></svg>"""
+
+ICON_WINDOWS = """<svg viewBox="0 0 24 24" fill="currentColor"><path d="M0 3.449L9.75 2.1v9.451H0m10.949-9.602L24 0v11.4H10.949M0 12.6h9.75v9.451L0 20.699M10.949 12.6H24V24l-12.9-1.801"/></svg>"""
+
+ICON_APPLE = """<svg viewBox="0 0 24 24" fill="currentColor"><path d="M18.71 19.5c-.83 1.24-1.71 2.45-3.05 2.47-1.34.03-1.77-.79-3.29-.79-1.53 0-2 .77-3.27.82-1.31.05-2.3-1.32-3.14-2.53C4.25 17 2.94 12.45 4.7 9.39c.87-1.52 2.43-2.48 4.12-2.51 1.28-.02 2.5.87 3.29.87.78 0 2.26-1.07 3.81-.91.65.03 2.47.26 3.64 1.98-.09.06-2.17 1.28-2.15 3.81.03 3.02 2.65 4.03 2.68 4.04-.03.07-.42 1.44-1.38 2.83M13 3.5c.73-.83 1.94-1.46 2.94-1.5.13 1.17-.34 2.35-1.04 3.19-.69.85-1.83 1.51-2.95 1.42-.15-1.15.41-2.35 1.05-3.11z"/></svg>"""
+
+ICON_LINUX = """<svg fill="currentColor" viewBox="0 0 24 24"><path d="M12.504 0c-.155 0-.315.008-.48.021-4.226.333-3.105 4.807-3.17 6.298-.076 1.092-.3 1.953-1.05 3.02-.885 1.051-2.127 2.75-2.716 4.521-.278.832-.41 1.684-.287 2.489a.424.424 0 0 0-.11.135c-.26.268-.45.6-.663.839-.199.199-.485.267-.797.4-.313.136-.658.269-.864.68-.09.189-.136.394-.132.602 0 .199.027.4.055.536.058.399.116.728.04.97-.249.68-.28 1.145-.106 1.484.174.334.535.47.94.601.81.2 1.91.135 2.774.6.926.466 1.866.67 2.616.47.526-.116.97-.464 1.208-.946.587-.003 1.23-.269 2.26-.334.699-.058 1.574.267 2.577.2.025.134.063.198.114.333l.003.003c.391.778 1.113 1.132 1.884 1.071.771-.06 1.592-.536 2.257-1.306.631-.765 1.683-1.084 2.378-1.503.348-.199.629-.469.649-.853.023-.4-.2-.811-.714-1.376v-.097l-.003-.003c-.17-.2-.25-.535-.338-.926-.085-.401-.182-.786-.492-1.046h-.003c-.059-.054-.123-.067-.188-.135a.357.357 0 0 0-.19-.064c.431-1.278.264-2.55-.173-3.694-.533-1.41-1.465-2.638-2.175-3.483-.796-1.005-1.576-1.957-1.56-3.368.026-2.152.236-6.133-3.544-6.139zm.529 3.405h.013c.213 0 .396.062.584.198.19.135.33.332.438.533.105.259.158.459.166.724 0-.02.006-.04.006-.06v.105a.086.086 0 0 1-.004-.021l-.004-.024a1.807 1.807 0 0 1-.15.706.953.953 0 0 1-.213.335.71.71 0 0 0-.088-.042c-.104-.045-.198-.064-.284-.133a1.312 1.312 0 0 0-.22-.066c.05-.06.146-.133.183-.198.053-.128.082-.264.088-.402v-.02a1.21 1.21 0 0 0-.061-.4c-.045-.134-.101-.2-.183-.333-.084-.066-.167-.132-.267-.132h-.016c-.093 0-.176.03-.262.132a.8.8 0 0 0-.205.334 1.18 1.18 0 0 0-.09.4v.019c.002.089.008.179.02.267-.193-.067-.438-.135-.607-.202a1.635 1.635 0 0 1-.018-.2v-.02a1.772 1.772 0 0 1 .15-.768 1.08 1.08 0 0 1 .43-.533.985.985 0 0 1 .594-.2zm-2.962.059h.036c.142 0 .27.048.399.135.146.129.264.288.344.465.09.199.14.4.153.667v.004c.007.134.006.2-.002.266v.08c-.03.007-.056.018-.083.024-.152.055-.274.135-.393.2.012-.09.013-.18.003-.267v-.015c-.012-.133-.04-.2-.082-.333a.613.613 0 0 0-.166-.267.248.248 0 0 0-.183-.064h-.021c-.071.006-.13.04-.186.132a.552.552 0 0 0-.12.27.944.944 0 0 0-.023.33v.015c.012.135.037.2.08.334.046.134.098.2.166.268.01.009.02.018.034.024-.07.057-.117.07-.176.136a.304.304 0 0 1-.131.068 2.62 2.62 0 0 1-.275-.402 1.772 1.772 0 0 1-.155-.667 1.759 1.759 0 0 1 .08-.668 1.43 1.43 0 0 1 .283-.535c.128-.133.26-.2.418-.2zm1.37 1.706c.332 0 .733.065 1.216.399.293.2.523.269 1.052.468h.003c.255.136.405.266.478.399v-.131a.571.571 0 0 1 .016.47c-.123.31-.516.643-1.063.842v.002c-.268.135-.501.333-.775.465-.276.135-.588.292-1.012.267a1.139 1.139 0 0 1-.448-.067 3.566 3.566 0 0 1-.322-.198c-.195-.135-.363-.332-.612-.465v-.005h-.005c-.4-.246-.616-.512-.686-.71-.07-.268-.005-.47.193-.6.224-.135.38-.271.483-.336.104-.074.143-.102.176-.131h.002v-.003c.169-.202.436-.47.839-.601.139-.036.294-.065.466-.065zm2.8 2.142c.358 1.417 1.196 3.475 1.735 4.473.286.534.855 1.659 1.102 3.024.156-.005.33.018.513.064.646-1.671-.546-3.467-1.089-3.966-.22-.2-.232-.335-.123-.335.59.534 1.365 1.572 1.646 2.757.13.535.16 1.104.021 1.67.067.028.135.06.205.067 1.032.534 1.413.938 1.23 1.537v-.043c-.06-.003-.12 0-.18 0h-.016c.151-.467-.182-.825-1.065-1.224-.915-.4-1.646-.336-1.77.465-.008.043-.013.066-.018.135-.068.023-.139.053-.209.064-.43.268-.662.669-.793 1.187-.13.533-.17 1.156-.205 1.869v.003c-.02.334-.17.838-.319 1.35-1.5 1.072-3.58 1.538-5.348.334a2.645 2.645 0 0 0-.402-.533 1.45 1.45 0 0 0-.275-.333c.182 0 .338-.03.465-.067a.615.615 0 0 0 .314-.334c.108-.267 0-.697-.345-1.163-.345-.467-.931-.995-1.788-1.521-.63-.4-.986-.87-1.15-1.396-.165-.534-.143-1.085-.015-1.645.245-1.07.873-2.11 1.274-2.763.107-.065.037.135-.408.974-.396.751-1.14 2.497-.122 3.854a8.123 8.123 0 0 1 .647-2.876c.564-1.278 1.743-3.504 1.836-5.268.048.036.217.135.289.202.218.133.38.333.59.465.21.201.477.335.876.335.039.003.075.006.11.006.412 0 .73-.134.997-.268.29-.134.52-.334.74-.4h.005c.467-.135.835-.402 1.044-.7zm2.185 8.958c.037.6.343 1.245.882 1.377.588.134 1.434-.333 1.791-.765l.211-.01c.315-.007.577.01.847.268l.003.003c.208.199.305.53.391.876.085.4.154.78.409 1.066.486.527.645.906.636 1.14l.003-.007v.018l-.003-.012c-.015.262-.185.396-.498.595-.63.401-1.746.712-2.457 1.57-.618.737-1.37 1.14-2.036 1.191-.664.053-1.237-.2-1.574-.898l-.005-.003c-.21-.4-.12-1.025.056-1.69.176-.668.428-1.344.463-1.897.037-.714.076-1.335.195-1.814.12-.465.308-.797.641-.984l.045-.022zm-10.814.049h.01c.053 0 .105.005.157.014.376.055.706.333 1.023.752l.91 1.664.003.003c.243.533.754 1.064 1.189 1.637.434.598.77 1.131.729 1.57v.006c-.057.744-.48 1.148-1.125 1.294-.645.135-1.52.002-2.395-.464-.968-.536-2.118-.469-2.857-.602-.369-.066-.61-.2-.723-.4-.11-.2-.113-.602.123-1.23v-.004l.002-.003c.117-.334.03-.752-.027-1.118-.055-.401-.083-.71.043-.94.16-.334.396-.4.69-.533.294-.135.64-.202.915-.47h.002v-.002c.256-.268.445-.601.668-.838.19-.201.38-.336.663-.336zm7.159-9.074c-.435.201-.945.535-1.488.535-.542 0-.97-.267-1.28-.466-.154-.134-.28-.268-.373-.335-.164-.134-.144-.333-.074-.333.109.016.129.134.199.2.096.066.215.2.36.333.292.2.68.467 1.167.467.485 0 1.053-.267 1.398-.466.195-.135.445-.334.648-.467.156-.136.149-.267.279-.267.128.016.034.134-.147.332a8.097 8.097 0 0 1-.69.468zm-1.082-1.583V5.64c-.006-.02.013-.042.029-.05.074-.043.18-.027.26.004.063 0 .16.067.15.135-.006.049-.085.066-.135.066-.055 0-.092-.043-.141-.068-.052-.018-.146-.008-.163-.065zm-.551 0c-.02.058-.113.049-.166.066-.047.025-.086.068-.14.068-.05 0-.13-.02-.136-.068-.01-.066.088-.133.15-.133.08-.031.184-.047.259-.005.019.009.036.03.03.05v.02h.003z"/></svg>"""
+
+ICON_MORE = """<svg viewBox="0 0 24 24" fill="currentColor"><circle cx="12" cy="5" r="2"/><circle cx="12" cy="12" r="2"/><circle cx="12" cy="19" r="2"/></svg>"""
+
+
+_ICONS = {
+    "edit": ICON_EDIT,
+    "play": ICON_PLAY,
+    "stop": ICON_STOP,
+    "delete": ICON_DELETE,
+    "refresh": ICON_REFRESH,
+    "ping": ICON_PING,
+    "swap": ICON_SWAP,
+    "plus": ICON_PLUS,
+    "folder": ICON_FOLDER,
+    "folder_open": ICON_FOLDER_OPEN,
+    "tag": ICON_TAG,
+    "settings": ICON_SETTINGS,
+    "proxy": ICON_PROXY,
+    "chevron_left": ICON_CHEVRON_LEFT,
+    "chevron_right": ICON_CHEVRON_RIGHT,
+    "search": ICON_SEARCH,
+    "copy": ICON_COPY,
+    "note": ICON_NOTE,
+    "close": ICON_CLOSE,
+    "check": ICON_CHECK,
+    "trash": ICON_TRASH,
+    "restore": ICON_RESTORE,
+    "user": ICON_USER,
+    "status": ICON_STATUS,
+    "windows": ICON_WINDOWS,
+    "apple": ICON_APPLE,
+    "linux": ICON_LINUX,
+    "more": ICON_MORE,
+}
+
+
+# Reverse lookup so svg_icon() on a built-in SVG string skips encoding/parsing
+_NAME_BY_SVG = {svg: name for name, svg in _ICONS.items()}
+
+# Each SVG pre-split around "currentColor" so recoloring is a single join
+_ICON_SEGMENTS = {name: tuple(svg.split("currentColor")) for name, svg in _ICONS.items()}
+
+# Default-colored SVG bytes, encoded into QByteArray once at import and
+# passed straight to QSvgRenderer
+_DEFAULT_COLORED = {
+    name: QByteArray(ICON_COLOR.join(segments).encode())
+    for name, segments in _ICON_SEGMENTS.items()
+}
+
+
+# Parsed default-color SVG documents shared across sizes, keyed by name.
+# Other colors are produced by tinting the rasterized alpha mask.
+_RENDERERS: dict[str, QSvgRenderer] = {}
+
+
+def _get_renderer(name: str) -> QSvgRenderer:
+    """Return the shared renderer for an icon, parsing the SVG on first use."""
+    renderer = _RENDERERS.get(name)
+    if renderer is None:
+        renderer = QSvgRenderer(_DEFAULT_COLORED[name])
+        _RENDERERS[name] = renderer
+    return renderer
+
+
+# Built icons keyed by the raw get_icon() arguments plus the device pixel
+# ratio, so a hit is one dict lookup with no name normalization. Entries are
+# built on first request - prewarm_icons() fills QPixmapCache off-thread
+# ahead of that.
+_ICON_REGISTRY: dict[tuple[str, int, str | None, float], QIcon] = {}
+
+
+def _atlas_image(name: str, size: int) -> QImage | None:
+    """Decode a default-color image from the PNG atlas, if it has this pixel size."""
+    png = _ATLAS.get(name, {}).get(size)
+    if png is None:
+        return None
+    image = QImage()
+    if not image.loadFromData(png, "PNG"):
+        return None
+    return image
+
+
+def _default_image(name: str, size: int) -> QImage:
+    """Default-color image: from the atlas when available, else rendered."""
+    image = _atlas_image(name, size)
+    if image is None:
+        image = _rasterize(_get_renderer(name), size)
+    return image
+
+
+# Alpha masks of every (name, pixel size) rasterized so far; recoloring reuses them
+_MASKS: dict[tuple[str, int], QImage] = {}
+
+
+def _get_mask(name: str, size: int) -> QImage:
+    """Return the icon's alpha mask, rasterizing it once per size."""
+    key = (name, size)
+    mask = _MASKS.get(key)
+    if mask is None:
+        mask = _default_image(name, size).convertToFormat(QImage.Format.Format_Alpha8)
+        _MASKS[key] = mask
+    return mask
+
+
+def _tint(mask: QImage, color: str) -> QPixmap:
+    """Fill an alpha mask with a solid color (no SVG re-parse)."""
+    image = QImage(mask.size(), QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(QColor(color))
+    painter = QPainter(image)
+    painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_DestinationIn)
+    painter.drawImage(0, 0, mask)
+    painter.end()
+    return QPixmap.fromImage(image)
+
+
+def _icon_pixmap(name: str, size: int, color: str, dpr: float) -> QPixmap:
+    """Build (or fetch from QPixmapCache) one pixmap of a known icon.
+
+    Pixmaps are rendered at the screen's device pixel ratio so HiDPI
+    displays paint them 1:1 instead of upscaling a logical-size raster.
+    """
+    cache_key = _cache_key(name, size, color, dpr)
+    pixmap = QPixmapCache.find(cache_key)
+    if pixmap is None:
+        pixel_size = _pixel_size(size, dpr)
+        if color == ICON_COLOR:
+            pixmap = QPixmap.fromImage(_default_image(name, pixel_size))
+        else:
+            pixmap = _tint(_get_mask(name, pixel_size), color)
+        pixmap.setDevicePixelRatio(dpr)
+        QPixmapCache.insert(cache_key, pixmap)
+    return pixmap
+
+
+def _build_icon(name: str, size: int, color: str, dpr: float) -> QIcon:
+    """Build the icon for a known name with pixmaps for every common size.
+
+    Attaching the requested size plus ``ICON_SIZES`` up front lets Qt pick
+    an exact match for buttons, menus and hover states instead of smoothly
+    rescaling a single pixmap on every paint.
+    """
+    icon = QIcon()
+    icon.addPixmap(_icon_pixmap(name, size, color, dpr))
+    for extra in ICON_SIZES:
+        if extra != size:
+            icon.addPixmap(_icon_pixmap(name, extra, color, dpr))
+    return icon
 
 
 def get_icon(name: str, size: int = 16, color: str = None) -> QIcon:
-    """Get icon by name with optional color override."""
-    icons = {
-        "edit": ICON_EDIT,
-        "play": ICON_PLAY,
-        "stop": ICON_STOP,
-        "delete": ICON_DELETE,
-        "refresh": ICON_REFRESH,
-        "ping": ICON_PING,
-        "swap": ICON_SWAP,
-        "plus": ICON_PLUS,
-        "folder": ICON_FOLDER,
-        "folder_open": ICON_FOLDER_OPEN,
-        "tag": ICON_TAG,
-        "settings": ICON_SETTINGS,
-        "proxy": ICON_PROXY,
-        "chevron_left": ICON_CHEVRON_LEFT,
-        "chevron_right": ICON_CHEVRON_RIGHT,
-        "search": ICON_SEARCH,
-        "copy": ICON_COPY,
-        "note": ICON_NOTE,
-        "close": ICON_CLOSE,
-        "check": ICON_CHECK,
-        "trash": ICON_TRASH,
-        "restore": ICON_RESTORE,
-        "user": ICON_USER,
-        "status": ICON_STATUS,
-        "windows": ICON_WINDOWS,
-        "apple": ICON_APPLE,
-        "linux": ICON_LINUX,
-        "more": ICON_MORE,
-    }
-    svg_data = icons.get(name, ICON_EDIT)
-    return svg_icon(svg_data, size, color)
+    """Get icon by name with optional color override.
+
+    Rasterized pixmaps are kept in the global QPixmapCache, so each
+    (icon, size, color) is rendered once per process; repeat calls with
+    the same arguments are a single dict lookup.
+    """
+    dpr = _device_pixel_ratio()
+    key = (name, size, color, dpr)
+    icon = _ICON_REGISTRY.get(key)
+    if icon is None:
+        icon = _build_icon(name if name in _ICONS else "edit", size, color or ICON_COLOR, dpr)
+        _ICON_REGISTRY[key] = icon
+    return icon
+
+
+class _IconPrewarmSink(QObject):
+    """Receives off-thread rasterized images on the GUI thread."""
+
+    rendered = pyqtSignal(str, int, float, QImage)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.rendered.connect(self._store)
+
+    def _store(self, name: str, size: int, dpr: float, image: QImage) -> None:
+        cache_key = _cache_key(name, size, ICON_COLOR, dpr)
+        if QPixmapCache.find(cache_key) is None:
+            pixmap = QPixmap.fromImage(image)
+            pixmap.setDevicePixelRatio(dpr)
+            QPixmapCache.insert(cache_key, pixmap)
+
+
+class _IconRasterJob(QRunnable):
+    """Rasterize default-color icons of one size into QImages (thread-safe, unlike QPixmap).
+
+    Atlas hits are just decoded. The remaining icons are rendered side by
+    side into one strip image through a single QPainter and then cut
+    apart, so painter setup is paid once per batch instead of per icon.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        dpr: float,
+        icons: list[tuple[str, bytes | None, bytes]],
+        sink: _IconPrewarmSink,
+    ) -> None:
+        super().__init__()
+        self._size = size
+        self._dpr = dpr
+        self._icons = icons
+        self._sink = sink
+
+    def run(self) -> None:
+        pending: list[tuple[str, bytes]] = []
+        for name, png, svg in self._icons:
+            image = QImage()
+            if png is not None and image.loadFromData(png, "PNG"):
+                self._emit(name, image)
+            else:
+                pending.append((name, svg))
+        if not pending:
+            return
+
+        pixel_size = _pixel_size(self._size, self._dpr)
+        strip = QImage(
+            pixel_size * len(pending), pixel_size, QImage.Format.Format_ARGB32_Premultiplied
+        )
+        strip.fill(0)
+        painter = QPainter(strip)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        for index, (_, svg) in enumerate(pending):
+            target = QRectF(index * pixel_size, 0, pixel_size, pixel_size)
+            QSvgRenderer(QByteArray(svg)).render(painter, target)
+        painter.end()
+
+        for index, (name, _) in enumerate(pending):
+            self._emit(name, strip.copy(index * pixel_size, 0, pixel_size, pixel_size))
+
+    def _emit(self, name: str, image: QImage) -> None:
+        # Queued across threads; the pixmap is created on the GUI thread
+        self._sink.rendered.emit(name, self._size, self._dpr, image)
+
+
+_PREWARM_SINK: _IconPrewarmSink | None = None
+
+
+def prewarm_icons(
+    names: Iterable[str] | None = None, sizes: Iterable[int] = (16,)
+) -> None:
+    """Rasterize default-color icons on worker threads ahead of first use.
+
+    Must be called from the GUI thread. Finished pixmaps land in
+    QPixmapCache, where get_icon() picks them up; icons requested before
+    their job finishes are simply rendered synchronously as usual.
+    """
+    global _PREWARM_SINK
+    if _PREWARM_SINK is None:
+        _PREWARM_SINK = _IconPrewarmSink()
+
+    pool = QThreadPool.globalInstance()
+    dpr = _device_pixel_ratio()
+    names = [name for name in (_ICONS if names is None else names) if name in _ICONS]
+    for size in sizes:
+        pixel_size = _pixel_size(size, dpr)
+        batch = [
+            (name, _ATLAS.get(name, {}).get(pixel_size), bytes(_DEFAULT_COLORED[name]))
+            for name in names
+            if QPixmapCache.find(_cache_key(name, size, ICON_COLOR, dpr)) is None
+        ]
+        if batch:
+            pool.start(_IconRasterJob(size, dpr, batch, _PREWARM_SINK))
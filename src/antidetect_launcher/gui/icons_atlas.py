@@ -0,0 +1,295 @@
+"""Pre-rasterized PNG atlas for the built-in GUI icons.
+
+Generated by scripts/generate_icon_atlas.py - do not edit by hand.
+"""
+
+import base64
+
+_ENCODED: dict[str, dict[int, str]] = {
+    "edit": {
+        14: "iVBORw0KGgoAAAANSUhEUgAAAA4AAAAOCAYAAAAfSC3RAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABDklEQVQokY2SvUqDQRBFz0QhNvYGrVIEkhRaio2K7yDYJ1ZWvoia+AK+g72WopWNIiJYKCQSREgjYjw2+8GXXx3Y4u7cs3d3GfhnqSV1X10HiLS5CKwBcznvY0S8pn4duACegVVgE3VJfVHf1V5uNTJIfVPbakG9VpuoTfVqyvVqaldtJeg06RLqgXo5AzoZgeqZYQycALWTruVNQ6BaVjvqcYJaSdfyhxcmPG0P+AAOgSNgF9iOiDu1oS5PS3xS++pDSqrmej11ayxRLQJloAucARsRcT/px+dH9AAoRsTXJPMoOMiSI+L7D38h+Qm1AtwAt8DPDGgBWAGqEdHPZrUC7DA8q6P1CZxHRAfgF3y8Aw4N8FHiAAAAAElFTkSuQmCC",
+        16: "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAA60lEQVQ4jZWRMU4DMRBF30QUNBSE0OUEaenhCkHKAegiShIEbW7AETgHNEjpEUegpkFCoaHh0TirjeNddkeyrLHnPX3Z0LPUiTpVT/qyqLfqr/qjflQSdaVu3K9ZBqveqcdJMkU9SxfX6ixb4wxepv4+JZmQBm2JvczgHVmrQF2k4UURbhPU4JtSklaBOs/gnSRdBG/qU0OScf139gTqMAGP6nMdLs0PCm93nvYrYATMI+KhMAfAQeHsC7gE1hHx2QQ2CiLi5T+oXgNgA6COOjKnwHfVqYfp1fvUqkq8lQAXwFGHBO8R8bpt/gDt73pAkN8txgAAAABJRU5ErkJggg==",
+        20: "iVBORw0KGgoAAAANSUhEUgAAABQAAAAUCAYAAACNiR0NAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABaUlEQVQ4jaWUvUpcQRiGn281xiABK28gFkLWJoW4f01CQNtUQq7AC7CzsNDCG8hlpLDRJpBikxQpA6nSCGmSIAhZBQPukyJzYCJzzrrsC8OZ7+P9nnnPFAMzSF1Q19TlWTgVrKOe+09/1F2AyAwvgU1grjD/JiJ+Zt4ecJbKY+A18ARYqQxHNqudwfrq77S6qbeffGuoy+pYPVHX1XZhLTbAeqk+VxdIA6oHE+6sr47ScK9wQKcyTgTeA9bNzY1AdZDB+oUDuncHaoEZbFQD65USFIHq0wJs0AgDWnX3BrwCloC9iBiqA+AUENiOiA/qYgq0cp+E79Rr9bG6ezdt3ex8KZr6EHieyh/AI+AK2IqIYcNflYHARrb/CLwH3kbE1yZYE/ASGACfI+JmEmQiMCK+TAPJ1QJus/20ql6risE88A24AHZUgPEUwGfp++m/rvpC/eX0GquHpcioD4BVyg9snb5HxGXe+AvccvvTEJmVkgAAAABJRU5ErkJggg==",
+        24: "iVBORw0KGgoAAAANSUhEUgAAABgAAAAYCAYAAADgdz34AAAACXBIWXMAAA7EAAAOxAGVKw4bAAABDElEQVRIibWVQU7DMBBFvy1OgKpssmIF4mTcoFyIqnAJOAJVVqxbTlAhlo8FU3DRJLbj8CVL0Yz9vv2jxNKCAiIQ01ocm1wJXgEbSUdJR2ADXC7BFtABA9/6tAHwkE6KwD1wYEIZ+AD0wJWZfPzEZfCsMvDO6r1ncNr57YxYUnhaP4vIjaABPgCraoMKePd3YdZgNrzEoAmeM2iGTxkAAdg1wTMGN/xqHjxjcGetbQl8NOoJg0drvQLb5DTuzqsMLH9Pu7FYPM6FN9F0nTw/SXqW9CLpLYRQ9NXnTtDbSw4tnOlGpTzOIjfalE4G77aDot+1p2TtwWsWXTiFWnsGEVgD+wbw3hj/HvuZvgB0oG24gZgOQwAAAABJRU5ErkJggg==",
+        28: "iVBORw0KGgoAAAANSUhEUgAAABwAAAAcCAYAAAByDd+UAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABwUlEQVRIidXWv0ocURTH8e8xi9gknREknXYBqxSpEh8hoFaGFQtBgi9gIUmRN1iwsoi7KoIWYiM2/nuFXVFBq4BFYqVNJFl+FnsnXseZ2Ts7a+Fp9nLunPO558LuDjz3kGSSypL2JJ1K2pA08lTYC0lVPY6/EWqxgnfAR+BlRt9fZraYhAE/gM8utQtsAQvAILBpZhPRwyapknCypGikTFbznqm6AyBp1uVOAEqupgzMufUF8CdjwvOEyZaBSZeqAdNm1nR7n1z+0i/acadYyoAehZtsJWWy+NRlv7Dhkt8KYLUMbFmS+cW5QNdwNRD7P3VHYACWeMUdgZJKMWwlNxYK5sRqqVgIGIAlXnER8LvXcNXDUg9SFKy7/X+FsXagpH6v6VgoJmnL9f3i50u0jw/e+kTSOLAORMAaMGVmzVjdMPAWeJ0XHPXWx7G9NaCcgKVGXjCKOrANfM2DtQUl9dO6lgawDxwAR2Z2lQcJBoFbYMDMfncK5ALN7LpbUBQ93W4YCt64z94u9u6L9Qbur/QQeA/MqPVHeVsQewMMeb0fhqRXks7U/ajELfNRYJ7W9y7rNTEkftL6NaqamQr2KhZ3dVAtIIDOJ0AAAAAASUVORK5CYII=",
+        32: "iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAACXBIWXMAAA7EAAAOxAGVKw4bAAAB60lEQVRYhcWXMWsUQRiG3+8MYv6AYJWAjZ3poiCaItgI/gDLu9skhVj5B2y1sIwi5BekSGEKCyGp1EpiYyWENOltLhHuHoublWFudm9nbtd8sDAz38z3PDuzx95KVxzWNQC4LamQdEfSuaSPZnbYNbeE94ERs/Hhf8C3AugpMPH6T8IFBuwA34FxxDqM/QT4C6AHPPAkdsNF7xpA5wpE4IWX6zHdCYADSVpyiU1J227eL0knkpizy18j8ELSe29oy8z8834uacW1f/oL33rGN+eAowEUVXfu8v7OjJj+Ov4l98tMS/BhDRygHxbIFgCGifAiViRLoAG89lgWEojAB1nwHAFgkAgfVtVKFgjgkwi89lgWEojA+0E+Hd5UALifCB9U1coVeOUVfx3kap+JtgSO3ZQL4EYFfOaZcHNeOkb8BTZPAFgGLt2UI2/sTd2xNKm/VHXHQaxLuu7aj4BjSfe8MSQNzWyvYb1kgY2g/9BrZ8MXEbjU9HV8JOmTmX3JgTcSAJYlrTlYeX0zs4tcaJKApLGkW2Y2agOYLGBmf7oAl9HrsniKwLgcALr4WClrTqoEfnhjj9uUYPofc811T6omrQK/6T62owJO4mnHErtEdtYCiVVJzyTdlXQtb9Nn4kzSoZl9bqleu/EXMexSy92jHLgAAAAASUVORK5CYII=",
+        40: "iVBORw0KGgoAAAANSUhEUgAAACgAAAAoCAYAAACM/rhtAAAACXBIWXMAAA7EAAAOxAGVKw4bAAACTElEQVRYhe3YP2sUQRjH8e8TNCAq3AWUQ+xNZaNBOw8EUwtBMQg2vgLxXWirWAopbMTKJmqhXbwL2AgJtrE4bTyIpPAPP4vdhclk9s/c7u1d4Q8O7mZnZz77zO7d3sKcx2Y5uaSzwEWgB3wBPpvZwSxNAEg6JemxpD86nJGk25JmVzhJXUnbKs6tecKNJG1K+u21nQgNYJLWJb2TtF9ylH7WJsANJS2l2/secsUfYEHSRiSqErAA1/X6bTrb7/qDPKyBywWmuGEF3JKSpc1yHdKvGUmLwBjI1v018AL4VbRsXrbM7KuPA94Al53mbeCGmf3w+r0FLqVNf4FzZvY963DFO8JOBCyYgsp1Av385X/kD7bmbm0A16mBG0o6OTVgA7huaNBGgJG40gunUWAOblAb1wSwAVzxRVkHmOIGFXCVlr9RYCu4SYE5uI+N4yYB1sQdqfA0gE9aw00I3PEmDuFKz80qORa7g6QesOw03TOzsYsjuUFw7+eGJDcIY6cNSeeBq9lnM3uZN2nlCir5z+Cm5+IClTuy/DHzRlcQ6Dvvd81slCJXgede3wGw6lcuJnWBy5J2gQuBfrVxAAsxnQPnH0wRB5FA4FrJ9h3gKQ3hIH6J+wHQ+/T1wcy+1ScdTiywBzxzQKOmQX6igGZ2c1qQvMSeg63nP7BuMuC+2yjpeEvzLzrvf4Y6ZMCh135/2sj09/mO07RVtsMrzTbrZcAzkvZmhNtQlaeqKbLNSh5IeiAp92INqpU8VFwBTpce1eTZAz6ZWcwTtPnLP9Pg6xxEchiPAAAAAElFTkSuQmCC",
+        48: "iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAB/ElEQVRoge2ZMU7jQBSG3yCkiIICLeeAK9CSNiXhDNkTcAHaCLgFFYIStqVE0HGCRdkSimS/LeIg8zJOZuyZeSuUT7IUed54vt9+niIW2ZAPoAf0rD2iAPaBMfACTKvjuTq3b+23EmAAvNHMG9C39vQCDIHZCvkFv4Ef1r5fWCF/Vx2a8boL9oFfwHvAHfHSUX4GDGs1p2r8ueliO8BVW+nYACHytdr6k5ji251SyYcEiJEPCsC8bZKRWH6oapdbiHnP1zkHdtfdyVhayuv65ZeY5Rf2f5X3b6OqKHgXKSw/AwZNC2QLkFDeW581QBH5XAGKyecIUFQ+dYDi8ikDmMinCmAmnyKAqXzXAObyXQIAJ+bybQMAW8DEXL5DgEM9z0S+Q4CRmvZqIt8hwLWaNkolH+0TOwF//x+mkC8VQPf/BNiuzo+AV33NUPlSAXT/L0I0EdXzJQLo/l9F9AubNQD+/m9iApzEyMf4bMdeuOJARPYaxv6IyIOI3FfHk3Pub8t11tI2wFHtd1FhTdsAUxH5KQbCGrf4ofvMOeeWy8sR6rNVRicfmwDWfKsAH/UBMvy5G4pn7Q9voXwN8KjGzixCVGueqdPa7ZP6NtoXkZtMXl3pO+du11aR8BNTQi6DYzL/yHdpbVzjAtiJfl4k+Mzagfdq7eNo8Q0G/ANrdKDBze59fwAAAABJRU5ErkJggg==",
+    },
+    "play": {
+        14: "iVBORw0KGgoAAAANSUhEUgAAAA4AAAAOCAYAAAAfSC3RAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAbUlEQVQokaXSMQ6CAAyF4UpCohMLCbfxCJ7BW+kR4Das7s5c4XMiOkBiy5s69H+vaRtxVGhx+be/+am7iJhxzSb2vnqiq4Dwxq0CrpowVEBYcMdp7W92nTa8s4ljdtTSch7Zc7wUHqDFOQVV9AHbxcuwffffjAAAAABJRU5ErkJggg==",
+        16: "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAiElEQVQ4jc2Qyw3CMBAFnxEFhCsF0EfoIKGG9EIN0AJKC1BFLi7A51QwOUSRIixb/hxgbivtzr5d6a8A7kBbI3ix8gRONQIAB9xqBBsjcA7NHBK8naQJGIB4fyDBng9wyU3g7SkRzJIGSVdjjA2rC54YEzigT0zoCR5AkzJz/Kqt1jvfWZt/ygKBhbEKOdzkpAAAAABJRU5ErkJggg==",
+        20: "iVBORw0KGgoAAAANSUhEUgAAABQAAAAUCAYAAACNiR0NAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAf0lEQVQ4jdXUqxHCYBBF4TxEKkBTAC6OWkIL0AIpBmqgBBqALiKjYj7Ub1DAXEGO3zO7s7u3qlYH+rTwgSs2SSFMOKBOCQs3bJNCmHFCmxIW7tglhbBgRJcSFp7Yv9c3X7X/Cx+OfE6NHFvKjKPQ2cQOe8Ig9HoXwXDIxtff8QIPoHFNRtCrtQAAAABJRU5ErkJggg==",
+        24: "iVBORw0KGgoAAAANSUhEUgAAABgAAAAYCAYAAADgdz34AAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAoUlEQVRIie3VsQ2CQBSAYTRaaKWtvQu4ga7gCrqCzqAr6AyuwAZOQG9LR0Py2UhiQSIgr+OvL++7S7gjSYa6hAdWkQDkOGIcBVSlWEcCUOCMaRRQ9cQmEoASV8yjgKoMu0ig6o5lJAAv7Otm9fmNa76yXTcs2m2lWRm2bY/ZBChxwazT8B9A2EUrcMLk7+E1QCrosctxwKjX4R8g9ocz9N0blx0CA1htujUAAAAASUVORK5CYII=",
+        28: "iVBORw0KGgoAAAANSUhEUgAAABwAAAAcCAYAAAByDd+UAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAt0lEQVRIie3WsW0CQRCF4QUCIjKc4gJwA64AiRZwCzYl4BpMC3YNpgMqoAFiwosI7nO0ITr5dLyIPx7pX41m3mwpDxJgjuek8AUNPjBJCStHLJNCuOIT05SwcsJrUggt9pilhJUz1klh5QdPSSFc8IZRSlg56AiMca8X3WZVSjlh60ZgDC2s+F91/5b+drV0KOEFG6Gh+RZai9jit/gSirZYeF+xEzpPsQPc4F3oizHH4u6iB0PwB7oZtJ9EqZM/AAAAAElFTkSuQmCC",
+        32: "iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAACXBIWXMAAA7EAAAOxAGVKw4bAAABJ0lEQVRYhe2WsS4EURhGzxUS0YhOtKJRSJCoZVsa4Q1YDf16BPYRZB9B1hMQLYVNFBq0otVpNkcxphF2d2bu5DZzkunuvd/JNzf/DDQ0/IO6q56pM6kEDswYqJspBVSHaledSyWQ86q2YuZMFVy/DNyoPXUhhUDOIfCs7qcSAFgErtS+upRCIGePrI22Wvi8GAIA88Al2f1YSSGQsw08qZ1JB1hsAYBZ4By4VzdSCOSsAw/qxagBVqdAjj/Pn0zXGDwAjkIIj6MW1dHAF9ABtsaFQ/wG7oDjEMLLpBtiNfAJtIFWkXCI08A1cBpCeC+zuYrAB3ASQuhXOKP0K+gBq1XDoXgDb2SX7LZqcM6kDQyBLrAWM3wkv35Kx870OgR2inzVGhrK8g1KkqiRAZl7JgAAAABJRU5ErkJggg==",
+        40: "iVBORw0KGgoAAAANSUhEUgAAACgAAAAoCAYAAACM/rhtAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABeklEQVRYhe2Yuy4FURhG13ZpFEKHVigkCgo13gCPgNPQileQ8wYuj+DyBC61gkRBIVq0Oo0sxeQkg5ycOTN7ZhSz6r3/f+Xbe/7MDDQ0NBRDPVBX6vboinpqwrE6VrfPH1KCqm/qet1OP/gl2OFcnaqi/0DOfWvAo7qthphCfdMlwTTX6kxZ/fMmmGYZeFD31eEI9fojQ4Jp7tTFmP1jJJhmAbhV2+pIjIKxBQEGgT2SY18tWqwMwQ7TwKV6oo7nLVKmYIdNkpG0kWdzFYIAE8BpngFflWCHNeBJbamZelctCDAKHAJX6myvxXUIprHXgjoEP4AWsBpCeO61eKh8nx9cALshhNesG6oSfAd2Qgjn/W6s4ohPgLk8clBugi9AK4RwVaRIGQl+AW1gvqgcxE/wHtgKIdzFKhgrwU9gH1iKKQdxErwhuWs9Z1oeiiT4AWyTceCWRpdX/jN1sjapNL8EX/3HH+5H1vDrI8tD8kxyz67LlmloaMjBN7yAKefovYcRAAAAAElFTkSuQmCC",
+        48: "iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABLklEQVRoge3YsU0DMRxG8YCggApaehZgAxgBVoAVYAZYAWZghduACdKnTZcm0o8COVIgJLnL2f87yW8A673qsz2ZVCqVyijAJ66iPTrjhzmecBzt0xrrNLiOdmqFvyzwgtNot73YEJD4wk203062BMASbziP9vyXHQGJKe6iXTeyZ0DiA5fRzmu0DIAZHqK9V3QISAxjAA8IYAgDeGBAohE1gD0FEDWAPQYkyg5ghgBKDmCmgET+AcwckMg3gIUCaDmAQ32Y6P/EMrzjonf5AgFT3GYRzxywxCvOsspnChjtkC3wjJNi8j0GNEZ6mZvjEUch8gcGjPZBM8N9tPeKlvL5Bqkre4rnH6Su7BAvN0hd2SI/2q/FmEHqyi/5xki/1+MHqSuGMkiVSqUyKL4BIJ7ufBVjQHEAAAAASUVORK5CYII=",
+    },
+    "stop": {
+        14: "iVBORw0KGgoAAAANSUhEUgAAAA4AAAAOCAYAAAAfSC3RAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAVklEQVQokWNgoDdghDH+//+vwcDAUM7AwMCLQ+1nBgaGDkZGxpsoov///5//nzCYD1PPhKQXl03IAK6GCZ8qfGCkafxMhHq4GhYkwQ4ojTcBkOYuagIAwAcxPNlU5l0AAAAASUVORK5CYII=",
+        16: "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAWElEQVQ4je2SsQ3AIAwEz4zCCOy/AjNkEvg0FFaiyBSRoOA6W/6zC8NqzBeSMlCCTDWz69WVlCU1xbSxCIDkHOVRf5H8lTOB0HYEOwkq0CcyfcwCf77yMm5KWDwlr2MTCwAAAABJRU5ErkJggg==",
+        20: "iVBORw0KGgoAAAANSUhEUgAAABQAAAAUCAYAAACNiR0NAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAWklEQVQ4jWNgGHGAEZnz//9/XgYGhgYGBgZ5IvU/ZGBgaGBkZPyMVfb///+9/0kHvchmMKGZSazLcOpBN5BiMGrgqIGD0cCHZJiBoocFTbIBSpNUOJDhiOEEAMjfQQDDy6KTAAAAAElFTkSuQmCC",
+        24: "iVBORw0KGgoAAAANSUhEUgAAABgAAAAYCAYAAADgdz34AAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAWElEQVRIie2OsRGAMAzE/CwBQ2UMho+nEAU0QO4Ap8lxVv/SmyXDARSg8p0KlKtPjUA1szn4zyUtTwGC8l0onZxTj+wNGchABv4a8A7fbdsKrMGIH9tkMDaXX0u1UqrESwAAAABJRU5ErkJggg==",
+        28: "iVBORw0KGgoAAAANSUhEUgAAABwAAAAcCAYAAAByDd+UAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAa0lEQVRIie2WwQnAIBAE9+wgJQVr9p2S7CCbT/KJBwdGCcLOU2Tm9KOAWB3zFkkmADuArdNbARxmdoY7SSaShd8p9+BhMA+IPeS335ug9xo9Gld85MEoqKCCCio4J1gH+mMXJz/A/38xxHJcurL2ncJX+wIAAAAASUVORK5CYII=",
+        32: "iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAe0lEQVRYhe2WoRGAMBAENwg8fYTWQi30Rh9o1CGwPBMGCObWZv5vP+rAmJ9J0YOkESjA8DBjBeaU0lI9IWmUtOk9Nkn5LKsLHArQ3z82pAemOwJPv716ZyTQDAtYwAIWsIAFLBAJrB9k1e+UlFtVsqtSmjlqVPtSakxLdsjEuv1emLgGAAAAAElFTkSuQmCC",
+        40: "iVBORw0KGgoAAAANSUhEUgAAACgAAAAoCAYAAACM/rhtAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAArklEQVRYhe3YsRGCQBRF0bumtGAB2gERXWjBVmG+tkD8CCTdr/BhBmbeSWHZyw7JB8zs3MqvGyR1wAB0G+89Aq9Syrj6CZJ6SVX7qZL6qKF5gvPJvYHr6jf8zwe4tU7yEiwc2D+OeY+hdTEK3PqbizT3igIPwYFZDsxyYJYDsxyY5cAsB2Y5MMuBWVHg+nl1ueZeRxg7K3BfPHbOCx5859a9VOAZ/V04968PMzuBCUMshRtSVUycAAAAAElFTkSuQmCC",
+        48: "iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAvUlEQVRoge3YsRWCQBCE4VkzzSwAW6BVLUQMpQ1rsACzu3BMiO8WOFifb774HswPRAAiIiIVJC8kB5KJ20sk7yQ7zzZzjO8AvACc1z6ImT4AejN7lw4dHBe6Yv/xmO55qx3yvIEE4Nhi0QLZzE6lA54Attszn5kVN3o+oZ+mgGgKiKaAaAqIpoBoCoimgGgKiKaAaAqIpoBonoC8+YoV9/YEjA2GLPWsHfj/n7vTBXoAA/b5nDKABxzjRUREviX8lGCVZk1zAAAAAElFTkSuQmCC",
+    },
+    "delete": {
+        14: "iVBORw0KGgoAAAANSUhEUgAAAA4AAAAOCAYAAAAfSC3RAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAuUlEQVQokeWRsQnCUBiEvwtxBLFyAEEcQXEEM4O9lVNY2TuDFg5g4QRWDmAl6QMS5Sx8hkeMxN6Dv7j77+798EQNtlNgBvSCdAV2ku6xTw3BDTAFLkHqAwdJ87oX2x3b3TC57SziWdDevBMHJ/4dk+rU0LIFzsDq46QXlsAAyCSVKYCk0vYNKCTlTSnbBXCTVAIkX9pb8W/BR0tREjwApNFiD6zDB7sWEjAEFrFQwfYYGH158STp+CZPCxqCIroIeTgAAAAASUVORK5CYII=",
+        16: "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAn0lEQVQ4je2TIRbCMBBE/6AwuEouAghkL1B6yHIKBODoJbhBDW4RLO+FTUosglHJ7My8zXsZUYCZLYE9sHJqAk6SHiV9Zjaz0XKMHlwNaN3QJFzjXBv1SkSDH9fABjgG7QG4AncASX0MOANbYOA7euAiaRdX78zMKmb8Kd37vqgZavgH/FrABK9vOydOZlNpOFeiiFtaKsUQPmsckdX6Ccyfj2zItMU5AAAAAElFTkSuQmCC",
+        20: "iVBORw0KGgoAAAANSUhEUgAAABQAAAAUCAYAAACNiR0NAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAA8ElEQVQ4je2UMUoDURRFz4uadIKgIqKdTXAZ2YO4hiwji0jhCgxkH2YDdiklSBws7ETGY+FHhsn8mSktcuEz/Pvuve/xYV7QAvUIuAEOElUC64j4avPlwiZq4S4KdZLzRSZsCGyAd+AR+E6lAXAPnACXvSdVx2maWUNtlmrj1gnVKTBN1xG/b/cGbGuec+AMWAOfiZtHxBzgsCa+Bo6B53SasK00uQU+MjpQl6pZwa5edVnlBn3NfbEP3Af+x8ASQO1sVNGUVb7+L6+AO+BBfenIvErfp7auQ3XRsFRzWKSt/ofcgr0ATjsmLCLitU7+AOK6p1KV42EWAAAAAElFTkSuQmCC",
+        24: "iVBORw0KGgoAAAANSUhEUgAAABgAAAAYCAYAAADgdz34AAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAfUlEQVRIie2VsQ3AIAwEDeOwIOwLmeNSQCJEKMAoScO3j/9sUbzInwIsEIDEU6l4dgUQOsGt/Arg2tx1PFe8uAIAQOuLiJh2QL1NHWrMnav/IK1Gzp6Ze/2CDdiADdgAJeAQyYUyGlK9TSOPR2pSX5/kovdAnAiOZeb7fjkBY+cIvdBe3/IAAAAASUVORK5CYII=",
+        28: "iVBORw0KGgoAAAANSUhEUgAAABwAAAAcCAYAAAByDd+UAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABH0lEQVRIie2Wr06DMRTFf5eQgWGY7REgBAxvgONNILNIZuaGxCGGRvEGONQSFAYC6LkPAzML5mDaZDTtvj9sUz1J09v09Jx7bysKa4ZVIUlqA33gBNgJtqfAIzA0s+9/ZySpLelD5Xh3iS3EZgXPPrAHfAK3wE+w3wLOgH3g0o3mkDR2FQwXcK4cZ1ym96dCSV2gG3A6bt6VdJjQ8a3sRDiFmRWpTAcV7qouBvMeG2UtWDbCR3MDfAHXbn3UUPfFzRfAXdLQzApJk7n1axM3ST6chPe39pZmw2yYDbNhNlyN4dQHklp1BSVtxbQ8Yp+oJ2AGbAP3kp4BRXgxGHDs4pnTqpRlbwlfi14qo5TpKXAOHFSszuMNGJnZQ81zq8Evi18emgrTmDwAAAAASUVORK5CYII=",
+        32: "iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAACXBIWXMAAA7EAAAOxAGVKw4bAAABGUlEQVRYhe2XvVEDMRBGnwwh1OCjAUipwOPIJHZiyqAOyoAZDy6EFFdADSa++QisY5az7m5ty+NEX7SS9uedtMEtXFjhEGdJFfAM3ANXreMa2ABvIYTvHHDt4k+SthrWVtIsd/E7ST+O4hai8uQeORmWwE20p8AotBRzTaPPbYzJI0kr83WdfSMpGL+VJ/d1Iski4Tc29lySJ/c4lSuE8PFvnQBwZT9W8bn+5O2Bs2nvCYAF8AI8mvUpaq78E3h1RUhaN510YnFMU65T5xd/ggJQAApAASgABaAAdAHUjdH3EzqkVmyd8ukC2Bh7cgxEjJmYra9DgivnFJR9ULEQs0wQvaNa79VG6iXwwP4wOqSa3bW/n2VYzaVfCsluzuh/WqEAAAAASUVORK5CYII=",
+        40: "iVBORw0KGgoAAAANSUhEUgAAACgAAAAoCAYAAACM/rhtAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABNElEQVRYhe2YMU4DMRBFZ1DSkSIR6bgGFFwgF4jgDGk5ViRyDBqOsdQ0W1I8iiWS5diJZ2d3CZJfZ2vsefJot/giV456DgMrEXkUkdtMSSsiH6r65eljBlgDB8o5AHdTyjUGuSMNsJ5C0PJyJy85ttwqargD5mfq5781IcsxBTdRs6xcJBmysfS8MTouwoWqfl86kKhZJAszzFKbwD5Tf19Yd45X4DnVVlVf4s3kfxCgR2MvqOrJRK0jnpzkiEVkL904n6K9IQnH/C4in6bTwDb89AZV6+4P2ebqrn7EVdBLFfRSBb1UQS9V0EsV9FIFvVRBL1XQy78WbMNFScxRSuKuNll44RJTUGSRGyxQwhe1ldI/kqN/WFlKgzd5xR73lvJWIlccotMF5g9ijM8S/E2wPhY/gcif/oQpIeIAAAAASUVORK5CYII=",
+        48: "iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABBUlEQVRoge2aOw6DMBBEIR0FBwuH4gLpQ85DmwNBNyliIscC+YPxhGheh+Rd5mFDs1SV+AMAdABGABP8TGZtx85dAWgAPAJCbzEAaJgCe8J/JFjhuwzhF8ofJ7zPsc0NQBtQ15q1NmOJzG4Q94X1hrdqW6d2Ss1RpxYCwFejuo7qtbd+4ZJS9EtsWrtPiM3WDp1+ByTAxvvm5/pahBJ7v9PvgATYSICNBNhIgI0E2EiAjQTYSICNBNhIgI0E2EiATYjAbF/EDDJiWek9ry60CBF4Otf9ERKmZ++5d1LjnMO8WK67BYxEjnFqLPnGr3gPtIeC4e84YgCOuF8KYll+QchzbEQhXmNfVsMJUTEbAAAAAElFTkSuQmCC",
+    },
+    "refresh": {
+        14: "iVBORw0KGgoAAAANSUhEUgAAAA4AAAAOCAYAAAAfSC3RAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAA9ElEQVQokZ2SsUoDQRCGvxUjXJXieglowMrSEGzyJFqksPdpAp5wBMs8gYUEAhbpDBjwRQxi8Vk4gUUvZ3Cq3Zn5dmb+WfinpZ8O9RK4Bs7CtQKmKaVlnneQAR11AjwCR8ADUMd5rlZqoR6rs7xSpb6qJw1d9NW1+qQOVLeBobpRe7tmUkt1qb7kYKmOWqCuOlcX6ofqL3F2gAUwjmsHSEm9BQQ+I3CfUtrs85pRfhHtdFtyR2qZg6sYvGyBeiHgMAcHIfVa7TdApxGrcucsllrELt/VO3Ws3qh1+Cbq4ZZr+nIXwBVwzrdob0CdUnr+U7B97Au2aPRLEO0hqgAAAABJRU5ErkJggg==",
+        16: "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABF0lEQVQ4jaWTvUoDURCFz2xilaQKhECyKdL6BD6Gen2KvJI/D2AgXQp9gBQprBZSGRBWBCG1YPSzcJDrJdk1eKq9O2fOPcycK/0TtusnMJYUJI0lZZIKSTMze6pUAzrAFd94Ae6AOVACH15rO3cIhLi5BSydfAY0oloDOAdegQIYAAEgFrgBnoG8wuEIWAGPwORHAOgDb78s7RfpAQ/AJnXQBbKa5ikJdm6hQuBE0sCPR5K2BlxIakp690JpZotDVFNMa/gZ0E0FNj6Y3h8uDD7wfiww8dWsgFFFc+6rvk4dBA9H4WEJSZCaHqTSw9ZKLQ39u+1x3Tp5Dtx7rAEugU7sat9jyiWdSjqW9ClpLenWzNZ1MzoYX9rUXxlOYugRAAAAAElFTkSuQmCC",
+        20: "iVBORw0KGgoAAAANSUhEUgAAABQAAAAUCAYAAACNiR0NAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABhUlEQVQ4ja2UsUocYRSFv7sGUqkshBCwEYNiEbFIIMFXSCPIVooiNmJtkTQJxMLCF0gdSGcgTR4ipWAji4qurBIEQRNBk82Xwn9h2B3jr3iambnz33PPHO4ZuGfE/16qFWAEeAI8ALaAg4jwVlPUPnVF3bMbDfWtWs1SqE4An4FBYAf4AmwDl0ntFDAMNIBaRHxPfcvAq06yF+ov9USdVssGVtQ59Vz9o9ZSfV21eLBfPVRP1bEMW8bVptpSF8oI3yePpm8iK/Q8VXdT34bFT1IngdfAYkS0MsiWgMdALzALPMoVch3hZskGdJt+C8Jh4GFnPdRnJecvIqJ+10ll2LwTGVdxauMY+AScAT8yxfQAH4FvEfG1qHAjXXfUoVw1aflV3xWLpqVcSEvaVMczyMZSCA7Vvi7CdF9LcTpP8aqUEIU6k+L5U33eeWDdq2C3n1+q+2lQXV1V59VFdS3Z0rZnItebqvqmQFzEnvpB7S3rvekHG8AAMAr8Bo6AekT8zVJ2H/gHm7i4j0et13QAAAAASUVORK5CYII=",
+        24: "iVBORw0KGgoAAAANSUhEUgAAABgAAAAYCAYAAADgdz34AAAACXBIWXMAAA7EAAAOxAGVKw4bAAABgUlEQVRIidXVv05VQRgE8FkgqFBp4RMQC3OJlVJpCBY0+gA21sRCExroNPokdvoCVsZEnwHEIDWFCRXRRKP8LM4qx8v9w7layDQn2f2+mf1OdmaTs44yahPTSW4nuZ9kMcnlJOeS7CbZTvIiyetSis7KuIU947GD1S7EBc9wVAm2sIFruIjz6OEBPtSaIzypE//igZOTYbPufcFDTI04zBTW8b32vMTsUAHcrevfsNxh6hUc1t5XmDshgGm8r+trpyVv9d/AQe1/O0hgCZ+xi5muApWjh/32DegvmMfCBMRDMdIHXQT+Bc//iTJqvFLKX//CoSaaBFjAfP9iG/voTUg+g4/1qi8NEnhXvwe4PoHAWu3f1sqktsBctTmN7Vc6kC9r4gXu9G/+dhxmNYFFE2DrxofdI00wwsagoj8srcmkx47jekcTzYu4gEua6N7URLla+7STcbHqOPxGYQ83h/GMezJLmifzXpKrSa4k+ZrkU5KtJM+TvCml/Dj1yc8cfgL6pldVbASWxwAAAABJRU5ErkJggg==",
+        28: "iVBORw0KGgoAAAANSUhEUgAAABwAAAAcCAYAAAByDd+UAAAACXBIWXMAAA7EAAAOxAGVKw4bAAACD0lEQVRIid2WO2gUURhGz4VsVtMFjDZBCApBFBEFEXz00UoIKEFLBVNq6RYKdpJOwSoKBgRtFFFLtRSFgGgCES0MIgbBB2rc9XEs9o5cN7OZzWYLyQfDMv/jO/MPs/deWOkKrRaqvcABYD2wDlgNzADTwKMQwvuOPJG6R72hVm2uqnpF3VHk13RCdRVwDjiZ1P0CXgJvgK/ABmAjUEpaLwKnQgjVxKsf2LXYVL3qZDLBU/WE2pdT26MeU6eS+ifqQFIznCXyYGX1Ycz/VM+opQWFC/u61LEE+lodbAU4njQdKgLl9I+otdg/p25rCozJTKeXCkt8htT56PNRrTQD3orxV628xgLoPvVz9PueAbsa6i4BX4B7IYQfbUDWAqNJ6BpwlPp/tvNSt1igxgmXqyrwPCfeHX9rHeb9hwrqMxYf+WAI4UWngF3A5oKacqdgGTDVPHAVeJvE5toxVo8A+4GJEMLdNJEp234+qXvbgSSepbh4qN5sTGaqxGXIuCwNLQNYSXy3NgMOW19L5+J9TR1pA3Y48RzPK/gLjPeD6mwSH2tlgVC71bPWtzTVB+rCD64RGGMD6uMkN6UeV3ty+vvUUeubdKZJ62eg3Ccbjld/Q7ysXvBf1dRp9bZ6X51JJlL9rZ63fjxpT+p29bLFh6jr6u4iv6UcE9cAO4FNwCDwDXgHzAJ3Qggf2pxphekPB9LXRTHdkrAAAAAASUVORK5CYII=",
+        32: "iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAACXBIWXMAAA7EAAAOxAGVKw4bAAACS0lEQVRYheWXO28TQRSFz43Iw8ShSUIDHRIPKVQ0tCAhQEhpcImlSBSg8JBARIJfQJB4FPAPKKAwHQXiDwASUCGEFVxAgCqRwBgL2Qofxa7ReL2z3qzXBcqpdufee84Zz3jnjrTVYVmKgBlJ+yTtkNSWtCJp1cz+5OitR3QWuAy8IR4N4BVwEZjKU7gA3AXaHuE41IF7aYwkLgFwSNJDSQec4aakp5I+SPom6aekPWHOMUkzTm5VUsnM3kV4r0k63G/mR4GWM6sV4AxQTKgpAGeBqlPXBMqRvEon6CM6CPxwSO4Dk4mOu+sngUeRZVlMZQCYBr44hVfSCkd4DFiKmLiRxsCyU/AAyPRXdfgWgA2Hc9lrANgJ/Apjn4CxQcQd3hLd+6nmMzAPrIWxc3mIO9wnCDZkF+ISR8Pk8QEFS1GxOGyLFppZW9KzQcQ3gx4DOeKrpCee2ISk30PU/o9gQCV8TvpZ7pjZi6E4SLNTgdJQxCWNDIvYBTAOnARG44JRNIHjORs4H3KvAfM+AzXnuQWczkl8DPgc8jaAWZ+BCnDLed8AFgYUN4IDrYObcUn/DITv1yNLskTGExG46vCsAtN9DYRjixETj9l8Q+LO/Dsw50vuMRCOl+k+vaoE7VYhQbgY1n106lrAEV+N+yF6aWa3I4RzkioK7gAdrEt6rqAprUkqStolab+kU5K2O7nvJZXN7K3PQF8AUwQtdp30aBO08hOZhT1GLhBcPhoe4dfAJYKbUypk3d0jknZL2qvgSK9LqprZeha+rY2/I8fCWHYPtCMAAAAASUVORK5CYII=",
+        40: "iVBORw0KGgoAAAANSUhEUgAAACgAAAAoCAYAAACM/rhtAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAC0ElEQVRYhe2YTUhVQRiG31Ev2o2iMFqYgiUEhYuojCIXrjKpRYFro9q5qXYV2KJNtSmXbtxUUILbFrUt6RdMBEOC3BhaYBn9cEG5T4s5wmmc47nnnnuMzHd3z8z3fs+cn7nfN9K61rhMmmBgo6R2SXsl7ZJUJ6lK0mdJ05JeSxo1xiyk5EwEVQWcBB4BBeL1A7gPHANS3ZBS4NqA8RKgovQG6EySs6QVATlJVyX1Sar2TPki6Z2kOUlFSTsl7Za0IcLyrqQLxph5T65GSYdL4VoKaABeee7GDHAb2O97dMGr0Az0AbOe+Amg2RPXHZ4UB7cZeOsYfwPOATUJFlkLnAW+erxaywIEcsATx/Ax0FQqmMezBRhzPOeAtnIABx2jB0BVuXAh3zww5Hh/BzpKBgS6HIOnQF1auJB/NTDg5Chgt6+VAYPgydCcGaC+UnChPAa45UAuAP1xgKedoIuVhnPyXXbyFeMAe4CpYHwWyGcJGOTsJUJRAQY4CnRlADMcBeOTdy8zxiBppNJw5Sj1tpG1sq0uPAKOSNqx2nn/XxmgO8H8j8aY55nR+JTkkweGVxVO/8BX/NcBsYVJO1GV0gqPs3cV4PLApyDfFNATB1h0fl/JGPCSk+9UHGA/tuQJ6yYZtIvANmwpt6RJYHlD5sB0Y4tGt98d8AaXD1cHPHNyHI+a/AdgcK0DW4aHNUQFSi9st/fQ8R5cKWAZYHD9ELahCWsMaEkB14S/EcslBgzGWrGtYVjz2LazNgFYDXDe4zUKbIoLjgQMxpuxTbarWeBaML5sD8MWvQeAO/gb95dAQ9zi3P/iF8aYaU+yLZL6JZ2J8Pkl6b2kKdmjkXpJeyRt9cxdlHRd0g1jzGIcYCIBndgDoHI1DhysKJQH0mCP0u5hj9biVMAe1Z3wvQpxSnuAmZO0T1KbpEZJ22VPtwqSPkiakDRijPmZJs+61rR+A5fAqKIIzvlqAAAAAElFTkSuQmCC",
+        48: "iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAC/UlEQVRoge2ZPU8UURiFz2X5Cm5cMVAIiQYpjBFtSLRAe5C/oNJIjFZqrUaNxGjiR2HsbKD3o7GikUIaLUAiSKIGSaARITGGRJTH4k50mb0zOzvOrBLm6Xb2zn3Pmb3zztyzUkbG1sYkMQlgJB2UdFzSIUn7Je2SVC8pJ+mzpAVJM5JeShozxrxPovZfAbQCl4E5Kuc1cBHY8S+E54HbwGoM4X5WgKtAoVri+4D5BIT7mQf60hReA1wB1gMEfAUeA2eBHuzyqgcM0AwcAE4Bj4DlECP3gVyIjg1EFZ8DhgMKzgCngaYKLkYjcAKYDZjzGZBPxECI+J/AENAQVbhj7lpsE3D9qi+A7UkYuO6YfBo4HFe4o0Yv8MVR5xXQEtsA0O+Y9A0pdAygA5h01HsLtFdsACgAi77xi8DupMUX1WwGxh0mPgB7KzVwzzf2G9Cdlviiunlg1GFiAeiKZABoA9Z8Y8+nLb6ofiPw1GFiKaoB/437DqirlgFPQx0w4jCxgZqA8z9Jmij6fMcYs1YF3b/x6g1Iehh7Em/N3QC2JaYsuFYsEnmdToLA9VyGoCW0adj0BjIytjombvsyxvwXLXjTd6HMQFpgX6uHgK5yA8N4EPLClyrAmSIdE8Bg0MByjAC1VRZfT2licS2qgZJNA3Zz0VhFAxd89deAtqgGurDbNz+jBGQ1CYvvxm5fi7kbdsIGvGOdwEeHiXGgOUXxe3AHCSX5UKgB73g7NtLwMwl0pCC+AEw56vWXO9FpwPuuBRsu+VkCehMUfwQbUfpx37hRDXjfF4Axx+Tr2FgwdocCGoCb2JjSzzAhIW9kA96YPDZwdTELnKSCLgU0AYMBVz26+KgGvHE5SsOuYpax0fkAtpPtxEbrDdio/ShwDniCjeJdrAOXSPPhiQ1i0/qDI7H7qpyJAvZvoZUEhK8Ct6jCM8ZlZAf2qenqVOWYwy6XlvKVgklsUwJ0SjomqUfSPkltklol/ZD0XdKipGlJk5KeS5oyxsTaTGVkZPzhF7vdBazptyunAAAAAElFTkSuQmCC",
+    },
+    "ping": {
+        14: "iVBORw0KGgoAAAANSUhEUgAAAA4AAAAOCAYAAAAfSC3RAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAA+0lEQVQokb2QsS5EURRF1xlTaXjVRKKbRkHFRCW8Fj/gI4hy/mA6iSj4A/EBWgmvEKVCLTEFKqOhEFmaM8ljJjEaOznJPfvufc8+F/4bUW/UaWANWAVaST8DN0AVEW9DbSMNhdoDnoAToA28ZLWTe1R7ajGc0lH7aqWuq99SpCbyrlIf1JVQW8AOcBQRn2oHKIHFXOUOuIyIa3UK2AVOo/bqPHAAbAHnwC0gsARsAxfAfkTcAzRrid5zx4WI6P+IOgd0UzP6qymaAfaAjaSugMOIGNR1TUbRAJaBs+w3k5sMaqmWExvSVKgfWbPjNOOiAgyA4zy//mnqb/gCqAJ5H6N0NwwAAAAASUVORK5CYII=",
+        16: "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABDklEQVQ4jcWRsUpDQRBFz5pHJH8QUYjYWwVsQmr9gAh+g4UKNtqnEEQ/wtbGSmJtJ5LGTsFatDfo43ksnGiQPBML8cLA7N17L7Oz8N9I40h1FlgC6kE9APcppZfSJDVTN9Se+uwH3qIMrheayndzW71Tc/VE7ajzEZpF34m7XL1V20NzSy3UM7Ux6c1qI7SF2kJN6qqaQlBXD9Rr9VF9UvvqkboQmk9PGkmeAfaA/VjaOXADFMAysAYsAodAN6WUjxuvq+6q1ZIlb6rHw2mh/BurwDqwEtQVcJpSep20o2HAtjpQL6IG6s5U5gioqHMj57qaTR0Qppp6GVX7lTkCmn6hWab7aaw+sDXS/w3eAebPFGeUsV7sAAAAAElFTkSuQmCC",
+        20: "iVBORw0KGgoAAAANSUhEUgAAABQAAAAUCAYAAACNiR0NAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABWklEQVQ4jeWTsUtCYRTFz/UVDrUYVJZi1hJRe6NDNAQN/QVt/Q9BrQ0iNLc2tdVuBElIS0UIIYRQS0NRNDgFya/lGi/1aWJbBz74vnvOPe/d870n/TtYFAHMSspJSkma8PKLpCdJJTN76OkOJIBdoMZPNHyFUQN2gEQno8DJuourwB6QAyadD3yfc67q2rr3Bk2zJFBysgJsALFfTBNzbcV7z4GkASOSziRdSto2s49QU0rSsqSk5/0s6crMHkOauKS861aaxeGW8TeBW6JxB2y19H3vw2NMA+VQNvvAOrAELAJrQB54d80NMNctlzhwARwCU11048ABcA2Mhrm27xAIzKwROo9JmvfjvZm9RWm7AkgDxx3yOwHSUX1DXTxfJWUlHUk69dqqpAXn+gfQ9sCOt9mnadZvvgzMDGTmhoVQfoVe+p6/mKSipE9fxUFfUJIEZIDMn5j1iy/oqI0R70vpZwAAAABJRU5ErkJggg==",
+        24: "iVBORw0KGgoAAAANSUhEUgAAABgAAAAYCAYAAADgdz34AAAACXBIWXMAAA7EAAAOxAGVKw4bAAABfElEQVRIie2Sv0vVYRTGP+eupYNwzQsmtTSkDS1CgiIhCEJg/hXh0n/RH9AQQVO1CQ6FItiitAQNLQ1B0x3uUHfS4IYmfBo60Zeb33pNLYceOMt7zvM858cL//GvEXUJ9RwwDcwBE8AFYDjTH4EPwFvgBfAyInpFjuq4+kTd82d8yejHXnKu/kq4pa5WSD31ubqsXlOH1MgYyrflrOlVeKtqq198Qe1mwa56T20WjfyN30zObmp01YXvyUG1k4m1owjXGK2nVkcdjExcB2aA+xFhlQAsArPAONAEGkAXeAdsAc8iolPhBHAX2I6IN3WdDKsP1c99xzxQ9w85/GN1rHTMuco9DtSn6pI6ojbyyE31lvrIH79tR71dYnA5DTbUSwX1LXUlDzxROsVo7rK0PtSLh+V+K6IOAHeAeeBKPr8HNoEHEfGptJG6zl5Zj9dHmbTOZDLvcVM9nzGb//3GscT/KtQptZ0xdRoG7cru26W8xol38qc49RWdWXwFLJ31HCZLRRoAAAAASUVORK5CYII=",
+        28: "iVBORw0KGgoAAAANSUhEUgAAABwAAAAcCAYAAAByDd+UAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABy0lEQVRIie3VMWtUURAF4LlZjYkpJGACdrFQERQUYreiIMoSDCIEi4BgI/Zi609Q0EIL/4OlCBbB4FoJUZImSWERIaCFiEgKwc9i78Lysm93nyZIwAMDj5k559w7DPdF/MdeR6rSjLGImIiIyZz6HBFfUko//toQKSKOR8TlHBci4lBJ+7eIeB0Rr3KspZQMdAIMYRZN5fiZowzNrDHUz6yBlQJ5A88whxMYR8oxnnNzuWejwF1Bo5vRATwsNC/gUh7toNNJmbNQ0HqA4XZTDW87isuoD2rSw7xemFYTtXZxPiefYLREoIYzuIbbuIPrOIf9JZxRPM3a88XiyS6EhCt4jq/K8R0v8gFqXXS2aZeN5EMX8U28xxI+4Vehvo6ZvgYFs/sFoTe4iSNdeg/jBl4WjB9XMbyaDddwsQJvOt8cbg1smMkNraesKm8Ys2X1qm/pdEScjYhjObUeEUsppXdVD9bPqI7FHlu6iPODaO0b0HMkItqCHyNiOX+fjoijuXawyiX6AnfzMqWOXMIM7u2o2T+F1m9nM0fpNu6U2RS2OpZlC1NVNHr/ILfjVLQWqI2RnNsdYAyrHTdc/ZPHoarpJB7lmNhVsz2J37qUoKQNZTXcAAAAAElFTkSuQmCC",
+        32: "iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAACXBIWXMAAA7EAAAOxAGVKw4bAAACNklEQVRYhe2WzUsWURTGf/dV+xB7V6Yuiij7klrXLkJa+A8EgYK0i1ZF5KYWghCV/hPRImpXu7JFuAgSWhSFSe2y0DcKcmNB+Gsx1xqneXXmNSvIB85i7pzzPM+duefMwAY28JcRyiSrO4DDQEcqAGqpeBFCmPktBtTNQB9wIsbBgryvgIfAOHA/hPC1qKEl4Tb1gvrelfElxkp4F7naigi3qJfVTxmSRXVSHVF71X1qVQ0xqnGtN+ZMxpo0PqqX1JZ64t2xMI05dUhtL/UIE772WFvLcD5Ru7PJ/ep8KqmmnlNbywrnGGmNXGkj82p/Omk0dfOB2rVW4RwjXep4SmcUYheoFeAG8BK4HkJYzCHYBBwBjgNHgS6SNqyQtN8c8BR4BDwOISzkcFSAIeAQMJink+e8Qx1WP1gcn9Uxdedq/HXngNoEnAdGgC2Z2zPAdNz1ItAJ7AG6M3nfgDFguNQsULeqE5ldvVUvqgfUXOPqLvWsOp2pfaZuL2wgkl1Nndgz8QwUrW1ST/nz5N+sZ3o1kivq7lKFyzk6TTos+wp/oJyr5eRVYG+8fBNCmG+Uq4xop3pNnc05+bNxt799hiyJ96gLBVpwQe0pyttcNDGEMKXeAk4Dr4E7JIMLksFyEtgP3A4hTBXfWgmo29QB9RfjarPJN6W6LuL/HNTB2Oc1dfBPi/flHL6+RrgqDXoYKLi2bgaeF1xbH5j8O95LPf671vvXWwVrGcUBOBYvJ0IINsr1f+M79JPcBvo9yzIAAAAASUVORK5CYII=",
+        40: "iVBORw0KGgoAAAANSUhEUgAAACgAAAAoCAYAAACM/rhtAAAACXBIWXMAAA7EAAAOxAGVKw4bAAACy0lEQVRYhe2XzWsdVRjGf6fXLkxEsWnMIqAGK4UQDW0ppgpqMbrIzhYRyaaC6LIbqZRmUSiEuhRdJJBNQf+C6EISbBal2i6yUCxosoiUomkTDdpC/bj8XMwJnV5m7sfMTULhPnAW95z3fZ5n7jnzvmeggw46eLARyhKoFaAPeBTojtN3gD+B1RBCtQx/ywbVp4HXgVHgIPAUsDsn/F/gF2ARmAPmQwgrRYw2MnVYnVKXLY/lyHW4rKmgvqbOtyD+VxzNYj5qtLaT6ph6tQ7xdXVGfUcdUQfUrlR+d5wbiTEzMScPV9SxZox1qdM5JCvqh+pgy098b0cGI8dKjsZU+kFrCYbVaxlJP6sn1LwXoWWou9V31aUMvR/V52sTxtW7NYG34nylXcYyjFaixlqN9l11PB24X11PBVxU+7fKWIbRfnUhpb+u7odUHVRfAr4GPgYmGxVYdS/wCvAySS18Io4KcBNYBW4Al4CFEMKNBnwV4AxwCngjhHA5K2hPA5KH1Q/UxcwjXh8/qR+pjzfQqOshL6lbPRvPZVncVj9Re5vRblgu1BeBC8C+jOXbwDfAd8CvJNtaJenNfcAhkrbYk5F7E3gvhDDbjNE8c++r1Yx/4St11CZKj7pLfUH9XP0vg+tcGYNPqr+lyOasrVGt8Q2oX6T47qgHChuMpCPqhnpS3VWK7B7n2yal5Hg7+FAfaQtRAc52XFh7gCPAc0Bv5LwF/AB8G0JYK6tR1Nir6mzOwd9EVf1SPbrd5k7VMZWH00W0Cm2xSZ/+Htis+lVgCbgWfw8Cz5K0PYA/gOEQwvUieoWgvhnLxHmTvly73qNOmnSOt7bNWI2Jx9oR04H6kDqh/h7HhFt40W0Z6mcZb+2nO+0LAHWoTmkZKsvfjt76TMG17YHaa3KZqMWGTV5KtxzqMfWflLm/1WM77es+mHxXT8cxvNN+Onhg8D91KJ4VQDLERwAAAABJRU5ErkJggg==",
+        48: "iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAACXBIWXMAAA7EAAAOxAGVKw4bAAADHElEQVRoge2YTUgVURiG36PSj7oyc1GUVIKgVEoQ/S7sj6DEKISCApdR0KagchEVUXtduqmFZD9UuCkyKgLDRM1oIxEkLYyyFMXCIH1azMlutztzZ+7M1S7dBw73wnzne99zZs53zoyUJUuWLFn+Z0zYBECBpHWSVktaYVuJpELbJGnCtk+S3tn2WlKPMeZbGP3AAwByJK2XtE/STklrJeWmqD8l6ZWkDkn3JHUbY6ZTzOUNUApcAYZIH0NWozRK49XAXWAqgJFpYNwaGrL/pwP0n7KaVWGMlwFtPsQGgVbgOFADLAf+eqSAXHutxsa22r7JaAPKghjPA84Akx5JB4BzQEXKM+RoGaDS5hrw0JsETgN5yRKWA70eifqA/TgLOVKAHOAA8NJDvxcod0tQi/OsJqIL2AOELrs+BmKAvcALFy9jQG18p80uwaNA/WwYdxlIvfWQiE3xwS1xAZ1EWc5SBKd8d8Z5a/k1qSYmME9Su6Tdki5LOm+M+eFTxEiqlLRNUoWkYtsWy9nkPksatr9vJT2R1Bcgf56k85IaJd2XVJewL1AIbPGZNAeowylzH11usxdjQDvQAMz3qbkVKEwe6Z0kHzgKvEnBtBsfgEagKJQ5H+YPAsMBZ3kkQPxX4CQJNsKwxhcBNzyEp3HK3iV+78YLYvrPA5YCG4GzwGPgu0e+Z8DKqMwX436AGwEuAiUp5C0ETgDvXXJPAGuiGsSFBMlPEXZBaebuNOCsg1iuE9X+g1NxbtnEz4FVkST+U6MYuGM1uoGFUQvkA8dIdqAKp2GAI8CSdGn8c0R6xrGLbpekDXLejYusxhdJg5K6JHUYY/qj1A2Fve2HgB6XapKIXuAwaTiWBzWfC3QEMB7P07BrKtQMGGOmJD3wCBmVNOJx/aHfA13awCmxj2Jm9Tawg5g9AigAtgM342Y/2iNDquAcE9qAah+xVTib1LLZ8JYlI7HPfDPOR4JxoAnIn2tfvrDm+xOUzP6MGISdeTea59pfUnD/tgQwHrXe3G7lEZCOAVzzuHY1DXrRkvGLWJp5+WnKyDKaJUuG8RNJ4azTqZ8ZHAAAAABJRU5ErkJggg==",
+    },
+    "swap": {
+        14: "iVBORw0KGgoAAAANSUhEUgAAAA4AAAAOCAYAAAAfSC3RAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAr0lEQVQokbWRqwoCARBFz8g2iyCIwWRTv8KPMIi/Y7f4K2ajxSYKJoNtQbDYlGNwkfWxshu8ceae4XIH/il1oraqQjV1oW7ycOQMI6BfwCfAGGgD3YhIk9yy8wMEqAF1oAmkZaKGOldTdZC/UkZnYBgR26LrA3WqxlfDW+4nBCyBRpkIkUE9YAccgPUP/yoiZvCoGeAEXIAbsAeuBeDxY6K2sicv1LKlvcCTSlBV3QG0Llg5KEN49AAAAABJRU5ErkJggg==",
+        16: "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAp0lEQVQ4jb2SIQ7CQBBF/yS4iqqeoqqVPQSKSu5QU4UF30NwAg5Q24vgCByBhxmxIU22uyT8ZN3+9/9kRvqXgBKofwFMwBNocgEFMAMvoF370JOmSpJ2AWOR1EeK7CUdJV3M7JE6wuDJY5IxAHTAsDWpy00ZvWY8yWWB+SzpJOkq6RbxLWZ2D5OrYD3vDe+wVr/1I5mBYusI35DGz3XKAjikBspsQKo+kWPPENAc8vEAAAAASUVORK5CYII=",
+        20: "iVBORw0KGgoAAAANSUhEUgAAABQAAAAUCAYAAACNiR0NAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAyklEQVQ4jc3TMQrCQBCF4TcmbSCFN/AW6cwlchhBUA/gKWw8hFYSPIyksLD8LbKRVaJkky0cCOyS8GVmmJH+IYAEsL53sxFYKukgafsNDQUz4Eob0dDcQze/PjwyLladkX6YtSQGJjqXVLrzOaTCvkoK4O6eYiqWA00UzEOrIMyVVMX6e9efBshjYaP785pyB1zc9STpNtCozWzfXfw5XHrnUsOjf24Bc7uJW6tp/fPQnYdmocbb6pkZwFptbxeSHpOz9DJNomBT4wm0R+cwbV9UngAAAABJRU5ErkJggg==",
+        24: "iVBORw0KGgoAAAANSUhEUgAAABgAAAAYCAYAAADgdz34AAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAZklEQVRIieWTwQ3AIAzEEEPAjqzb7uN+goToqyIHRdwANiG5EI4PUICkhANcEgmQDP4jCeO5gVx50X0k70j3IF+y/EwbyXe4jV8Eb3r9ra9k36sAsrVwKD13bpPlxVklkXZBA98qDzRZbm5P6MuSAAAAAElFTkSuQmCC",
+        28: "iVBORw0KGgoAAAANSUhEUgAAABwAAAAcCAYAAAByDd+UAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAA9UlEQVRIie3WPQ4BQRjG8WeQuIQ4h8oBtIiQ6CXuo5XottA6gMYdCJVLbIK/wivWBokxOxLxdDOTvL+dr92V/nkjQC0mNgBSoBsDqwIbLjnEQuvA7hvo9i0U6BI2d2ipsOne0so2XH7UjnbDs3hJ0lhS09pzST3n3NGz3vMAZWCWWcoZUA4ORccMrABJFCyHjj7CbKlGQCXgs73ErvuShEIf3kNblqmkoXWlkggBPsSKPHF3F98KJ5La1rWUNJF08qy/cs7tn44C0wDvzmw6eSO/hwvPmfiHy9fiYE+4Beqx0d030DVQjYWmQL9wLIPG+/X7iZwBveS3nZ/VwvwAAAAASUVORK5CYII=",
+        32: "iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAACXBIWXMAAA7EAAAOxAGVKw4bAAAA7klEQVRYhe2VIQ7CMABFfwnJHIfAwAEQzCExmB0CjoPGY0CCQiGnuAISPBd4CCAsY4MxSkvGXjKxpul7a7pUqqkiQAjMgcCX/MSFlfMIoAMcufO/Ed3SEcCS7/AQ0fjK5+czkjRIDjRzJsaSsCBsS+ol3ifGmI2FdV8DjFPbP3Yi/gV55E1+DWgBsRd5KiKyuWAEtKwt+Kb8dqBi5xEZp9netpaQV/M/NllySbPE0E7S3oIrNsZMn84Ahrn32Ocsspzp23AraZ3usvQUAwi43Ns3jkC38AI2yIno+I44+I44AaHTgETEHOg7l9e44AySUC3BXM4YawAAAABJRU5ErkJggg==",
+        40: "iVBORw0KGgoAAAANSUhEUgAAACgAAAAoCAYAAACM/rhtAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABO0lEQVRYhe3XMU7DMBiG4c9MlRhKdyZ2JloJVaq4BAwcgROwsUBbOAFH4BxMLVKZ2JnYGVLmlwGnOJEjBZLUTpV3tCL50R8nSqSurvoCeoAJ7fAG9IElcBcdEjgAXvhtGhUSGAFrskWHnHiQszYg57uJBC7Ybvc+5F5to6netaSr/GJMwFdJT/nFwvsOHEo6bQCyL+lG0pGz9ibpzBjz2cB+5QMGwCp39lbAICisw1UNGAJJlLg0YGyR8eHS7CSbw9mzNGxsgyo5Bz0BxqE9mTxPYRLNJKN+RXS4Enk/FiziWdKxs/wu6VbSVwOOhTHmo9SVBZNruvMij+978FLSyT8nUXs+4KOkh21D/hRg+PlHcFsDk9C2TRY5bwNy1lbkKLRtk0VOHeAS6Id2ZXKQi+hwaRbZC+3o2qm+ARNDCbF/JUOFAAAAAElFTkSuQmCC",
+        48: "iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAA6klEQVRoge2YQQ6CMBBFZzwQ91EJZ+lZSIyn1OdCmrgoWAhxOjhv2wTeT9qhH5EgCMwBOmuHzQAJeAC9tctqJvmMrxBAN0njOUQfIVrgr0NoxYPZT3MTTxEZVPVWWjz9WGYLJxEZgfPcoms8BMhb6G4tsojrSRTyVniXP8Rlzu91OoPnQpPBolKavHQvPqZHsnZZTWH0JWunahbmdvvbyftHJ+RN8CA/24mBq4iMYlx6VHWxtxflgIs0IF/DnKD1n4hqigGm/jnIu4/6xcMh/kqEaIWjh2j/MpcphEjWTqvBc6HJuNo2QXBgXpKcrYmVCU42AAAAAElFTkSuQmCC",
+    },
+    "plus": {
+        14: "iVBORw0KGgoAAAANSUhEUgAAAA4AAAAOCAYAAAAfSC3RAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAARklEQVQokWNgGDTg////PP///+chR+OU////T8Elz0Sui8jWyAhjQP3TgSRnB6UPIYlVMDIyfqHIRpxg8AUOTkB2AqAZAACTbiB0ril/QgAAAABJRU5ErkJggg==",
+        16: "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAXUlEQVQ4jWNgGN7g////hf///y/Ep4aFgBmWDAwM//EpYCLVVVQ3gBGZA/WvJZIQzAsnkMSOMzIy9sM42MLgPxY23nDACf7//7/q////K/GpGfhAJJQOjlNqwRAAADElGjtZig85AAAAAElFTkSuQmCC",
+        20: "iVBORw0KGgoAAAANSUhEUgAAABQAAAAUCAYAAACNiR0NAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAWklEQVQ4jWNgGAV0Af///9/4////jcSoZSHSTGViLWciVuHwMZARXQAa+OhhpgKl76CJ32VkZPRHFqC6C4kC////v/L///8rxKgd/JFCdQOJzSl3qW3xKMANAO9BFhZzsj8/AAAAAElFTkSuQmCC",
+        24: "iVBORw0KGgoAAAANSUhEUgAAABgAAAAYCAYAAADgdz34AAAACXBIWXMAAA7EAAAOxAGVKw4bAAAANklEQVRIiWNgGAWjABn8hwJS9DDRyjGjFgweCxixCZKaUuCGMTJimEdzH5AERvPBqAWjYKQCAGGKFAicG4NkAAAAAElFTkSuQmCC",
+        28: "iVBORw0KGgoAAAANSUhEUgAAABwAAAAcCAYAAAByDd+UAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAd0lEQVRIiWNgGAWjgETASKqG////szMwMChDuXcZGRl/UtdJmBZq/UcALVL1M9HCUaMWDm8LWbAJoiV9dIAsrvz//39cZhOfZdCSPrkAa5ahe5BiLWmICNJNULYfAwPDXRzqqFMKjZY0oxYOjmyBD9C9Ah4FowAAXtR7+xekmfEAAAAASUVORK5CYII=",
+        32: "iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAiUlEQVRYhe2W4QmAIBCF30VjNEjuUYu0R3PlIO1x/TEKSSk7iPB9v5RT+VDuIUBI7UjpRlXtALgwXURktVG6LzDqwVB6TmMpRQEK/FKgTRWiPr/iXHOqmsuU5zkR9flbkjnx+RMkry08QZ/Z6wBMYTwD8Jm13jyqGcUUoIAVb79ke07Y9zkh1bABCv+FI8j4bnwAAAAASUVORK5CYII=",
+        40: "iVBORw0KGgoAAAANSUhEUgAAACgAAAAoCAYAAACM/rhtAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAArElEQVRYhe3X0QmEMBAE0IlYhldICrlCrhLr8Brx+rCQ9Wch4oe7sHtHOOeBED+yDIkwCBAR3VvJGiQiLwBVX9dSypwxd8wYoiqAp64la+iQNehbGDCKAaMYMKr7gGaTnBriSgUw6XoD8HHsMRvH0yTHhvB66GMxG6f7K/ac4Apft1a0U9t0n8XzGeQQkbc0S9bc7q+YAaMYMIoBo7oPmPlXd2yc3zUEEdGf2wEztiXqhd/QdwAAAABJRU5ErkJggg==",
+        48: "iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAW0lEQVRoge3XsQ2AMAxFwZj9dzY1VGmcL8TdALae0jhrAQA5NTW4u/uxqGpk1zUx9CQBaQLSBKQJSBOQtn2fvG+babu30+dfQECa/0CagDQBaQLSBKQJAAD+7AbUoww2WDKpvQAAAABJRU5ErkJggg==",
+    },
+    "folder": {
+        14: "iVBORw0KGgoAAAANSUhEUgAAAA4AAAAOCAYAAAAfSC3RAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAnElEQVQokeWSIQ7CUBAF57eVYEhP0NNQDAKSejQnwGG4UgUGyTlKkOARzSAoCWn6IallklWb2byXLIwkqAlwABZA0s0VmIcQ2qipLtVGrdS1ulEf6l7NezNTw1vcqqfesdI4Z3WSDeYPoVZzIPRWKXAEVoNiJ98i1e7ANImW/8E/iBlwAQq1AuKf8iIFCqD5fLmyW3yjBWpgNzYpT4MucFAkUY75AAAAAElFTkSuQmCC",
+        16: "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAw0lEQVQ4je3RMUpDQRSF4e++vEoQrBU3YSH2AXvR3tI1iWtwAQrWJrWpbAXrgGCj8VjkBZ4QTTStfzXM3P9wLsOGFCQ5wgW2e283VXW1MiDJHh5xj2l3f4o3HFTV5KeAFofYwnFVfXSNWozwkOR6ifeCy6oaNRjAQu7O7zjHMhn2cZdkV5KzJFm1a58kTeacNL8Rew0XbQd/CujzHzAPmDH/mnWl3uysxRivuE0y/V77wk7njJuqesYQT+s26GaHnbsZn9ZARybQpIuUAAAAAElFTkSuQmCC",
+        20: "iVBORw0KGgoAAAANSUhEUgAAABQAAAAUCAYAAACNiR0NAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAA5UlEQVQ4je2UMWoCQRSGv19FQfAMCdY2WuQIe40UewohhQcI5Ay2dlp6BAu3CqQK9oFUKRLR/dOMoquru2KnXzMD897Hzxtm4Mpos7H9CPSASqZmImlZymo7tr3ycQalEtpuAt9AArwBaTirA8Owf5KUFBHWgDbQAKaSRpnkH8AMmNt+z3GkoaYv6Wt3Xj6IL82BFyBPtgn1DIxtC9udS2a1i+3X4HjI3uil/IS1dS3hlrvw1oTKrTrPtrcGfAJ/QBTea5rXdSJUBPwG19nvqwgr2/Fe1PDBdoFqyYRrIJG0KNlXjH9n2qzeH2d8cQAAAABJRU5ErkJggg==",
+        24: "iVBORw0KGgoAAAANSUhEUgAAABgAAAAYCAYAAADgdz34AAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAj0lEQVRIie2Vyw2AIBAFCSdrsQI7wxa0QQsAyzDjwTVB4wdEORgm4cKSN7AkoNQvADTQAo5jBqBKEbQnwT5dimDdeX1Qa4BJRvNUAMBFvQ844YqTjugYQSX3EIMJFkR2o5Y4+4lgn6fvFqdSBEVQBBkFo1LLO5Ia6GU4fzLkw4ll85pqwAD2hWArWZ+3Pw8zB/e3Qz3dgzUAAAAASUVORK5CYII=",
+        28: "iVBORw0KGgoAAAANSUhEUgAAABwAAAAcCAYAAAByDd+UAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABIklEQVRIie2WwSpEYRiGn8+YUcQN2FiQlWzZSImNW5iVrRLK3sZaijtwC5KxobgDGyRlzWqyoPRYONOMyeQcZ0zSeTbfWbz/+5y+Tp0f/jvReFBLQBWYB4Y75Hcj4jK3VS2rNb/nVh3M4+pP5gawCLwCJ8lsZQYYBcaBnSSfS7iczIOI2PwqqO4Ba8C6eg1cpOivAw8RYXvZVbKy7U4n1SH1LsXa27lXFxo9fSneEoCIeAZW0uZbGAOO1WlorjSt9FydBCopj1SAfWAW2AKqmYSJ9CZLXj1NhFOQYaU5aHwwpV4JP1EIC2EhLIS9Ez4lc+QXHI3OR2j+no6AOWBVnQBeuiQbAJZaHB9kuET9lJpahuzXxKzUgTPgMCLeutT5x3kHH8oTSnL4UxMAAAAASUVORK5CYII=",
+        32: "iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAACXBIWXMAAA7EAAAOxAGVKw4bAAABRUlEQVRYhe2XMU7DQBBF3xiUpAGJOoGKdIiSHqQcA0SFuAC3oKELpMgFOAEooYtEGaCDiiOQCiTyKbzGlnGEHTtpsr+xd7Q783Z3ir+w6rLkQJIBbWAPCGas+TCzu8pJJLUkDZVPnaqLNySNcxaXpHdJm1XUXnffY2Df/XeBB2CaMf8G2AK2gUvgrCyAAUjqA6cuVjezr6zJbtfPwI4L9YC8/TAFXoBXM1M68W10tv9lkdQpcFVZGkpqzQ3g5l+XhBhLqkPcA0V1AdwXXBMAh8A5Yb+dEF5h8ROYV5JqiVPoR1RLU6q5N5YOkCUP4AE8gAfwAB4gAphEAUm1RRVL5Z5AbEhGxJ7wStIsU1pGAXCUGI8gNqUN4JHYGS9aT8CBmX3+RiQ1JQ1Ker08GkhqRnWznma7hE+ztYp3/U1oy9/+2PKV1g8zfsaWCbWXvgAAAABJRU5ErkJggg==",
+        40: "iVBORw0KGgoAAAANSUhEUgAAACgAAAAoCAYAAACM/rhtAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABgklEQVRYhe2Yzy5DQRSHv0O3NiT6AKobjb1WX0FThHcQD+I1rEsTHoGoPbERL4CysdX+LNzLzfQ25c69/jTz7eZMZs43ZyY3uQcCU465AUlloAWsAXMT1g+BfTN7KMBtFEktSX19jyNJIwctQq4hafBNuZidorwskjPgFqhE8WfgHHgds64MrCfGfWClsKuWVHEqUvvCml1nTacIt7iCbaCbiM+YmSYIGtABtpyp4wweL8AlcGJm92nJtpOl+OqukhYlPWZ8t2n0JbWSOWYynPaD6M3t+ezhsAB0JdXjQMl3RzPrSDoAlj22KQFNYJ73oh1Kqn48s6xXnCeSas51L4HnFefMjTNehT8kmPLVmIU/JDiOIOhLEPQlCPoSBH0Jgr4EQV+CoC//RnCQDOonWhkOKTkH8Cl47UyuFG40ipvzCrK3PvIm+VcHcAdUzeyzrJIawBm//y6HQNPMeiRlzOwC2ASefkmMKHc7loPxDcwNoM7kBmZevAA94DS1NxOYZt4AdXx07fYxvxIAAAAASUVORK5CYII=",
+        48: "iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABOElEQVRoge2ZPRKCMBCFd+0sPITHMTfRQ3gBe38OonYWtF7HGeyeBQmzBhwFEpZx9ishYd4HD5hJiAzDaADAASgAlOjGRjv4HMCxY2jJA8BSU2BI+MANwEwjvEsQPrDWECiiEDsAix/mzfxdl4xfJTRf2K/hxdylDy0Zt0pxB3rM3/Rr21dKVO1wuQXaqpSaA4B5FgF/jbYqJZfIJuCvk6tKkmadUgmkBsAC1RdRUrQNnKQAUS0hKcM5FoPeQjMz04T4lG/8X35iTEAbE9DGBLQxAW1MQBsT0MYEtDEBbUxAGxPQRgo85Ql0WNzNTUuWOqsUuEeDtlOQ8Bm20eE6q1wXckR0HinXUBwzX4nEE2DmCxGd1CL9zjGEb4Bqk+8wbN01K3t8Wl6PRPpus+YgbHCsUj9Kw/gHXlqo8AjLwQglAAAAAElFTkSuQmCC",
+    },
+    "folder_open": {
+        14: "iVBORw0KGgoAAAANSUhEUgAAAA4AAAAOCAYAAAAfSC3RAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAA9UlEQVQokZ2SMUoDYRBG3ySWghCCYKviGZJKCwtjoYWCvbWdVexESOcJ9BYWKVSwMhJvYGnYFJ7AFOFZZBeWn+wK+WCqmTczfDOwokJtAAPgGGjkkQFHETGvJNVT9Vu9UM/VS3Wm3qrtJFpqFOCV+pY061mtD3V9ben+EUO1DUSSagLPwFkBbqhT4OsfT/aAG+ClAH+BLeAR+KmANoF94DUisgKcAVPgMyKellHqCZBFxAQW1hd6Bzo1a3byGlJwBHRrwG5eA0DZ1RFwr94B6eGbwAHQL4MTYBvYAcbAYcXEMbCrPgDX5Zfr5Z3rNAeGLE6ymv4AwtyJ+NPe7BwAAAAASUVORK5CYII=",
+        16: "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABE0lEQVQ4jaXTP06VURQE8N95PIhobIwNGEtqEkOMsgB7Ij0lJS1bcAnGJYALEEIoeT0EEtiBDQRCJWEsuM98Cfg9CNPce8+Zmcz9xzNRkOQT1vG60/tVVT8mGiR5h1Mc4KLVv+IPPlTVUZ/BEB/xEl+q6rYlGmKEwyQ/H9Bd4XtVjQaYgrG4zW+whofE8B57SeYlWU2SSXvtIskgd1gZdopPMsGbqjofdgpX+I3NCcJveFtV59wd4hhbWKiq7T51kg3sj9eDTm+EpSTTPeIZLDXuPYMDzGKxJ8AiXjTuPYNjXGK5x2C5cU66sVbalQyS7GYydhp3NclcJZnHWSfWq54EcN3Gz1jo+0x9+PeUH8n/P/4CYoCVeVOhUjsAAAAASUVORK5CYII=",
+        20: "iVBORw0KGgoAAAANSUhEUgAAABQAAAAUCAYAAACNiR0NAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABUklEQVQ4ja2UvUoDQRSFv6vBgJDKwsIExVIs1ELwBXwDa5E8gXaCgukF30CwtdNS0DJCimwTwUoEtfKnSCNKzLHYGRiTXZmNnmaHu3O/OTNnGPhnmR9ImgNWgLGBOedm9lmIKqkuqadsHRRyKGkSeAMS4Ajou38TwIkbr5pZEgMsAfNAGbgws9MB57dAC2hLuslh9N2cXTN7Ds9LQ/bN2sAekAfzpjaBM0mGpMVRziqUpEPHmC0F9YU/QLtAA3gPHV7lpByj/XD/Xo/ue0yadox2gC3gOgv4RBpMxcw6MTRJFdfT8rUw5Q/SNNci3eHmdsysmwWE1HpVUjXCXQ2YIdhuHtCvHOMu7MkENkcANn9Ug2vTkGSSXgtclxfXM+045RJwRxrIOmkol0AtwiHAA7ABbANLwJR3+dvzFaOepDoMP7DLwHikO68vIDGz+4J9cfoGHp1ZnB8JBBoAAAAASUVORK5CYII=",
+        24: "iVBORw0KGgoAAAANSUhEUgAAABgAAAAYCAYAAADgdz34AAAACXBIWXMAAA7EAAAOxAGVKw4bAAABDElEQVRIid2VPU7DQBCF31gpotwC6NyGIpyF3CO5ArmY06aiAySHIhyAJkIfBbOS7ewmXscU8KTVyjva9+bHMyv9CwAFsAb2xPEMTK8RWCeIm3i6RiB4XkZsC+DL12KoAABn7JseEQbsPSNFjsDU65CDVW+BzGyUTlf/ikCXz8LBWOSOOzN7kaSiY/gYgfwg6TV8dAUq3x8tE5KWgcPMuCTwMMDzcKdqHo4pEJqwOrE0/t0ZcPQ168t87l4rAjP7lLSTNJE0z/D+3u/snCMu4Nj6npOmaP5TAkPqkBSQ1O484DZz5jRxk4rg3clL/TTJkIY7SHpLzaI+D04uWtO0AFZAPQJx7Vyx+v5BfAOvqUL0GkiAYwAAAABJRU5ErkJggg==",
+        28: "iVBORw0KGgoAAAANSUhEUgAAABwAAAAcCAYAAAByDd+UAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAB0klEQVRIid2Wz0tVURDHP2M9gySlrUK4KPoh2bLnJoQohf4FV22DKCFwmQt3gQq6axP0L4hkmwJFN4WLNiUR9IMiEAoJKZWvC+f4Dvfpfefe20L8bs48zsx8zpk7b+6F4y4LhqQTwAgwCJw5xH/SzJYqUyXVJC2otdYkna7COunrQ+AW8A944WusOtADnAcm3L8S8I6vs2Y2epCjpGngPvBA0ntgMSH/BvDZzJRN9s5L9viwSEkdkj4mlD2rT5JuhjxtCacEwMz+AHdT/SP1AvOSrkGjpKnQ15IuAu2JIe3ADDAAPAJGCgEd+qGIv6SXDrwKzTfsz3uOJVUDxoGf8SlC06yUaIpWmorp2Rt+Ba67/Q34VfJWZ4Fut5ebdqMbTkYnGyoJQ9JwlOdcvJf9W/wGfrhdLwuMYr8DX/KA0CjBQAVgiF3OTpk8YF1S8mAI8pjQB03PLw/YBVwqCgQue2wy8A2w7XaZsoaYLeBtS6CZbQKr/rNM44SYVc+VD3RVaZz9hjlosxWwr+hYAa6kANd97cxzLqgVAEljPlieQmO0zQE3gHuSLgB/Q0AFPZF0CrjN3mvq2f6O0j+iympBUg2KfyYW1QbwCnhuZjv/KecR1y66E/uAgB4QHwAAAABJRU5ErkJggg==",
+        32: "iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAACXBIWXMAAA7EAAAOxAGVKw4bAAACBklEQVRYheWXv04VURDGf4PkQgMJ0Q6kUiujVBcoIaG2MLHDWBlfwLdQEzvRgo7KwhYJ0HGhuBDUTirEF9AKInwWO5s9LufevfsHG75m58w5Z+bbmdlzZuG6w8KBJAPuAveBoR57fpnZ58aZSJqStKXBsNS081FJhwM6l6RjSeNN+B725zLwwOV3wDZwEVn/HpgAbgOvgOd1CRiApFXgmetGzOwsttjf+isw7aoPwKD1cAF8A76bmfKGP6axLbIiaalEqmLYkjRVmYCvX6lJ4lDSCGQ1UBYvgY2Se4aABeAFSb09JUlh+QhUhaRWEIXVlNV/Q664xyCSgquOAjBvZrvpIBaB6CfYEM6Ag1ARK8J9YM7lT8B5TafDwCOXu2Z2emlFWISS3gTyw5rOkTQT2Hudn4+loBPI83UJ5Gx08pNFBOYi82UR2igmYGYnwIkPm4zADzP7WUjAkTK9J+lmVc+SbpE0OKHNUgQAZqsSyO2tTKBOGvoWYD8CB2QHUhMETskdQH0J+GHR9WFb0o2ynn1P24fdXk1Ov+u4Q/IGY8CfmldENPwhgd+pQlLL2fbcVJWApBaw5roNM1tJCeyQ9YRvJW0D48AuzWBC0hNgEXjsunXImtJRYI+sM75qfAHa/1xMkiYlbdbs9QbBpqTJ1G/s1+wOya9Z6covwDlJW350qS2/1vgLQ1QrHCu4gMAAAAAASUVORK5CYII=",
+        40: "iVBORw0KGgoAAAANSUhEUgAAACgAAAAoCAYAAACM/rhtAAAACXBIWXMAAA7EAAAOxAGVKw4bAAACjklEQVRYhe2Yy04UQRSGvx9BjcaFmkiiYSWygbjAjYAkPoCR4HXnAxgfxNdwjZJo9AU0XIJLdAPujTLoAjEmDvwupnumpqd7bt0thPCvps5MnfrqnDOnqwuOdcSlpMH2MDAHTAHnOszfB55J+l4CW6tsz9muuDe9tN2y0TLgZmzv9QgX61FZXIrgBGwAo5H9B/ABqGbMGwZuBeMKMF5aqm2PJiIy0cWcx4k5C2WwxRGcBxYD+4AkdwAUsADcT3z1qg+OHWAFeC3pW9piD8JQdOvV9iXbW33WbZoqtufCNQb62G1dUc09zeMjoYvAou3p2DCY16OkBdvPgWs53AwCs8AFakF7YXusXmb9prhI2Z5IpPsq5ExxwfqcGF+HQwSY0jVOQEYNHlSagTuS3oWGQxPBSKtJQxbgZskgadqQtJ00ZrWZFZrbxsNSkGpPonDNFmUBrgJPos9/gbeS/hQIhu3Tke+hYM0WZaU43M0QMFkcWl03aMAl16wrC/ATsBuMpwqCChX6/BWt2aJUQElVYC0w3SyOK9XnmqS9tB+1azNhyAuNYHRUC32mphfaA4ZFe8X2SF6wQCPA5Yy1mtQtIBQbxaSv3gElbQFf2jjNo9DXpqRK1g87PerC2ijyjxL6yqw/6A1w0vapvpEiRQ067Ku5AMPaOEkxDXuS5gadWX/Q+ci/Tq1hn43GywWfxHbJaNCxYsCmJmlbkiypavsjcLtIqkBr0UMh7o3hK+ySpK8x4Hpi4jiNna2WCBimd5zm080odHf1cQY4XxLgT+A3zW91UGtvY5Iat1K2Z4D3HPwpex+YlbRMCCNpCbgHtJxq/6O2gfkYDrIvMO8C03S+wCxKO8Ay8Cb1buZYR1n/AMhcw4r/IkjjAAAAAElFTkSuQmCC",
+        48: "iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAACXBIWXMAAA7EAAAOxAGVKw4bAAACIUlEQVRoge2ZMU7DMBSG3+vWoYIrdIQLAEcgxwAWeohegJ0WCY4BbAxdoGKvyikoElKZ+jM0jtxXO4ld2yko31Y7sf8//uPXJEQtLS1bAMgATAAs4cagaeFdAGNH0TrfAPpNGthFvOIFQKcJ8VkA8YrrJgxMhIgbAL0a53Xyq66TPkrYvmErxWvn9nPROmmjJDPgcf7AL22VLLFORxbbgClKoRkB6EYxkI9hilJwE9EM5OPEipLOdpxCGQgNgB7WO6LOxHTgXhogKkzoLFUfawdtiGZmpj3Cpi99yQ+MdQX2kCtmfpCNf2kFXk2NZQa+IgnxYUFEc1NHmYG3OFq8mDLzytThYuCeE0FEMuvG+FQZkCedlRwbGjmX1UCBoVwfit8rAAdx9G7ocJrXugLMvCCimd5ERCcBtdqQc8yY2bqhVG2jTcTIKT77aOC0QoMZ0585AMei+RMRHxOxfihaiDmPdjHQyUW7D+hnwPmClXbmxWMqmmPGSI5tLWCKOnGQBS2lgcr81zGQ8kZ2L2AK0z2QtycpaL7zVK5AwoLmVMAUdbfEFDHyjw9R+UM9gEvZn4CLOrp9VyAFtebUDfzoHdh8uTuntE9oCyL60LWI1Sleq+gG3sUgQ2XCUtBiUhSwXMNQ9Bda9bcSGRE9JpG3OxkzPxNpK8DMT0R015ik+oyV+C2w/sg3SrvZOHEL2+t1YcT3M2sM1AeO89BL2dLyH/gFj+6kQfAw4rsAAAAASUVORK5CYII=",
+    },
+    "tag": {
+        14: "iVBORw0KGgoAAAANSUhEUgAAAA4AAAAOCAYAAAAfSC3RAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAA10lEQVQokY3RMUpDQRCH8e+vQUhhbeUJBLGIkMpK8DKeIYmWgjaeRizUIqBY2HsErcRaPgs3Ydm8h29gYdnZ3zA7G/UQOKE7lkneuhKjgm6BpyZ3AOyoZ0meN6R6rj6WfdTtKjdTv9Rp67aqSwEegHd1FyDJJXAD3LV41BTZB/aAMfBd8IVKweu21zDJj3oEjJN81NULTsGnSV5Xb/zceHxHqFfqy6q9JX/Tmw3BbaVpmV4vVhflznEfnneged+3tHhRnfX+ZR++LsP4H1V4ot6XNRmEhsYvHhm79CTnHL0AAAAASUVORK5CYII=",
+        16: "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAyklEQVQ4ja2RIQ7CMBSGvyIHFocmKJgk4Qw4TsMRdgg0SNBsVyBMIoADAA79Y7qkK+02Ev6kSdPX9+V7rZE0AubEUxpjLtGqpJWa85SUxvp71cYEAgyAM5BHIZWB3Q8lZZIWTr0vqYiaeIDMat+8O1FIj3r2wB3YuIfGmDewDI7jGrTFM5nUDCQlbQDH5AqsK0AJvIBDF0hMLbVaxyZIaAS3OLOFPARp/U4H8vAhnZoDkEJS8lOzA5layMmu7s0OZCxpK2n39WD/zAeBYio6JV5/WgAAAABJRU5ErkJggg==",
+        20: "iVBORw0KGgoAAAANSUhEUgAAABQAAAAUCAYAAACNiR0NAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABGUlEQVQ4jZ2TMU4DMRRE50cpELlCCrKhpCE3oKZDShcCV0BcACRuQhoarsABcgQ2iA1FKkpK8mgcsIwde/dLltbyn+cZ22vAgaRj5WtjZp/ZLuCEsloD4xyvH8zvE33nkiaSXoAzM1uVOLzLJJkB25zTXkRYAU/AA/CbwMwWkuaShs5pHBo6dLBdTSP9l/uc/nMo6dX7rsNFM3uUdJ10GnHYB6bAaTTSn24edVp6KQnolYO+AYMQuGwLdPob/7x7kjaSPiRNgFkXaGyXsTuL7zZQL/IKOAwXqzZQD7YGqlRTEdS74SYJC6BNCuo97AYY5ZLsRKMYtBMsAb11Ywu8t4YF0Nr7t2vgaJ/GCqADSRdu+mxmX53cda0f6Mev7ZtBeNoAAAAASUVORK5CYII=",
+        24: "iVBORw0KGgoAAAANSUhEUgAAABgAAAAYCAYAAADgdz34AAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAw0lEQVRIib3UQQ7CIBCFYeLGfWOr8Sg9dPUCXkLtAbiCG1fmdzNGghQZBp2EdFF4X4BpnftHoasrMPwSALiokNeqgnmDhOuQUqAaiQFgBLyM0YwkAB+ctzfvpAZQIdojUiOaSy5E+qZAApmSQFHL5ZEdcAMewNo551bybpbnyYosyeH29P+az4wpNaGvRb5esgUp/hYi5CwL5twCdXgG2TYLL0HM4RlkL71uDw+QTYDcZbQJj5Aj7zostqIR6oCuebClngcTvDIkypprAAAAAElFTkSuQmCC",
+        28: "iVBORw0KGgoAAAANSUhEUgAAABwAAAAcCAYAAAByDd+UAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABN0lEQVRIidXTMUoEMRTG8S+yFguuay923kI8gJXlFp7AwkIFuxXFK+gZbHe3sRRHj2BlsYdQsP3bJBriZEkmGcEHwzAPXn558xLpj8NIEjCTtJtZu5R0ZIz5yFaBV7rFCzDKsQYtueuEugtJQ0l7kh6Ag6xOvQ6vMmqmnTuNgcAY2KmOtoHAIfBu87eAqYaGILDpYS4mNTpdi+THksKi7dgixpgbSZf20x2keKeRX3rn7foN2Iou8FOT1mkENMAEOEvBstDYKe0aAdoA3/c9NsOiCGa6L+k43JHr8LMmDNzbdRcu5zpc2vcQmNZEYzsZ2QG7KEaDOZ70iq46NG3ocwmafBdroNlYCdoZ8xbYSEWLsRy0GhagTRtaHVuBzoFZL1iAPvI7muqYhw6AU+DJPufAei/Yv40vG6sAQ5qh/2IAAAAASUVORK5CYII=",
+        32: "iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAACXBIWXMAAA7EAAAOxAGVKw4bAAABO0lEQVRYheXVPU7DMBjG8edl6YDUW6AidWKCASbmHIGZC8BditQbwMQBYK/EAZiR0l6h6vBnMShN8/naLgPPmCh+fnbsRPrjmCQBD5KunGOUkh7NbOtWAC/E5RWYeLpP3Or9FJKevYi9FRj53Awoo1fCC0iG6AIAZ0ABTLMh2gDAPbALt76AeRZEEyDMfMd+Vj3j+BAtgILD9J51F6IFMA3LXs2ydzYeRBMgXJ8DK2ALLIHTIYDRiDZAbAYjcgFaEIujAiqITQXxe5wP/gXALDXAzD4l3VUuXdYBZeXmew5EZ4BJ2CA/KVMiwitYN72CLsQ6BWLQJsyFGPUt6EGcH6U8FSKqPBaRpNyLSFregdg0IbKUD0VkLe9B3ADX2cs7EPXkK68hFg3lT55yi4BcSLoNY7yZ2Yd3rP+dbxLAJnDyhOCSAAAAAElFTkSuQmCC",
+        40: "iVBORw0KGgoAAAANSUhEUgAAACgAAAAoCAYAAACM/rhtAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABl0lEQVRYhe3Wu07DMBiG4c9IrN0rcQUcdpaCxMbOBhfADSBEu0E5zOyw0L0jYuYWgAWpV9EyUImXoUFEaVI7ie0UiW90nD+PHJ+kJY+RJGBN0ranmmNJT8YYPNWTgAP8pg8YH7YVH0Vy0pN04QMZCih5RM794hp1OsA487svayN9AYMhfQKDIG1AwABHwAA4B1pRkYuACe4h86ER0K6IvCqNtAAPyc/QsXZ9pAU4KABOS9SvjHTZB0cF7e+uQGPMs6R9SZNU85kkt5G0jGCL2ZxL5wvYcwWmauWN5LUVuQiYPG8DQ2AKvFXB1ULagL5TGhkbuADZXRpgAfITWE/3CXmbsSZnda9KOk73yQUCnbC03yTIk1TTZvr5D3Ccee8xJtIaZudtPzNhxzGQOfPwtixyJyJubpE0hizYZnouLwZHFuBucL3hhETWxlmQkzpIb7gQSO84n8hgOAfkbuO4OshouCrI6LgyyMZwFuQH0AO6CbgZnAWZl/i4DPKU2SGfzTQZ0WZwGegGcAe8AK/APbDVtOs/fyLfjBncfUElm6QAAAAASUVORK5CYII=",
+        48: "iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAB0klEQVRoge2YPVLDMBBGbcpwBDKcgbsw5BculdyAgYKKghIOkTtwgYxpIY8ia0YjLEWWtbKKfDNpEmn3vYllW6qqcwoJevkB1lrcF1qFrR6PWhI5BNo+KhK5BNpeav/EvzWQqOa9rAF7TaxS1LebJReQunkktASktr6EpoDUX6tKhAgAl8AWaOSzASZFSJwSEPidPU6+G18iQGDbAd9m27OXS2KpKdB4BJqIfmklcgtIzVUyiQAB3yW0iRFIKhEgkGQR95RYJBOQMROOt86o26iqRIiAdgZJlCAgHEuHxOzUxCIEhKVLogGmvknFCAhPl8SLb0JRAlX1J3EwsPZA7RpsJ/wWphjgyeK6Nn83t5QHa+5zKRJBARYd11y/h0l6pvBLSCa4JOLfEiPjYHEv4hMTs0o4GBrgakiBLBKe3v4HWY9CahKennHrEJjnkkgObxR2SSQ7ElGDNxqoSajDG43mwHdKiWzwRsNkEtnhjcYuieBT59HgDYBoidHhDZDeEsXAG0CzUIni4A0wl8SDMca1zy3jdd0hAfABvHd8Xw58G49E+fBtgFv8Z6hfwN3YnN4AU+C1A/4Naz+bIu7t2cBwPMO5kR67uq4/tXqdc86A/AIGgQXxFu7qXAAAAABJRU5ErkJggg==",
+    },
+    "settings": {
+        14: "iVBORw0KGgoAAAANSUhEUgAAAA4AAAAOCAYAAAAfSC3RAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABLUlEQVQokX2SQSvEURTFf29ig7KwHospLGhGxtRY2KCUkr3ypWxlP9mwVD6AnSg20qSwZKOYjX4WDv3TcOvWu++de9595zwYEmpTvU02h2FKBVwHFoFT4Ah4AASmgT1gBzgvpfSrNzTUgXqvPvkVLXVBfVVf1Otg6gAj6V0B7oAmsAYMSilXIV0CJoELoA+0Mg2oE2FdTl3UbrJkbyPTjH43zak99T3rkvot2cveap5wrDZRb9QDtR2ibhqmkm9qN2ctdV+9rQFjwDPwOkz2X/ERpUHtqGdRb/6fUWeCOf7xVh3Nw9f/EacTAcerPm7Hw1oAc5Wz+Shai5e71cZ6zL0O67vaVmcz3lOIB2rj95dr5COcAIcR6xloA1vAJnBZSnn8U7r4eaP21c4wzCd714E+ZPIXHAAAAABJRU5ErkJggg==",
+        16: "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABTElEQVQ4jZWTP0uCURTGnys0FNVozrq0FIFQizjX3NoHcHVy8iuIOLuUW/gJ3rnNTZds0KElEgKp6YX4NbyPchXerAMHzj3//zxXyiGgDszM9Ty/EAUESWVJ7yGET2Am6cnmWgihDJQkFSVNQgjE1QIwJKMlMLBcBS4s94HU8tAF1wnObbgD2sAE6DpxAJpAAjTsA1COE5ScvZE3a+TbdpeH24Z7IIneFaBjrkT6CTCIA6+AsdtqRcFLYGperpJ4NNbXAV6AR6C2WoyrTqMdTIFOtPAq8ADMCpL2JX1IWmyc5nf6jke4ARb/GKG5MYKVBaAHjP6wxATob1/gyFXau3o3FlIyVKpgfVHSsaS5HRKgFS21BYxc4EvSnmPWWWMop8YEvsyp5Z67hAjK25/pTNlnegPGkp6VXehW0omkA1ee77wYcGmMvALXeX4/0lbnF2mMBxwAAAAASUVORK5CYII=",
+        20: "iVBORw0KGgoAAAANSUhEUgAAABQAAAAUCAYAAACNiR0NAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAB10lEQVQ4jZWUv0pcURDGv7MG1lJYm4ALsogJ2mm1ddIEbpEUIhgbrVxh30B8gvUZEtx0sdnGlLEI6UJgA6KFEbZIZbokSsT9Wdzvuic3N3vNwHAO8+/MfDNzpBIC1oGBeb3MvizYMjAEvpiHwNI4n0rkHIBNoAfsAdOSnkkKklYlrfieAA2gCxwBLSAUZdMipRufFz6/+rEAHAPXwKV1P3xuFAU8ssEUkACHQB94FNnUgVfAvuGYcgK9ooBdv7b8Hxgn9ukUKRsuZT8nrwJNczWne2doapmsYsW8pDVJD/RnoxYl9SV9NPcty2hGUk1S664y4AXw26kPgNkos1Nn0DZfWFa1zWPg3L5D4KXcxROXNBFl17RhO5K1LWtGsgAseE4HFUmTkn5KOg8h3JS3opCGMbDbjOhzScnfcyXXPZujkq14CnSAK+Bt3BQHyOg0bgrwmnTQd8mvJDDtbA5z8nFj0/WoNf4CgXR/AZL7Ake6LcSzW4n0cwb3gw27wJsMUweYBQ480ImkM0m/JNWLXtv0a9nCXxqfQTZObtoVo48j+0i2igIGYAt4T7r8DWAnmzvgoe8doOazB2xQ9H39A6N50i06AT454JN7OY8J+hw4A74B22X2t70B0IzrnAv7AAAAAElFTkSuQmCC",
+        24: "iVBORw0KGgoAAAANSUhEUgAAABgAAAAYCAYAAADgdz34AAAACXBIWXMAAA7EAAAOxAGVKw4bAAACNklEQVRIiaWVv0tcQRDHZw8V0uTgEA40BI50KbUJAf0bRAJimjRXyKUVTsXGIqXVCSbFJZV/QAqLdNfYBcwJSekVd5DCQhKTFDniJ8XO+iab3fi4DCzv7cx3fuzszoxICQIqwBYw0rUFVMroliI1GFN7UmNVYBmYN7yRGn2oC2CoMgcsAitA/TbjT4ErNXANdIBnuh8Z3EB5a8CxOdUPYD1nvK4AgD4wjlKyZ7CbkewS6On/FXA35WBFAT3dN4BD4Ax4BbgI3wTeAttAVXl9tbGUcrBooqn+M5fpDDT01NfAXArgTD63J3DwUnU7ln/zlp1ziMgb3T6KlGeBLkUddIHZyMdj/b5PRd4EPujxADYi40P+pqF1ovcUqChGoGUEF8BuFEBXZUdATdeR8rpRoHsUNQPQtm96GZhO5DYo1AyvFiLN3MdNMVZE5I7yz51z45TC/1BFRF4HB8Ap0Iow7/TbCSkSkU4kC5FvAgMR+aisAwFmgH3gm8ldyyiVveRmJGtjOy4wBawq4CSK7NZniq9qgLVsvoADBR1mQXndHdU9JmorATCPr4Mx0JjAQRXfZgAWAt9OpQci4kTkk3NuoAo7evSNhMEWcIJvEQ3n3BcR6av4fi6CMAt6JppAuwb7PJKNKTrpd3KDB1inmAkhn0+AX/gqn1bcqcpX8UMptJiv5AaOcVLHz4aFcFn4PgW+2u8BP/HPekrlc8ASqUFThvjzjQfan8hYxoHTSz0HPgMvgJkyur8BNDbdfyOO/XIAAAAASUVORK5CYII=",
+        28: "iVBORw0KGgoAAAANSUhEUgAAABwAAAAcCAYAAAByDd+UAAAACXBIWXMAAA7EAAAOxAGVKw4bAAACoklEQVRIibWWT0tbQRTF3zNkkS6yTjaVoNUuKnHdLu0XaLJU19Kla2vEbi0oKNpAQAJmF1wVaxSaQjZCPoBu+kezqQS0VNKV8dfF3EduJy+TxtQLw2PunLln3pk7d8bzBjAgBrwDGtLWgNggMQYh84GPdNsB4D8E4UshaAOL0trimxkmcAooAHWgBEyL/40EP1PYU/EtSz8D1IALoAxM9iN7CrQsye6AvOrvK3xJfE3gMETuFpByEZYFeA3sSGJoawJTCj8GfLMwJ8CqxAAouAgvBLQq/TiQA44l8HjInASwBRSBOSAi/vcSq+4irKlVRpz6O0wWGqhTcgEzSpq5IQhXJMYdkO4HDja/GDIWAbLAhrRsmBKyBQB5F9EzYAH4EQYGksBnuq0KJC2sTqQlzBn2g8EosGsFuQGeWH8WkN0CFWm3inRE4ccxGa3tAIh5mCwM7EoCpa0VZxXZc+V/oUgz1pwpYB84o1OR1jzgq3RyDrk3BFMJGavI2Lpj/qJgGiOe5z0Sf7PXhP9qdA7ob9mnbWDUwtxH0jFM6Tu1JY1jDrq2c1TmYZKmqkjtpPnE30mTAL5bMU3SCCAKzAKbwKUA9qwVJxWptiqQsLBbMtbE3DIz9Loz6dwMxyFjwcFfl5bRf6ZwRYlxGL6RHeA0phyBI2v7GTCvFMi4gMH91gDiQxBG6ORFTY/ZckzI94Pv+79k4rxIlEdVHxU8Cexh6ucKEPd9v+153pFAHrtWVpBVXQNv6c7eG1QVAkYxGa2tgTlqP6VfdhGm6H5igLlBgqJeUfht8V2KAm1rXot/eNdMYp4a55gL+ZX4FyTIlcIGBX1T+mlMHtRFrd7vmX6Gub4CywGvMdUJYPbegfuQ7obIfQJEH4owCiwDX2RPdxjw+PwB0ltk5bYLCrYAAAAASUVORK5CYII=",
+        32: "iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAACXBIWXMAAA7EAAAOxAGVKw4bAAADEUlEQVRYhb2WPUubURTH702Q1BKkjhZaUiwORQftYodOgotFN6NLCxn8AIJb51SaD9AMDraIk4OQtqCLFgdR+gn64hCnOomDmKH+Otxz68nNfZ6ENPYPlzw597zd/305x5guAAwCVeBURhUY7MZXt8FPaMXJf0lCVuvxRYZHtVdBMsAYUJTfjJo79cGVzCdRV7I8MAcsA1NAttPgBWA/oHcPGAYeKdmGsllX8hFgWiXqcQQU2gXPAseR/QW4DP4vKrsXCTYh9lFsxhKYUso7wAzwMeLoE4pSwNLMAsA1UAYmxJfHaFoCy0pxQjkvApuygvdAX8TW673zgdXcjPI7n5bAnFIsp+xWx8AdaM1iKgN5oK4onEhU7jyBBRV8D7DtDKY7YQHIAZMycil6m+LrEhgO52Mn8pv6bnnZJHDFGHNhjDmUcQFUEhK5L7/9xpjrtNW8Bg6BhmLgZaB3h+RriszlApsPgU5z7QDuAl8jzrYI7qys0uMAKMk4UPJKYNMHfI74d7UDeKuE34FdcZoNHOW4YeeA5uc5o5JoRFjIAovABmHtAH4q+hJPKO6weZQi8yU1P5nkR3T/1o6MMSYv8nNrLWmGtwKhBdy93wRWgecRvX/ZAourF+uxLRgCzmjFGr05hLE6AbqBAR4CNeAqUFqKsJB2DY8iqy8GOnVcvbgX244cMM4N1dsJOhWa34sGCQ+RBPMYCeebKLbWNox74X6L6DI0sNY2rLUrxpgBY8wzGQPW2hWxD3GuvguR+aZsMzR3Q8VUgw4APMUdcE9/Pk15TAWv0a5ydZ5EWfmd1XNhMXqivqv+XZBVvJH9fEWkrRL2loBt3HVeUAvYUqqP0zLVDOzg2qmyotBji9aneo1W1HDdkG7JptISyOCahk5QUnbPlbxBawPrcRQmHkuiIIoadVyjUuDm+u0qm1WlO45r4WOtfSE1uHKYxXXIy8As6uTiegZwldOKzHc9V8hbgGNzFJiX354caINrXDyOceXbn5FaT4K0SSBHvIE5Ax7cegKSRD+ukfkB/MJV1KFufP0BkNfokH+q6+AAAAAASUVORK5CYII=",
+        40: "iVBORw0KGgoAAAANSUhEUgAAACgAAAAoCAYAAACM/rhtAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAEjklEQVRYhcWYS2hdVRSG/5WGaNKBKW0GIoYU09LUCjqR2mpJFBTaWtuBIJ3oqDQRGgppIHbSB1icOhAqKaIBa81EwRRF8AHSxIJ0UAkSaynGQW0eDT7S0NfnYO9D9t13n3tPmsT+cLjn7v2vtf/9PGttaQkAtAGngXH/nAbalsL3ogHsBW5QjhvA3vstbmOOuFDk/RtJP5UZrgD7/HMlKD+9mDZqqwhokrRF0mOSLkj60cxmA8qzwfvbZva+t5OkkwmOgHWSXpS0QdKopK/N7NKCVAO1wKHE9I0DOz2nPqrbHdi/HNWtBuqA48CtqO4mcBSoOFixwKMV1hXAYPT/NvBoYN8EzAX114DRKj57iopr9b3KMAdcquL8VMLPOxX414EvgZmgbBZYU0RgZ2A0A6z35duBiURj3wINCT+1wIcJ/jmgxXPWUzrSu2I/qXnfGLyPmNmYJJnZWdyR8aqkpyWtlHRV0kEzuxM7MbPbkl73o/ucpLuSvvc+73rOGPCH3CZU8FtxBN+MpqKlqtE9ws9KiPYiRuso3WnngJplELcGmAzaGQfqixofj3q2ZRkEdkZt7FiIcR2lx0JfFX4z0AsM+KcXaK5i80Hgf7CwOG9cD/wZODicwzO/ZmcpxyzQBViO7acRv/L04g7X47hj45/I+PkccWcSwmKcSYkE3k1w06Ea0A5czWkgOfx+dEJMAUP+mYrqOhP2K4DvctqcD9WAR4DpHGI/8EDCeTOl0/oZ0BjUN/qyDLMk1iTQAJwC7uSIbJMnZJgGTgDdwOPpxSDhNkGGqVBcJDIcyd4K/pqB3aRCNeDXoOBAnpPI4UBgM1SBNxTwBgr63hfYjNdIeiio/6uIk/8TtZKGJWUf6W5gXNKUpF/MbC7H7mLwvhloNLOZkACskrQ5x0YRt8lzH5b0VlD1g4CtOYv0OtAHrEg4rLZJVlFsk9TiwrIwoskwn88APcDdBAngY9Ln2KKOGe/jo5w2yzNCoAMYoTwkB9iTcL7Yg3pbgpsd1BtSHcoMVwKbgMuB4ckcruFGMu9T15kS520PB9xrwOoUryxgNbN/Jf0M/CRprS+uSxmbGZLeA76Q9JqkJ3zVRUmfmNnvuSPhAtgMk5L+rsAtBbAzGo3kGloMcJszxLGihg1+LWSYyBv+RQqswQXDGW7hcuaqhh1Rz7YvtbigrRbccZahK+akkqangvffzOxs4LBG0jOStkmqkTRsZt9UEGCS9kh6SW4dn5c0aGaTkmRmV4DzcjcNkrttqNqrV4IezTGfdq4FhhO7dZB0xLMCd4bGmMhmBZd2hrnx/iICmyi98pgBvoqmIkZ/wk9fBT64y4DwC3ITaK0q0Ds/VMX5KKUpAcCmwP7BqEOXKb8uiXGkkDjfQC1whNIrEHA77RguqaqnNDXoDuyfTIkHdlB6QoA70HtYyOVR0FArsB+XP3QRHQO4/CXDiaD8hahTK4O6elyKcRDYRZH7mHsFpfnzNHAAeAO4EJSPLJuAAgKbyE+2wEVIHfdNoBfZTnl4BS7GLHbnt9zAZYb9wBguMvkc2LoUvv8DpXazA8k4vSwAAAAASUVORK5CYII=",
+        48: "iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAFJElEQVRogc2ZX4hXRRTHv7PburvRRg/6IMGWugRKKz30B830wYLUCDRYerIINFJKwRetCPJFwdyQQguFsqdSIkiEIDWxBGUhRRcDCckQRKIXV1x1sU8PMz+Zzp2593fX/bV+4Qe/O3PO95xz77kzZ86VWgBgKXAMGA2/Y8DSVtiaUADdwGfksQvonmw/s6hw/k4Qk+1nEiFtmsW9l04hz2NsA3rCb5uZOzZRdl0TjrVLelHSc5J6JJ2X9J1z7k8jNyqpKxp60Dk3EuZ6JF2N5m4457ojXSdphaSXJfVK+kvSIUl7nXM3xxHXHeJ+4GQiBW4Am4COINdh5m8nuMaMzP1hvA84kkm1c8D88To/P2HUYgh4NTF+JsF3PKG7GbheYWMM6K/rfBfwWwVxGVYlOJffBd9JfCo3HcBqQ3AbGATWAacrjP0CTElwtgFfV+juBBYDG4PNGMvqBLDPKG+M5nqA3RkHDgFTS3i7gU8SepeBASM7aGS2pjjvy9iaZq6HGn/CyrIK2CLpJUmzJP0jv3Jscc6RC8A5NyrpbWCHpPmSOiWdk3TCOWdf/IvmuifHWwCw1z7appUnAOEp21RdV4fglcRjHqjWnBgAe4ztG0BvHQJHcW2+TJ2VYJwAZiZu3sZqzSJRH8U1+tkW+GztrjM2hwgbZgptuQnn3O+SPjLDc5pwYDqwFRgGboXfcBib3kQMM831dufcWBN6BUfa8Gt6jJUl8g5YC1xLpEAD14JMtgYDPk7oZZ+AVZ4DfA6cAv5OED1W4rxdt8swmAsCeDejkz/Z4e/2evzbnsPuksDX1nC+gTUlN+Nwhe5/T3bA+xUKPwIPZAxOp5g2J4FF+JqqK/y3Ve0ImXcCmEoxfQtBNISfJF91XsE/mUJtExnbmnC+sNwC7YkgkuVBkJ8CrALOUKyLGlgq4KAZ3A88BcxKOZIwNGz0F5XILjKyw1X8kW76ZAdcNYPZYixDfMvod5XIdhnZWzVt9Rj90TZJts0xUod0stEm6awZe70mx3lz/UyJrJ2zulngz9UfmOEhAW9QxKWQ2/uAhRXErXqJ2/CnuOPkF5kljXX3QEagga+AzoyhViyj3cA3FT7tihWmAT9VBVFytyZsIwt8n1bo7sS2KPGPbAN+7c9hQcZg3VJiO/lSoi+j0yglluQCjwN5FJgLHDUkH5boOWANPjVyGAkyZcXcSqMzROgh1QbFns+OJnTuqpzG774xNo/X+Y4QfYx3xkVWz+4CY/M60Dceok2JFJjRAp+t3Xb88TXGkbK0S5H0Uiyts+X0RAMYSNy8FXUI7Ln0NH4n/N+AXypjfJmSyzW27Mnri0arPDLQLmmepNmSbso3p5oqDfDL8QuSHpJ0QdIB59wFI/atpLei60ea4W4YsOXBoJkfSOQp+JZj8uAT9Drxu3oKe+KnjO+PxthXJ4BlRvl2IFyceLQWh8gcgEqcb+A0Pn0HKR5iVtcJIFV41cH6BOfCu+A7R6YWKwuin+oPHNfxHyns+fUKpiKl2PE+it8o7V5jMQbMq+V8ZHReiD6Fw4QNBl9+2DbMLMNlj55zw3gHfs9JdUROAI+X+djMR75OSa9Jel6+7X5R0vfyH/qI5E5JeiJSfdo5NxTNX5L0cDQ/wzn3RzTfK2m5/Ao4IulnST8k2u6tAb4hFmM/vj3SCbxp5q4A2bbmpACYnUmDFDZMtr9J4HtIVThyz939BvAv83vkV68DgP18de8B3+07iO85jQG/4psHzVeUTeJf0NCa1oiuDQIAAAAASUVORK5CYII=",
+    },
+    "proxy": {
+        14: "iVBORw0KGgoAAAANSUhEUgAAAA4AAAAOCAYAAAAfSC3RAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAA80lEQVQokZWSO07DUBBFz7NoyR4oonxK5DhbgIo1QE1k99CzAVZBRwXiI3bgNiwCCjokpByaMTKPWMCt7ry5dzTzZhIZ1ALYB47i6RpoU0qbXNs3LdW1uvE71mo1ZFqpb2qtXql36n3wOnKr3FRFYqZO1Q91kvFZaKqvmaKVOuJz9aZX9FY9C96EtkAtY47dSD52RSKu1Yfgo9CWO8AceAEuVIASeFfH4d0DFuplxK/AvBj84t/Qa3X0n1YLoAWegePQPgEHvdqH8QZwEtq2q9pfxyRWMB1YxyJvuTuAZssBNJE7HZq3ij3l+HFyaYv5T0f+CQM2XxIFjtd/AAAAAElFTkSuQmCC",
+        16: "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABI0lEQVQ4jaWTPU7DQBCF31pOlwPQQhEEUsqQdFAAl0jhHAAOQMsJ4o4eTpAOmlThDomL1DSkoIToo3mOVs5aIGWlkefNvPlZ70xQ4gBBUk/SrU1vklYhBFL8ODADJsCS/bO0L2sL7gIzYAtMgTnwZZnbtjWnm6o8A9bAEBi46jVwY31g39rcLE4wcfah8QuwAIJlATzbNzK32P0w329q3AE2wF1U4B74BHLj0jFBwGndop3nxv0oQd+2M+ML414u6di8B+BH0pHxI/BtvePvE/AhKTc+qRVJIhIl9CZv195BV8gkrSxj8ytJG0mXUdUr2yrjsWOqusJfz/je+ow2/neQRslBcpJ4lEv2R7mkbZQbnRS0L1PRrBxaEjXX+VVSlVrnX5/y+rgkVDpXAAAAAElFTkSuQmCC",
+        20: "iVBORw0KGgoAAAANSUhEUgAAABQAAAAUCAYAAACNiR0NAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABd0lEQVQ4ja2VMU4CURRF7ycQeo3EShthETbYuAEtNOIKYBusQNegCboAbSHRxFI7tSBCYyGNdg7kWHBHviMCibxkkvn33XfnzZ3/3wTNCaAgadvL2xBCMq9mmkgRaAAdYMQkRsYaQHFRsR2ga4E3oBcJ9oxhTnWeWA1IXFgD9l185gtgz7m+uUezOkuAO2ANyAEPwDuw6usDuHeuZG7yq1N71nVnJWO77qgZ8ZrGdr0uudPuD09tMkAtwk6NbUVY2dhJhB0bq8eCHZudj7Bn4HGKNY/Ac7TOu7adAgVvh1aGNAIupgheOhc/vAUMgXwANiS9SBpIejWnIKmSwdJYl7Qq6UlSksE2c9kO/h3LfuUU+O9HGaQfJX3llsYeHES115IqQDkqLmvs7VXEO5S0Yo1vYrqx+0vZ2E5WmRy9ko/XPfOP3id/DQkmw6HvExAPh3Pf7zk3ezhEossbXxlP60Db2yGNobH6L88cYQHx+BdwE0IYzuJ/ARLTwwQMXO6fAAAAAElFTkSuQmCC",
+        24: "iVBORw0KGgoAAAANSUhEUgAAABgAAAAYCAYAAADgdz34AAAACXBIWXMAAA7EAAAOxAGVKw4bAAAB20lEQVRIibWWvU4bURCF51puLEeIigoKitDwI9mkgDIRJRRESDhPgOngccwbICGigCiIKIlIAYlEEL8FBQ4yNTX6UuQM3FzWrA3kSKuxzsyec3eud+6adQGgH+jv5p48wTJQA1aBM+BO15m4GlB+jnARWARuyEcLqAPFTsV7ga+RwBegkSHcUM6xDfR2In6kG/aBClACrsXVgE/6fa1cBTgQd9TWRG3xla8DJfHL4naBoOubuCXVlHSPP8njdqmPvnIXLwBN8e+j2g/imkCITPbF11PxMg8bWon4d+LOMxZ0odx4xFXF3aB/V0G5GTPrM7ONEMLPSGdacSujq87NOBFC+GFmm9Kajg1mFdcSkUnFnQwD5yYS3jU+xgZjintJ8YDiZYbBZVLjcI1RMzPfoFsze5Mh8hLchhB6Cvl1L4MbNBXfhghmdiJ+OCQwsxHljhN+KNZ0g0NF31THleJgxuIGkxqHa/yKDT4rziXFvmFTGQbOfU9411i/Z/SitV7xRWuRjvFoVBx0MSquklHhQ+/fUaGCogYV/I9hp8J0XFdpP65/K1elk3GdmPiTAGwAKzxGQzlH/oGTtKtO50fmQtu25BiVgXn+HvCnPBz6p+Lmec6h/4Rh158tfwCRVyfFtmlSGAAAAABJRU5ErkJggg==",
+        28: "iVBORw0KGgoAAAANSUhEUgAAABwAAAAcCAYAAAByDd+UAAAACXBIWXMAAA7EAAAOxAGVKw4bAAACMUlEQVRIib2WPU+TURiG72MZSE00wUYHG0GjCw7lD2jiRxTwlzDWUSDRQRfdxH9CTTTGAQdGQSOTUYbWqUsRiYPN5dD7pceTtx8U7JO8ec5738/H+T6PNIIAU8DUKL5hyAQTkm5KWpR0VdIdSUh6L+mrpNeSNkIIf0bpRJyoCKwATQZLE1gGiqMmWwAaSdDdnEQp1gDmj5IoAA+BtgO0PMoK8NPYR38Yq9imZaztGIOXzIaZrAMl4y+M7QOXgGm3AZ7bpmSfTKrDTGM2spdAwfgF4MD408j+mbED4Lyxgn2zkS70Snaa7pqtZ8nMPTG+R3QcgHPGAB5HeCEaaYO8jURnh2VrVkq4bXNrOX6vzG0leCla0+XUaYLu1l9JuJloTe7nJJyP+OmEWzXepHOWD4nbkdPFxGnJ+D4wmZNwEvhlm6WEK0dxb0nSKXOL1lshhEYS85r15xDC7zShsU+JbcbVJW3794EkZcO8bF0HZpOY161bOVwme9azOTZ1SRVJM4cIsMn/l02pO6VjkyzhD+t1daYw/t6ae5PDDWNTM9eQumv43bocQtiJewR8kXRP0tmUi2zOuLmT4192czcGx3YsMmK8B9/k+K42GxQ52cu7ZrxOryqAk3ue1oy3GfT6c/wHuBb593+A7RSAKv+WGKvAHL1LjDnbxCVGlWFKjGR6Rymi6gOnsU/SIp3dO2yZ+IgBZeJRCuEb6jwxVyTdNfVO0jd1rq8Pxy6E+3Rg5FL/LyDr+3Kk7Pk4AAAAAElFTkSuQmCC",
+        32: "iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAACXBIWXMAAA7EAAAOxAGVKw4bAAACrElEQVRYhcWXzUuUURTGn1vKYEhSA4mULiQDx3Ur29rHRlCodf9AYGDrQvctgoRcVJuir421sahVTuAf4OBHG7Wg3QRGLQR/Lea8M2eu7+iMMzgHhjnvfc45z3nP/XjPlZoQoBvobiZGaJAwSBqRNCppQNJtg55L2pKUl7QSQqCZpNKIs8AssMbhsma22VYQZ4B7wO86iGMpmm/mqOS9wLco6DrwBNhJIdwxbD0azwPnGiXPAZsuyAowAQTgpRu/Dzxwzy/MZsJ8EtkEco28uSd/DHS6xPZsfBk4ab9lG9sDhs22E5iLkug9jDxDddmnI/y1w8bc+FU3/irymXZYnoPWBKVFU37zCBt02FdKWzLBArDkqjAY+fpKVL2UN8pSWe0rSdkdPuWCjKf4jzt8KsI6gYJhReBsWgKzLsBECv7FsL9AVwreZRjA5xR80sWficFAZfus+/Ia3gPsGv5+f/3Kdh/MZhfoSeHYMHwt4Thh+IikIdMXUo7Sy5I6TP9YKwFJi/bfYT5lsZgL9nhJUs4nMOps0wgGnL5xQALfnd6fgvvYV5JMJemCA4aBM5HjdaePxOWtQXoD+BPhfU4/X9aAZxy/PJUqU9A2Sabghxu7I+lXZHdL0k3T70b2XvolPTT9jaS3Ed4n6ZHnTEtgNYRQtY+B0y6BQgjhUxo7cM09LoYQ3kX4mHv8KVWmIO8AHySRLacPpeCJXHT6dgruYy/5zAKVbuc4DqLVmKMVR/Ep4J/ZNHYUm0F7P0Zm2L7PsRm2tyExh7glm6N1LVl9zSn7m9ICpUVUb1M6SWXOE/L6mtKoEnmqZQOYp3ZbPk9lqyXSeFvukshQmsNiCuFhUjTfo11MokSywAz1X81mqLXVIjnK5TSnUjPRr+rL6bZKx2uh5ZfTAxJq+nr+HzxnDpXryHD/AAAAAElFTkSuQmCC",
+        40: "iVBORw0KGgoAAAANSUhEUgAAACgAAAAoCAYAAACM/rhtAAAACXBIWXMAAA7EAAAOxAGVKw4bAAADeElEQVRYhc2ZPU9UQRSG3xE1MSCLqA0YCrFQE6yh8KsRjdrYQKAgRluN+A+w1l4T/AdaaFS00c6oFTGChUos1GhCNNEFCYl5LO4snB1m7i7LAnsa5t555sy7dz7PQaqjAU1AUz19rtkAB+wGjgCPgUe+vBtwmyWqDRgG7gNF0lb0zDDQthHCOoC7wGKOqJQt+rYd6yGsGbgBzNUgLLQ576u5XuK6gMlIRwvABDCdI2baMwuRukmga63i+oAfgeNZ4BrQAlwM6u6RzTlrFz076tta+w70rUVc+MtvAq2+fhswY+o+AK1AwZdLNgNs821avQ9rC0DvasV1BV9uHhgImMtBR+dM3fmg7lLQdgD4G3zJ6oabbEHYOTcf/kJgO/DZMK8wex7Z3vja1H8Gtgc+egORk1SzcMhWmLWBCDMSMKciTH/AjESYgYAZqySu03+xkt1McA8N85LIieG/4kvDPUj4umWYOfL2SbKNtGSz+AURMDuCH3Elx99Vw80DOyJMgfLVPZ5y1kb5CTGa4M4Fw7I/R2B3wJ5NcNcNswgUYtCwgRZITFjgjuGmUuIMbzfy2wmmhfItbahUt8VwF0z5uXNuLtHncVOeqCRQ0hNTPhEDnHNFSS9iWrZI2YSW1G+AxzFHZFvFAfNqugqB7035AMF2k+iz32ta+oLtkuyQvk046ZZkL6RfqhBomSZJqTlr+2yRtEuSnCQBPQEwIakYcbJH0knz/EzS7woCW1U+Oi8kzUa4nZJOm+ce59w7eYHhptoI1i+VL5KGtK3+77fg/RPFh3ivyof4qaobYjt0z5Ue4jPm+etSiSzAsXY01hNwKOBWnMGRNuH0OZjgjgVcu7Q8xD8l2X3vSKK/T5L+med9lQQGzD9JMwnO9lmU9GtJoHMOZSuyZNEjyTm3KOmjeXW4CoGHTPmj9xEz2+czr2nZaNCjzkKNfVnwYONetzzcSXns21gXVt9gI6/8gwGTf+X3jcKg6S+Vg6bXrAya3pj6+gVNvnEXWShYsnqHnYPUGnYaJ7HA/Rb5gXuBlYH7J5YD9wLlcw5qCdwDkbHUxyirT31cJ576qE2cEZmXPHpKfvJoyjPrkzwyIpuBMeqXfhujXum3QGgHME7tCcxx1iOBGRFaAIbI5tyfHFF/PDNE6vjaALEOaAd6WE6i9/h3m5NETxnr8G+I/78sWFwlFUPgAAAAAElFTkSuQmCC",
+        48: "iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAD7UlEQVRoge2au2tUQRSHz00johLEUlF2Y6KCWbKNoPgCYwq1EBS0FXv/EGOjptRGiwiKWNiolY0vFF+YrJAIirGIkPgEIyGfxZ1dj2fnzmw2dxNX/MHCnb3fnPmd+5q5M1fkv7IFnAJOtbKNJI8gQCIiJRE5LCJlEdksIutEZIVDvovIexGpiMhTEbkhIi+SJCGP9psWUAYGgXHmr3FXt7wUxgvAlSZMZ+kKUFgM453AGWAmR/NVzbjYna0y3wNUAgbeA/caMHrPsVmqAN15m+8Hpj2N/QTOA33ARuCH2T/iflo/HNsHDLkYVlNAf17mTwCzpoE54BLqugWuGeYTUAS63LbWVVWv4GLNGWYWOLFQ8/0e89PAgOF2eY7iMbX/uGf/LhNjgPqzPAvsa9Z8tydgBejxsLcN95i0b6juT4AnhrnlieO7z6aY7z1B+rSxgSrAag9b8hzdAx7uoIfr9XCrM9pu/OlE+jjTmsZz5B170bAPUEdfcYnbp3UhI2YP9ffNYKPmi/z5nJ/DXPOKXQ58MQ3tD8QeMOwXYHmA1Tf2DI10dtT3sJcC7FHDvvEdfcUnjtE6EuAvG3Y4Zr5sKvwMZe1J9mywgbTOuUZNkV4Ntp/IHjuRDq60zgfYDmDS8JmXj6pnL6NJwmdtyPCns8CE+lFlXyBwr2G/AssaSGCZY7W2Bnh7VYzphDsUWxKRoipPiMjzgJftpnw7SZKZWAKOuWP+3hGo8kxEPqhyl4jUHr86gcOm4s3IC8dmU34UYK0suykLdB5umr9rXnUC9ua4GzGxxZRfR/gQa2NZWS81rzoBe0QnIkHXm/J4hNcaM+UNEd56qSWsxytTIlI3VPhLNZUkyRqRP8/AyiUy04xWVTc6QlQ7SCfwbclczF9fqxs6gUkD7UkCEpERw5dCvKlbMnVHIvxew3/0JVAx0NrIUXhnyl0RXmujKb+N8NbLaHVDJ/DUQHsiQUdNObMz8siyNpaV9VLzqhO4YaBDoUGW1J+xbRETITazE3QeDpm/rdd/YDDnxhzXTf2TAS+vRN1MkvYju2MJSHo56D7no4uVJevheuYYzZNte73QZJhqn1dKV6nA4r3Ufybvl3pXuVXTKg8Nm/+0igvQ3hNbLlA36bSeDfT3Ty2qgK2c3N1pYgxQf9k0P7mrAmdNr18Gioprdnq96GLlP72uGgktcAyR9h/zXeAoE17gWNiR9yTRTXyJ6X5gf1X3gYnA/vyXmFQSnaSzd61a5BukVYt8JpECMJyj+WEWY5nVk0gZOE1zC91jru6CFrrz/NSgV35/arBF0reo6qjzm6RzO6Py+1ODl0v+qUFMLMLHHm2vX4vc43TG22GAAAAAAElFTkSuQmCC",
+    },
+    "chevron_left": {
+        14: "iVBORw0KGgoAAAANSUhEUgAAAA4AAAAOCAYAAAAfSC3RAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAWUlEQVQokd2OMQ2AQBTF+klAAC7ABQ7RgBFkYIEJAwxlYCO5yx0ToetL8wr/QB3URe2eW5OTgBU4gLPmaVdnNUql0ZuslEx9xavUUjmZGhEbMAE90NZWf4gLxQhHPztH/AwAAAAASUVORK5CYII=",
+        16: "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAL0lEQVQ4jWNgGBng////lpRoLvwPAaQbgqS5cPBqZiLZdFq4gm6GUJQWyNc8+AEAdN1R57WgyYsAAAAASUVORK5CYII=",
+        20: "iVBORw0KGgoAAAANSUhEUgAAABQAAAAUCAYAAACNiR0NAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAATElEQVQ4je3TwQmAMAxA0aKLdA/t/gs4Su/Po14ES4Ng6R/ghUCS0uzTsCFHYQUVB9YorKKMi+2uXmNL19TWQlf+Ndp/2Dc07vVmj50T/I0U5b1D/wAAAABJRU5ErkJggg==",
+        24: "iVBORw0KGgoAAAANSUhEUgAAABgAAAAYCAYAAADgdz34AAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAT0lEQVRIiWNgGAWjABv4//+/2P///7Noafjl/xBAXUvQDL/8//9/sVHDaW64+P///69ADX9BjuFMVHMNuYCmQTRqCTUsoWl5RBvDR8HQAwD50clsmQB5GAAAAABJRU5ErkJggg==",
+        28: "iVBORw0KGgoAAAANSUhEUgAAABwAAAAcCAYAAAByDd+UAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAVUlEQVRIiWNgGAWjYFiD////s/z//7/3////CvSybOl/CHjw//9/SXpZ9h/KZhm1bNQyXJatoMQyJmo6jmqArkE6aumIsZS2hTeapfSpnkbBKKAbAADSUyAzofKYzQAAAABJRU5ErkJggg==",
+        32: "iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAZklEQVRYhe3WwQnAIBAEwL30keYkqcNOUqqbh34UP8YkB7IDfm8XjgMBEVkFyUAyeoYnZv+WaMITyaBwhS8bfrL2Svg20qE8P64rUAmV+KrEyBl2mdkF4EA+UQOwz858xPVDIiIzbtcyE7HXZCW+AAAAAElFTkSuQmCC",
+        40: "iVBORw0KGgoAAAANSUhEUgAAACgAAAAoCAYAAACM/rhtAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAgElEQVRYhe3WMQqAMBBEUbGyjDfe64kX8DbfxogYTSEbNsK8bovAh2kyDCIi0gwwRTe8AhKwABbdUrjEZRbddHqI47jj567Epeg2xSlOcX+Km4H1Fre1ihs/vsO1wlvXE2eK9KJIL4r0UomM/7BmD5EW3VS4RFp0y6uuZhUR+akdTmnzhyNP6O8AAAAASUVORK5CYII=",
+        48: "iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAkElEQVRoge3XMQ6DMBBEUcSBcqDgw/jiaGhiicIK4KDMbvJfR4H0R1oKpgkAAPwRSQ93wzBJRdIqqbpbLtvFN9XddFonXq/n+Of0Jr642w4R70K8C/Eu2eOXzPHPTry+GT9/+L5uqXBKfUJN6o+4YUQUjIiCEVH8+oj4P/VNZ0R1N122G1HdLcNSnQ0AADiwAUK5cOrHWsBjAAAAAElFTkSuQmCC",
+    },
+    "chevron_right": {
+        14: "iVBORw0KGgoAAAANSUhEUgAAAA4AAAAOCAYAAAAfSC3RAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAVklEQVQokdWOwQ1AUBAFZyUUoAu60KEaNKIMLThpwGE08MPPujDHzU7ewH9RO3VRh7u/pnA7gQNYn+TSaqizur+RVcea1Dyp1FqplNoCPTBFxJZr/hQXPzdHP/7D010AAAAASUVORK5CYII=",
+        16: "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAALUlEQVQ4jWNgGL7g////lhRp/g8BhZQYUjg0DGEi22Rq2E5TzVSJRvIT0tACADtcUedr3qmOAAAAAElFTkSuQmCC",
+        20: "iVBORw0KGgoAAAANSUhEUgAAABQAAAAUCAYAAACNiR0NAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAASUlEQVQ4jWNgGAU0Bf///1f4//+/NbUMY/7///+V////f/n//78ttQy1hRo4gg2FARtc6pioYhupgKpeHtSG0SRhUy/rjQKiAQCwP40UX8rZuAAAAABJRU5ErkJggg==",
+        24: "iVBORw0KGgoAAAANSUhEUgAAABgAAAAYCAYAAADgdz34AAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAUElEQVRIie2UsQ3AIAwEXwxBdmRdMgRbXBqKVDTkpSD91dad5cJSCJIENKA65QDdEgHqlCfyr8iYkRu4VvPl8w12sJ4o8lXA+ypeEY88nM8DOWvJbGR3IR0AAAAASUVORK5CYII=",
+        28: "iVBORw0KGgoAAAANSUhEUgAAABwAAAAcCAYAAAByDd+UAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAVklEQVRIie3VwQnAMAhGYQlZIrcu3DEKHaubvB7iAqXRkPC/BT7xoGZKbRNwACdQM7AGPPSucBSoDiFU6F/0/oqW0KlGlbpSYethDuYeb0fz3pNSU3sBHawgM27Q/D8AAAAASUVORK5CYII=",
+        32: "iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAY0lEQVRYhe2WQQqAMAwEN/7DzxV9hz/xqY4He/DgwaI1CDvQY5iBEKhkjPkbwAKUTDnAlhIBlCp3hCMccRVxZr47O/Toqe8bUldgueVvyFvPcJQUOs5sioj1aUAzqR8SY0wPdkntE7Gx8mxBAAAAAElFTkSuQmCC",
+        40: "iVBORw0KGgoAAAANSUhEUgAAACgAAAAoCAYAAACM/rhtAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAcklEQVRYhe3XsQ2AMAwAQURFGTZmPZiAbZ4maUAUiKA46G8A6yU39jBIkl4BptYNt4AFWIHUuuUixxWxIoEpRxE5MhlZg5G1GFlLT5H7KXID5qezxi8CQwu9YuOMM66juC4O1rgnf0Hkp6kg8tspST9wAFV18ocLmYxkAAAAAElFTkSuQmCC",
+        48: "iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAgklEQVRoge3YuwmAQBAGYbEg+xEtxsZlTO4SA/EFe3vMV4DMDxq4wyBJkjoBTNENrwEbsANrdMtjJb7KNQKYSjSZR6yOaIEjWuGIVjiiFRcjlui228qIsx2Yvzx3/Cuwa6lfodQfsfFRjI9ifJTs8V381Oc9q1RkPmxVZD4tSpKkFw7/4m/q6oBmcAAAAABJRU5ErkJggg==",
+    },
+    "search": {
+        14: "iVBORw0KGgoAAAANSUhEUgAAAA4AAAAOCAYAAAAfSC3RAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAA80lEQVQokZ2QoU5DQRBFz5AGB5VVBFNREv6gop9QTA2KEH4A23/AIkklFa9JTYPDgi4OAQkKRQIJJDUHwTZ577GUtNdsdmfOzp0LGyrKF7UBnAA9oA3MgRkwjQizoLoPXAM7QAE8Ax3gGLgHTiPivTJWbah36qW6Xas11Rt19MuveqY+1KFSvaW+qd3l21Y6e0AREYtsEBGvwG3qq4DttNMqPaW+CjjnJ4hVOkh9lR2O1Be1mSPUjvqhHtYLoRYpvVYGelTHWR/qrjpK6U3UC3WWJo3VT3Xw5yJqVx2qV+r50p46UL/U/j9ZZD/tq3trg2V9A4fztbxRofY6AAAAAElFTkSuQmCC",
+        16: "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABBklEQVQ4jaXSsS6EURAF4POLKDabrIaHQDQiCkRColOovINutR5D4x0Uap1WJBqFBI0IhWhFY30KV2x+u/8Kp5lkZs6ZmXtu8k9U9QQmkmwnWUvSSXKX5LiqqvORapjFBd5wiRPc+8Qh2qPIrzjCdK22gmucYXwQeaJMPmoYMIVn7A8q7pS1pwdw+/t28YLWV26sxLUkV1VVPTUJJDlN0kqyUBfoJHkcQU6ShxIn6wJ3SWZ+ITDX1/8NLBarVprYOMANfvyfFJ+vMTWEvIke1oept4vPz+W1Z9DBcpncK051m1Ycx36xqh+32EAX79hrOjVoYRVbmO+/GXtFZKlRZMSAv5Pr+ACsYwl0IRRW9gAAAABJRU5ErkJggg==",
+        20: "iVBORw0KGgoAAAANSUhEUgAAABQAAAAUCAYAAACNiR0NAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABXElEQVQ4ja2UvUoDURBGz40IphMLbQQRC4P4AoJgbSNooeIjWIqNWPgKNmJpI6hEa9/AIqDgX2NnCjuxVEFyLDKBaJLdDTrNwM53z8ydnTvwz5ayguo4MA0MAXXgMaXU6DuLuqjW7LQXdUctF6pQHQT2gU3gDTgDboBPYApYAWaBO2AppfScV9lBVFJVx7rEB9Rt9V19Ukfyrqlazcza1K6F9ihLVFNf1dECwKReqA11sptgPDIe5sHazizEma3276Xw0+FvigKB2/CVbsCh8J99AFvaHyPUAtbDT/UBbPWu3hFRSzG09+pAEZq6Fz2c7yXYCcF2AVhF/VCv1VIvUVm9jaFdzYE9qF/qXF7miXgBqucxGsORbCau+REw1ZPcFqkj6lEMbTe7VucC1gHtub7iBSzTnLMyzb95CVyllBoBOQbWgVNgI6VkZrV5FsviRN39E+gXNHNJ/9m+AQzIZx98gjboAAAAAElFTkSuQmCC",
+        24: "iVBORw0KGgoAAAANSUhEUgAAABgAAAAYCAYAAADgdz34AAAACXBIWXMAAA7EAAAOxAGVKw4bAAABIElEQVRIid2VPW7CQBCFMZULKEFyR3pMGV8hl6DmBJzEkeAU5gLJJZLCPfIN3ECTj+ZZGi023nWwImWk1Vi772d27R1PJv86gAx4B0qg1ig1l/1GOAFO9McJSELFN0AlgTOwB1JgppFq7ixMBWxCKm/ED0D8ABsL05j078QcyyFgx0dxij5gZo6ls/IWXmyO69Vdn5rnrXIeRdHF10DY3NForaRUFamvuOGm4paPQLVAswEGc3Frd23aRnhmWINK+WWAzsrRaDX4VH4bYNBwPjoRY32mLni8iyawbRVHj1bRiF+BtW9FXc1uruE2u6vyF7DwNUmAgv4ogLXEAb6BpZeJjDIg5/6Hk9sXCiwkHm4SUMxS4j/A7ukGxmQc8T+LG8SGE6F9AL+EAAAAAElFTkSuQmCC",
+        28: "iVBORw0KGgoAAAANSUhEUgAAABwAAAAcCAYAAAByDd+UAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAB3UlEQVRIid2Wv0tbYRSG369ItKBDnCShEhEslOAUEBzq1klwD3Tr1rW4ODl0dpTs/QuCXYqLKLi4hA5tIWMEbbEdLDRtlMch5+Ihibm/bJGe5VzIe87zfeee+xLpf4+QRAQUJa1LqkoqSepK6kg6knQQQri6l9MAFeAd8Ie74xuwCUzlhb0Cuq7xb+AEeA/sA18GwG2gmhX21jX6DNSB6RG6eWAbuDTtJfA8y82i2AUKCWoqQMtqLoDFpLCKG+NuyoPO2lgBDoH4hbQFicYYe7MR9StuOhtx4iK321hPC3N9mtZjL0740m3j0IKkANZdn5nB3x+552ilP4YQfmYFSjq2XJA0tDweWLJ8ngMmSWfuuTwO2LU8mRPoHefXOGDH8pOcQF9/Og54ZHkJmM8BfGH5q6T2nSpggr4RA2xnIVmPT9ajkaRg03liJQPwtdX3gKUkBVPOnlrAbArYmn17ADtpTlnl1v3bwEqMfsJuFsF6wGpioDvthfPFpjnIAvDYbHAZeOPeWQQD+A7U0kIX6bt+kugBO8CqwTJDA7AB7LmR+TgHGsBTV1MbB030J8oazajvjWX1HeRUUjuEcD1CW5P0QVJR0g9Jz0IIZ4O6ew13062/ChqAzv0z2IOJG3Z0mL+Qf4pQAAAAAElFTkSuQmCC",
+        32: "iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAACXBIWXMAAA7EAAAOxAGVKw4bAAACKElEQVRYhe2WTUsWURTH/1cpA8FNEfMEBeIuchW0cCcmIugmP4HCA32AVm3UfQt3BbXyA9hO2rlqExJKCzFooTUgFr5Qrazn1+LeoZPM88zcmSEXdVZn4Pxfzp0754z0r4eLBQCJpJuSEkmnklJJe865Hw17+1MUWALekR+fgRfAWNPCA8Ai8K2LcF6sAcNlNbq+AuC6pJeSbFcfJa1L2pV0KGlI/nVMSLpn6o4lzTnnNsq3e04c+GC62gKmgV6GR4BVgzkDZqqIDwCvDdFT4FIEfg74HrBfgdFYA4tWPLoDzzEF/Awc20B/WWBiLtwWcLmKgcC1bBqZLwtaMqDpquKBaxA4CFw7ZUHZd77f68JFmHhiGrqdV9NnihNJd8LjunOOugYkvTL5ZE8D8t9zFrsNiEvS+y78uQYSkx82ZMDytIoMnJp8qCEDluekyEBq8tzjqhCWJ80rsAb2JH0J+URDBsZNvllYjV+pWYzUUQYc8CZwHZUa58CYMbBa08Cs4VqJAa4Z4IOK4jeANHAcA1djwMPhyMBvtalI8Rbw1jSxUKWDcfw+B7/VloHBAowLx/7JiHeAdrSBQDiD3+dZHITZfh+4BVzB/7jcBR6ZC2fFswYqmxjF7/OYOAEWgDa//wlqmegH5oGdAuEjYAW4ZrCFJqJWLn6lTspPuJb8eE3lh8yGc+4sB9OW9Ex+6HUkPXTOPY/RrR3mJDrA478qfs7ExYj/j17xC5byBn4qCVoHAAAAAElFTkSuQmCC",
+        40: "iVBORw0KGgoAAAANSUhEUgAAACgAAAAoCAYAAACM/rhtAAAACXBIWXMAAA7EAAAOxAGVKw4bAAACtUlEQVRYhe2YPU8UURSG3xE2UAgsiQEkKBSEhEYqEymwoyQUaoU0UkGinZXa4V8wsaQgoaDTyhAFGhOtoJCCYGw28lEoRDSbwD4WM6tn787AzseiUd7q3M0973nm7t075650rn9cXtJEoFPSqKReST2SWiVtSypI2pD02vO8YhaQcaAagSlgGShxsvaBeWD4LMA8YAzYOAUqSotAf73gcsDziMJF4APwBngBvAU+Rcz9DtzKGq49KG5VAhaAceBiRN5VYBpYDwF9DCTe+7ZILgRuFbgWw6MBmAD2HJ/7aeG8kK/1GZBL6NcHrBmvI2A0DeCYC5fY7LdnO7BpPHeAliRGjVT+WleTrlyI9yBwaLxnk5hMGYNSnD1Xo/9T4/8D6IprsGwMFrKEC/zz+Id4WTNxkjupfEOMZw0Y1FkwNZbiJN41iUUizrkMACdNnSOgOWruBWfca+Itz/O+1QNQ0rqJGyR1R010AXtMvJMlkaPPJ9StkAvYauJ6rZ4kHTjjtqiJLuC2iS9lhlOtDmfsrugvuYAFE1/ODKda7p4rhM5SNeCGiXuBK5khVWrExF8l7daUBTQBB+YImK4HHbBiaszFTZ43yeuAu8pp4YaoVLyXATDsGExkDPjSeH8EmpKYLBqTPaAvI7h7zsPfSWrUj3+HKGsNaE8JdzN4fZa1QprWH7jtPO0mMJjQa8qBKwIDieGM8RMH8hC/n8vXmD/k7Dmrd7X6nFTAAx4Ax475Pn7LNBlAdADN+Le5G8DD4Ct0L/dFZ5weMgAdxb9DpNEKMBBA1QWyBZjFb9PjaAt/P3uBT75ukEGBLmAGWMJvNsP0BZjDv9xXnXNxIFPd8PE74W75/Vyb/K6kIGnX87zjU3Lzkl5Jum4+fi9p5Mz/FYuSs5Il4NGfZqqSgfz74MoK26fn+m/0E/8XFRrNBr/LAAAAAElFTkSuQmCC",
+        48: "iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAACXBIWXMAAA7EAAAOxAGVKw4bAAACtUlEQVRoge2Zv27UQBDGx5BrkqsDUg6JS1LxAoeUB0BKoIAmDWXyAEABEs+QAE3yAkgXpFCEPwk0uTpPkTSRoAXd6U658KPwWjhza2yv1z5O3Ce5GMvzzTfe9e7OWGSKKf5vBEUJgDkRuSciqyLSFJEFc4mInJvrVEQOReRLEAS9ojG9AGgB74Ee2dEzPq1xCl8E9nKITsIesFi1+E1g4EF8hAGwWYXwGeBNgoghcAw8AVaAJaBuriVz76l5ZpjA8RqYKVP8B0vQPrAFzOfgmjc+fQvfQSlJmLej0QEaBTgbhkPjlU/t0ZzX2AFqHrhrwK6Ff8OH9mi10R/sjhfyq3F0EgOg6YNYL5XHPt68JU7NMp3aRUnvKsI+BeZ8hngNRj9s982OcLeMY8uj3qSY2yrmvivRHFePBxfkWCpdQbjExveJLjDrQvRIz/0S9CbF1t/CwzSfa5Z7q8r+5EdeJnxU9lqagy0BvYSdOMvJDx3rdpqDLYEFZX9zVeOA78rWWtIB/FTzsO5HW6bYdRX7R5qPbQQmCrYEzpV9owohBjeVrbWMIEsCmrRM6JfllMCpsqusX3WsszQHWwKHyr7vqsYBD5T9OTeD5Sgx/JePEiMjEARBV0SOYreui8hzj1qT8MLEinDk3EMi7PnEUfZx+hY+j9OGVBc0HSaloDHEk11SGnJbUb/rYyQou6iPBaqyrXIJrPvUHzW2DizB+oRlYN7G1jb2xlaEi7KSsI0EhGt3h7B9uAIs86e1uGzuPTPPJLUWL0tPwiRSRnN3A1g3oitJogm0PYhvE1ttKk3CBGwB+4RbflZ0jY91k3JJwscvplkJfzGtSVjD2n4xnUl4MPuadjwwYt+KSLxTPRSRx0EQvCuqtxL8ZSTujFtbZqgkfgEvx60pN2JJTJ74CBM1baaYYgz4DZ+xfRmsjxbPAAAAAElFTkSuQmCC",
+    },
+    "copy": {
+        14: "iVBORw0KGgoAAAANSUhEUgAAAA4AAAAOCAYAAAAfSC3RAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAA3klEQVQokZWRsWoCQRiEvznXNzCFVboEQRAFG7FLI+RJ8oABGxsJpkgVwRR2V/kAlsabFLeQc28VnHJmv39+/hWA7SfgBehwqROwlFQmPorQF/ANVEkegAEwlHS4SGy/2V6nExv5xvZr6oe4Xtr0v5I0y/nhSksPmGfyCviUdGiBEdoCR+rjNNUFHmyPc41z4Cjp+co2H8CiiFObA0KmqalfoFsAS2Bge3PjcUtBUml7CEzuAgHi577fAxYZr6K+3i3mrNS13Qd2wA/1IVJoBExbYIQfgUWm+QysJO3/AHp/TLLH9KmjAAAAAElFTkSuQmCC",
+        16: "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAA7ElEQVQ4jaWTMU6CQRSEv1ksaOwMBa2HACuLv/AAnIFjeAQPYOU9iBZU/jR6CBMruz8YGxgLdg3Bfb8Bp9rsm5mdvPdWALaHwDVwzm9sgJWk90ptJ7b96n6sbU8jg5tMugjqyfaj7Yda/azElvRRI0ja2r6tvp4N/oSk56MMbAuYAw0wqFA64F5SmwLjOXDXk/ASeLI9jggNsJA0CxImduOdlEO5LBgADsyRtC28BKyAT2Bh+yoSRUh5wxrg7Vgx5CZJaoH2FINoCv826IDRQWN/sLf2XVVte5o/UB9ebA8VRbM9BibEm7iU9PUNXVKikoshW5IAAAAASUVORK5CYII=",
+        20: "iVBORw0KGgoAAAANSUhEUgAAABQAAAAUCAYAAACNiR0NAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABP0lEQVQ4ja2UvUoDQRSFv7u6FjZiKwgSUkSIpU8QSK+F2Ke0EnwAsbW1tVajvfgSeYIQAoKNIqTxB02OxU7WRbyTkXjK2cM39+fMGkGScqAOLOBrYGYvke8lrCXpSbP1JqkTY5mkJeABeAYugYnnBdrANlA3s6FX3Wa4/SShk73g3fE8i3zPzKusqjtgC7iPAZNlZiNgFPPMBEpqAo2IZQL0yplKaoa5HP8CO03YvCR9TrfvVhgqOwJugC4gx5oDh8CZpItYy9M2u2Z2HfEhqUERp1pWOTfPH4P99GTAAHgH2iFnKwkAV1l4mwcUJV8B63MBAczsnOLHsEsktCkqlxJyNJwHBqHC/1QMOH3b+R84Yy8qSNoA+kAPuMWPTwbsA6vAWvRaSR1JrwlP71FSC/wwV6HLQC1iGQN9M/sA+ALzpvJlM5LGSgAAAABJRU5ErkJggg==",
+        24: "iVBORw0KGgoAAAANSUhEUgAAABgAAAAYCAYAAADgdz34AAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAqklEQVRIid2VUQ6DIBBEF9LT+Ovh9L7Qc7z+gKFE6RBRk84nzO4ju2M0u0OAB1Ygoikmv1cBq9i41qIC8ssn0T8lf1ABAEjmzppXT9NSzjmn+LQlndDzgCERbi1sSIR/AHojPCd/KA9bgMO7BmSruW3J70SWxtCtepHV3akR5QMPLEC4BDDMvFPz/Jf8F4Ac4VlpWEQ9Si+oI9wh+Xf6FWFBIfkvH7+ZmX0AmmIXedX3yPgAAAAASUVORK5CYII=",
+        28: "iVBORw0KGgoAAAANSUhEUgAAABwAAAAcCAYAAAByDd+UAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABb0lEQVRIid2WrU5DQRCFv+kPVVxTXoHHaMBUEOANEAhcDdgqFAiS1mAIgpDwBqQGTB0vAALCI9CEUEfTHMTdDava6e1PCMdMbzKz307v7pwLK5bFH5IyoA1sAevO+gHQA7pmNnJTJWWS3lRcD5LKHlYlxDawCXwA18C3c68Z0AKawAFw6+3wKez0zAlKa+9D7Y0nvxRifGfezlK9Ay/Apye5Mj1lsszsZJb80vSUxWrlwJn+Ukn7wB5Qd5YMgT5wZ2bjdKHncNJOJ8Au57ynVXeHobNWeHwEvpwd1oEG+T09Bi5cHUq6ijt1gtLaTqjtg//QxHfm7SxVrNmYBbgwReAgxGxVwF6IrTAbu8sGdslP3xr5PWsuC1gBMLORpB1yi9nGOYgLAwN0TO5nPk8rqP8/vP8scBii1yVS1dI1vPbUBw6BhqQO/hFXA46SNXySVA4WU1Svyr97fz+EHdAqucXsEgaxQ9GAz82syOCfXz9GRFQI41g3swAAAABJRU5ErkJggg==",
+        32: "iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAACXBIWXMAAA7EAAAOxAGVKw4bAAABvklEQVRYhe2XsWsUQRTGf++8XCy0sjSFgnaSzkJrUbE4myBCIP+H2KYXKwsLwcIq/gOCsUtncZAujSCCda4xwuWXYmfDnBFuZ9YkIn6w7Mzbee/7ZnbmzQycMyKvqNeAdWAVuFAQZwrsAG8j4qBKifpY3bcfJurVGvLr6rQneYuPaixmnRfwPAvwoDSAOlJfZTFudvUdpPdqZvsQEZYIiIifwKfMdKur7zC9jydcKXmGr8D7VP5e5KlutWNXSV6NweIm/7iA4eImJ6FeAW4DlwrcDoFdYO/EPOs6B9ShuqnOeuSJbXWlVsBmD+IcE3UZCn6BzbA/S9XPwAugJO8vAWPgKU3e2QBedx4B9WHWg/UC4jzGKIvxBspWQT7hqna8lDFbXC4VcCpoBUxbgzo6DwE7me2l+kS9c2Yq1ItpaeTY+qXNWvZtrQfXXPwBQET8AB4B2306UoPjPBAR39R7wA2a/bxsS+0rIIkQ2EvPmeCvWYb/BXTBYVZeqiFz/rQ9KxWwm5XHpRkzkd/PTJMSf9SwOUz8CezbXAPLoK78JmPWkI/bmGVXqEbEMs1h4i5pS+2IGc2wv4uIL6W8p4YjE9K3OV8AnsAAAAAASUVORK5CYII=",
+        40: "iVBORw0KGgoAAAANSUhEUgAAACgAAAAoCAYAAACM/rhtAAAACXBIWXMAAA7EAAAOxAGVKw4bAAACEklEQVRYhe2YsU5UQRSGv7OglTQbDYUdMTYSYixM3ITa0LiJ8AAUWljzGMQnsDB2FkrkESwMRkuwQbciFiZgsyUuv8XMLsPdu2rODFwwfMlmJyeb/37ZOzP3zIVzjtUVJbWB+8A1Z+4A2AZ6ZiZnRq3YDUkbKsdXSZ2ScnsF5YYMJHVLCJb856rsS5rNkWtXAp9JupKRZ5LmJR0kmU9zBB9WBN1yldx3SeZLT0Yrfs+kRTM7zLYL/ErGMxN/9QemC4lM4jnwOo6/ewJOVdDMtnIzWn//SbNcCuaSPQcl3QOWgAVgyhnTB7aATTP7UXeRlXQT/Eexq5LWJR1lPmVS9lX3WHQKrhcUSxkoaTBct1jhtq4lpR1gF/C2VtPAItAmrItXkm6bmbxzcInjXnIHuGtmA2cWAJLmCT0kwC1gDuh5V/FCMt7NlYt8qbuGVzBdrUU65prOewouwD44FDxxiyTVnlWaYCi4XanfOWuRSQwFe8C3pP5eodl8I+lBA14jWjCaoKvAUay3gS6wDNxsxCwyWiRm9gF4DBw0pzPOiY3azDYlfQQeAR1Cm+7qhEsx9iSJ3cSL+GmcC7MPnlsuBXP5bwX7ybjI2Vrjr1v64BdMD+SLCi+K3A1GlHtSKX/y5iFpNh5wTosNt1wi2Y0HnNLsSbqeLRglOwqveUvxtiqX3ZgqzL058g/un83sZ67PmfMbWQyvDNmWD8sAAAAASUVORK5CYII=",
+        48: "iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABN0lEQVRoge2ZMRKCMBBFE8eGgoPJobiAvXoeWg+E3bcgMhEEBvaHJc6+FtjdNwTzJzpnHBAAFYAGQAsebahZpRy8APAgDj3FHUCRQmCP4XsJ9vDVjsN/4C0ndOsz5gqgJNYvQ82YhlXfYfzB0oaPepSDHq20po+K4+uC9358uxx2n5NsHH3Oezdkv9ns34AJaGMC2lAFoJlih0+tHFw/xQoF9FPsVgEcJcUKBI6RYgUCqilWnEa3PreWqT62D2jzVwKv+EKKjzEFscBzcK3ORcI5t7whzTy36ed3w3zLfTATCXIRKNAFpjwFoptHsZhSWMBUH/GuORzaduKVmIA2JqCNCWjDEEieYn/U7HsyBJKm2FCrXugpaqBxrHKhCQQJ/YMtocBkiiVzQ4o/yCORlIe73GVjkHgDoyQf5jQ9T/4AAAAASUVORK5CYII=",
+    },
+    "note": {
+        14: "iVBORw0KGgoAAAANSUhEUgAAAA4AAAAOCAYAAAAfSC3RAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAA6UlEQVQokY3SMS5EURjF8d8dEhKZVhQ2MGzBRFQaOlZAqbIQC5AorECjsQIkSmIDI1EpiNCYo3lPnjdvjH/13fOdc797k6+oSLKCXSz4zTvOSynjpjhfhfq4wwifjf4yBhgmOWyHJRkmeWlNkuQoyW2SUZKzJL26VxdzGLeDFR/YwjZO63BvirnJJq6xhANs/PzxDy5w3zr3ZgZLKU94qs9Jvup64qlJ9jPJXtvXNfEK6y1t9J/gGo5b2gluZgVf8dChTTJtATp8L0mGUCqhj0eTK9dkEasYlFLeSuO2FexUhi4+cVlKeYZvWp1xlELZJ/oAAAAASUVORK5CYII=",
+        16: "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAy0lEQVQ4jZWTsQ3CMBAA7xEdtBkAJkBCNNSMEJQZKNkgHR17kJRIFBRswAw0dEg0INqniZFJ3k5ylf3/PttvWfBQ1TkwweYkIp9ADlQ11zgXVR3FBC9V3RjxtBI8LcnAG4+BR3AHWAEz4OhLBuH6BlNgByyAswsOewhKb7xsZKt7pm0W1xM373MFE1OgqoXxjAerNtSDPVDUYvc+AgCJ5FoFW2Bdi5VA1kkgIplVbOE38Q0kHdYkVe0/HT6TT/47bU0S+86Om4hc3eQLUiysint2x6YAAAAASUVORK5CYII=",
+        20: "iVBORw0KGgoAAAANSUhEUgAAABQAAAAUCAYAAACNiR0NAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABLElEQVQ4jZ2VsS4FQRSGv3OpEYWKN1gKlV48gLg3nkFJLyFxW0+hotRJREmlEKWK27hXIVEp3F9hJjm7mRm79082Ozn/nG/OzGzOGg1JWgJWm3GniZm9F/wabChpqrK+JG3kGOZgO8ANcA08JuauAAdh/AFsm9lTqbrjUMF6xq+CfyHpW9IkVWnPjedibnbVP70Au8ACcNuE9pIpZVXAK3AILAJ3kqpozs8A3AtP1DLQB567AsfAaSPmL4pOQDMbAyc+FrZaA85yhkVlgZIGhY+7n8srbfkNuMx4o85AM3sA9gsLdgNK2gKOMvZ5WLA9EFgDBhkvdxTFLV/hmkdb+Vv+iawO+XFuzK1VGM9kKCnVvlLaDO/7pNuywXpNJZ2lSvbQ/34BXiMz+/SBX6CU2UiwqKraAAAAAElFTkSuQmCC",
+        24: "iVBORw0KGgoAAAANSUhEUgAAABgAAAAYCAYAAADgdz34AAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAm0lEQVRIie2VQQ6EIBAEG+Jr9ml+QP+r+47aiyZokIHZKBf7RGCamoYQpCcFRGAGVuo0tgLmyo19kKTzj1Hng+zVtXXA2ARpBWzjeogHYEHC2ShJIYTDfA5QWk/90er2Xw0e01XCXLLbE/Q/opYLzal/AqtDS/0TvHfw+EP7SpL14eSUeNZSkefLPGsqASIwAYtj42Xz3n7sB/0AspOKNItFmKwAAAAASUVORK5CYII=",
+        28: "iVBORw0KGgoAAAANSUhEUgAAABwAAAAcCAYAAAByDd+UAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABWUlEQVRIic2WLU8DQRCGnyEkFIEEBaoSi+AHoMCWDwXBYgjwA/gHJKRJFRgUNAFBKrC4JjioxBWLqgH1IljCsbnrDe1C+5q9nZubZ2azuzfwz7LYIMmAHWATWHDGeQR2zez91xlIqmsw3UqaKov/o0JJS8BDmJ4DLyXf7wGzmXkLqLkrlXQUsn12+neCfztTaatfpRPRfCaMb64Mv3UHnIbnNeC6CBoDh9GBB5oMaGbKgd5IqvwF8FhSB3gCVoDXYF8F9rOOk4mAAIsF9umUwAYwV/AuPjLDA82sUfROUi0PmHKXujSeQElNx116lQyYUt5NcwI0S3zKLno/0MzaHr9kQEnLlP+Mu57EvEt6CKyX+DT57BL6ajw3jZltpAKO/OD3wliJHQfQV4xe1hgv6X0Yq5LOcJ6tHM0D1ShmvoZoE/NUj+MXNcLbwBb+RjhWF7gELkLrMTp9ADHqHvkzd6fyAAAAAElFTkSuQmCC",
+        32: "iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAACXBIWXMAAA7EAAAOxAGVKw4bAAABZElEQVRYhe2XsU7DMBCGv0M8Q0WRYIWJmR02Roh4BJh5AB6BtTwD7VYxojIygZhYYAGkIt4ACfVnqItKcRIndhQh8UuRFft898lO7DtoWZY3IGkX2APWKvgTcGpmD7WJJJmkc9XXm6TNGIDjiODxEJLunJNHSZ3AOQMPxDgEYsnTt+XaezN7rwLvNHTtCjAqg/ABzPpUIzhA5oHYqAIQJTP78EBc50EkByiA8K7EcurgkgZzr5/AGOi6ZwSsNgoA7BeMdRc7GtmCKM39x4Ny62Cf3+fE4ljrK/APEAwgKatwGR0kB2hKVc6BF+Ai0PY1OYCZ3QCHofah+jtbIGkbOAk0P3Mrlg6AaXKaBdqGfiuVL6O6SUo8gJn1gX5qgNY/Qh/AxLW5RUsNzXxNCq3gR1r+FJqWl/jrOF+SdBsyIUVhkqejEACT1GsgeE/Sr20tKk53mBan66XUxXoGLs3sKtJPM/oCwBsRVsrDZuEAAAAASUVORK5CYII=",
+        40: "iVBORw0KGgoAAAANSUhEUgAAACgAAAAoCAYAAACM/rhtAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABi0lEQVRYhe2YMU7DMBSGf1fQiQGJmUOwMcIZWkDtMQoXYGPiEh0qCltXDgATF2BrOAFVB5D4WCrkpnETu44JFd/kWO/Zn+zESZ7UcExZANCWdCTpMHCOL0kTY8xnYH4xQAu4AuZszgOwG1POAMMIYvVIAv3IcnElgUdr0Amw75nfrVUSeLcG7Afk5wWzUMmWo3/Pan/4ChZwIunNuu5IGlWRdAlGxRjzqkDJJILSkmRmdZdKJhOUfiRP5SG5k0IM6Oa6biRdSzpYXHckjSTl49IISrqvENMp6ky6xSE0XrCQ3KG6cl9EnGfpQC+KafwK/gtuynYKAuM1n1Mu7pIJpqTxgqGvultJY8+crDxklSBBY8xTSF4I27nFwLH8f+SnISsfeg8OJJ155owlXfhO1Pgtbrxg6FN8HlvEReNX8M8Kzqx2u8b57bFnRQEuwWer3cOzeFSFxZg9q6v6GUl95bd1VC9SUU8Bcx1DoLQcnZdsAZfEKQG7mAMDwPmwpiiiu5hKejHGxCjv/R7frXFdn1AvQygAAAAASUVORK5CYII=",
+        48: "iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABMElEQVRoge2asRHCMAxFY6BJwWCwApmFBeiBeWgZiDTwKVARwA7GsqTznV6X2CfpxXacO6frnAYAsAVwAXBDHe4AdhqF9wDOlYqOSQzSAlLFy0vgNW00kJHAa85POQBYM+LpSuB7wRYXT/FiRctJfGarHQ/AICohLUD35CQ0BOi+jISWALXVl9AUoPa6EtoC1CclkfzsCHMJ3zqGkOybA/MhPEIIy1jDghFUk2SdrQgkaV5gpZXo3zWUu2aaHwEXsMYFrGG/hbifGdwdvvkRcAFr2GuAO4e5ND8CLmCN7wPWuIA1vg9Y4wLWzAmM0wswDzj+IZJrjHbs5gWuH9d7DQnKsf9RS1YgrUO+HDalT0P6mDWHU1HxJNADOBkWfwTQFwtMRGr/ajDHjXKVTRtHmSf6gJQbqeeZDgAAAABJRU5ErkJggg==",
+    },
+    "close": {
+        14: "iVBORw0KGgoAAAANSUhEUgAAAA4AAAAOCAYAAAAfSC3RAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAZklEQVQokdXPzQmAMAyA0URdxJ2EguAkHpxHcL+Cl89LWyT2x2sDgZDwSCLSZwAH4DL9Fdhr0AH+jQPywNLamvBvZPAdMouGgh0LdXVbOi/3cxOZsz94MnYWkU1Vr9hQ1ROIsx7jAW6ZdhY05wlRAAAAAElFTkSuQmCC",
+        16: "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAXklEQVQ4jWNgGH7g////1uTIwRX8////3////4uxyJVD5SwIGVKMbgiS5gLCfkAzhGTNWAzBq5kJjxksSGxmUm2HOxtbmBCtGUmMOEOQohHDz0iGEIxGnAoIah6aAAA7pJ0a6o4OkAAAAABJRU5ErkJggg==",
+        20: "iVBORw0KGgoAAAANSUhEUgAAABQAAAAUCAYAAACNiR0NAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAgklEQVQ4je3RSwqAMAxF0fjZoEJdoaLoHr1OAgY/bVNw5pumnL42In8+CTAATWTeAsGDAcxPqGKrnulzwEaxG3rBxtgrkmgx9oIuwFaMXdCFM1MKqxNmJSIWKGum7eyfTabp4/Y92KhPf92+GzMzPwqE2DYNugNdbss+druiedgfdw5dgimWv54IUgAAAABJRU5ErkJggg==",
+        24: "iVBORw0KGgoAAAANSUhEUgAAABgAAAAYCAYAAADgdz34AAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAlUlEQVRIie2SQQqEMAxFY++geEMRmcuKFPEwvtkUppRpSVpX6t82vNeEL/LmuQE+wKCYG4GlBg6wlSQB7sPsbBEMAZ6VJPAV6K1bZCXN8JLkMnhGsgPHZfBEsvOL18Kd0uGSWScinfWjf5Pc3EebFCtcA1+BXlPhanj01ibRVLFJAiyaKkaSE5isW8yaKgaJDf7mXvkCljh47t9GzCsAAAAASUVORK5CYII=",
+        28: "iVBORw0KGgoAAAANSUhEUgAAABwAAAAcCAYAAAByDd+UAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAnElEQVRIie3TQQqDMBCFYWlPJEhPVhS8sxV7AP9uRpBQ7TwzgoU8yCqTfIvkVVVJyV8H6IFGmH8AXQ4G8PKgho12pj0CNob9RBNsAGoZ9KJhmAcNx/bQ07AN9G3rHCxBFwhgUrGbaH6bv4t3+JK82WTL3dMcbABqpafZ2GovFvV8/TBU6VkICnRKz1boDDxl0C5plZ4ZegwrKblMPkFDylvxDZz+AAAAAElFTkSuQmCC",
+        32: "iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAxElEQVRYhe2UMQ7CMAxFbeAKcL9KVOoZGDpwDQZOmj6WVKoiaGs3iRjypS5NnPeUyBZpaWn59wBPoHfUDcCYAw4QLBIRHmKtXwLoFwftkkjgAejcAlaJ7HCLRDH4Honi8DWJavAfElP86sATiRk8i7jgJ6fD+cu/i/MsW5I3T5/APDGPwAPQeYZVNvhirazEnlYrJmHp8+wSniFjldhqw1vcM4nIXVXfWwKq+hKRIdaoiFy3alYDjJ4hE2/icQje0tJSIx/Y2wd/AT5cpwAAAABJRU5ErkJggg==",
+        40: "iVBORw0KGgoAAAANSUhEUgAAACgAAAAoCAYAAACM/rhtAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAA20lEQVRYhe3WQQqDMBBAUeum7rTn7cJFLyeViifq76IKwZoYkyEJdP5SZXwQQlJVmqZpmndAU8IM2+AH8AS6iBk34AX0krYVtxaENHBrMkigWVCEIndwAANwlUJ2oUgHrhXBxSCT4UKQyXFnkNlwPsjsuAPkBMzZcQfIMnAb5LSDGyVwtYDxYplTL+/yZdkQPxunJNy48yw90oIbgNaycdIhXTjjmzxIH1w25BlccmQILhmS74U16mx1IMUurH0ozoJ8A3cR3AYZdbYaSFmc8YPoJRFbVk3TtD/pAzOWqDvibbxyAAAAAElFTkSuQmCC",
+        48: "iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABF0lEQVRoge2XQQrCMBBFg95G6G0Kgldx0UVvXcXvpsFPzcS2mZgpzANXtjPvWQMaguM4juM4BwNAd4SZ0qIRwAPAVXHmbZ45aM2UFo34oBJB8pE6EQC6xaLiiIQ8AEwALpruvPCqFZGR72u48+LiiGbyJLA7ork8iWyOMCNPQqsjzMmT2M8Is/KRXIR5+YgQ8ZxftuUjQsQx5CNzxPJTj09DXf6kPTCEcN75XnuEA/t1sFt7JhHkU4fYXoQgPwHohYNtJyInT9fYjFgjT9faitgiT/fYiNgjT/e2jSiRpxltIjTkadZ/I5D+U1/02yYTUe1P/aAlTzM54gXgruGaWzhoydPMGFFXnhaqP+JqXxvHcRzHcSryBgBAnC8MwVUbAAAAAElFTkSuQmCC",
+    },
+    "check": {
+        14: "iVBORw0KGgoAAAANSUhEUgAAAA4AAAAOCAYAAAAfSC3RAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAY0lEQVQokd3NwQ1AQBRF0fd/9GGrBImalKARe0XoQgU2EwVowLVAIpOImZ2463fypP8F1EAPuCR5KpI0SgpmtuU8rUD3NKiAIhc5MAHDhV/RDZfAfOImCUV44SgNRbjNQt9uB42+bT9qzUAjAAAAAElFTkSuQmCC",
+        16: "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAWElEQVQ4jeXQsQ2AMAxE0fQpMkiajJqJmIBVMsOjCRKii6FBnOTu/tnnlP4nVJQo3DDQn8Ab8vswCmp4M/o0ttDZyNM4Jrje+RJyKvSwjH3OGnwLicHf0wH17539j/MgLAAAAABJRU5ErkJggg==",
+        20: "iVBORw0KGgoAAAANSUhEUgAAABQAAAAUCAYAAACNiR0NAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAYElEQVQ4je3RwQnAIAxGYVdwgh5cwgW6hdO7gBOU10soklNpfpCC754PkqS0WxpQgKrEOjCArMIuoP0YAypQVFi2A3ePfl4TaDb0oOGbOfSUPMDQudg3HRrHJvSQYbvX3UwoxvGu23qXAAAAAElFTkSuQmCC",
+        24: "iVBORw0KGgoAAAANSUhEUgAAABgAAAAYCAYAAADgdz34AAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAYklEQVRIie2SwQkAIQwErUJ7tF2viOtifOhDwp0Irh/JQJ6ZhWRDcJxVgAjkk/JCQxti5AWILt+TA3m2oJD/Lm6fZSaQ3fxLJH+oEb59tG0xIfoqDiFPH618CElAOiJ37qACeO8iWmySU14AAAAASUVORK5CYII=",
+        28: "iVBORw0KGgoAAAANSUhEUgAAABwAAAAcCAYAAAByDd+UAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAb0lEQVRIie3SsRGAIAxGYToqjtphHI0tHMnCrZ6FKTiMViYW5A2Q7w7+lKJoyoACbED1wnauDiB7YQAtsAkwoMqkiweWZcrIMRX99BmB1h26oSZ/9oSaDkRBF/M1Diim2AtqhymoPdahqxsWRb92AjyEXIvcxfP2AAAAAElFTkSuQmCC",
+        32: "iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAeUlEQVRYhe2TsQ3AIAwE6RglM7BvJqDKRBmABS5FqBBxKhsl+pNofScwKQkh/g6QgR0oq+SVmxYaMcgBTmCTXPJvyIHS/25eJW99WLUiXK4d2PogrAjXN3+LCFm4p4jQbZ9EHP34y42IOLkRESefRMTLh4g1ciGEFxc+q9TsXDkMZAAAAABJRU5ErkJggg==",
+        40: "iVBORw0KGgoAAAANSUhEUgAAACgAAAAoCAYAAACM/rhtAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAnUlEQVRYhe3UMQ6DMAxGYdjY6GUYuR13o70P++vQRApSRM1iW+h/B3C+wc4wKKWUCgsYgSna0a3gNmAH5mjPqQZXe6dBdnAAB7BE265wa7RNOOGeiQMmYMyKm/l9oNsdpBfuBXyaB0xIt50DljIYK9L9IIDVinTH3UGG4SzIcJwBGY/7g8yBMyDjcbUOMg+u1iDz4WoFmROnlFLKry9Bxbs+pb79WQAAAABJRU5ErkJggg==",
+        48: "iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAqElEQVRoge3VUQrDIBBF0awo+2mTxbjxcPuTgUKtjRp4U3jnz6+5A4rLYmZmZvYBWNUNw4AdOICibun2Fh+KuumySjznOf91asTv6rafHK/ieBXHq8jiueEjUcaX2UHq+KmB0mszO1j+YGcC5PEzIWniR4LSxfeEpY0PrcD08eFLaE2++HBhibzxobFE/vhQWeJ/4gOwneEHsKl7hgBP4KHuMDMzM+v0AkmvX2GMnj6CAAAAAElFTkSuQmCC",
+    },
+    "trash": {
+        14: "iVBORw0KGgoAAAANSUhEUgAAAA4AAAAOCAYAAAAfSC3RAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAA4klEQVQokY2OMWoCURiEv5H1BkKqHEAwFh7ArDdwPUN6uxzCzl7wBlrkACnsA6k8QCrRwsoga5gUPuWxvk0c+OHNz8z7P1GR7QwogIew2gBLSac4p0RxBgyAr7B6BN4lvVSz2G7aboXZ2i4iX4TdxTfjYu77lV9Rwy8LYA1MbpDOegXawEhSmQFIKm0fgYOkXapl+wAcJZUAWU1oDHwE25M0rWYaNVhD4CnMMBWoK/6rJCqwB76j931FSUVk56lMjPrD3+iNkLm5+AZMbT8DrkIAHWAcL66y3Qe6NRc/Ja0u5hdlVYvnzffx7gAAAABJRU5ErkJggg==",
+        16: "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAxklEQVQ4jaWTMQ7CMBAE5xAFDV064B+hoswDkvBHUHgEFanIK3hBGrqliJGME2MiVopk3+2OYtlnTEjSCjgAa1fqgauZPaf8o7CkTmN1DpwEFC6QebXM1YrQb56pccsNkAOXwFsCLfAAMLMqBNwiwVAl0JrZPvz1SpISYdxRqvd+kQqkFAVIOkvK3XeaDQBqYAvs3Ho24Cf9DVh+6dUM9w5wnA0ws8bbNjGff4QehmcbM3u9fqoZG6JQd3+oLITwOcahRmP9AvlXoNh47++LAAAAAElFTkSuQmCC",
+        20: "iVBORw0KGgoAAAANSUhEUgAAABQAAAAUCAYAAACNiR0NAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABIklEQVQ4jc2UT0rDQBTGf69quxMEKyK60k3JMXoH8Qw5Rg+RhSew2HvUA1RXdScibXDhTqR+LvKQMMkkIQvxg2F4/7755g3zjAZIOgCugD137YC1mX011cXIppJyVZFLmsbqLEI2BF6Bd+AO+PbQALgBjoCzzkolTVzNrCY289ikUaGkFEjdHFH0bgtsgpoTYAysgU/3ZWaWAewHyRfAIfDoqw6b0iEJ8BHJA0kLSYomVPMlaVH2DboWd8XfEkpKJa0kXfpa+eNFET5KiDFF40duJ+7rp7AP/j9hWw8z4B54djuh+D39CM1sGxA8tQioXHkHIKm1FaWcXZPCB+AauJX00sJ57vuy6dShpHnNUI1h7lP9F7EBewoctyjMzewtdP4AsNvCcuTVZysAAAAASUVORK5CYII=",
+        24: "iVBORw0KGgoAAAANSUhEUgAAABgAAAAYCAYAAADgdz34AAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAlElEQVRIie2Vaw6EIAyEi/E0XFDvC3uOb3+IG8ISU0p8RecfaTvTR8KInAlgAGYg8o+YYkOPwFwhLjH1CKyd+0rMp1joEQDAGhcRcWWBuZuc1Lkfr/1AVmjGbqnbfYKHCJT7bbnTNSZ4BXbFqEnK/5baewv3X1FN4COyGIqWJMuNmmSNTdrtk8XoJyA0EIdUc7y/fAH9lhi3TUIZmwAAAABJRU5ErkJggg==",
+        28: "iVBORw0KGgoAAAANSUhEUgAAABwAAAAcCAYAAAByDd+UAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABZ0lEQVRIie2WsUoDQRCGvxFJbIwWJi8gioWCb2DnE+QVlJDWylSpYmVroa2dVVo7q4CVoIIKaVImVkkTbX4L9+A87nJ7lxgh+MOxuzNz/z+zs3sczBnmEySpBDSAA2A14h4Bd0DLzIZTZySpJOlN6Xh1iU3EsodmA9gC3oEr4DPiLwBHwDZw6p78kNRxFbQmxJy5mE4a348KJVWASiRmw43rknYTeNaC2JiYvpn1kzJtevQqK5phjaW0LZg1oofmAhgC5269l5P30Y0nwHWioJn1JfVC66c8apKCaS/av7lv6Z/3MBGSykAZ+DCzrrNtAkVgYGYDH54sFdaBZ6AdsrWdre5Lsvg9/BecObyvBTDg+0R2Q7ZuyJcPkqrBZ34KjgDVqG/xexgnOAomkgpZCSUV47gCxB2ae2AMrAA3kh4A334asO/mY8fllWVtBr8WtaSMkkQPgWNgx7O6AC/ApZndZnzvd/AFHidHc8JhezgAAAAASUVORK5CYII=",
+        32: "iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAACXBIWXMAAA7EAAAOxAGVKw4bAAABUElEQVRYhe2XPVLDMBCFvw2UcAQy5gLQ5gSZVKEAmnAMzsExYCaJ74FbcgJmuEGozaNAZoQjO3KiTCj8Gq1W+/Ms7UheODKsi7GkDHgAroCT2nIJrIBnM3tPQa6e/EbSWtuxljRNnfxS0mdEcp9EFhN7EMlhBpw5eQIMrAYXa+Jszp1PGkiae1/XWDeSzLObx8Q+DQS5C9gNPflWUkzsYSiWmeV/5gECUdF3hTuuX8TWwMGwcQTAPfAIjLz5Pli6sQCeojwk5VUl7Zkcryjz0PrRj6AnECrCVkiqivLDzAqnGwEXAGa2bPLtkqSxCEM3naSF03212PdF2BPoCQTR+R4AFm4sPN0rkO4Z7x+j/0CgrIS2n9BtqPmWIZsmAitPHu9CwvmMPdVbF+dMcV1QLKIbFZ/ENBGJ1latdWsd6xlwzWYzug0lP9v+cpBmNRW+Af7JwMLKbMiGAAAAAElFTkSuQmCC",
+        40: "iVBORw0KGgoAAAANSUhEUgAAACgAAAAoCAYAAACM/rhtAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABaElEQVRYhe2YMU7DMBSG/4foRgcqOiGOAeoNegAK4gqscA8OgmivQSSOEbGyZGT4GdJIlmOnfnlJyOBvcuxn+1PcWtEPzByxTCa5AnAH4CJSUgH4EpEfyz5qSK5JHpjOgeTVlHKlQq6hJLmeQlDz5lpvcmy5lbfhM8lFR/3iWONyOabg1tssKudJumw1e54pHZfug4j8npoQqFkGCyOchzpJfkTqrxPrungl+RQaEJFdqy9USJI9NjYjIi0f7RFPTvCIAexRH+fG6xuSe6ddAPhWzSa5c/96g6rV67u0fnsNsz/iLGglC1qJXTNJkHx3Ht9EpDj2bwC8NAMi8th3D5MggAen7creeGO9mf0RZ0ErWdBKFrQye8EhL+rCaX9ioIs6Sv5gTSQLWukSrNyHlJgjlcBaVbDwxCKqoEgjN1igRFvUlkr/SI79w8pUSlqTV+rj3lT2KXLJITrrwPwWyvgswP8E62PxB/oeyT0wTqXvAAAAAElFTkSuQmCC",
+        48: "iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABGklEQVRoge2aMQ6DMAxFoerCwMHKobhA99LzsPZAYfsdCFUagRIHJ24qvw0pNn51oCDTNMofAGAAMAMwCGPs2kG67gZAB+AZUfQRE4BOUuBM8R8JqeIHhuI3ym8nrPvY5Q6gj4jr7VqXuUTNfiH+BRss3ontvViTWkebGggAX4nalpTrbPzGJSXolzi09n8haY46VH0HVECa4JXPdbeIhXq+6jugAtKogDQqIM2VK1Ho/p3r/6T6DqiANCogjQpIowLSqIA0bM9CoWebXO/S1XdABaRRAWliBBb3gDLIoLKTe9ld6BAj8PKOxxwSNucYOHdSYs5hHpXbaQErwTFOpcI3fsU60J4KFv9AjgE4aJ8UUNk+QeDZNkoh3vXRXs9UFJsPAAAAAElFTkSuQmCC",
+    },
+    "restore": {
+        14: "iVBORw0KGgoAAAANSUhEUgAAAA4AAAAOCAYAAAAfSC3RAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAA60lEQVQokZ2SvUoDYRBFz0iw8imsIoK4qLUPYJc+rWCRZzCFdvaWwSKWlj6ANoEIgYhgqXWwshKEY+GsbDYb0dxm4Lvzc+fOBysiANQD4CUiZuoh0AW2k58ClxExqRauZRwAR+oAuAVawDUwBNaBO7WvtubGqs/qq3qvbtZlqW31UT2tE59+4y2nLkDdUt/Vor7jBiAwi4inJcVXwEdEHDfxS6H21BGkOepI7f2nSenqFNj7Q/5+5v5IKHLx9i8yS3N260Q/LV8ozqK5c1QPepZxrN4ADxV5HeACOC+To6F7AZwAO/nU+OVWxhfDF53RIUVWFgAAAABJRU5ErkJggg==",
+        16: "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABAElEQVQ4jaWTvU4CURCFz7C8Aw0VhsTCRJ+EikDpW1jAw/gCWJhYEezc3sZgA50FWxJsJOaz4GjWZS8YPMlt5syc+b3SPxF1RuBCUk9S16a5pLuIWNSqABO/NvDADmvgCciBDbAFxkAzJTADVsAb0AMaJT4DBuYf90SAqbO+ANdAO1FpCyiAUZW45zf6qaEBQ7fTSfkchNt5B24kqXEsoIqI+JT0LOn8RwC4BfJTKvquYC7pEsiOBdjnStJr2XjmwQz+IDAEPvaG6CNZAa0DwfVrNNn0kRTOkpW4zLai9pAqImO3s/EZ517bFhhVg1OfqSOpL69Ku4FNImKZau9kfAEgtCPs+TYzYwAAAABJRU5ErkJggg==",
+        20: "iVBORw0KGgoAAAANSUhEUgAAABQAAAAUCAYAAACNiR0NAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABXElEQVQ4ja2UvUqDUQyGn1NcpHgDIorQoS3+XIGjOKlLK67OvQQdnNydvAd1EcHbEKuIg0Lbyd1OLo+D+bT4tf2qNks4yTlv8uYkgSlLGudUS0ANWAhTD3hKKTkWVa2rx2o9zvPqqfpqXrrqkVoemaHaAC6AJlAGzoBZ4Ba4AV7ifgXYBlaBLrCbUroblmEjol+G7qibaq4kakltqX31TV0bBtgcoNRWN9TFgjJVA7STo6/uDanV5TjAeNeKu4eZLathHdgHZoD38D2mlM4LAEvAHTAHLBf+/iSinkSWNYDSvxHhOfTiF6C6FVEO/oueZdgLXfkDRvam92VRU0xAOwo9kURP3kfrpJ/Oo6Dd+gVgrm0GneWI1FerE4CNbuyBS+sxTv2InqNfNHrDZnUduAKWgAfgmu/WyJbDCp/LYSel1C5ik9E/jI/6KZ3wjV5fY4ATUCWalkkX7DTlA39pdVB0UW9AAAAAAElFTkSuQmCC",
+        24: "iVBORw0KGgoAAAANSUhEUgAAABgAAAAYCAYAAADgdz34AAAACXBIWXMAAA7EAAAOxAGVKw4bAAABT0lEQVRIid2UPU7DQBCFZ+MKKWloSY1SmwuEEkWiovEBkEBUmAOFngukpiAKTaiQcgFL1E5rPgqe0eJk/QNJAU9aze7OzL7V/Jn9dbg6JXBgZudasZkNpcrMbG5mD2Y2c84VjUwI2kfADZDRjBdg3JoAOARm3vkRuASOgb7WCLgCFrIpgBQIR8R78FXyDTircwIckABr+aRtCEqSYdB40zcWSREMVyjAHUgSuSyB3j4InJeTSXn/xeQCaEvgnMPM7nW8aOvXCaougNW+CAYiyMu7nqfMpezvktTPdibZujy34Kjy1jeCueT4FwSnkk8bGmCiEC1qWz4AlelztUx9g4jPwQWQ/ICgvtFkNAbe1fZxh8dPGkeFZ3ynn6z1q90Mu4pTqt+UOblWEw20Rrrzx/Vtp9wpXGVO6rBsDEsNSaTqmgIrNWOu/VS67Qn9N/gA0F1B/4urUa4AAAAASUVORK5CYII=",
+        28: "iVBORw0KGgoAAAANSUhEUgAAABwAAAAcCAYAAAByDd+UAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAB1ElEQVRIid2WMS8EURDH/4/oKK5BRCvk3LcgEhINmyt8APc1fAP3DfRoFJyGhkJCIhIRSolGhUTD4afY2dy7tXu3D1cwyWX33s2b382beTMj/XdxRRWBEUnzkiYkjdnynaRrSXvOuYcgMlAF1oCqt+aAReAI+CBfmsAOUAkBbtvmbfs+AZykDL8AF8A+0ADObS2Rd6AODAQBgQXg0TN0DCwBgxn7BoFl4MzTPwRKRYEnwJu9Pxmoa6zt+GvAq+096OipB0xidQtMdj2ar3ZmPOh6J8XdVKxugEv7zAVCa15MsxPJ8zBLokCg82K64//mPKWqpLKkfknvKRubzrmrQGgkaUvSm6Th4HsaKpa9yZVZSdb7egV0zj1LSk5lqudAk3t7jn8BAhvmfqOX/8D38M6eo79ofyRluw14bc9yVgkLFWBIcdb7ttsUSsRVH2D5F4CR2Wrm1lXiFgNwWqR+doDlXvy0YsXKEcDqD4B+aZvuplw35Vdg5huw2ULF29swQNzPEmityPHSak9JHnRuT6nNJQ+KxSPKyl4rYRHtDfggN1G6eFr3YorVxnPiEWOf7BFjvbBnOeCKZW+TfCk8RIWMiSXFY+KUWrUxGRMbPW8/f0Y+ATc47GGIgFN4AAAAAElFTkSuQmCC",
+        32: "iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAACXBIWXMAAA7EAAAOxAGVKw4bAAACDUlEQVRYheWXMU9UQRSFzyxWbEWkcDeUEiR29lQWEIlWJISCgp6SaCGQ6A/wRxgLC2ys5AdYrDZ0kGi5wQQJNJvQ8VnMPLiZfcy+ebzFgpNsdnby5p6z986ZO0+673B1FgFTkmYkdUOMY0l959xZg9qGSJ8C74EDbsYP4A3QqUOwYgKtmPk54HOCtAwDYBdoj+J9kBDkJG1K+hA9dyLpm6QjSX/kS9CRNC9pSdK0pLakd5LWgFfOuV+5GVgDPkb/6jvwHGglYkwAL6IynQELuQJ+mvEFsB4yUglAC9iORMzmCChwAjyrSlwSc9XEOgQmcwRcAPvAXvhs1RRhM7GTIyDGXk0BLa73xIDIojduqKbgnLuU9Db8bEtaHzfnEPDu+Buy0LtzAUHEJ1POqWJ+7CUwODTjmf8h4NiMu0MCgCWToo27UmUzYBXmd7PR6JrxFZcV0Dfj+TEIsDH7pU/g+znBMhNNMQcbnpbZMN6EX8L3tKTFpgTIt+mHEccwgE44LgnH561dUnIUPxq1YNe4YbsBAdWakVnQxrfOAqu3IK/ejqOFs/hLxFUmcspB+YXkca76hUjEAbCcckfY7ctkXMmS1yz8NeqrpCdm+lTSvvzZXhwoXXmfL8o7qMCRpJfOud8pniSASWDHuKMKBmFNtZpXFNIBXgO9BHEvPJO2mkETr2bS9avZeZ149xv/AM0SJUZ7d058AAAAAElFTkSuQmCC",
+        40: "iVBORw0KGgoAAAANSUhEUgAAACgAAAAoCAYAAACM/rhtAAAACXBIWXMAAA7EAAAOxAGVKw4bAAACjUlEQVRYhe2YvW4TQRRGv4kjkCylJUSkTSxE/AAUkdxE0ECVuAGJV0AiZSgookg8QxAlLiwh0dhPYCQau7OSIlUEAYcKhFJgDsVOxHi8a8/u+gdQPmmU2d2Ze0/uzozvXelK/7lMnsnAdUmbktYk3bJNkk5t60pqGWN+5vGTFuoa8AioA98Yr3PgFVCZhPO6Y7juPSsAT4CTAKgkNYFyGqbFQPANSTVJdxKG9CR9lHRmr5clrdi/ru5J2gJeStozxvTTwMZGEKgC32Oi0QKeAmsj7K0Dz4B2zPx3wFIuQOBFjOEPwBYQvMGABWAHOPZstVNBeoDdGLjnwEKq/3rQfhGoxUSykAXQ1QXwMCuY58MA+579gzyAFzZy205bnQCkG8k+IbsbeJsQQV/beQCtryKDa7IRN85fT+m2fQ4ZY35I2nNu3SfmMM+84CekuqSOc/14XiCJAnad19wDgn48Ziag5K3vTff5vF+xjDFHkr44t267z+cOaPXJ6Q8cYX8L4JnTTwYEXjtroTkTtDHyI3jq9P1UaZq6mcAwEnBlajjDcn2NBOw6/WVgfWpIVkBJ0o0EhiHAlqSvzvWDKXG5cn2cW4ZkERU4l2qTI/8bJ6JEtuP4OwyZVPFO9p0pAlY9X5XQiU1n0jFQnAJcULqVNLlMlEReqkaKGiTAflzCupHWyIEX/v1JQJIn5fcMFYgKGldv8rxukoumbBsRWGK4pj0iKiGDjRLt1ip5y84RkH4kL43vEh20SXNLdsxkCvcRjgpEa/JXjCOAz0TnWdO2jr0Xp761FVYLpwQtA40ExyFqkPLjUVbQCnBIVEOMU8+OrWTxlfcD5qKku4rS9FX9STbdD5jvZ/oB80r/mn4Da37Ld7YAjWsAAAAASUVORK5CYII=",
+        48: "iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAACXBIWXMAAA7EAAAOxAGVKw4bAAADAklEQVRoge2ZQUtUURiG39OEMJmtLY3aKLXUX+CiEKOIcVWgkP0BoZ3+h6B/0CJoOdQmqJWiu9yYkJC0HJpFi1ASFPRpce7EnW/OdebeuXcca164yBnP/d73veee75zzXWmAAf5vuLwCAZOSHkmaknRD0lj0d0jSvqSapF1J65LeOefqeXFnBnAHeAl8Ix1OgU1gGRjOW1QTEvrcBl4DJymFh1ADloBS4QaAMvAKOM5BuMUXYDqt3pY5YEU751z0+y1JVUlJJL8kfYyu75J+RJckjUbXpKQ5SbOSRgIxDiUtOueqaY00GbAjANwDfiY8uU3gPnA5BccQUAF2EmKuAtkSTCDYU8Lv+lfgYWYiz1UCFoB6IP5KXgZC4t8CV7IKD3COA1sBnvk8DFi86Oapn8FbBqqG6zdpJ/YZwk+AJ3kLN9zlwEhskybFdjACTSjAxDitc2LpwhiINCwamhqdzrk+MVCiNcUuXxgDkY6KodooiqsQ4Be7g5iBU2DU9rt0HuI6gXPuWH5b8vcnSY9tv741EOGDac/YDv1uYM+079oO/W7AntrGzkVFVgAjJhMd2T4tIwAcmZuu9kZuNoReoX3TbkldPYTlttqCBmptgvQSlttqCxrYNe3J3OSkx4RpW21BA+umPZebnPR4YNprbe8ArkfLdgP7wFAh8s7W0dFWIunmTZOJKgXrDWnIvpnDV8zi2CGvwlNn/Nm301GAYfwhIo6FAjVb/uwHmliQ5yZIHRgvSHOc9ybdHCljgUr4cl8cW0C5AN0Nzu4P9SbgNHBoAlaLMEFyWWWq28DztOJznq8TeRa2EghWA8Hr+LJg5uwUvaaL5FlaTCByCSbAp7sKKRY72hd3V+iw+peqRBgN6RtJoZR2IOmT/DFwT/4w0jiQNMrrE/Lbg1lJoW169+X1dsBP7O2EJ9cNtul2wqYwUcJ/FrKLXRbUgGf0cKWPGxnGbzs2aN4AtsNpdM8yXZbp8/zMOipft5mRrx6MSboW/Tv+mXVN0vu++Mw6wAD/AP4AJrr5ftTPJxgAAAAASUVORK5CYII=",
+    },
+    "user": {
+        14: "iVBORw0KGgoAAAANSUhEUgAAAA4AAAAOCAYAAAAfSC3RAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAA00lEQVQoka2RMU5CQRRFz0MLNRaExlJcB709iQU9CbW1lCQswsYNuAFYgq7DwpCoAUJo8Fgwyvjzv/4QbvKKN3PPvPsycEipXXWSqlsX6qkz9TbVTO3VAZ/Vftb31aeir1HCngKLrF+ks186LgEfgJE6T/0IuK8T9Ugdqi+phmpZsv0U2aQT4A64Bs4LviUwBcYRsf4B1QAegQu2+6wK4BkwAF6Bm4jwe9qVulFbVdHUlvqptmH3HZfAR0S8Ve60vXsH2vlrTbVTBWW+jtr8z/envgC4dIJn5426DgAAAABJRU5ErkJggg==",
+        16: "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAA6UlEQVQ4jb2QMUpDURBFzygpgkkXXIGFFroArXUJttqE2LkPXUGWYOoUbiDYa2vjx8rWCDbfY5EnvPzk4wuCF4Zh7ty5zAz8EdHWUI+B81TeRcRDsat6pdbqLEWtjkqHB+qnOsy4YeIGJQZnLtDPuH7iTpv6rTUeLynvZ9xBylXJBqFO1Eq9TlElrvXpTZOuequ+prhRu0XDm2JpJXUXGAGHrP7nC3gCxhHxtmKg7gEzYA48AnXDYBs4AnrASUQ8L3XVqXqvdtrWVTtJM13XnKsXbcOZ7lJ9/6nzO3eAj98MWJzYK9D9E74B8CSr5SkhJY0AAAAASUVORK5CYII=",
+        20: "iVBORw0KGgoAAAANSUhEUgAAABQAAAAUCAYAAACNiR0NAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABI0lEQVQ4jdWUP0oDYRBH34pFiIqCFqbLFYx2Wtpqn0Y8QC7hBQKawj7YegDFQqyFnCBWVjEQ/IdC0GczwY1sYnaxcWAYdmZ+b+Zbdj/4Y0t+a1BLwEY8dpIkeS88Ta2rA79toNaLwvYD0lEb4Z3I7RUB3qndOPIoV4pcNy+sEpscZ9ROoraepZ2bwHwCPoGVjNoy8AE8593yUn1Ta6ncZuQucsFCXFX76lC9CR+qD2o1NzCgFbWt3oe31UohWFHL/FPUNWALWJygewFukyTpT6WrZbXl7NZSy2nG/A/mKXAAnAFXwOuE2QvALtAAloDDrO1qMbU59RjjmmZoRpfH2Ie9HfF8VmCqdycLuBrxMQdw1DvSjr3D64i9HMAecJTS/gP7AuvnDC/ZtkYBAAAAAElFTkSuQmCC",
+        24: "iVBORw0KGgoAAAANSUhEUgAAABgAAAAYCAYAAADgdz34AAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAtklEQVRIie2UwQ2DMAxFUZfIHGWUDkGV4bxHuwds0BM5vF7MhUa2IXCo2i9ZSPnC3+Dodd1PCOgBASYtAfqjmt+BwqcKMBwxeQFeQAaSVtazAlxbAkSnzRUvqyctAZM2SRUvqTdaPS6704PyAh76vFW85ey5Oz2w5LlpyRoynHZNV18iwKglzZN/t1bs8bSNTQZ7PPlLr13LwEBxNmGwJxDkswmDPYEAn03Lz9za3Hr/dNj95eoNHGevrEvE9E0AAAAASUVORK5CYII=",
+        28: "iVBORw0KGgoAAAANSUhEUgAAABwAAAAcCAYAAAByDd+UAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABoElEQVRIie2VPWsUURSGnxMtTGyCoikCCtbarBDwA4xglSJ2gXRa+0e0VmzTWZgutSExP8BGwS7gR5EoRBgxnXksPAvXye7M7joWii8MZ+acc9/nzO7cGfjXFeM0q2eBVaCXqVfAs4g46How1CV1z+PaU5e6hq0UgErdyaMq8itdwebVL2n6XJ0tarOZUz1Q57sAPkrDd+rMgPpp9X32PGzzmxqBeS3jZkQc1osR8Q3YzMvrXQCnM1YNPf3aqS6AbzMuqMe2UeYWar2TS71dPIn3BtTvF/XF3wam6ZPCdF19kMd6kX/cCSyBM+ragE3f15o63e40Pviuup0bvsrz5c5Bf7WGfi3UKWAZuAPMNfX2lwD7wAtgIyKORp5CvahuNTwkbdpSL4x0h+oc8Bo4BxwBb4Bd4HvLnCeAS8Blfr5QPgNXImK/6c5C3cgpd9Xe0ObhHr1ca3oN/yvUq8XPcmtcWOGzWPj8MnT9XXojYwXsTAoEXgJf8/xmE/BMxo8R4aS0XPuh5jkQ2NfEsDaPk7Xr7YyfOgA+Bc4Xnv/1Z/QD75S6dgIzOKoAAAAASUVORK5CYII=",
+        32: "iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAACXBIWXMAAA7EAAAOxAGVKw4bAAABzElEQVRYhe2WMUscURSFz1slbrSIIkgqwS0MgqQTiVH/hSGSNNY2Fv4Ff4hBJWm0SWpDYhFTqQgWQgIuRLdaSNgUivvZ3IWLzs6+Xd82iQeGufPueeecNzPMG+l/R+h0IjAqacIuT0IIZ2kitTYeB3a5i11gvNvmS8DfDPMGasBSO5rRjwB4IWlPUkHStaRNSd+tPS3pjfXqkl6GEL61E6SVeT9waqv8A0xlcKash3Efpwyw6G7zSg5vxfFex2gXIjPMuvpjDu+Tq+dSBhh0dSWHd+HqJykDlF39LIfne+WmrHYBzLhnu57De+d4MykDBOCDE18D+ly/aGMNvE9m7kyGgXNnUgW+2FF14+fAcPIAFqIE7DX5CgJ8BUpdMXcheoBlYB/4bce+jfV01fyfRMvNCChIei5pVNKjSN1LSWeSjkII9Y7TAa+Acs5L1wplYKET4yKwdQ/j29gCillevU0yrElatPpC0oakY0m1yDUMSJqU9FbSU9P6JWk1ZvXzQN2SfwaGIk2ztIZMA9Ocj5m0YxMugbFOzZ3eGHBlmtsxEypGPrivudM8NM07W3nWdjxi55+pAkj6cUs7N0AD1wkDNNWK/SF5wAO6hhsy5VMp8i3P4AAAAABJRU5ErkJggg==",
+        40: "iVBORw0KGgoAAAANSUhEUgAAACgAAAAoCAYAAACM/rhtAAAACXBIWXMAAA7EAAAOxAGVKw4bAAACRklEQVRYhe2XPWsUURSG3xsTEkjpikbSxFQSLUQTUqTQSrERtNFa1Co/QH+AKfwF4pbaKWKz3RqwCihYxI9NkzTCok1MYJuY9bHYu3C83tnM3Z3dqOwLC3PvnnPeZ5gzM2ekof5zuV4LAE7SOUlXJZ3y25uSKpLeO+fo1aNrAYvAGtlaAxYPC+4esN8Brq194O6g4W5FQLaBN/63Hfn/5qDgpoGGMa4DN3wvtmOc36ubuAYwPQjAcmA60yF2JjiZJ/2GmwB2jeH9HDkPTPwOMNFPwPmgr+Zz5CwEORdSPEcSGU8E61qOnM/BeirFMBVwJ1iHwDGFQN9TDFMBa5Lsm+F8jhwbg6SNRM80Aaumn2qdmt7fVBsm/nVf4bzppaDpnwNHI3El4EUQezHVr6thAShLum22vkl6KWndr89Kui7pmIkpO+fudOPXDeA4UCG/KsD4QOAM5CjwENjrALbnY0YHCheAzgIrwDqtt8yuP14BZg8NbKh/RbkfM8CUpGuSzkg6npLbLiHpq6QPkl455+qJ+ZlgJeAx0Ex4rBykpq9Z6hVuDtgqECzUFjDXiSHzMtEaz9/q94nlh1rj06akZuL5HlHrs/S0pDGzX5e04Jz7krsSrW+KanBJHgGTiVCx2pO+lm2ZKuabJk+RK8GlWO4VLOKxHHhcTkl+ZhLfAalzYx6PEV+7raexuCzjJXNcdc79LBrQ17Tz4VIsLgvQjumfioKK6KM5PhkLyAK0d1mjMJw/ZWuPxQIK762i9dcDDjXUUAfoF4Zoa4irm+2dAAAAAElFTkSuQmCC",
+        48: "iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABtUlEQVRoge2YPVLDMBBGVxTpOAIVM2HcpqYiZ4AuXIUyVwhX4BA0cU+VhpYbhCapHoWVIdnEiaVVUDzozbiQRmt/K+tnd0UKhUIyAAeMgVdgASz9s/B9Y8Dl1nkQYATUnKYGRrn17gA8A+sO4jesgUlu3SIiAkwChGvyOkGzbPTMr4AXoAIG/ql83+rAn8iznGg2rF7zH8DwiM3Qj9mmJsfGpjlR9My3it+yGx74E+NYHVexhiLypNpT59znKSM/Zqq6Hw064qA527epAmwrZbs4p9Y2EUslYhBgO1C2y1gdliV0EVgc+FLt2wBbPVa/qzMWB2rV1pv6GHrs3KAjDsMxepfyGI2GdBfZnFwRKn0OJbac6G8wt8E70c9wegPdE5o5uZdNG/ymlDP2U8oZl5xSFgo9JWhD+Q34IE0scy8iNyJybdTwLU0wV4vIm4i8O+cwvnOfgGPSSvq6EeF1HyvpLjpsoYIVmxN0CNYSTNB5gj0iwmUrpKwbEZmwWCGwbnQspYyq+1hJVjfCUPexQoq6EYa6jxUC6katmwPYuQ2dc38aBnf9/r8ubF0EvXegUCgU8vIDHOKFQFkv8c4AAAAASUVORK5CYII=",
+    },
+    "status": {
+        14: "iVBORw0KGgoAAAANSUhEUgAAAA4AAAAOCAYAAAAfSC3RAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAzklEQVQokb3SMUqDQRAF4G9EtBdyBItAzmD0Dn9lZ693yB08gJ2NuYOJZwj8RY4QSG+asXBWlpQJuLDsm8e+nTc7w4krIDNXmGJX/C2eCr9hW3iCMSLuL4uY4hPLij9wU/gKi8IDHqAJd1hGxLIcrDtX646HGVycW+N3WWqZ5ngp/HrEHyLiugkfu5ra+qrz7ojfR8T7/1tVwk1mDu21zFxl5nPtVccPmbnhjF9tfZxgqD41S20Y5p2boe7+CUe/EzGr+IB9hxddgvFUl+AH6ydWkAaEjL4AAAAASUVORK5CYII=",
+        16: "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAoElEQVQ4jc2RzRECMQiFP3bswkbWOrKdaBnaSVKHaWTrwMOSMUE8OLn4ZpgADwg/MAkBUNUbsAb8w95rwFURuS9mrEByAQk4m0TcCnDqnEVEtmaoqg6tjlxu+sIkpgv0IyTfdo+AK/C+woVjWR7V3uhCu4g8p0do7WWNsZlEyDAusUgH/4njSvP/3xnzt0DHJWyMVqB+ZBwBe6d7Lsr5HS9w1WRqoPcRjAAAAABJRU5ErkJggg==",
+        20: "iVBORw0KGgoAAAANSUhEUgAAABQAAAAUCAYAAACNiR0NAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAA3klEQVQ4jdWTsQ3CMBBF3yF6FoCOLhmABdjAKOPEjIPIBiyQAUhHFxZgAtPYYIxzkaJQ8KXobOv7++7rB2aGADjn1sBO4V183SucVkTueEHjdJT+02AAlskrJ6CJ9hYoEk7nzwMMUIVNKtiIyEvQOVdmBFMOseAib8d0zC6Yjmz9mAF15k7txwwwmmDBt2c55B4C3jlcARtF4ObrVuH0IvKY3UPgt8Hu+Az2kFfHaG1IfY86NMm5zXRotbv/F2yjhTbiXIc4qWBF9KMPoADOYx22wEER6X3VOO1II9PwBE8j5g+txjYTAAAAAElFTkSuQmCC",
+        24: "iVBORw0KGgoAAAANSUhEUgAAABgAAAAYCAYAAADgdz34AAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAS0lEQVRIiWNgGOqAEcb4////f4KKGRkZSVXLRInriAEsuGxGBrhcTIxamvtg1AKCACOSiUmCpKiluQ+GPhgtKkaLiiFgwWhRMfAAANFMMBu7tvsRAAAAAElFTkSuQmCC",
+        28: "iVBORw0KGgoAAAANSUhEUgAAABwAAAAcCAYAAAByDd+UAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAA+klEQVRIie1WMQ6CQBCcNXyDzk4fwAfsTXiJiT3Ym/ARTOz5AA/AxMKOh6wFh1nj7d1iqAhTbeZudi5hdwKwdNBYMPMZQGbQ9ER0cpoKQGrQtER0BYBEkBmA3CB+iPoAYGfQfJAo/M3DxR4zTcPMNQ+olfPSnXeC6xxXWntuIq+eHavh7PBNaa4MQRHoUzCzj/+ZUm0tQs1VU8sladjje6k1vJQ6hN54bwGQ4V1hyMYYXkR0dJo7gK1B04yBL79hiolB7MwsmudYaFN68XCxKZymWcN7NbRCC2/f4IR+MQpm3ls02lpYfqb+0kjD1thYBnEDsdQBWHsvAG9EdpA//usTtgAAAABJRU5ErkJggg==",
+        32: "iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAACXBIWXMAAA7EAAAOxAGVKw4bAAAA6ElEQVRYhe2X7w2CMBDF3zNugYPAHJYwiI6he2ioc8ggMsf5hSYQe5SLMRDhfbpc+R0v/ZNrgbWLIRCRA4DcwLYknx1bAMgMbEPyNciIiBObfI/1RtYFdmdw/RPtlfwdgFfG6kTNUsk7ANVUA55k1ICIjP49wX0YmH0JNgObAe0U1KndrkmM4KJmoAXwMLCNEk9Ra/z+j9VvxwWAk4FtSF469gxbK7+GVt7fAxmAo6FIX7mRvYVg9lOgGSipKFVwhIu26cXOwGZgPQa0bui+6IZOGYrmNQMVIhfIiUrdmgeafQmW8zRbrd7CFqWqt6Pt8QAAAABJRU5ErkJggg==",
+        40: "iVBORw0KGgoAAAANSUhEUgAAACgAAAAoCAYAAACM/rhtAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAA9UlEQVRYhe2Y0Q2CMBCG/zNuoYPAHLCJjqF7+FDmkEFkjvNBSGoT2nKHSWvue2rT8PHnGpqjgPHnkD9h5iuARui6E9Fz9rQALkLPSES3ZXIMFhsAnVD88MYnheeLwx6SXxJWMGRIrOdWSeyJBRyIqI9ZmZkTLwYAZHgcVkIWv8UWUIsF1GIBtcTOwS73nEuh8RRfweIDhu1Wi08nImEkotfsOUPetk1L22bsQV1bzMyO5fSep1d4nJ+p+K+46oADJch9SYZn9Zeg6goWgQXUYgG1FB8w1VG7yHo2GR7R1Uf0wY2IPdVt8ahwTcE4daO1hiaDUR9vxrG/TDkpZ9oAAAAASUVORK5CYII=",
+        48: "iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAc0lEQVRoge3YQQrAIAwAQVP6/y/Hc4UiQmQRd46lBBaFlrQm3S3GB5mZJYMjPrN3zX0qhpIMoL2zF8Y792f1jlfNPf4EDKAZQDOAZgBt+iWu+ovcNff4EzBAEsutBM0AmlsJmgE0A2gG0AyguZWgGSCJ1QHjVTA/sTHrDQAAAABJRU5ErkJggg==",
+    },
+    "windows": {
+        14: "iVBORw0KGgoAAAANSUhEUgAAAA4AAAAOCAYAAAAfSC3RAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAkUlEQVQokc3SOwpCMRCF4S9yCwXB0gVcH0tyHS7NBbgJN2CjhWAhlqKMxVUUSWIlGDgknMOfSYZJKisiBphi9tD8eU4RMUKLyZt2GGJZurTBKeOvcKy9plcL/wtssM74G+x1DSqCuSacEd8qLjJ+H4dChvofr7WKPwFvNbDRzV/7oS0uNTCVgohIGHvNb/u+3wHy2Rv/MjZuJAAAAABJRU5ErkJggg==",
+        16: "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAuElEQVQ4jc3TPWpCQRTF8d/II0WIhUXSieBHmjRpLV2BtStwHS7KLWQBFhZpbCwC6cQuwZvCKI8H43to44HDFOfeP2cGJmmgiHjECK9Vp9JQG4OSV5hghm4OXkTEB4Z4rmQLvF1ahgLjJtfIqXXL8n0ACiwz2Se+sa0D5AZ26DRpMM9kX3jH9BKg7g1+6xrUAX5uBTRqsMHh2gZFSqkfEQ/oOf6Jwf+5RsIeTzlAygUnRUTCSwV+9h80ryRggO1WHQAAAABJRU5ErkJggg==",
+        20: "iVBORw0KGgoAAAANSUhEUgAAABQAAAAUCAYAAACNiR0NAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAwklEQVQ4je2UPQoCMRCFv5FFUBsrG/FnddF+r2LppbyClZ0nsPACHkGwtLC0FJ7FRggLMUG33AchTHjzzZCEMX6QpD5QAGtg5S/7ktQDFsAV2AKlB5iE8kxS6aota/vYeXLgDMxSus+AS4oxVZ0mYS2wGWXAPuJ5AjtgmAq8RTyvFNBHJkkRTw6cqD58VKl3mNxlC/wfmAEbqhf0x9e0ViwdaGbH+qGkLjB3BR7AAbi7uAAGIWBwYockyYCRB/eHcvEGpEkpg7tP51MAAAAASUVORK5CYII=",
+        24: "iVBORw0KGgoAAAANSUhEUgAAABgAAAAYCAYAAADgdz34AAAACXBIWXMAAA7EAAAOxAGVKw4bAAAA8ElEQVRIie2WMW7CQBBF3ziugqgjGqRgy3CGFOlzDCqUw+QKuQsVl0jaSNBGioSE+WlsvBQoMw5Ikchvdos//83uFrPGGSTpFiiBCpg2awVUFggx4D4pToPGp+qOAJIGwKTppgSKZl0DC+DT21CrXNJrEjg64VtGgw8AYN632KPskuH/gCsB5MCLw/cObIHnPoA3h+8jGtzKJMnhWwJPwFcUEHmDXTQ8CqgvCjCzPeC5zn6ARuFr+nOA8DtkwArYOP3hE+Rm9gAgaUg3Lgu6cVnQdR4GuIa+pBszqyU9ArME3jYw+BXgB7gBdxx/Eg77b93IOVTigycxAAAAAElFTkSuQmCC",
+        28: "iVBORw0KGgoAAAANSUhEUgAAABwAAAAcCAYAAAByDd+UAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAA7klEQVRIie3WTUoDQRCG4afjEFFxqxsNSEZdeATP4CFyDK/kPcxCcKfgXg/gQhD8oVw4o2GIhuk42TgFRVXTX9VbTW8q6cAiYgOHOKr8uM7TEk3XMGo0rOPop7pfgRExxAHGKHGJZ1xU5/W2gxYRsTXTsBn3MZjRT3CHk7agLyCecotzbLBY0gN7YA/s2Aqct9Bf4wFnywBvWugfc0G1pYiIFvoJbnGVC8z5w7dcWC7wfdXAlb+wB/5zYIFTn0tT03c6AaaUppg2LyJie84Q93jFC4Y5wKxFuFqC93yvk2Uj3/xT4IJhEnbnDDFG+QFGWzhz0TjCtQAAAABJRU5ErkJggg==",
+        32: "iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAACXBIWXMAAA7EAAAOxAGVKw4bAAABEUlEQVRYhe3XMUoDQRjF8f+LG5Ag2AQLQQnJaOkBPIidrWBvZe8hPINg4SksQm5gL9jZKjyLbHAZV2QymyzCDAx8A/t978eyLIzYwrI9Ak6A03irw5AKmLSFAEe/9SUBbA+BY0kvts+Ay0bIDBimwquWkBEwrQfOgNCoJ8BODT8HblIDfwBs3zZCAnCYOzQJANxtMzBegz7DC6AACqAAYPknvF6z9xGYdwHIHpKzZNvJTZJsXwH3uYCcb+AzN/zfAz76BvT+BgqgADoDPAAL4L0PQCXpAsC2gDHf94MQ1eONAFaFJANv9X6OH7S93wABvAJP9XkK7K4D6ORyanvA8kYVor0C720U8AdOwEELKgDhC//hRle8/x4eAAAAAElFTkSuQmCC",
+        40: "iVBORw0KGgoAAAANSUhEUgAAACgAAAAoCAYAAACM/rhtAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABPElEQVRYhe2YzU3DQBBG3wQHJDhw48KPAJvQBmkBiTZohiM1UAAHECXQgiuAAkAfB2NYjGPkzCY20j5ptVpZHj3vzMH6jBEgaRsogHNgFi5bo8QGcNwQqIUOF70XVVCSAXstAjMgBzb71uwt+HkTB1QtyYF7Mysl3QJXwG7fml1kCyS2qNpRS9R7Dpzw8ybmQAmcxZYDyCRdtogcEbn9y5IBd0NLdDEZWuAvkqCXJOglCXpJgl6SoJfRC5qkC2eNZzN7jSHzLzFJctaYm9mTpEeqn9eoxJzBt4i1vkiCXpKglyToJQl6SYJeRi+YATd8J1enwHTJWqsRNLPr+tCS/TX3nbULhgcze6fK+krgIXwWpKdN6ZdVCkbLACVNqXLFIljhh/SOf6MKdiFpAuzTLl/QMTqDp6iN0fkl/wHcwFVLSNsrzAAAAABJRU5ErkJggg==",
+        48: "iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABq0lEQVRoge2aS0oDQRRFzwutCaLTINEEk7QORRBcjftwD1lCBi5DXIQOnIhzd5CBIBGfg5R0p3/mU12VljpQ5EPq5t5+TdHFK6EBqOoBcA5cZIf4NJZGVSPgjAKTQL9sntMAqirAMcUmx8Deupq1BDBX84pio0c2/2ujAKraAk5YXLXfEQOPInKvqqfAuzWXFUQVJvdZ3JNZk2NgBLQLpr3at1hNpKqXJMbSJgdAy7WhdYmAF98mtmHnr/BfhAC+CQF8EwL4JgTwTQjgmxDAN40PULqh2ZI58FyT9hJitn+2mInIzKLe/0dU9cmi3lREpqraBR4s6pYSAdcW9XrmVSzrllLXKvRVk26OEKCExgeY16SbI1SgCBH5BrQO7Sx1Pgs5qUIIUEHjAzhZiUIFKggBVqHxASLgjqS1FLPoydroXroJICKT9Beq2gaGJL2yOPV+yOr7aCerUM6MiHwCb2YsYfq/A4rDjTM/d1IBa41u0zvuiMiH+XwL3JCEXKd6K+PsqIGpXp8kUHqMgM4mujtx2MNUr8dyqPQtelg2dycCVGEOiHTJh4qB+AcB7mS0cy2qlgAAAABJRU5ErkJggg==",
+    },
+    "apple": {
+        14: "iVBORw0KGgoAAAANSUhEUgAAAA4AAAAOCAYAAAAfSC3RAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAsklEQVQokbWPMY5BYRRGz0NeJJPJ7IA16OhVmreAUShmD9ZBotQqFOxCww6UkyiESHQyI0dD8/L/vyh85b335HwX3hH1Ux2prVfBhXpQv8q7SgLKgDrQA85JUC3UjboDZsAemANndazmIUNb/TOeX7UZAicJSLUfq9qI/XvPNgaenoDd4FQdPKl6Ub9DxiVwTBhz4Bqz/iSMa7X6uK2V2CnwARTACjgAHeAfGGZZFja+khtCRMkNAzloUQAAAABJRU5ErkJggg==",
+        16: "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAA20lEQVQ4jb2SMUpDQRRFz9OIipCUFoIYcAOSxjYQBDeQJbgFt+ECxFWIjZD229gp2FhaWJmQQruTJpqJzMQhhQemetx7574Z+A/UgTrMzTYqxBfAPbC/bvqb+qDu5uaREewBfeALaIAzYAocAc8R0axK66ljF3yqE5e5Un+CW4m4BdwCncRzZ35SniLCXHrfv3lM02H5FQ6L3Ra8/k5PDaYVBj11MztRDyoqfC9xq2TSVJqclAzOK8R3xYJqqDcrxB/qcarJ/cRt4BJoAyPgHTgFusB1RLwUb7AOMzsTKHP17TQjAAAAAElFTkSuQmCC",
+        20: "iVBORw0KGgoAAAANSUhEUgAAABQAAAAUCAYAAACNiR0NAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAA8klEQVQ4jcXTr0oEURQH4DsT1iC2RQQHtG5QELGJgtgsvoM2k6/gI9h8CftaLbZNtg2KQVwQ04pB/Awz4jDIzr064K/dA/fj3D8nhP8OCvS7gOZwocx6F+BZhY3R6wJ8xAt2fgusYqs6ao5jrGCAbczHQksY+s4brnCJaa3+itM2rIeR+EywOAs8SMDesdE08sb6MOpeygyzLBu1gUUCOP6p2ASnCeAgBrxPAHe1TQz2Ex4FHrA3q8PrEMJTQpdFCKG1y5OEDifaJkb5uW8iwaOoc2AZd9WmD9wqx/G5hp3H3ssXuqB8pH6tlmMNm0nYX/IJy5e4HeXdECUAAAAASUVORK5CYII=",
+        24: "iVBORw0KGgoAAAANSUhEUgAAABgAAAAYCAYAAADgdz34AAAACXBIWXMAAA7EAAAOxAGVKw4bAAABKklEQVRIieWTwSqEURiGn2M0TZokmguYhRtQ7KjJkp07sJsV92ApRRYWyg3IykJqUhIXYCEls2ZjQ5kGPRbzSxjm/CezkHd1Tqee53v7/h/+ZdSyuqYe9wM+pl7YyVE/BFu+Z64fgpsMvqKG3wCOqoPZuaBuqjW1pFbVcgo0qHW1mU17rx6qy+qiuq8+Zm8v6pk6kwe+bf601VqMYCEBrtpQh2MEpwnwO7USAy+pzwmCne+YA5/uQ0Ch5yRfcxkreEiAA4xHCUIIbaCVIJhViz0FWU4SBFVg1Zg/W11KWPJbDtQPO+zWYA9oJ7QAaIUQXmJarCc2mIgaQ62otznhu7m6qtPqUyT8Sh3pxvlx6+o8sAEUgQadL6wJTALTwBRwDtRDCNe5GvyZvAJlw3Am3zgpFgAAAABJRU5ErkJggg==",
+        28: "iVBORw0KGgoAAAANSUhEUgAAABwAAAAcCAYAAAByDd+UAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABZklEQVRIid3WPUsDQRSF4XMjfhZiE0FQbBRsFJSAEAsD1nYW/gErU+gfsLUQrNNb2MaA6SxMaSVqo4UIShRbUWQNvBYbSSBrsrPDNjnlznCfnbvD7Ej9HvMtAIxL2pSUMbMT/1fqjuWAJ8IcpY3NAl+0UkgbPG3DztPGhoHvJnYJTKYNTgAVoAgMNp/F2oCZHoXngBLwALwBZWBfUlbSjqRA0hnwIakB3ADHQDbJKraAT5LlHVhwwXJAkBD7y4ELWPPEDon5TQXMe2L3wNB/9aM2zWrsVkSnYmaBCzjlCd52G4wCBzzBUVew7gkWnGYDS56bpgHkXUADXjzRZ2Alqn5HS80MSVWntnRmWtIVsBZrNpD3XCFAHRiJ/YqEfwOf7Dn1BFgEfhJir8CYE9hEdxNgDZJeNwh3bCmi6B1wQesC1Z5it5o9T3TCU39b0oaka0lVM3tsG1uWtC5pRlLZzGqJVtc3+QW533SQonLNPAAAAABJRU5ErkJggg==",
+        32: "iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAACXBIWXMAAA7EAAAOxAGVKw4bAAABkklEQVRYhe3Wz4tNYRzH8c8x1JSNX6OmaKJmYSFZ2EwpJYpZWJktZe9fETsLm7uZlLBRlCQzEsmGsiEbK9mIBTG9LO6Vq+bcM+fcp2vBZ3u+53m/n+95fpzkfwoHc5j5G+BjeKWf45OGX8Sa35lcB3AQP4bg1ycGHwjcGYJ/xb5JwqfxbQD/gKMTgw8EduIFrmBvlzGqDUA2JVlMspRkPsnnJCtJbiR5XVWVAfxMktNJ5pJ8T/Isyd0kt6qq0kUu2IMn6vMWz0c8h0fY0QU+g/cNg280q/qdbCVwuxD8C061hR8oBIezo1h1bVlqZVyfB+kv1tYCRwoJ9Jp2QJ3AbCGBN00FdQJbCgls6yrwsZDAoa4C7woJXMDWLgL3CwnsT3K59Vv6l8xaw/5ukx62t5V4XFAAeutxRp3PV1sZN2e5VTWm8LLQ7FfQePWvJ7FYSGChNXwgUOHamPBLneBDEtN42hH+EOOfqpjV/46/8gnLOIcTOI+b/vw9v4ddY8OHJKZwGAvYXFOzGycxr8ui+yfzE1y/2zFh6CXzAAAAAElFTkSuQmCC",
+        40: "iVBORw0KGgoAAAANSUhEUgAAACgAAAAoCAYAAACM/rhtAAAACXBIWXMAAA7EAAAOxAGVKw4bAAACMUlEQVRYhe3YPWhTURiA4fcT0Yp0sIuCUpEqnaQoFEc3oQoWQScHQXDQQV0EBwdxE8FFpwrqZOugi4OIiItDpSC2oChUBBH8A3+gg6W2r0NirWnuzW1yLoHiu+ZLznOHk3MS+N8yL8peQO0BDgPvI+J62esVTu1Sb/i3K+02zad2q6/9t6PtdgGghvqgBjelbmi3DQB1v4s7127XfOpoDW5SXdNuFwBqpzq7APdC3dxu13zVzfEHdkZd3epnLvl7UN0G9ANbge/AOPAkImbVAFZGxEx1dgswAHQDHcAEMAq8ioi5VvG1sJ3q/TobQPWjOqTuU3eo59WJjFnVl+relLgj6s+cBZvtbArcYAmwhR1oBbdR/VYibljtaAV4sUTciLqikSFzF6urgA9AV9NPmN0PoDciPjUazHuCPsrBAVwqgoN8YH8iTL3uFR3MA5Z5+5gsOpgHbPmYyqnwzs0DTieAZFX4ApEHfJcAktVA0cE84JsEkKyOq+uKDOYBx4DZNJ5FbQKGrNx+cssERsQU8CylqqaDwOVGR12jo+ZuOk/dTgPP1e1ZA42At9N66tYLrM16MRcYEW+B4dSimsaBp02/W+1RZ0q81exp+RHVqyXhHraMqwLXq58T46bVviTAKnK3+ish8Fgy3ALkyUS4a8lxVWCoF9S5mgWn1TvqKfWQekK9aeVPo9puuYTfIU39ganuAgapHFljwEhEfKkz10nlxOgHvgKPIuJxM2v+b9n2G0NZq6O+5TbNAAAAAElFTkSuQmCC",
+        48: "iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAACXBIWXMAAA7EAAAOxAGVKw4bAAACvUlEQVRoge2ZPWgUQRTH/y+JhsARjUUkJEEiBhFLUZAgYmFhI2ojio2VAQsLESux0kIUBDu1iYooIgELGy1EDBokgtgEEYL5MF9C8AtJ4PKz2ARPvcvOzO7tgtyvvH1v7/fmZt/szEk1atTIFKAA9AIDwMe8fbwADgAT/GY0bydngLP8S3/eXk4AR8vIA5zM2y0WoAWYKyM/BxTy9osFOFdh9E/k7eYE8K6M/F3A8naLBVhXRv4m0JC3mxPAphLxZ8C+tL8j8c8ItEjaKOmzpHEzK5Zca5S0TdKImU0ufWaSuiS1SVoraV7SWzObTeriI90FXAWm/5oeP4D7RAvW6pL4OqAHuAy8LzOtFoFXwHGgrpri9cAFoFihs5QyA9wArgOTDvHLDAFbqyFfAB57iCRhCuhOU96A2xnJLzNMWt2KaG5mySyw08UttgsBqySNSGpPOhCOTEnaZWYfXIJdnvhDyk5ekk65yktuBRxLIOPLU0kPfBJWLIBo0dmexMiTi2aGT8KKzwDQIWkskZI785KazWzBJyluCrWG+3gz5isvxRfQGCgTwmJIUlwB9SE3DaSTgD1CXAHTgTIhNCl6S/UiroDxMJdgDvsmuKzEY5I6gnT8mZC0xcy+uSa4LGQvw328aZd0ySfBpYAXYS7B9ALngXQaCH/ua7NkANgc5+fUtoBBSTsSj4Y/PyW1mdmXSgGu+89b6fh483olecm9gD5Jc8l9vLkWF+BUgJl9d7lZygxKehgX5Lx0A82ShhWd52TBbjN7nuodgSMZdaBHqYqXFGBAX5XlZ4DOqhSwVEQT0eFTNSgCe6omX1LEBqKjj7Q57esSfLgL9CjqEuvLXC5KeiJpSNKopDWSuiXtrxAvSVcknfHdEycCaAXuAF+BBeAN0Z95ZbeiQANwEOgHPgGjwD1gb2bSNWr8Z/wChLWCuFYwpm8AAAAASUVORK5CYII=",
+    },
+    "linux": {
+        14: "iVBORw0KGgoAAAANSUhEUgAAAA4AAAAOCAYAAAAfSC3RAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABFklEQVQokYWSsUoDURBFzwtBFINBtFOMwiKSQgWLRRQsxMLWD1CwF1tL8Q/8AT/AQiwEO0GwsgmIhUUqu5DGQkWEeGxecLPu6lQzd+bMzBseFJi6qrbVrnpcVFNo6o2DluRrKiXsNXAJ7AItYCZfUC0BK8A+kABfwNS/E9VRYCLmPoFnYLNkwAB4ou6o1Rinak9d/wtK1Y5ay+m3aksdKlv1CDgLIbzm9CugBhz+AtVJYA64K1jmHHgEtoomzgIPQLcA3AO2gaf82+bV6ehfqGuZ3JjaVJfVutrIgisZP1EPMvFi/8IxXoCfDzDST4QQ2uqwegqMA40QwkaEUuAFIEShDizFRgIfQAd4B5pAL97jPoTwBvANTXKl4rueabMAAAAASUVORK5CYII=",
+        16: "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABTUlEQVQ4jZWTPUucURCFn1lXsmCTIILJBptNrBZstMhKwGohRSBlWhtbsfDHSAqLVAmC+A9sxMYPWIJFggiJG4ilsCSRhcfCu3B9eV+TneZe5p45c2bmDlSY+lY9V3+rn9WJKmxZ8KTa976tlWFrFRyPgR3gAtgEToHOOAQ14CmwDjxPBE/GKWFeXVYfqTPqnnoyjoI3wALwDGgDW8CC2v6f7LPqpTqV+SJN5FSt/0vBNnAQEYORIyIEPnDX3I2Hsq+oV+rrkrc59UwdqM0qBavAN+CwSBAR34FPwCTQrSKYBo4jYliiYBZ4B/Ryfy0DvEoKflT8uhfAEfAR+FVkXx51V62rPbVbwCxl96Y6kysYjmSn8z1wkwV0gOuM7yfQKipoZQDUXXVfPUrL1Ej+VtrUBkBkAS9TnXXgL3AJfI2IYRrbIvAH6EfEl1HcLX724CItMcrXAAAAAElFTkSuQmCC",
+        20: "iVBORw0KGgoAAAANSUhEUgAAABQAAAAUCAYAAACNiR0NAAAACXBIWXMAAA7EAAAOxAGVKw4bAAABxElEQVQ4jZ2UO2tVURCFvzFBI4YQI8Yi2AhXQbwKKlFBEm+hEAu1U7DID5BUgmIhCP4FEWxVUthIKsEqBJtgRO18gY9OiOJFERMfn0V25LhzzzmaqTZr1qxZs/ecAzWhXlBfqwvqQ7VZV1MldsqV8VTtLqtZU6N5FPiSzh+Ab8BuYNdqBV8Bo8A7YBw4l/BGWUGp9RTrgNPAGaAF9CR8fU1d51CvqL3pvEFtpXu8VFZTOrIawEmgkR5hP9ALfALGVuPurDqlhrpTXZvw68nl+P+IDanz6kSH3D51Uf2s7vhXwftqWx0oyc+oz9XZPLfiDtVRoAncjoiPJT3vAgvAsHqizt09dVY9VMHZok6r39VblQ6BEeAtMFfRdx6YAV6QLflfgmofMM3SQld9ReeBy8BQaWN1q3osnQ+oD9TBDrxtalO9kVbroNrISZvUIxl2M71kV4a31HyykXzkbqCdmZkAHgOR4V0R8SvD3qv9RcGNwI8iIyLawCRwUd2jDqtXgXySfuAw8JXl7mmBj7P073sSEW8SPgg8Ap6lgs3AZERcK4w6AExFhH8EC916gL3AdmAR+AncWSYnzhjQl6abi4iXRY3f8nU8JXBQ1bEAAAAASUVORK5CYII=",
+        24: "iVBORw0KGgoAAAANSUhEUgAAABgAAAAYCAYAAADgdz34AAAACXBIWXMAAA7EAAAOxAGVKw4bAAACMElEQVRIia2Uv0uVYRTHP4+/0IKsIe5wEcxcCjKHgoaUqMipO5RFUIRQLtHS0N8gTdbkFA6NDQURpFBL0RCEUCGV/RCyDCIqF9GET8N9jPde33t9ks7yvs97zvl+v+c9zzmQYGqbek19ry6rb9SLKblJpo6bbyf+B3i7+rsGweR6+Q0JHEXgBXAnnseBsfi+Z73kpgSCTcAtYBY4CNwHmoFDwC61JYSwXCs5pYJloBfoigRbgR3xmSqytql71bOZc4h9mY19KNTLT6mgByipBXUn0AoMA3PR379R8auKH6tX1APqoHpcbVRLsYIZdfNGwU9FkN4cX5P6JfpvbgS8U/2hvqwTM6L+iiTn/pXgkbpUbyWo3eon9Z36U92WCt6vflc/qq3rxN5Vn8cqRlIJJmNzbyTEltSJWMFctX/NNY1lHgVmgAcJeh4CU8ACUFQ7ss68KewCAvAVeJVAcBo4DEwDLcBK1pk3aEXKg9QPdNdDVvuAQWA/MADMVxNkg4M6oO6L5y3qnDpUh2AwTvj1zACerBV8Rm2r+nYp3o7hGjlrwNQ+dXURVv6iEMJiVfwYMAl01igi5Hx7ApTyCNbs9BCCwBDlBmZVNqgXgA85BA2U+whU3qL2XIkhzKsd6jTwDGikfAEKQMWSU3uAI8Df3ZQlmFKvAtuB18C9EMK3TNxT4C2wGJXvjgQLEfw88DmEMFohME+1WgSOxapWgIkQwkxVTDNwGViKAm6HEOarsf4Aw/CyQ0+/IxsAAAAASUVORK5CYII=",
+        28: "iVBORw0KGgoAAAANSUhEUgAAABwAAAAcCAYAAAByDd+UAAAACXBIWXMAAA7EAAAOxAGVKw4bAAACpklEQVRIibWWW4hNURjHf8ttwkyN+6VIhkGINJNxGdcHKUJIU+KJFC8ePHjxREm8aRRFSskTJV4MIZck1yc1jbvx5prrMD8Pe8np2PvYZxqrTnut9f3X91vrO9/69oYymjpYPaS2qh3qU3W/WlmOn7yw/hGU1s7/D+DWDNjv1pjHT48ymHNS5joL+rO6G9gPmAHsAwSWAKOAO9E+qbuBr4GVwEPgMTAIOAYcj/Yh3Q0cDlQCT4CpQEfs13XB17+belQdWDQ3Ml4L1Wt5/PQqgzkb6KVOAz6S/I8BGBbtk9WKEMK3Uk5yhUGdCtQC04AaYAqwHBgDbAd+AtXAljIOUBJ4Rm0vGFcX2S/EsH5Wc2VrKdi66OxgCc2GggLwQO3bVViN+i46qiuh66O2q8+i9khXgZfUl+rVHNqd6n31eYTOLBc2T/2o3lVX5NBXqx/U6xHYUi6wJSbDKzVvNh9WT8fkUZ1QrEl1pNYAi0lK2NkQQmeaLqWdAz4BL+J4brEg6+I3xOcT4G1OGMBL4AZJXa0lua+5gFXxuRhYk4ekDgFOAuOBdqAFeFOs+yukak+SIj007rZZrcjBbAIexf4IkvL341+7rFU3FlYS9UrMvMzXj1qprlZHqXvU+XG+UR2dtWiGuihlvl7tVNvUqoy1E9WGDFtT4bgwpJOBW8ULQgi3gQPAWKA+/YyMA9oybF/VoWk7WZYVNrW3ujfDIermErYKddvvceEJq0nJKoAQQgdwQj2hzlSr4m+pepbkWycNNhHYDVxMM65Vl5Sq9Oo909u2FO0mdX3M+j+bLxI1AAuBgSTfLJeBiyGEn2o9SerfBFqBzyRv+wFAXQhhV/TRF9gBnAwhtP4VrRKn6QksABqB70BbCOFUhnY6sAr4En02hxDep2l/ATP9L4Wl5xqQAAAAAElFTkSuQmCC",
+        32: "iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAACXBIWXMAAA7EAAAOxAGVKw4bAAADP0lEQVRYhbWXXYhVVRTHf2tGnDItI4aSIdKhJulJS0hILKcw6EGIAqESeutrxI96D3rwoUKI6CHyIShuBM2LfUhImPRlMBU9mpQYE4rNOIYFajP318Pexpnh3HPPGbzrZd+9z3/9139/rbUvLMLU1eoB9Rd1Vv1d/UC9czF8TYOvVy9Ybud6LkI91iH4FTvYy+CrugQ3b8lAXc6+hhqGgMvAOPBvHjsOvAXM5H4/MNIrASuAN4FngdeBi8AocAh4ooBb2ysBA8AJ0qx/AyaAzcDB/PuKLa9LuKShgH+AR4BPgHdz4EGgBTxawEWvBMwCp4GxiJgFzgJn1eeANQVc7RVougV3ZRH3q/3qgHo76XCOAhZwPRGwCbiXdMhuzYFXkw7lBPBtxm1Xr2/IXW05/V5W96tL1KfVverGAmZXIR+8f7UFtDLxtgrMkNouiHjqagXfkQln1KVdsB8XBFxQayelToQjmWhOfaMG/gH1L1OlVP25m+huhF+oJ3OOX9PdA9QJ9ZA6lUWMLTb4pkxwWB1v4Pd49jua29PqssUIOKz+oP6hPtjAr8/0SHkvr5zqM2XYjnlAXQ88BPwILAW+rCsgItqkAiXwax7e3EhADg6p6HwdEXN1BWT7EPimEGNjGaiqFtyR2xWkYlPb1AD2AKuAY6TitLIJB+o7+TRPNb3L6k7n27j6VRm2dAvy/n8eERtIZfaIurVm8IdJS38iD80Bk8B3anWRUpebcvxjC8Zfyyn2lRoCxnI7rL6orsv9UF/u5vyqemPJ+Ep1Oi/nni4cuyq+PaleWxzrK3zsA6YjYmahY0ScB3bm7t7KWVTfrE+BecXs/1sQEW213ckzIlrqKHCkE0btJ72aO3GcN5X0myJiep7afHUuVqgH2A3crd5QEnyQ9Dz/qULgAHAPhTdjMQ8MA6eqokfE3+r3wKTayvg2cB+whfRqLj0D6g5gHfB2REyVAa4x/cF8Xt2q3tKBaEvhfk/lnH8p9ydL8MvUfWppKo4F4CC990aADcDNeZatiDipDpEO4UfA8Yg4V/C9DtgOnImIz/LYEPASsC8i/uwqoMOMhzPxIHAGOFAMXIJ/Abgtc08D+yOi48H8DwuS11Z3ZJsYAAAAAElFTkSuQmCC",
+        40: "iVBORw0KGgoAAAANSUhEUgAAACgAAAAoCAYAAACM/rhtAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAEU0lEQVRYhcWYa4hVVRTHf1udUkehtKykMB2ypLIHlQ6oKQhliX6oGLQssomKLKGyKAKDILCHWVHRh/oSBJnoYEFRhiE9mIJI0LJEM6QUzPAx41ij8+vD3tMcr9x7zz13JhcM+8456/Hfa++zXtAPpM5U31a3qcfUveomtVUd3B826gH3itpjedqonn6qwLVWAJall08VwF05AXaqo4vYGFQHuEuAcTnZhwOzi9gpDBA4N607gAOZ593AJ8DOEv4pddiqndS56ha1QR2vHknHOVsdpA5Vv80c8wdF7NTjwUagDbgPGAN8AWwDvgZ+A+YBr2X4zyxiZEgdAAUagPnADGAz8AMwBzifeKRfZfjD/w2wE2gB3gU2AruBHmAX8DhxA3ecSoDdwB/AGyGEPSXvXlBHABdknjUWMVLPHbwY2ABcXfpCvZwIbm/mcd6QdALV48HJwGJgvnoTcIjo1cPE416VfvfSOeqUEEJ7HTbzkTpM/V3drl6hLk+hZrz6pDE/T0q8WzKh5sMBB5eMPpoMrk3/n6Hery5Ux5TwLi9Je60DDW6Uui8ZW5qDf1IJwA71ooEE2JYMHVfPyynTXgLyeweiBFMfyhj5tAa5liSzLyP/Zn+Du1I9qnYlAzfXIDvYWJr9qO7JgJzXX+CCMfEfVneqP6k1ZQZ1aQLVZl8FvlWtJxb/p/zOpPCztN5bQEejul89qH6T8eKiesEF9ecMwP3q0IK6nk163soA3FHJi3ncOxuYCHwJXAi0hRCOFgEIrElrJ31pcALQXA/AlrRuAM7OGKmZQgibiWlwBLFm7KXr6wE4I62HgCPAd0UBJlpJ3OzIzLOJ5ZgrFgvpbvRG/UnE0urPosjUa4CFwEHgI2L9eBmxqSqkcFDmMnepZXeaQ1djJgr00kbjBGJlOblqR9wMvApMA9YC69WmAuACsIKTO72ZwDBga606Ucdmd5bCzVr1L/WWGnU1q7cZs9Hx5L0O9R61SX1evS6vstHqMnWJOqzk3ThjulNdUQPAu42NPup09QF1XOb9SPOMR9I9ed3YT5TjeSlzh57KCfDpSjoTzyq1oZqiWdWOz1ic7k4Aj6pV+9083jY2/CcVD6UfSQcxGJelEMIB4HZiiPgbyDP/q1pYhBA2AE3qqEoADwBjcyjbBDwD3FgtLqojiXEvD71DjJNllV2lLsijSR2ivm9sMcvxzDCWabNy6GtUX1RnVmJ6UJ2QB2Din5ru4ufqXcZR8Fz1OfvK/J4qH91g9ZEUwqZVM3ir+ph6Wg0ge6da5ejXCrJj1dVWqM5PyMUhhDVqC/Be+jobgF+AdcDHIYSeEgOTidXJFmB7+usiTrvOIk60rlUbQgjdJbLTgCXAwyGE7ATiBKr4dRk7r+nADcBUoJ04nPyHmOSnAItDCMcr6JgDzAKeCCGYdC4CLgWWhRCOVcJQa1/RTByvDScWsOtLvVpGbhGwgLixLmBdCGF1Hpv/ApfKaoFz5Tp+AAAAAElFTkSuQmCC",
+        48: "iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAFi0lEQVRogcWZaahVVRiGn3XLskGtKEsaHMpbRmFzRhOFDTRJww1KoyKQCixICxp+FAUNFEWDQd4/RRakIkETGTSQlRUVNpll2qgFTZqaQz79WOvYdt/tOWffvfW+f/Y+e33D+501fd9aUDPUDvUSdZr6ubpO/V2dpz6ujqjbZ21QR6pzbY616uS+5toD6gB1cQvyWUzoa86bQH2kBHnVper2fc0bAHXbNM7L4rKqvjvqCAA4Fti1F3qnVXVcVwBD03MD8E9B+1Lgu4Lvx1V1XFcAg4F/gZOIPfFSpu0hYN8QwjBgSk5v35r8V4M6WX1F7a92qoekMf6r2k/tUq9KsvNy82CXKr7r6oH1wCJgIvAW8CUgMJ84rKYBU9UdgHdyuttWcVxJOYNVwDDga2BP4ELgSmAFcAwwiBhkB7B7TjdUcVxXAH8DpwMvApOIvfEtMBxYAowBuoBzgHE53UoB1AL1fPVn9eQWcsOM+VEWw6r4rmsO7A88A+xc1GhM8MYBq+k5B4YWqGxdqE+py9RB6gR1u0xbp3pCep+S5LK4sYrvunrgcOLkvRdYDoxVT1NPAX4FBqkfEydzV053otp380A9LP2TK9NQ6VKnquPUy9WZ6u3qgCQf1B9yvXB9XwYwK5H4IPNtiHqRem6DeE7nwVwAq9VDti7zSOTsDIkHSugdZ0/Md2um1+qeuQl5VAndoC4qCOKxLck5S6BDnZNx/FUvbFxXEIDqxVuCc975LTmnpWtcdSdjEbRIXZKxtVwduSV4NxyPMZ40/GUs0JerA3tp6+5Eek6y18DrdfNuOOxQP0pO3k7PByvYG6KuSXYezfXq2Dq5NxxelYwvNK4a662Yy6jdyeZcNz2SmVcT7Y2OtlG/T8afT8/narDbqf6b7N2c64V85toDZVKJ84gl4AZiegDwVC84b4IQwkLg3fTzTzatqa9tpV8mgGvS8w1gCLFYmVNCvxleTM/hwGeZ76dYsJNn0VYAan+gkevPJxZCr4QQ1pQkujm8kJ4riL3QQD+gaYrRbg8cDTRS5DXEbv60BMGmCCF8CjwBvAbskWtuuie0W1KOyrwfCLxKTJtrgXoDMSUfSJxX44EjUvOOdTiYmFkZ1qmHqsMrG2bjXrAht/rMUp9O7xc00293CO0AfAHMJg6fqcDv1aiDOgropmdhfwHxoGAt8F5VJ0PVZ9V+6ff+6k/G4vyAirafNx6G5TPTDepL6idWSe7UvdUZ6m6572OSoxX28oRZPUC9K71PzpD/RT0zI3ePWu4MVd0nKd6eJ5+RmZFxel8vAhirXpn5fbx6lrpTTm5Xy+Rb6n7GU4ZC4hm5kcZstIHbSgZwhXp6m7Iz3UzhXzSJxwOPhRCaTtIQwtfAw5lPd6id7RBK2Bv4sU3Zj4ATixqKAtiu4NvmcCvwScbWmBK6I4DFbco+AHSpPfatogCWAW2tLimVuAT4A5jO/ylBO+gfQlhdws8jQI/jl6KdeDXxAKothBAWqDfF1+bDroG0/C5p10fys7BoiBb1wF7A3JLGu4FzbZG/q9sbjxI/BN5s1766i/oo8d6hpfD0dg3n9EakNONtY+ox2pgmjFAvNd7c/5hZtVrezKgD01L+ftsbmjEPGdLLIFrd0jdQdOGXt3W++kFabrfZnFzRHLgTmK0uIN4s/kAcrx+HEH5r4Tf7r64jXnKsIg7LwUCDyMoW5CcRr25PDSGsaCZbuDmoHcR09iCgk5hCH0kcg93AyyGEtTmdccAZxOpqIbA4hLA+0x6AAcRbzKnADSGEr3I2OoD7ifdrU0IINiNfGsYcqNuYfE1Tr1avVZ9UH25tYaOd0cbbys7Mt051tjqxDKdencsbLzDOAA4mptcvp+K8jI2jgHuI9bXAN8DdIYRSxyn/AaYb6eOcG9PeAAAAAElFTkSuQmCC",
+    },
+    "more": {
+        14: "iVBORw0KGgoAAAANSUhEUgAAAA4AAAAOCAYAAAAfSC3RAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAc0lEQVQoka2SMQqEQAxFH7KoCHZ23v9GXmHZervV5tmkEJkRI/vhw4dM5oUQ+LfUSZ2yTaP6DY+lN69K7wq8DzlFbdSmVq8WgD6cog3qJzxkic8U1CIN6lsF+F19XBxVbYEFWCLfJnbAfMjbFf1MzZ/cHe2AYkDZfyTIzwAAAABJRU5ErkJggg==",
+        16: "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAaElEQVQ4jWNgGLTg////PP///z8FxTzkGGD+HwHMcaljwWPGKQYGhnIk9gCA////K/3//1+REs1/oVgJlzomfGbgYJPsCvK8QCxgxGM7IwMDQymU283IyEiaN6iRkK4yMDCcRmIPUgAATJVQljf5SFgAAAAASUVORK5CYII=",
+        20: "iVBORw0KGgoAAAANSUhEUgAAABQAAAAUCAYAAACNiR0NAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAiklEQVQ4jWNgGOyAkZCC////szAwMMRDuQsZGRn/UGTj////q/8jQBUh9UxEmCmPxFYg22Uw8P//f9n////vgGIZig0c/OD///+8////74ViXmoY2IsUy72E1BMTyyQBFiLUNOBgD1cATdg7oZjyhP3///9ZSLE8i5B6YmL5IRL7ASHF9C++BhwAAC6yYoqAXeqZAAAAAElFTkSuQmCC",
+        24: "iVBORw0KGgoAAAANSUhEUgAAABgAAAAYCAYAAADgdz34AAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAQUlEQVRIiWNgGAXUAv////f5////Cyj2oYUFL/4jwAti9TFR3SXkApoH0SggCEaTKUEwmkwHHowmU4JgNJnSDAAA/FeFdbI/3nIAAAAASUVORK5CYII=",
+        28: "iVBORw0KGgoAAAANSUhEUgAAABwAAAAcCAYAAAByDd+UAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAuklEQVRIie2WMQ7CMAxFvzt1YGRpL9IZdewl4DpwCLhEZw7RazAy81gqEUGHpHIqEH1bItnPieLI0oozlhoAbCQdJCHpYmZ396oCWQkMvBiAMqew45MuJUeR6LxF7vkBnILTHbPKAmkNVIvIfo45fVhI2o3Lq5k9fEt6kwF98Gj6sYBswnaiD9uUHPmq88DjSr/70fwPQAXUS8mW+7yBZqIPm5QcqX24jdzzwWPEmDtE7cfYc9YhaiWGJ4dx2rPBMY4wAAAAAElFTkSuQmCC",
+        32: "iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAt0lEQVRYhe2WvQ3CMBCFfUiUGYMu7MAATJBRQpU5skZ6ehiBKSgjIX00V1hAYT3FsYL8SS58xfPz392FUKkIAAZcgKePHrA1DXR80ylaO9HDOTGWzcAjMZYHoAHu0fHfgEbRkh8OsA8hnHx6NbOXqlXZJsARGH20JRafo18wr2rCd/3JqGipiagsQFv0CiITZR5hZUm2WYyWLMeqgeFHIhoULTURHRJj2QxMibE8eFveF2vLK3/FG5um7uyhOAegAAAAAElFTkSuQmCC",
+        40: "iVBORw0KGgoAAAANSUhEUgAAACgAAAAoCAYAAACM/rhtAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAA+0lEQVRYhe2YsQ3CMBBFvxFdJHoqdqCioqFiBtZgFyZgBqCgYRQoWAAqikeBkRBYKeILjuCelMI56evLl/M5JzmO0z7AAFgBl/isgEFpX5IkIAA7PtkCobQ/AZOEuSeTXP2egcdhw9h3AEbALbF7N2BU2p8kCVgmDC4ttM0+YmAmaRGX6xDC3krbcUpiWSSVpGlcHkIIVyvtbGI3Ob0cMSeLLmICUL2ZezVZlfYnYF7Ti+e5+ha9uNvUpPjYiRRLySI5WhXJfxwzjpPBf1xY27zyZ0PLP00WrW4sqZ9434+xLCwMnhvGvgOP0cc2keINXRh9SB0fHjnOr3MHSHCJ0FJGXZUAAAAASUVORK5CYII=",
+        48: "iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAACXBIWXMAAA7EAAAOxAGVKw4bAAAAmklEQVRoge3WsQrCMBRA0Rc3/Yf6/0uz6ld1rON1KSLYisWUR/Ue6BTISwotN0KSfg5wBiowTk8PdNnn+gjQAQOvhl1cYnrbS2rreaX1hsAYEceF5Vsp5dRy3qHlZhm2uMD1zdplg3lt7f4jjnhcon/6jdbdHF6S8lmjmazRlazRGdZoOmtUkr5ijWayRleyRmdYo+msUUn/4w6sIaWcoLQc7QAAAABJRU5ErkJggg==",
+    },
+}
+
+# name -> {pixel size -> PNG bytes}
+ATLAS: dict[str, dict[int, bytes]] = {
+    name: {size: base64.b64decode(data) for size, data in sizes.items()}
+    for name, sizes in _ENCODED.items()
+}
@@ -1,8 +1,8 @@
 """Browser launcher using Camoufox with auto-fingerprint."""
 
-import json
 import logging
 from pathlib import Path
+from types import MappingProxyType
 from typing import Callable
 import asyncio
 
@@ -28,14 +28,11 @@ async def _read_json_async(file_path: Path) -> dict:
 
     Raises:
         FileNotFoundError: If file doesn't exist
-        json.JSONDecodeError: If file contains invalid JSON
+        orjson.JSONDecodeError: If file contains invalid JSON
     """
-    loop = asyncio.get_event_loop()
-
-    def _read():
-        return json.loads(file_path.read_text())
-
-    return await loop.run_in_executor(None, _read)
+    raw = await asyncio.to_thread(file_path.read_bytes)
+    # orjson parses bytes directly - no UTF-8 decode round trip
+    return orjson.loads(raw)
 
 
 async def _write_json_async(file_path: Path, data: dict) -> None:
@@ -45,12 +42,8 @@ async def _write_json_async(file_path: Path, data: dict) -> None:
         file_path: Path to write JSON
         data: Dictionary to serialize
     """
-    loop = asyncio.get_event_loop()
-
-    def _write():
-        file_path.write_text(json.dumps(data, indent=2, default=str))
-
-    await loop.run_in_executor(None, _write)
+    raw = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str)
+    await asyncio.to_thread(file_path.write_bytes, raw)
 
 
 # Screen/window dimension keys that should NOT be persisted or spoofed
@@ -79,6 +72,72 @@ SCREEN_WINDOW_KEYS_TO_EXCLUDE = {
     "document.body.clientHeight",
 }
 
+# Firefox prefs for session restore - selected by AppSettings.save_tabs
+_SESSION_RESTORE_PREFS = MappingProxyType(
+    {
+        "browser.startup.page": 3,  # 3 = restore previous session
+        "browser.sessionstore.resume_from_crash": True,
+        "browser.sessionstore.max_resumed_crashes": 3,
+    }
+)
+_SESSION_BLANK_PREFS = MappingProxyType(
+    {
+        "browser.startup.page": 0,  # 0 = blank page
+        "browser.sessionstore.max_resumed_crashes": 0,
+    }
+)
+
+# Firefox prefs applied to every launch
+_PERFORMANCE_PREFS = MappingProxyType(
+    {
+        # Performance optimizations - hardware acceleration
+        "gfx.webrender.all": True,  # Enable WebRender compositor
+        "gfx.webrender.enabled": True,
+        "gfx.webrender.software": False,  # Prefer hardware WebRender
+        "layers.acceleration.force-enabled": True,  # Force GPU acceleration
+        "layers.gpu-process.enabled": True,
+        "media.hardware-video-decoding.enabled": True,  # Hardware video decode
+        "media.ffmpeg.vaapi.enabled": True,  # VA-API for Linux
+        # Compositor and rendering
+        "gfx.compositor.glcontext.opaque": True,  # Faster compositing
+        "layers.offmainthreadcomposition.enabled": True,  # Off-main-thread compositing
+        "layers.async-pan-zoom.enabled": True,  # Smoother scrolling
+        "apz.allow_double_tap_zooming": False,  # Disable double-tap zoom for faster response
+        "apz.gtk.kinetic_scroll.enabled": False,  # Disable kinetic scroll (can cause lags)
+        # Reduce paint flashing and reflows
+        "nglayout.initialpaint.delay": 0,  # No delay for initial paint
+        "nglayout.initialpaint.delay_in_oopif": 0,
+        "content.notify.interval": 100000,  # Less frequent content updates
+        # Memory and performance
+        "browser.sessionstore.restore_tabs_lazily": True,  # Lazy load tabs
+        "browser.sessionstore.restore_on_demand": True,
+        "browser.tabs.unloadOnLowMemory": True,  # Unload tabs when low memory
+        "javascript.options.mem.gc_incremental": True,  # Incremental GC
+        "javascript.options.mem.gc_per_zone": True,
+        # Reduce disk I/O
+        "browser.sessionstore.interval": 60000,  # Save session every 60s instead of 15s
+        "browser.cache.disk.smart_size.enabled": True,
+        # Tab unloading for better multi-tab performance
+        "browser.tabs.min_inactive_duration_before_unload": 300000,  # 5min before unload
+        # Reduce animation overhead
+        "ui.prefersReducedMotion": 1,  # Reduce animations
+        "toolkit.cosmeticAnimations.enabled": False,  # Disable cosmetic animations
+    }
+)
+
+# OS hint for fingerprint generation
+_OS_MAP = {
+    "windows": "windows",
+    "macos": "macos",
+    "linux": "linux",
+}
+# Short OS codes for WebGL lookup
+_OS_SHORT_MAP = {
+    "windows": "win",
+    "macos": "mac",
+    "linux": "lin",
+}
+
 
 def _remove_screen_window_keys_from_env(env: dict) -> dict:
     """Remove screen/window keys from CAMOU_CONFIG_* env vars.
@@ -141,7 +200,10 @@ class BrowserLauncher:
         self._browsers: dict[str, AsyncCamoufox] = {}
         self._browser_instances: dict[str, BrowserContext] = {}
         self._pages: dict[str, Page] = {}
-        self._monitor_tasks: dict[str, asyncio.Task] = {}
+        # 'close' listeners registered on each running context
+        self._close_handlers: dict[str, Callable[[BrowserContext], None]] = {}
+        # Strong refs to in-flight close-cleanup tasks (asyncio keeps weak ones)
+        self._close_tasks: set[asyncio.Task] = set()
         self._stopping: set[str] = set()
         self._on_status_change: Callable[[str, ProfileStatus], None] | None = None
         self._on_browser_closed: Callable[[str], None] | None = None
@@ -179,7 +241,7 @@ class BrowserLauncher:
         """Periodic health check for running browsers.
 
         Detects browsers where the Playwright context is disconnected
-        but the monitor task failed to clean up.
+        but the 'close' event never fired.
         """
         while True:
             try:
@@ -213,16 +275,75 @@ class BrowserLauncher:
                 stale_profiles.append(profile_id)
 
         for profile_id in stale_profiles:
-            # Cancel monitor task if still running
-            task = self._monitor_tasks.pop(profile_id, None)
-            if task is not None:
-                task.cancel()
+            # Detach the close listener in case the event fires late
+            self._unwatch_close(profile_id)
             await self._cleanup_profile(profile_id)
             if self._on_status_change:
                 self._on_status_change(profile_id, ProfileStatus.STOPPED)
             if self._on_browser_closed:
                 self._on_browser_closed(profile_id)
 
+    async def _detect_geoip(self, profile: BrowserProfile, proxy: dict | None):
+        """Detect public IP and geolocation (through the proxy, if any).
+
+        Updates the profile's proxy country/timezone for display and returns
+        a GeoIP info object, or None when detection fails.
+        """
+        # Detect current IP for timezone and geolocation
+        # Use Camoufox's MaxMind database for accurate timezone matching
+        from camoufox.ip import public_ip, Proxy as CamoufoxProxy
+        from camoufox.locale import get_geolocation, geoip_allowed
+
+        geoip_info = None
+        try:
+            geoip_allowed()  # Check if geoip extra is installed
+
+            # Run blocking IP/geo detection in thread pool to avoid blocking event loop
+            loop = asyncio.get_event_loop()
+
+            async def detect_ip_and_geo():
+                """Detect IP and geolocation in thread pool."""
+
+                def _sync_detect():
+                    # Get public IP (through proxy if configured)
+                    if proxy:
+                        proxy_str = CamoufoxProxy(**proxy).as_string()
+                        ip = public_ip(proxy_str)
+                    else:
+                        ip = public_ip()
+
+                    # Get geolocation from MaxMind database
+                    geolocation = get_geolocation(ip)
+                    return ip, geolocation
+
+                return await loop.run_in_executor(None, _sync_detect)
+
+            ip, geolocation = await detect_ip_and_geo()
+
+            # Create geoip_info compatible object
+            class GeoIPInfoCompat:
+                def __init__(self, ip, geolocation):
+                    self.ip = ip
+                    self.country_code = geolocation.locale.region or "XX"
+                    self.timezone = geolocation.timezone
+                    self.city = ""
+                    self.lat = geolocation.latitude
+                    self.lon = geolocation.longitude
+
+            geoip_info = GeoIPInfoCompat(ip, geolocation)
+            logger.info(
+                f"Detected IP: {geoip_info.ip} ({geoip_info.country_code}, {geoip_info.timezone})"
+            )
+            # Update profile with IP info for display (flag emoji)
+            if not profile.proxy:
+                profile.proxy = ProxyConfig()
+            profile.proxy.country_code = geoip_info.country_code
+            profile.proxy.timezone = geoip_info.timezone
+            profile.proxy.city = geoip_info.city
+        except Exception as e:
+            logger.warning(f"Failed to get GeoIP info: {e}")
+        return geoip_info
+
     async def launch_profile(self, profile: BrowserProfile) -> bool:
         """Launch browser for profile with auto-configured fingerprint.
 
@@ -252,60 +373,6 @@ class BrowserLauncher:
                 debug_proxy = {k: (v if k != "password" else "***") for k, v in proxy.items()}
                 logger.debug(f"Proxy config: {debug_proxy}")
 
-            # Detect current IP for timezone and geolocation
-            # Use Camoufox's MaxMind database for accurate timezone matching
-            from camoufox.ip import public_ip, Proxy as CamoufoxProxy
-            from camoufox.locale import get_geolocation, geoip_allowed
-
-            geoip_info = None
-            try:
-                geoip_allowed()  # Check if geoip extra is installed
-
-                # Run blocking IP/geo detection in thread pool to avoid blocking event loop
-                loop = asyncio.get_event_loop()
-
-                async def detect_ip_and_geo():
-                    """Detect IP and geolocation in thread pool."""
-
-                    def _sync_detect():
-                        # Get public IP (through proxy if configured)
-                        if proxy:
-                            proxy_str = CamoufoxProxy(**proxy).as_string()
-                            ip = public_ip(proxy_str)
-                        else:
-                            ip = public_ip()
-
-                        # Get geolocation from MaxMind database
-                        geolocation = get_geolocation(ip)
-                        return ip, geolocation
-
-                    return await loop.run_in_executor(None, _sync_detect)
-
-                ip, geolocation = await detect_ip_and_geo()
-
-                # Create geoip_info compatible object
-                class GeoIPInfoCompat:
-                    def __init__(self, ip, geolocation):
-                        self.ip = ip
-                        self.country_code = geolocation.locale.region or "XX"
-                        self.timezone = geolocation.timezone
-                        self.city = ""
-                        self.lat = geolocation.latitude
-                        self.lon = geolocation.longitude
-
-                geoip_info = GeoIPInfoCompat(ip, geolocation)
-                logger.info(
-                    f"Detected IP: {geoip_info.ip} ({geoip_info.country_code}, {geoip_info.timezone})"
-                )
-                # Update profile with IP info for display (flag emoji)
-                if not profile.proxy:
-                    profile.proxy = ProxyConfig()
-                profile.proxy.country_code = geoip_info.country_code
-                profile.proxy.timezone = geoip_info.timezone
-                profile.proxy.city = geoip_info.city
-            except Exception as e:
-                logger.warning(f"Failed to get GeoIP info: {e}")
-
             logger.info("Starting profile: %s", profile.name)
             logger.debug(
                 "Proxy configured: host=%s, port=%s",
@@ -339,53 +406,15 @@ class BrowserLauncher:
                 # Debug mode
                 "debug": self._settings.debug_mode if self._settings else False,
                 # Firefox user prefs - only session settings from launcher
-                # All styles and UI customizations are handled via browser build
+                # All styles and UI customizations are handled via browser build.
+                # Fresh dict per launch: Camoufox adds its own prefs into it
                 "firefox_user_prefs": {
-                    # Session restore settings - controlled by save_tabs
                     **(
-                        {
-                            "browser.startup.page": 3,  # 3 = restore previous session
-                            "browser.sessionstore.resume_from_crash": True,
-                            "browser.sessionstore.max_resumed_crashes": 3,
-                        }
+                        _SESSION_RESTORE_PREFS
                         if (self._settings and getattr(self._settings, "save_tabs", True))
-                        else {
-                            "browser.startup.page": 0,  # 0 = blank page
-                            "browser.sessionstore.max_resumed_crashes": 0,
-                        }
+                        else _SESSION_BLANK_PREFS
                     ),
-                    # Performance optimizations - hardware acceleration
-                    "gfx.webrender.all": True,  # Enable WebRender compositor
-                    "gfx.webrender.enabled": True,
-                    "gfx.webrender.software": False,  # Prefer hardware WebRender
-                    "layers.acceleration.force-enabled": True,  # Force GPU acceleration
-                    "layers.gpu-process.enabled": True,
-                    "media.hardware-video-decoding.enabled": True,  # Hardware video decode
-                    "media.ffmpeg.vaapi.enabled": True,  # VA-API for Linux
-                    # Compositor and rendering
-                    "gfx.compositor.glcontext.opaque": True,  # Faster compositing
-                    "layers.offmainthreadcomposition.enabled": True,  # Off-main-thread compositing
-                    "layers.async-pan-zoom.enabled": True,  # Smoother scrolling
-                    "apz.allow_double_tap_zooming": False,  # Disable double-tap zoom for faster response
-                    "apz.gtk.kinetic_scroll.enabled": False,  # Disable kinetic scroll (can cause lags)
-                    # Reduce paint flashing and reflows
-                    "nglayout.initialpaint.delay": 0,  # No delay for initial paint
-                    "nglayout.initialpaint.delay_in_oopif": 0,
-                    "content.notify.interval": 100000,  # Less frequent content updates
-                    # Memory and performance
-                    "browser.sessionstore.restore_tabs_lazily": True,  # Lazy load tabs
-                    "browser.sessionstore.restore_on_demand": True,
-                    "browser.tabs.unloadOnLowMemory": True,  # Unload tabs when low memory
-                    "javascript.options.mem.gc_incremental": True,  # Incremental GC
-                    "javascript.options.mem.gc_per_zone": True,
-                    # Reduce disk I/O
-                    "browser.sessionstore.interval": 60000,  # Save session every 60s instead of 15s
-                    "browser.cache.disk.smart_size.enabled": True,
-                    # Tab unloading for better multi-tab performance
-                    "browser.tabs.min_inactive_duration_before_unload": 300000,  # 5min before unload
-                    # Reduce animation overhead
-                    "ui.prefersReducedMotion": 1,  # Reduce animations
-                    "toolkit.cosmeticAnimations.enabled": False,  # Disable cosmetic animations
+                    **_PERFORMANCE_PREFS,
                 },
             }
 
@@ -418,19 +447,9 @@ class BrowserLauncher:
                     camoufox_options["addons"] = self._settings.custom_addons
 
             # OS hint for fingerprint generation
-            os_map = {
-                "windows": "windows",
-                "macos": "macos",
-                "linux": "linux",
-            }
-            # Short OS codes for WebGL lookup
-            os_short_map = {
-                "windows": "win",
-                "macos": "mac",
-                "linux": "lin",
-            }
-            if profile.os_type in os_map:
-                camoufox_options["os"] = [os_map[profile.os_type]]
+            fingerprint_os = _OS_MAP.get(profile.os_type)
+            if fingerprint_os:
+                camoufox_options["os"] = [fingerprint_os]
 
             # Save complete fingerprint config for consistent profiles across sessions
             # Same profile must have same fingerprint to avoid detection
@@ -438,11 +457,23 @@ class BrowserLauncher:
 
             fingerprint_file = user_data_dir / "fingerprint.json"
 
+            async def _read_saved_fingerprint() -> dict | None:
+                # EAFP: one open() instead of exists() + open()
+                try:
+                    # Async I/O to prevent UI freeze (50-200ms blocking → non-blocking)
+                    return await _read_json_async(fingerprint_file)
+                except FileNotFoundError:
+                    return None
+
+            # IP/geo detection (network, through the proxy) and the saved
+            # fingerprint read (disk) are independent - overlap them
+            geoip_info, fp_data = await asyncio.gather(
+                self._detect_geoip(profile, proxy), _read_saved_fingerprint()
+            )
+
             # Check if OS changed - if so, regenerate fingerprint
             regenerate_fingerprint = False
-            if fingerprint_file.exists():
-                # Async I/O to prevent UI freeze (50-200ms blocking → non-blocking)
-                fp_data = await _read_json_async(fingerprint_file)
+            if fp_data is not None:
                 saved_os = fp_data.get("os", "")
                 current_os = profile.os_type or "windows"
                 if saved_os != current_os:
@@ -450,11 +481,10 @@ class BrowserLauncher:
                         f"OS changed from '{saved_os}' to '{current_os}' - regenerating fingerprint"
                     )
                     regenerate_fingerprint = True
-                    fingerprint_file.unlink()  # Delete old fingerprint
+                    await asyncio.to_thread(fingerprint_file.unlink)  # Delete old fingerprint
 
-            if fingerprint_file.exists() and not regenerate_fingerprint:
-                # Load saved fingerprint config (async to avoid blocking)
-                fp_data = await _read_json_async(fingerprint_file)
+            if fp_data is not None and not regenerate_fingerprint:
+                # Saved fingerprint config, already loaded above
                 fp_config = fp_data.get("fingerprint", {})
 
                 # Remove old timezone - we'll set fresh one from current IP
@@ -626,7 +656,7 @@ class BrowserLauncher:
                 camoufox_options["config"] = fp_config
 
                 # Generate WebGL fingerprint matching the OS from profile
-                webgl_os = os_short_map.get(profile.os_type, "win")
+                webgl_os = _OS_SHORT_MAP.get(profile.os_type, "win")
                 webgl_fp = sample_webgl(webgl_os)
                 webgl_vendor = webgl_fp["webGl:vendor"]
                 webgl_renderer = webgl_fp["webGl:renderer"]
@@ -702,9 +732,8 @@ class BrowserLauncher:
 
             self._pages[profile.id] = page
 
-            # Monitor for browser close
-            task = asyncio.create_task(self._monitor_browser(profile.id, context))
-            self._monitor_tasks[profile.id] = task
+            # Clean up when the user closes the window or the browser dies
+            self._watch_close(profile.id, context)
 
             if self._on_status_change:
                 self._on_status_change(profile.id, ProfileStatus.RUNNING)
@@ -717,34 +746,41 @@ class BrowserLauncher:
                 self._on_status_change(profile.id, ProfileStatus.ERROR)
             return False
 
-    async def _monitor_browser(self, profile_id: str, context: BrowserContext) -> None:
-        """Monitor browser for manual close or crash.
+    def _watch_close(self, profile_id: str, context: BrowserContext) -> None:
+        """Run cleanup when the context emits 'close'.
 
-        Waits for the Playwright BrowserContext 'close' event.
-        Handles three scenarios:
-        1. CancelledError → programmatic stop (stop_profile called), no cleanup here
-        2. 'close' event → user closed the browser window, run cleanup
-        3. Exception → Playwright transport error / crash, run cleanup
+        A Playwright event listener instead of a long-lived task awaiting
+        wait_for_event() per browser; a task exists only while cleanup runs.
         """
-        cancelled = False
-        try:
-            # Wait for context to close (user closed window)
-            await context.wait_for_event("close", timeout=0)
-        except asyncio.CancelledError:
-            cancelled = True
-        except Exception as e:
-            logger.warning("Browser monitor error for profile %s: %s", profile_id, e)
-        finally:
-            if cancelled:
-                return
-            # Browser was closed manually or crashed
-            logger.info("Browser closed for profile %s", profile_id)
-            await self._cleanup_profile(profile_id)
-            if self._on_status_change:
-                self._on_status_change(profile_id, ProfileStatus.STOPPED)
-            if self._on_browser_closed:
-                self._on_browser_closed(profile_id)
-            self._stopping.discard(profile_id)
+
+        def on_close(_context: BrowserContext) -> None:
+            self._close_handlers.pop(profile_id, None)
+            task = asyncio.get_running_loop().create_task(self._on_context_closed(profile_id))
+            self._close_tasks.add(task)
+            task.add_done_callback(self._close_tasks.discard)
+
+        self._close_handlers[profile_id] = on_close
+        context.once("close", on_close)
+
+    def _unwatch_close(self, profile_id: str) -> None:
+        """Detach the 'close' listener before a programmatic stop/cleanup."""
+        handler = self._close_handlers.pop(profile_id, None)
+        context = self._browser_instances.get(profile_id)
+        if handler is not None and context is not None:
+            try:
+                context.remove_listener("close", handler)
+            except Exception as e:
+                logger.debug("Failed to detach close listener for %s: %s", profile_id, e)
+
+    async def _on_context_closed(self, profile_id: str) -> None:
+        """Handle a browser closed manually or crashed."""
+        logger.info("Browser closed for profile %s", profile_id)
+        await self._cleanup_profile(profile_id)
+        if self._on_status_change:
+            self._on_status_change(profile_id, ProfileStatus.STOPPED)
+        if self._on_browser_closed:
+            self._on_browser_closed(profile_id)
+        self._stopping.discard(profile_id)
 
     async def _cleanup_profile(self, profile_id: str) -> None:
         """Clean up profile resources from internal tracking dicts."""
@@ -754,7 +790,7 @@ class BrowserLauncher:
             del self._browser_instances[profile_id]
         if profile_id in self._pages:
             del self._pages[profile_id]
-        self._monitor_tasks.pop(profile_id, None)
+        self._close_handlers.pop(profile_id, None)
 
     async def stop_profile(self, profile_id: str) -> bool:
         """Stop browser for profile.
@@ -776,10 +812,8 @@ class BrowserLauncher:
             if self._on_status_change:
                 self._on_status_change(profile_id, ProfileStatus.STOPPING)
 
-            # Cancel monitor task first to prevent double-cleanup
-            task = self._monitor_tasks.pop(profile_id, None)
-            if task is not None:
-                task.cancel()
+            # Detach the close listener first to prevent double-cleanup
+            self._unwatch_close(profile_id)
 
             # Firefox saves sessions automatically via sessionstore.jsonlz4
             if profile_id in self._browsers:
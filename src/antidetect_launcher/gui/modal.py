@@ -1,11 +1,74 @@
 """Modal popup helpers - modern inline popups instead of QMessageBox."""
 
+import weakref
+
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QComboBox
 from PyQt6.QtCore import Qt
+from PyQt6 import sip
 
 from .popup import PopupDialog
 from .styles import COLORS
 
+# Message popups reused per (parent, kind): building a PopupDialog (layouts,
+# stylesheets, buttons) costs far more than swapping its texts. Weak keys let
+# the cache entry go away with the parent window.
+_MESSAGE_POPUPS: "weakref.WeakKeyDictionary[QWidget, dict[str, tuple[PopupDialog, QLabel]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+_MESSAGE_STYLES = {
+    "confirm": f"color: {COLORS['text_primary']}; font-size: 14px;",
+    "info": f"color: {COLORS['text_primary']}; font-size: 14px;",
+    "error": f"color: {COLORS['error']}; font-size: 14px; font-weight: 600;",
+    "warning": f"color: {COLORS['warning']}; font-size: 14px; font-weight: 600;",
+}
+
+
+def _build_message_popup(parent, kind: str, title: str) -> tuple[PopupDialog, QLabel]:
+    """Build a message popup: wrapped label plus Yes/No or OK buttons."""
+    content = QWidget()
+    layout = QVBoxLayout(content)
+    layout.setSpacing(12)
+
+    # Message
+    message = QLabel()
+    message.setWordWrap(True)
+    message.setStyleSheet(_MESSAGE_STYLES[kind])
+    layout.addWidget(message)
+
+    # Create popup
+    popup = PopupDialog(parent, title)
+    popup.set_dialog_content(content)
+
+    # Buttons
+    popup.add_spacer()
+    if kind == "confirm":
+        popup.add_button("No", popup.reject, False)
+        popup.add_button("Yes", popup.accept, True)
+    else:
+        popup.add_button("OK", popup.accept, True)
+    return popup, message
+
+
+def _message_popup(parent, kind: str, title: str, text: str) -> PopupDialog:
+    """Return a (possibly reused) message popup showing ``title``/``text``."""
+    popups = _MESSAGE_POPUPS.setdefault(parent, {}) if parent is not None else None
+    cached = popups.get(kind) if popups is not None else None
+    if cached is not None and sip.isdeleted(cached[0]):
+        del popups[kind]
+        cached = None
+    if cached is None or cached[0].isVisible():
+        # No parent to key on, or the cached one is on screen (nested popup)
+        cached = _build_message_popup(parent, kind, title)
+        if popups is not None and kind not in popups:
+            popups[kind] = cached
+    popup, message = cached
+    popup.set_title(title)
+    message.setText(text)
+    message.adjustSize()
+    popup.fit_parent()
+    return popup
+
 
 def confirm_dialog(
     parent,
@@ -28,25 +91,7 @@ def confirm_dialog(
     Returns:
         True if confirmed, False otherwise
     """
-    content = QWidget()
-    layout = QVBoxLayout(content)
-    layout.setSpacing(12)
-    
-    # Message
-    message = QLabel(text)
-    message.setWordWrap(True)
-    message.setStyleSheet(f"color: {COLORS['text_primary']}; font-size: 14px;")
-    layout.addWidget(message)
-    
-    # Create popup
-    popup = PopupDialog(parent, f"⚠️ {title}")
-    popup.set_dialog_content(content)
-    
-    # Buttons
-    popup.add_spacer()
-    popup.add_button("No", popup.reject, False)
-    popup.add_button("Yes", popup.accept, True)
-    
+    popup = _message_popup(parent, "confirm", f"⚠️ {title}", text)
     return popup.exec()
 
 
@@ -59,24 +104,7 @@ def info_dialog(parent, title: str, text: str, dim: bool = True) -> None:
         text: Information message
         dim: Ignored (for compatibility)
     """
-    content = QWidget()
-    layout = QVBoxLayout(content)
-    layout.setSpacing(12)
-    
-    # Message
-    message = QLabel(text)
-    message.setWordWrap(True)
-    message.setStyleSheet(f"color: {COLORS['text_primary']}; font-size: 14px;")
-    layout.addWidget(message)
-    
-    # Create popup
-    popup = PopupDialog(parent, f"ℹ️ {title}")
-    popup.set_dialog_content(content)
-    
-    # Button
-    popup.add_spacer()
-    popup.add_button("OK", popup.accept, True)
-    
+    popup = _message_popup(parent, "info", f"ℹ️ {title}", text)
     popup.exec()
 
 
@@ -89,24 +117,7 @@ def error_dialog(parent, title: str, text: str, dim: bool = True) -> None:
         text: Error message
         dim: Ignored (for compatibility)
     """
-    content = QWidget()
-    layout = QVBoxLayout(content)
-    layout.setSpacing(12)
-    
-    # Message
-    message = QLabel(text)
-    message.setWordWrap(True)
-    message.setStyleSheet(f"color: {COLORS['error']}; font-size: 14px; font-weight: 600;")
-    layout.addWidget(message)
-    
-    # Create popup
-    popup = PopupDialog(parent, f"❌ {title}")
-    popup.set_dialog_content(content)
-    
-    # Button
-    popup.add_spacer()
-    popup.add_button("OK", popup.accept, True)
-    
+    popup = _message_popup(parent, "error", f"❌ {title}", text)
     popup.exec()
 
 
@@ -119,24 +130,7 @@ def warning_dialog(parent, title: str, text: str, dim: bool = True) -> None:
         text: Warning message
         dim: Ignored (for compatibility)
     """
-    content = QWidget()
-    layout = QVBoxLayout(content)
-    layout.setSpacing(12)
-    
-    # Message
-    message = QLabel(text)
-    message.setWordWrap(True)
-    message.setStyleSheet(f"color: {COLORS['warning']}; font-size: 14px; font-weight: 600;")
-    layout.addWidget(message)
-    
-    # Create popup
-    popup = PopupDialog(parent, f"⚠️ {title}")
-    popup.set_dialog_content(content)
-    
-    # Button
-    popup.add_spacer()
-    popup.add_button("OK", popup.accept, True)
-    
+    popup = _message_popup(parent, "warning", f"⚠️ {title}", text)
     popup.exec()
 
 
@@ -262,6 +256,7 @@ class ModalOverlay(QWidget):
         super().__init__(parent)
         self.setObjectName("modalOverlay")
         self.setStyleSheet("background-color: rgba(0, 0, 0, 160);")
+        self._dimmed = True
         self.setVisible(False)
         self._layout = QVBoxLayout(self)
         self._layout.setContentsMargins(0, 0, 0, 0)
@@ -283,6 +278,10 @@ class ModalOverlay(QWidget):
         self._dialog = None
 
     def set_dimmed(self, dimmed: bool) -> None:
+        # setStyleSheet re-polishes the overlay and its children - skip no-ops
+        if dimmed == self._dimmed:
+            return
+        self._dimmed = dimmed
         opacity = "160" if dimmed else "0"
         self.setStyleSheet(f"background-color: rgba(0, 0, 0, {opacity});")
 
@@ -3,6 +3,7 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+import sys
 from typing import Any
 import uuid
 
@@ -27,7 +28,12 @@ class ProxyType(Enum):
     SOCKS5 = "socks5"
 
 
-@dataclass
+# Value -> member lookups for bulk deserialization (cheaper than Enum(value))
+_STATUS_BY_VALUE = {member.value: member for member in ProfileStatus}
+_PROXY_TYPE_BY_VALUE = {member.value: member for member in ProxyType}
+
+
+@dataclass(slots=True)
 class ProxyConfig:
     """Proxy configuration - the only user input needed."""
 
@@ -125,17 +131,20 @@ class ProxyConfig:
 
                 logging.getLogger(__name__).warning(f"Failed to decrypt password, using as-is: {e}")
 
+        # Profiles sharing a proxy (or a country) share the strings. Instances
+        # stay per-profile (geo/ping fields are mutated in place); the
+        # password is deliberately not interned
         return cls(
             enabled=data.get("enabled", False),
-            proxy_type=ProxyType(data.get("proxy_type", "none")),
-            host=data.get("host", ""),
+            proxy_type=_PROXY_TYPE_BY_VALUE.get(data.get("proxy_type", "none"), ProxyType.NONE),
+            host=sys.intern(data.get("host", "")),
             port=data.get("port", 0),
-            username=data.get("username", ""),
+            username=sys.intern(data.get("username", "")),
             password=password,
-            country_code=data.get("country_code", ""),
-            country_name=data.get("country_name", ""),
-            city=data.get("city", ""),
-            timezone=data.get("timezone", ""),
+            country_code=sys.intern(data.get("country_code", "")),
+            country_name=sys.intern(data.get("country_name", "")),
+            city=sys.intern(data.get("city", "")),
+            timezone=sys.intern(data.get("timezone", "")),
             ping_ms=data.get("ping_ms", -1),
         )
 
@@ -146,7 +155,7 @@ class ProxyConfig:
         return f"{self.host}:{self.port}"
 
 
-@dataclass
+@dataclass(slots=True)
 class BrowserProfile:
     """Browser profile with auto-configured fingerprint."""
 
@@ -171,14 +180,14 @@ class BrowserProfile:
     # OS for icon display (auto-detected or user choice)
     os_type: str = "macos"  # windows, macos, linux
 
-    def to_dict(self) -> dict:
-        """Serialize to dictionary with encrypted proxy password."""
+    def to_dict(self, encrypt_password: bool = True) -> dict:
+        """Serialize to dictionary with (by default) encrypted proxy password."""
         return {
             "id": self.id,
             "name": self.name,
             "folder_id": self.folder_id,
             "status": self.status.value,
-            "proxy": self.proxy.to_dict(encrypt_password=True),
+            "proxy": self.proxy.to_dict(encrypt_password=encrypt_password),
             "notes": self.notes,
             "tags": self.tags,
             "created_at": self.created_at.isoformat(),
@@ -189,34 +198,40 @@ class BrowserProfile:
     @classmethod
     def from_dict(cls, data: dict) -> "BrowserProfile":
         """Deserialize from dictionary with decrypted proxy password."""
-        proxy_data = data.get("proxy", {})
-        proxy = ProxyConfig.from_dict(proxy_data, decrypt_password=True)
+        # Called once per stored profile on startup - keep per-field work minimal
+        get = data.get
+        proxy = ProxyConfig.from_dict(get("proxy", {}), decrypt_password=True)
+
+        # Transient states (starting/stopping) and unknown values load as STOPPED
+        status = _STATUS_BY_VALUE.get(get("status", "stopped"), ProfileStatus.STOPPED)
+        if status is ProfileStatus.STARTING or status is ProfileStatus.STOPPING:
+            status = ProfileStatus.STOPPED
+
+        # Folder ids and tag names repeat across profiles - intern them so
+        # they're stored once and filters compare by identity first
+        intern = sys.intern
+        tags = [intern(t) if isinstance(t, str) else t for t in get("tags", [])]
 
-        status_value = data.get("status", "stopped")
-        if status_value in ("stopping", "starting"):
-            status_value = "stopped"
+        # Only generate a uuid / timestamp when the stored value is missing
+        profile_id = get("id")
+        created_at = get("created_at")
+        last_used = get("last_used")
 
         return cls(
-            id=data.get("id", str(uuid.uuid4())),
-            name=data.get("name", "New Profile"),
-            folder_id=data.get("folder_id", ""),
-            status=ProfileStatus(status_value),
+            id=profile_id if profile_id is not None else str(uuid.uuid4()),
+            name=get("name", "New Profile"),
+            folder_id=intern(get("folder_id", "")),
+            status=status,
             proxy=proxy,
-            notes=data.get("notes", ""),
-            tags=data.get("tags", []),
-            created_at=(
-                datetime.fromisoformat(data["created_at"])
-                if data.get("created_at")
-                else datetime.now()
-            ),
-            last_used=(
-                datetime.fromisoformat(data["last_used"]) if data.get("last_used") else None
-            ),
-            os_type=data.get("os_type", "macos"),
+            notes=get("notes", ""),
+            tags=tags,
+            created_at=datetime.fromisoformat(created_at) if created_at else datetime.now(),
+            last_used=datetime.fromisoformat(last_used) if last_used else None,
+            os_type=get("os_type", "macos"),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Folder:
     """Folder for organizing profiles."""
 
@@ -229,14 +244,15 @@ class Folder:
 
     @classmethod
     def from_dict(cls, data: dict) -> "Folder":
+        folder_id = data.get("id")
         return cls(
-            id=data.get("id", str(uuid.uuid4())),
+            id=folder_id if folder_id is not None else str(uuid.uuid4()),
             name=data.get("name", "New Folder"),
             color=data.get("color", "#6366f1"),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ProxyPool:
     """Pool of proxies for quick rotation."""
 
@@ -256,7 +272,7 @@ class ProxyPool:
         self.proxies.append(proxy)
 
 
-@dataclass
+@dataclass(slots=True)
 class AppSettings:
     """Application settings stored locally."""
 
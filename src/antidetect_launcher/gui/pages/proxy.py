@@ -24,7 +24,7 @@ from ..theme import Theme, COLORS, TYPOGRAPHY, SPACING
 from ..styles import get_country_flag
 from ..icons import get_icon
 from ..models import ProxyConfig
-from ..proxy_utils import parse_proxy_list, ping_proxy, detect_proxy_geo
+from ..proxy_utils import parse_proxy_list, ping_proxy, ping_many, detect_proxy_geo, detect_geo_many
 from ..components import FloatingToolbar, CheckboxWidget, HeaderCheckbox, InlineAlert
 from ..modal import confirm_dialog, get_text_dialog
 from ..table_models import SimpleTableModel
@@ -446,19 +446,23 @@ class ProxyPage(QWidget):
         if not self.proxies:
             return
 
-        async def ping_one(proxy: ProxyConfig) -> None:
-            ping_ms = await ping_proxy(proxy)
+        proxies = list(self.proxies)
+
+        # Ping all concurrently with limit
+        latencies = await ping_many(proxies)
+        needs_geo: list[ProxyConfig] = []
+        for proxy, ping_ms in zip(proxies, latencies, strict=True):
             if ping_ms > 0:
                 proxy.ping_ms = ping_ms
                 if not proxy.country_code:
-                    geo = await detect_proxy_geo(proxy)
-                    if geo:
-                        proxy.country_code = geo.get("country_code", "")
-                        proxy.country_name = geo.get("country_name", "")
-
-        # Ping all concurrently with limit
-        tasks = [ping_one(p) for p in self.proxies]
-        await asyncio.gather(*tasks, return_exceptions=True)
+                    needs_geo.append(proxy)
+
+        # Geo lookups only for reachable proxies without a country yet
+        geos = await detect_geo_many(needs_geo)
+        for proxy, geo in zip(needs_geo, geos, strict=True):
+            if geo:
+                proxy.country_code = geo.get("country_code", "")
+                proxy.country_name = geo.get("country_name", "")
 
         self._refresh_table()
         self.proxy_pool_changed.emit(self.proxies)
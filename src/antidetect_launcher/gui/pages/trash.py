@@ -1,28 +1,148 @@
 """Trash page for deleted profiles."""
 
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtGui import QColor, QIcon, QPainter, QPen, QPixmap
 
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
-    QFrame,
     QLabel,
-    QPushButton,
     QTableView,
-    QMessageBox,
     QGridLayout,
     QStackedWidget,
     QMenu,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
 )
 
-from PyQt6.QtCore import Qt, pyqtSignal, QSize
+from PyQt6.QtCore import Qt, pyqtSignal, QEvent, QRect, QRectF, QSize, QTimer
 
 from ..theme import Theme, COLORS, SPACING
 from ..icons import get_icon, ICON_TRASH, svg_icon
-from ..components import FloatingToolbar, HeaderCheckbox, CheckboxWidget
+from ..components import FloatingToolbar, HeaderCheckbox
 from ..modal import confirm_dialog
-from ..table_models import SimpleTableModel
+from ..table_models import TrashTableModel
+
+
+class TrashItemDelegate(QStyledItemDelegate):
+    """Paints the checkbox and actions-button cells of the trash table.
+
+    Replaces per-row CheckboxWidget / QPushButton index widgets: both cells
+    are drawn from the model and clicks are hit-tested in editorEvent.
+    """
+
+    menu_requested = pyqtSignal(int, QRect)  # row, button rect (viewport coords)
+
+    CHECK_SIZE = 18
+    ICON_SIZE = 14
+
+    # "more" icon pre-rendered once per device pixel ratio, blitted per cell
+    _MORE_PIXMAPS: dict[float, QPixmap] = {}
+
+    @classmethod
+    def _more_pixmap(cls, dpr: float) -> QPixmap:
+        pixmap = cls._MORE_PIXMAPS.get(dpr)
+        if pixmap is None:
+            pixmap = get_icon("more", cls.ICON_SIZE).pixmap(
+                QSize(cls.ICON_SIZE, cls.ICON_SIZE), dpr
+            )
+            cls._MORE_PIXMAPS[dpr] = pixmap
+        return pixmap
+
+    @staticmethod
+    def _button_rect(cell: QRect) -> QRect:
+        size = Theme.BTN_ICON_SIZE
+        return QRect(cell.left() + 4, cell.center().y() - size // 2 + 1, size, size)
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index) -> None:
+        column = index.column()
+        if column not in (TrashTableModel.CHECK_COLUMN, TrashTableModel.ACTIONS_COLUMN):
+            super().paint(painter, option, index)
+            return
+
+        # Row background/selection only - the check indicator is drawn below
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.features &= ~QStyleOptionViewItem.ViewItemFeature.HasCheckIndicator
+        opt.text = ""
+        style = opt.widget.style() if opt.widget else None
+        if style is not None:
+            style.drawControl(QStyle.ControlElement.CE_ItemViewItem, opt, painter, opt.widget)
+
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        if column == TrashTableModel.CHECK_COLUMN:
+            # Same look as CheckboxWidget's indicator
+            checked = index.data(Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Checked
+            size = self.CHECK_SIZE
+            box = QRectF(
+                option.rect.center().x() - size / 2 + 1,
+                option.rect.center().y() - size / 2 + 1,
+                size - 2,
+                size - 2,
+            )
+            border = COLORS.accent if checked or hovered else COLORS.text_muted
+            if checked:
+                fill = COLORS.accent
+            else:
+                fill = COLORS.bg_hover if hovered else COLORS.bg_tertiary
+            painter.setPen(QPen(QColor(border), 2))
+            painter.setBrush(QColor(fill))
+            painter.drawRoundedRect(box, 4, 4)
+        else:
+            # Same look as a QPushButton[class="icon"]
+            button = self._button_rect(option.rect)
+            painter.setPen(QPen(QColor(COLORS.border_light if hovered else COLORS.border), 1))
+            painter.setBrush(QColor(COLORS.bg_hover if hovered else COLORS.bg_secondary))
+            painter.drawRoundedRect(QRectF(button).adjusted(0.5, 0.5, -0.5, -0.5), 4, 4)
+            icon_size = self.ICON_SIZE
+            painter.drawPixmap(
+                QRect(
+                    button.center().x() - icon_size // 2 + 1,
+                    button.center().y() - icon_size // 2 + 1,
+                    icon_size,
+                    icon_size,
+                ),
+                self._more_pixmap(painter.device().devicePixelRatioF()),
+            )
+        painter.restore()
+
+    def sizeHint(self, option: QStyleOptionViewItem, index) -> QSize:
+        # Painted cells have no text - skip the font-metrics based default
+        column = index.column()
+        if column == TrashTableModel.CHECK_COLUMN:
+            return QSize(Theme.COL_CHECKBOX, Theme.TABLE_ROW_HEIGHT)
+        if column == TrashTableModel.ACTIONS_COLUMN:
+            return QSize(Theme.COL_ACTIONS_SM, Theme.BTN_ICON_SIZE)
+        return super().sizeHint(option, index)
+
+    def editorEvent(self, event, model, option, index) -> bool:
+        column = index.column()
+        if event.type() not in (
+            QEvent.Type.MouseButtonPress,
+            QEvent.Type.MouseButtonRelease,
+            QEvent.Type.MouseButtonDblClick,
+        ) or event.button() != Qt.MouseButton.LeftButton:
+            return super().editorEvent(event, model, option, index)
+
+        if column == TrashTableModel.CHECK_COLUMN:
+            if event.type() == QEvent.Type.MouseButtonRelease:
+                checked = index.data(Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Checked
+                new_state = Qt.CheckState.Unchecked if checked else Qt.CheckState.Checked
+                model.setData(index, new_state, Qt.ItemDataRole.CheckStateRole)
+            return True
+
+        if column == TrashTableModel.ACTIONS_COLUMN:
+            button = self._button_rect(option.rect)
+            if not button.contains(event.position().toPoint()):
+                return super().editorEvent(event, model, option, index)
+            if event.type() == QEvent.Type.MouseButtonRelease:
+                self.menu_requested.emit(index.row(), button)
+            return True
+
+        return super().editorEvent(event, model, option, index)
 
 
 class TrashPage(QWidget):
@@ -34,11 +154,16 @@ class TrashPage(QWidget):
     )  # List of profile IDs to permanently delete
     selection_changed = pyqtSignal(int)
 
+    # Row menu icons, shared by all instances and built on first _setup_ui
+    _RESTORE_ICON: QIcon | None = None
+    _TRASH_ICON: QIcon | None = None
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._deleted_profiles: list[dict] = []  # List of {id, name, deleted_at}
-        self._selected_rows: list[int] = []
         self._header_checked = False
+        self._pending_refresh = False  # Trash changed while page was hidden
+        self._selected_ids_cache: list[str] | None = None
         # Removed _compact_mode - no longer hiding columns on resize
         self._setup_ui()
 
@@ -46,6 +171,17 @@ class TrashPage(QWidget):
         """Setup page UI."""
         self.setObjectName("trashPage")
 
+        # Coalesces header checkbox repositioning (sectionResized fires per
+        # column) into one pass per event-loop tick
+        self._reposition_timer = QTimer(self)
+        self._reposition_timer.setSingleShot(True)
+        self._reposition_timer.setInterval(0)
+        self._reposition_timer.timeout.connect(self._do_reposition_all)
+
+        if TrashPage._RESTORE_ICON is None:
+            TrashPage._RESTORE_ICON = get_icon("restore", 14)
+            TrashPage._TRASH_ICON = get_icon("trash", 14)
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(SPACING.xl, SPACING.xl, SPACING.xl, SPACING.xl)
         layout.setSpacing(SPACING.lg)
@@ -92,7 +228,7 @@ class TrashPage(QWidget):
         self._header_checkbox.show()
 
         self.table.horizontalHeader().sectionResized.connect(
-            lambda: self._position_header_checkbox()
+            self._position_header_checkbox
         )
 
         # Floating toolbar container
@@ -167,11 +303,17 @@ class TrashPage(QWidget):
         """Create trash table."""
         table = QTableView()
 
-        headers = ["", "Name", "Deleted At", "Actions"]
-        self.table_model = SimpleTableModel(headers, self)
-        self.table_model.set_alignments({2: Qt.AlignmentFlag.AlignCenter})
+        self.table_model = TrashTableModel(self)
+        self.table_model.checked_changed.connect(self._on_checked_changed)
         table.setModel(self.table_model)
 
+        # Checkbox and actions cells are painted, not per-row widgets
+        self._delegate = TrashItemDelegate(table)
+        self._delegate.menu_requested.connect(self._on_actions_clicked)
+        table.setItemDelegateForColumn(TrashTableModel.CHECK_COLUMN, self._delegate)
+        table.setItemDelegateForColumn(TrashTableModel.ACTIONS_COLUMN, self._delegate)
+        table.setMouseTracking(True)
+
         # Apply unified styling first
         Theme.setup_table(table)
 
@@ -202,123 +344,90 @@ class TrashPage(QWidget):
         row = index.row()
         if row < 0:
             return
-        self._show_row_context_menu(row, self.table.mapToGlobal(pos))
+        self._show_row_context_menu(row, self.table.viewport().mapToGlobal(pos))
+
+    def _on_actions_clicked(self, row: int, button_rect):
+        self._show_row_context_menu(
+            row, self.table.viewport().mapToGlobal(button_rect.bottomLeft())
+        )
 
     def _show_row_context_menu(self, row: int, global_pos):
-        if row < 0 or row >= len(self._deleted_profiles):
+        profile_id = self.table_model.profile_id_at(row)
+        if not profile_id:
             return
         menu = QMenu(self)
-        
-        restore_action = menu.addAction(get_icon("restore", 14), "Restore")
-        restore_action.triggered.connect(lambda: self._restore_profile(row))
-        
+
+        # Actions carry the profile ID; one bound slot each reads it back
+        restore_action = menu.addAction(self._RESTORE_ICON, "Restore")
+        restore_action.setData(profile_id)
+        restore_action.triggered.connect(self._on_restore_action)
+
         menu.addSeparator()
-        
-        delete_action = menu.addAction(get_icon("trash", 14), "Delete permanently")
-        delete_action.triggered.connect(lambda: self._permanent_delete(row))
-        
+
+        delete_action = menu.addAction(self._TRASH_ICON, "Delete permanently")
+        delete_action.setData(profile_id)
+        delete_action.triggered.connect(self._on_permanent_delete_action)
+
         menu.exec(global_pos)
 
+    def _on_restore_action(self):
+        self._restore_profile(self.sender().data())
+
+    def _on_permanent_delete_action(self):
+        self._permanent_delete(self.sender().data())
+
     def update_deleted_profiles(self, profiles: list[dict]):
-        """Update list of deleted profiles."""
+        """Update list of deleted profiles.
+
+        The table is only rebuilt while the page is visible; otherwise the
+        refresh is deferred to the next showEvent.
+        """
         self._deleted_profiles = list(profiles)
-        self._refresh_table()
+        if self.isVisible():
+            self._pending_refresh = False
+            self._refresh_table()
+        else:
+            self._pending_refresh = True
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._pending_refresh:
+            self._pending_refresh = False
+            self._refresh_table()
 
     def _refresh_table(self):
         """Refresh trash table."""
-        self._selected_rows.clear()
         self.floating_toolbar.update_count(0)
+        self._selected_ids_cache = None
+
+        # One repaint for the whole update
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.table_model.set_profiles(self._deleted_profiles)
+        finally:
+            self.table.setUpdatesEnabled(True)
+            self.table.viewport().update()
 
         if not self._deleted_profiles:
-            self.table_model.set_rows([])
             self.content_stack.setCurrentIndex(1)  # Empty placeholder
             return
 
         self.content_stack.setCurrentIndex(0)  # Table
 
-        rows: list[list[str]] = []
-        payloads: list[str | None] = []
-        for profile in self._deleted_profiles:
-            deleted_at = profile.get("deleted_at", "")
-            deleted_text = str(deleted_at)[:19] if deleted_at else "—"
-            rows.append(["", profile.get("name", "Unknown"), deleted_text, ""])
-            payloads.append(profile.get("id"))
-
-        self.table_model.set_rows(rows, payloads)
-
-        for row in range(len(self._deleted_profiles)):
-            # Checkbox
-            self._add_checkbox_to_row(row)
-
-            # Actions
-            actions = self._create_actions_widget(row)
-            self.table.setIndexWidget(self.table_model.index(row, 3), actions)
-
-    def _add_checkbox_to_row(self, row: int):
-        """Add checkbox to row."""
-        checkbox = CheckboxWidget()
-        checkbox.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        checkbox.customContextMenuRequested.connect(
-            lambda pos, r=row, w=checkbox: self._show_row_context_menu(
-                r, w.mapToGlobal(pos)
-            )
-        )
-        checkbox.toggled.connect(
-            lambda checked, r=row: self._on_row_checkbox_toggled(r, checked)
-        )
-        self.table.setIndexWidget(self.table_model.index(row, 0), checkbox)
-
-    def _create_actions_widget(self, row: int) -> QWidget:
-        """Create actions widget for row with single menu button."""
-        widget = QWidget()
-        widget.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        widget.customContextMenuRequested.connect(
-            lambda _pos, r=row, w=widget: self._show_row_context_menu(
-                r, w.mapToGlobal(w.rect().bottomLeft())
-            )
-        )
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(4, 0, 4, 0)
-        layout.setSpacing(4)
-        layout.setAlignment(Qt.AlignmentFlag.AlignVCenter)
-
-        btn_size = Theme.BTN_ICON_SIZE
-
-        # Single menu button with vertical dots
-        menu_btn = QPushButton()
-        menu_btn.setIcon(get_icon("more", 14))
-        menu_btn.setIconSize(QSize(14, 14))
-        menu_btn.setFixedSize(btn_size, btn_size)
-        menu_btn.setProperty("class", "icon")
-        menu_btn.setToolTip("Actions")
-        menu_btn.clicked.connect(
-            lambda checked=False, r=row, w=menu_btn: self._show_row_context_menu(
-                r, w.mapToGlobal(w.rect().bottomLeft())
-            )
-        )
-        layout.addWidget(menu_btn)
-
-        layout.addStretch()
-        return widget
-
-    def _restore_profile(self, row: int):
+    def _restore_profile(self, profile_id: str):
         """Restore single profile."""
-        if 0 <= row < len(self._deleted_profiles):
-            profile_id = self._deleted_profiles[row].get("id")
-            if profile_id:
-                self.restore_requested.emit([profile_id])
+        if profile_id:
+            self.restore_requested.emit([profile_id])
 
-    def _permanent_delete(self, row: int):
+    def _permanent_delete(self, profile_id: str):
         """Permanently delete single profile."""
-        if 0 <= row < len(self._deleted_profiles):
-            profile_id = self._deleted_profiles[row].get("id")
-            if profile_id:
-                if confirm_dialog(
-                    self,
-                    "Confirm Delete",
-                    "This action cannot be undone. Delete permanently?",
-                ):
-                    self.permanent_delete_requested.emit([profile_id])
+        if profile_id:
+            if confirm_dialog(
+                self,
+                "Confirm Delete",
+                "This action cannot be undone. Delete permanently?",
+            ):
+                self.permanent_delete_requested.emit([profile_id])
 
     def _on_empty_trash(self):
         """Handle empty trash button."""
@@ -346,17 +455,7 @@ class TrashPage(QWidget):
 
     def _toggle_all_checkboxes(self, checked: bool):
         """Toggle all checkboxes and sync header."""
-        for row in range(self.table_model.rowCount()):
-            widget = self.table.indexWidget(self.table_model.index(row, 0))
-            if isinstance(widget, CheckboxWidget):
-                widget.blockSignals(True)
-                widget.setChecked(checked)
-                widget.blockSignals(False)
-
-        if checked:
-            self._selected_rows = list(range(self.table_model.rowCount()))
-        else:
-            self._selected_rows.clear()
+        self.table_model.set_all_checked(checked)
 
         # Sync header checkbox state
         self._header_checked = checked
@@ -365,23 +464,16 @@ class TrashPage(QWidget):
             self._header_checkbox.setChecked(checked)
             self._header_checkbox.blockSignals(False)
 
-        self._update_selection()
+    def _on_checked_changed(self, count: int):
+        """Handle row check state change from the model."""
+        self._selected_ids_cache = None
+        self._update_selection(count)
+        self._update_header_state(count)
 
-    def _on_row_checkbox_toggled(self, row: int, checked: bool):
-        """Handle row checkbox toggle."""
-        if checked:
-            if row not in self._selected_rows:
-                self._selected_rows.append(row)
-        else:
-            if row in self._selected_rows:
-                self._selected_rows.remove(row)
-        self._update_selection()
-        self._update_header_state()
-
-    def _update_header_state(self):
+    def _update_header_state(self, count: int):
         """Update header checkbox state."""
         total = self.table_model.rowCount()
-        if total > 0 and len(self._selected_rows) == total:
+        if total > 0 and count == total:
             self._header_checked = True
         else:
             self._header_checked = False
@@ -391,20 +483,21 @@ class TrashPage(QWidget):
             self._header_checkbox.setChecked(self._header_checked)
             self._header_checkbox.blockSignals(False)
 
-    def _update_selection(self):
+    def _update_selection(self, count: int):
         """Update selection state."""
-        count = len(self._selected_rows)
         self.floating_toolbar.update_count(count)
         self.selection_changed.emit(count)
 
     def get_selected_profile_ids(self) -> list[str]:
-        """Get selected profile IDs."""
-        ids: list[str] = []
-        for row in sorted(self._selected_rows):
-            profile_id = self.table_model.payload_at(row)
-            if profile_id:
-                ids.append(profile_id)
-        return ids
+        """Get selected profile IDs (cached until the selection changes)."""
+        if self._selected_ids_cache is None:
+            ids: list[str] = []
+            for row in sorted(self.table_model.checked_rows()):
+                profile_id = self.table_model.profile_id_at(row)
+                if profile_id:
+                    ids.append(profile_id)
+            self._selected_ids_cache = ids
+        return list(self._selected_ids_cache)
 
     def _on_batch_restore(self):
         """Handle batch restore."""
@@ -427,7 +520,11 @@ class TrashPage(QWidget):
 
     # === Positioning ===
 
-    def _position_header_checkbox(self):
+    def _position_header_checkbox(self, *_args):
+        """Schedule header checkbox repositioning (debounced)."""
+        self._reposition_timer.start()
+
+    def _do_reposition_all(self):
         """Position header checkbox."""
         if not self._header_checkbox or not self.table:
             return
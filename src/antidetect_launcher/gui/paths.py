@@ -1,11 +1,23 @@
-"""Platform-specific paths for application data."""
+"""Platform-specific paths for application data.
 
+Directory lookups are memoized: the platform/install checks, path
+resolution and mkdir run once per process.
+"""
+
+import functools
 import os
 import shutil
 import sys
 from pathlib import Path
 
+# Platform / packaging facts, fixed for the life of the process
+_IS_FROZEN = getattr(sys, "frozen", False)  # PyInstaller bundle
+_IS_LINUX = sys.platform.startswith("linux")
+_IS_WIN = sys.platform == "win32"
+_IS_MAC = sys.platform == "darwin"
+
 
+@functools.lru_cache(maxsize=1)
 def get_data_dir() -> Path:
     """Get platform-specific data directory for the application.
 
@@ -24,12 +36,12 @@ def get_data_dir() -> Path:
     if the executable is frozen (PyInstaller) or installed via package manager.
     """
     # Check if running as PyInstaller bundle
-    if getattr(sys, "frozen", False):
+    if _IS_FROZEN:
         # Running as compiled executable
         return _get_user_data_dir()
 
     # Check if installed via package manager (Linux)
-    if sys.platform.startswith("linux"):
+    if _IS_LINUX:
         # If running from /usr/bin or /usr/local/bin, assume installed package
         exe_path = Path(sys.argv[0]).resolve()
         if str(exe_path).startswith(("/usr/bin", "/usr/local/bin", "/opt")):
@@ -44,29 +56,42 @@ def get_data_dir() -> Path:
     return project_root / "data"
 
 
+def _win_data_dir() -> Path:
+    """Windows: %APPDATA%/AntidetectLauncher/."""
+    appdata = os.environ.get("APPDATA")
+    if appdata:
+        return Path(appdata) / "AntidetectLauncher"
+    # Fallback to user home
+    return Path.home() / ".antidetect_launcher"
+
+
+def _mac_data_dir() -> Path:
+    """macOS: ~/Library/Application Support/AntidetectLauncher/."""
+    return Path.home() / "Library" / "Application Support" / "AntidetectLauncher"
+
+
+def _linux_data_dir() -> Path:
+    """Linux: follow XDG Base Directory specification."""
+    xdg_data_home = os.environ.get("XDG_DATA_HOME")
+    if xdg_data_home:
+        return Path(xdg_data_home) / "antidetect-launcher"
+    # Default: ~/.local/share/antidetect-launcher/
+    return Path.home() / ".local" / "share" / "antidetect-launcher"
+
+
+# Platform branch picked once at import
+if _IS_WIN:
+    _PLATFORM_DATA_DIR_FACTORY = _win_data_dir
+elif _IS_MAC:
+    _PLATFORM_DATA_DIR_FACTORY = _mac_data_dir
+else:
+    _PLATFORM_DATA_DIR_FACTORY = _linux_data_dir
+
+
+@functools.lru_cache(maxsize=1)
 def _get_user_data_dir() -> Path:
     """Get user-specific data directory based on platform."""
-    if sys.platform == "win32":
-        # Windows: %APPDATA%/AntidetectLauncher/
-        appdata = os.environ.get("APPDATA")
-        if appdata:
-            data_dir = Path(appdata) / "AntidetectLauncher"
-        else:
-            # Fallback to user home
-            data_dir = Path.home() / ".antidetect_launcher"
-
-    elif sys.platform == "darwin":
-        # macOS: ~/Library/Application Support/AntidetectLauncher/
-        data_dir = Path.home() / "Library" / "Application Support" / "AntidetectLauncher"
-
-    else:
-        # Linux: follow XDG Base Directory specification
-        xdg_data_home = os.environ.get("XDG_DATA_HOME")
-        if xdg_data_home:
-            data_dir = Path(xdg_data_home) / "antidetect-launcher"
-        else:
-            # Default: ~/.local/share/antidetect-launcher/
-            data_dir = Path.home() / ".local" / "share" / "antidetect-launcher"
+    data_dir = _PLATFORM_DATA_DIR_FACTORY()
 
     # Create directory if it doesn't exist
     data_dir.mkdir(parents=True, exist_ok=True)
@@ -74,6 +99,7 @@ def _get_user_data_dir() -> Path:
     return data_dir
 
 
+@functools.lru_cache(maxsize=1)
 def get_config_dir() -> Path:
     """Get platform-specific config directory.
 
@@ -84,14 +110,14 @@ def get_config_dir() -> Path:
         Windows: Same as data dir
         macOS:   Same as data dir
     """
-    if sys.platform.startswith("linux") and not getattr(sys, "frozen", False):
+    if _IS_LINUX and not _IS_FROZEN:
         if not is_installed_package():
             # Development mode - use project config (.config/ at project root)
             current_file = Path(__file__).resolve()
             project_root = current_file.parent.parent.parent.parent
             return project_root / ".config"
 
-    if sys.platform.startswith("linux"):
+    if _IS_LINUX:
         xdg_config_home = os.environ.get("XDG_CONFIG_HOME")
         if xdg_config_home:
             config_dir = Path(xdg_config_home) / "antidetect-launcher"
@@ -104,6 +130,7 @@ def get_config_dir() -> Path:
     return get_data_dir()
 
 
+@functools.lru_cache(maxsize=1)
 def get_cache_dir() -> Path:
     """Get platform-specific cache directory.
 
@@ -114,15 +141,15 @@ def get_cache_dir() -> Path:
         Windows: %LOCALAPPDATA%/AntidetectLauncher/Cache/
         macOS:   ~/Library/Caches/AntidetectLauncher/
     """
-    if getattr(sys, "frozen", False) or sys.platform != "linux":
-        if sys.platform == "win32":
+    if _IS_FROZEN or not _IS_LINUX:
+        if _IS_WIN:
             localappdata = os.environ.get("LOCALAPPDATA")
             if localappdata:
                 cache_dir = Path(localappdata) / "AntidetectLauncher" / "Cache"
             else:
                 cache_dir = Path.home() / ".antidetect_launcher" / "cache"
 
-        elif sys.platform == "darwin":
+        elif _IS_MAC:
             cache_dir = Path.home() / "Library" / "Caches" / "AntidetectLauncher"
 
         else:
@@ -144,6 +171,7 @@ def get_cache_dir() -> Path:
     return cache_dir
 
 
+@functools.lru_cache(maxsize=1)
 def get_logs_dir() -> Path:
     """Get platform-specific logs directory.
 
@@ -155,17 +183,19 @@ def get_logs_dir() -> Path:
     return logs_dir
 
 
+@functools.lru_cache(maxsize=1)
 def is_development_mode() -> bool:
     """Check if running in development mode (from source)."""
-    return not getattr(sys, "frozen", False)
+    return not _IS_FROZEN
 
 
+@functools.lru_cache(maxsize=1)
 def is_installed_package() -> bool:
     """Check if running as installed package."""
-    if getattr(sys, "frozen", False):
+    if _IS_FROZEN:
         return True
 
-    if sys.platform.startswith("linux"):
+    if _IS_LINUX:
         exe_path = Path(sys.argv[0]).resolve()
         return str(exe_path).startswith(("/usr/bin", "/usr/local/bin", "/opt"))
 
@@ -183,7 +213,7 @@ def _get_bundled_config_dir() -> Path | None:
         3. Project root .config/ (dev fallback)
     """
     # PyInstaller bundle
-    if getattr(sys, "frozen", False):
+    if _IS_FROZEN:
         meipass = Path(getattr(sys, "_MEIPASS", ""))
         bundled = meipass / "config"
         if bundled.exists():
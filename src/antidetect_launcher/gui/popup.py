@@ -176,6 +176,13 @@ class Popup(QWidget):
         
         self._container.setGeometry(x, y, width, height)
 
+    def fit_parent(self):
+        """Re-cover the parent (it may have been resized since the last show)."""
+        parent = self.parentWidget()
+        if parent is not None:
+            self.setGeometry(parent.rect())
+        self._center_container()
+
     def resizeEvent(self, event):
         """Resize overlay and recenter container."""
         super().resizeEvent(event)
@@ -245,6 +252,8 @@ class Popup(QWidget):
         self.closed.connect(on_closed)
         self.show_animated()
         loop.exec()
+        # Popups can be exec()'d again - don't accumulate handlers
+        self.closed.disconnect(on_closed)
         
         return self._result
 
@@ -258,6 +267,7 @@ class PopupDialog(Popup):
     def __init__(self, parent=None, title="", close_on_overlay=True):
         super().__init__(parent, close_on_overlay)
         self._title = title
+        self._title_label: QLabel | None = None
         self._setup_ui()
 
     def _setup_ui(self):
@@ -273,6 +283,7 @@ class PopupDialog(Popup):
         if self._title:
             title_layout = QHBoxLayout()
             title_label = QLabel(self._title)
+            self._title_label = title_label
             title_label.setStyleSheet(
                 f"""
                 font-size: 18px;
@@ -326,6 +337,12 @@ class PopupDialog(Popup):
         
         self.set_content(main)
 
+    def set_title(self, title: str):
+        """Update the title text (only for popups created with a title)."""
+        self._title = title
+        if self._title_label is not None:
+            self._title_label.setText(title)
+
     def set_dialog_content(self, widget: QWidget):
         """Set content between title and buttons."""
         # Clear existing content
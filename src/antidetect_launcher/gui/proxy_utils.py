@@ -2,9 +2,11 @@
 
 import asyncio
 import logging
+from collections import OrderedDict
 import aiohttp
 import re
 import ipaddress
+import time
 from datetime import datetime
 from typing import Optional
 
@@ -12,6 +14,46 @@ from .models import ProxyConfig, ProxyType
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import - parse_proxy_list runs these per line
+_PROTO_RE = re.compile(r"(\w+)://(.+)")
+_AUTH_RE = re.compile(r"([^:]+):([^@]+)@([^:]+):(\d+)")
+_DOMAIN_RE = re.compile(
+    r"^(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)+[a-zA-Z]{2,}$"
+)
+_USERNAME_INVALID_RE = re.compile(r"[\s@:]")
+_SUPPORTED_PROTOCOLS = frozenset({"http", "https", "socks4", "socks5"})
+
+# Shared by ping_proxy/detect_proxy_geo so batch checks reuse one connector
+# (pooled sockets, DNS cache) instead of building a session per request
+_session: aiohttp.ClientSession | None = None
+_session_loop: asyncio.AbstractEventLoop | None = None
+
+
+# detect_proxy_geo results per (host, port, username): the answer only
+# changes with the exit IP. Small LRU with a TTL
+_GEO_TTL = 3600.0
+_GEO_CACHE_SIZE = 512
+_geo_cache: "OrderedDict[tuple[str, int, str], tuple[float, dict]]" = OrderedDict()
+
+
+async def _get_session() -> aiohttp.ClientSession:
+    """Return the shared HTTP session, creating it on first use."""
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        connector = aiohttp.TCPConnector(ssl=False, limit=64, ttl_dns_cache=300)
+        _session = aiohttp.ClientSession(connector=connector)
+        _session_loop = loop
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared HTTP session (call on application shutdown)."""
+    global _session, _session_loop
+    session, _session, _session_loop = _session, None, None
+    if session is not None and not session.closed:
+        await session.close()
+
 
 class ProxyValidationError(ValueError):
     """Raised when proxy validation fails."""
@@ -41,10 +83,7 @@ def validate_proxy_config(proxy: ProxyConfig) -> tuple[bool, Optional[str]]:
         ipaddress.ip_address(proxy.host)
     except ValueError:
         # Not an IP, check if valid domain
-        domain_pattern = re.compile(
-            r"^(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)+[a-zA-Z]{2,}$"
-        )
-        if not domain_pattern.match(proxy.host):
+        if not _DOMAIN_RE.match(proxy.host):
             return False, f"Invalid proxy host: {proxy.host}"
 
     # Validate port
@@ -60,7 +99,7 @@ def validate_proxy_config(proxy: ProxyConfig) -> tuple[bool, Optional[str]]:
 
     # Validate username/password characters
     if proxy.username:
-        if re.search(r"[\s@:]", proxy.username):
+        if _USERNAME_INVALID_RE.search(proxy.username):
             return False, "Username contains invalid characters (space, @, :)"
 
     return True, None
@@ -91,23 +130,21 @@ async def ping_proxy(proxy: ProxyConfig, timeout: float = 10.0) -> int:
         return -1
 
     try:
-        start = asyncio.get_event_loop().time()
-
-        connector = aiohttp.TCPConnector(ssl=False, limit=1)
-        async with aiohttp.ClientSession(connector=connector) as session:
-            async with session.get(
-                "http://httpbin.org/ip",
-                proxy=proxy_url,
-                timeout=aiohttp.ClientTimeout(total=timeout),
-            ) as response:
-                if response.status == 200:
-                    end = asyncio.get_event_loop().time()
-                    latency = int((end - start) * 1000)
-                    logger.debug(f"Proxy {proxy.host}:{proxy.port} ping: {latency}ms")
-                    return latency
-                else:
-                    logger.warning(f"Proxy returned status {response.status}")
-                    return -1
+        start = time.perf_counter()
+
+        session = await _get_session()
+        async with session.get(
+            "http://httpbin.org/ip",
+            proxy=proxy_url,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as response:
+            if response.status == 200:
+                latency = int((time.perf_counter() - start) * 1000)
+                logger.debug(f"Proxy {proxy.host}:{proxy.port} ping: {latency}ms")
+                return latency
+            else:
+                logger.warning(f"Proxy returned status {response.status}")
+                return -1
     except asyncio.TimeoutError:
         logger.debug(f"Proxy {proxy.host}:{proxy.port} timeout after {timeout}s")
         return -1
@@ -121,6 +158,51 @@ async def ping_proxy(proxy: ProxyConfig, timeout: float = 10.0) -> int:
         return -1
 
 
+async def ping_many(proxies: list[ProxyConfig], concurrency: int = 32) -> list[int]:
+    """Ping proxies concurrently, at most ``concurrency`` at a time.
+
+    Args:
+        proxies: Proxy configurations
+        concurrency: Maximum number of pings in flight
+
+    Returns:
+        Latencies in milliseconds (-1 if failed), in the order of ``proxies``
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _ping_one(proxy: ProxyConfig) -> int:
+        async with semaphore:
+            return await ping_proxy(proxy)
+
+    return await asyncio.gather(*[_ping_one(p) for p in proxies])
+
+
+async def detect_geo_many(proxies: list[ProxyConfig], concurrency: int = 32) -> list[dict]:
+    """Detect proxy locations concurrently, at most ``concurrency`` at a time.
+
+    Args:
+        proxies: Proxy configurations
+        concurrency: Maximum number of lookups in flight
+
+    Returns:
+        Geo dicts as from detect_proxy_geo() (empty if failed), in the order
+        of ``proxies``
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _detect_one(proxy: ProxyConfig) -> dict:
+        # Bounded here rather than by the connector pool: time spent waiting
+        # for a pool slot would count against the lookup's timeout
+        async with semaphore:
+            try:
+                return await detect_proxy_geo(proxy)
+            except Exception as e:
+                logger.debug(f"Geo detection failed for {proxy.host}:{proxy.port}: {e}")
+                return {}
+
+    return await asyncio.gather(*[_detect_one(p) for p in proxies])
+
+
 async def detect_proxy_geo(proxy: ProxyConfig) -> dict:
     """Detect proxy location using IP geolocation.
 
@@ -149,33 +231,44 @@ async def detect_proxy_geo(proxy: ProxyConfig) -> dict:
         logger.error("Failed to convert proxy to URL for geo detection")
         return {}
 
+    cache_key = (proxy.host, proxy.port, proxy.username)
+    cached = _geo_cache.get(cache_key)
+    if cached is not None:
+        stored_at, result = cached
+        if time.monotonic() - stored_at < _GEO_TTL:
+            _geo_cache.move_to_end(cache_key)
+            return dict(result)
+        del _geo_cache[cache_key]
+
     try:
-        connector = aiohttp.TCPConnector(ssl=False, limit=1)
-        async with aiohttp.ClientSession(connector=connector) as session:
-            # Use ip-api.com for geolocation (free tier)
-            async with session.get(
-                "http://ip-api.com/json/?fields=status,country,countryCode,city,timezone,query",
-                proxy=proxy_url,
-                timeout=aiohttp.ClientTimeout(total=15),
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    if data.get("status") == "success":
-                        result = {
-                            "country_code": data.get("countryCode", ""),
-                            "country_name": data.get("country", ""),
-                            "city": data.get("city", ""),
-                            "timezone": data.get("timezone", ""),
-                            "ip": data.get("query", ""),
-                        }
-                        logger.info(
-                            f"Detected proxy location: {result['country_code']} - {result['city']}"
-                        )
-                        return result
-                    else:
-                        logger.warning(f"Geo API returned status: {data.get('status')}")
+        session = await _get_session()
+        # Use ip-api.com for geolocation (free tier)
+        async with session.get(
+            "http://ip-api.com/json/?fields=status,country,countryCode,city,timezone,query",
+            proxy=proxy_url,
+            timeout=aiohttp.ClientTimeout(total=15),
+        ) as response:
+            if response.status == 200:
+                data = await response.json()
+                if data.get("status") == "success":
+                    result = {
+                        "country_code": data.get("countryCode", ""),
+                        "country_name": data.get("country", ""),
+                        "city": data.get("city", ""),
+                        "timezone": data.get("timezone", ""),
+                        "ip": data.get("query", ""),
+                    }
+                    logger.info(
+                        f"Detected proxy location: {result['country_code']} - {result['city']}"
+                    )
+                    _geo_cache[cache_key] = (time.monotonic(), result)
+                    if len(_geo_cache) > _GEO_CACHE_SIZE:
+                        _geo_cache.popitem(last=False)
+                    return dict(result)
                 else:
-                    logger.warning(f"Geo API returned HTTP {response.status}")
+                    logger.warning(f"Geo API returned status: {data.get('status')}")
+            else:
+                logger.warning(f"Geo API returned HTTP {response.status}")
     except asyncio.TimeoutError:
         logger.debug(f"Geo detection timeout for {proxy.host}:{proxy.port}")
     except Exception as e:
@@ -218,25 +311,34 @@ def parse_proxy_string(text: str) -> ProxyConfig | None:
     try:
         # Check for protocol prefix
         if "://" in text:
-            match = re.match(r"(\w+)://(.+)", text)
+            match = _PROTO_RE.match(text)
             if match:
                 proto = match.group(1).lower()
                 text = match.group(2)
-                if proto in ("http", "https", "socks4", "socks5"):
+                if proto in _SUPPORTED_PROTOCOLS:
                     proxy_type = ProxyType(proto)
                 else:
                     raise ProxyValidationError(f"Unsupported protocol: {proto}")
 
         # Check for user:pass@host:port format
         if "@" in text:
-            match = re.match(r"([^:]+):([^@]+)@([^:]+):(\d+)", text)
-            if match:
-                username = match.group(1)
-                password = match.group(2)
-                host = match.group(3)
-                port = int(match.group(4))
+            # Fast path: plain partitions give the same split as _AUTH_RE
+            # whenever every part is present and the port is all digits
+            username, _, rest = text.partition(":")
+            password, _, hostport = rest.partition("@")
+            host, _, port_str = hostport.partition(":")
+            if username and password and host and port_str.isdecimal():
+                port = int(port_str)
             else:
-                raise ProxyValidationError(f"Invalid auth format: {text}")
+                # Odd input (trailing junk, missing parts) - regex decides
+                match = _AUTH_RE.match(text)
+                if match:
+                    username = match.group(1)
+                    password = match.group(2)
+                    host = match.group(3)
+                    port = int(match.group(4))
+                else:
+                    raise ProxyValidationError(f"Invalid auth format: {text}")
         else:
             # host:port or host:port:user:pass
             parts = text.split(":")
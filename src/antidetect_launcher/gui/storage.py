@@ -1,12 +1,18 @@
 """Storage manager for profiles, folders, settings and proxy pool."""
 
-import json
+import hashlib
 import logging
+import os
+import sys
 import tempfile
 import uuid
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Iterable, Iterator, Optional
+
+import orjson
+from PyQt6.QtCore import QMutex, QMutexLocker, QRunnable, QThreadPool
 
 from .models import (
     BrowserProfile,
@@ -22,6 +28,25 @@ from .paths import get_data_dir
 logger = logging.getLogger(__name__)
 
 
+def _dumps(data) -> bytes:
+    """Serialize storage data to indented UTF-8 JSON bytes."""
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str)
+
+
+def _dumps_compact(data) -> bytes:
+    """Serialize machine-owned storage data to compact UTF-8 JSON bytes."""
+    return orjson.dumps(data, default=str)
+
+
+# Value -> member for proxy pool loading (cheaper than ProxyType(value))
+_PROXY_TYPES = {member.value: member for member in ProxyType}
+
+
+def _digest(blob: bytes) -> bytes:
+    """Content fingerprint used to skip rewriting unchanged files."""
+    return hashlib.blake2b(blob, digest_size=16).digest()
+
+
 class StorageError(Exception):
     """Base exception for storage errors."""
 
@@ -48,10 +73,21 @@ class StorageCorruptedError(StorageError):
     pass
 
 
+class _WriteJob(QRunnable):
+    """Drain a Storage's pending writes on its I/O thread."""
+
+    def __init__(self, storage: "Storage") -> None:
+        super().__init__()
+        self._storage = storage
+
+    def run(self) -> None:
+        self._storage._drain_writes()
+
+
 class Storage:
     """Local storage for all application data."""
 
-    def __init__(self, data_dir: str | Path | None = None):
+    def __init__(self, data_dir: str | Path | None = None, background_io: bool = False):
         """Initialize storage.
 
         Args:
@@ -60,6 +96,9 @@ class Storage:
                 - Linux installed: ~/.local/share/antidetect-launcher/
                 - Windows installed: %APPDATA%/AntidetectLauncher/
                 - macOS installed: ~/Library/Application Support/AntidetectLauncher/
+            background_io: If True, serialized files are handed to a single
+                I/O thread instead of being written (and fsynced) on the
+                calling thread. Call wait_for_writes() before exiting.
         """
         if data_dir is None:
             self._data_dir = get_data_dir()
@@ -79,16 +118,27 @@ class Storage:
         # Unified labels pool (tags/statuses/note templates)
         self._labels_pool_file = self._data_dir / "labels_pool.json"
         self._trash_file = self._data_dir / "trash.json"
+        self._trash_log_file = self._data_dir / "trash.log"
 
         self._profiles: list[BrowserProfile] = []
         self._folders: list[Folder] = []
         self._settings: AppSettings = AppSettings()
         self._proxy_pool: ProxyPool = ProxyPool()
         # Labels pool
-        self._tags_pool: list[str] = []
+        self._tags_pool: list[str] = []  # Ordered for the UI
+        self._tags_pool_set: set[str] = set()  # Membership checks
         self._statuses_pool: list[tuple[str, str]] = []  # (name, color)
         self._note_templates_pool: list[tuple[str, str]] = []  # (name, content)
-        self._trash: list[dict] = []
+        self._trash: dict[str, dict] = {}  # {profile_id: item}, in deletion order
+        # Encoded trash items: {profile_id: (item, json bytes)}. Items are
+        # immutable snapshots, so each is encoded once, not on every save
+        self._trash_blobs: dict[str, tuple[dict, bytes]] = {}
+        # Trash log state (see _load_trash)
+        self._trash_log_pending: list[bytes] = []
+        # Restores' "del" events, appended only once profiles.json is on disk
+        self._trash_restores_pending: dict[str, bytes] = {}
+        self._trash_log_size = 0
+        self._trash_snapshot_size = 0
 
         # Profile ID index for O(1) lookup
         self._profile_index: dict[str, BrowserProfile] = {}
@@ -98,13 +148,76 @@ class Storage:
         self._tag_index: dict[str, set[str]] = {}
         self._tag_index_dirty = True  # Rebuild on next access
 
+        # {folder_id: [profiles]} in list order; rebuilt lazily like the tag index
+        self._folder_index: dict[str, list[BrowserProfile]] = {}
+        self._folder_index_dirty = True
+
+        # {profile_id: lowercased name} for search; avoids a lower() per
+        # profile per keystroke
+        self._name_lower: dict[str, str] = {}
+        self._name_lower_dirty = True
+
+        # Last filtered get_profiles() query: (key, result)
+        self._last_query: tuple[tuple, list[BrowserProfile]] | None = None
+
+        # Serialized profile dicts by id, plain (fingerprint) and encrypted
+        # (file). Dropped whenever a profile goes through update_profile()
+        # or is moved/removed here, so a save only re-serializes - and
+        # re-encrypts - the profiles that changed
+        self._plain_dicts: dict[str, dict] = {}
+        self._stored_dicts: dict[str, dict] = {}
+
+        # Files with unsaved changes; written on flush(). Inside batch()
+        # the save_* calls only mark them, so N edits cost one write each
+        self._dirty: set[str] = set()
+        self._batch_depth = 0
+        # Fingerprint of what each file holds on disk; a save whose content
+        # fingerprint matches is skipped (no temp file, fsync or rename)
+        self._file_digests: dict[Path, bytes] = {}
+        self._write_count = 0
+
+        # Background writes: latest bytes per file, drained by one thread
+        self._io_pool: QThreadPool | None = None
+        if background_io:
+            self._io_pool = QThreadPool()
+            self._io_pool.setMaxThreadCount(1)
+        self._io_mutex = QMutex()
+        self._pending_writes: dict[Path, bytes] = {}
+        self._io_scheduled = False
+
         self._load_all()
 
     def _rebuild_index(self) -> None:
         """Rebuild profile index after load/modify."""
         self._profile_index = {p.id: p for p in self._profiles}
-        # Mark tag index as dirty - will rebuild on next tag query
+        # Mark derived indices as dirty - will rebuild on next query
         self._tag_index_dirty = True
+        self._folder_index_dirty = True
+        self._name_lower_dirty = True
+        self._last_query = None
+
+    def _rebuild_folder_index(self) -> None:
+        """Rebuild folder index for folder filters and counts."""
+        if not self._folder_index_dirty:
+            return
+
+        index: dict[str, list[BrowserProfile]] = {}
+        for profile in self._profiles:
+            folder_profiles = index.get(profile.folder_id)
+            if folder_profiles is None:
+                index[profile.folder_id] = [profile]
+            else:
+                folder_profiles.append(profile)
+        self._folder_index = index
+        self._folder_index_dirty = False
+
+    def _rebuild_name_index(self) -> None:
+        """Rebuild lowercased profile names used by search."""
+        if not self._name_lower_dirty:
+            return
+
+        self._name_lower = {p.id: p.name.lower() for p in self._profiles}
+        self._name_lower_dirty = False
 
     def _rebuild_tag_index(self) -> None:
         """Rebuild tag index for fast tag-based queries.
@@ -125,12 +238,12 @@ class Storage:
         self._tag_index_dirty = False
         logger.debug(f"Rebuilt tag index: {len(self._tag_index)} unique tags")
 
-    def _atomic_write(self, path: Path, data: str) -> None:
+    def _atomic_write(self, path: Path, data: bytes) -> None:
         """Write file atomically to prevent corruption.
 
         Args:
             path: Destination file path
-            data: JSON data to write
+            data: Serialized JSON (UTF-8 bytes) to write
 
         Raises:
             StorageError: If write fails
@@ -144,8 +257,12 @@ class Storage:
             raise StorageError(f"Failed to create temp file: {e}")
 
         try:
-            with open(fd, "w", encoding="utf-8") as f:
+            with open(fd, "wb") as f:
                 f.write(data)
+                # Data must hit the disk before the rename publishes it,
+                # otherwise a power loss can leave an empty file behind
+                f.flush()
+                os.fsync(f.fileno())
             # Atomic rename
             Path(temp_path).replace(path)
             logger.debug(f"Atomically wrote {path}")
@@ -157,6 +274,148 @@ class Storage:
                 pass
             raise StorageError(f"Failed to write {path}: {e}")
 
+    # Write order on flush. A profile moving between profiles.json and the
+    # trash must be in its new home before it leaves the old one, or a crash
+    # in between loses it: deletes ("add" events) go to the trash log before
+    # profiles.json is written, restores ("del" events) only after it
+    _WRITE_ORDER = (
+        "trash",
+        "profiles",
+        "trash_restores",
+        "folders",
+        "settings",
+        "proxy_pool",
+        "labels_pool",
+    )
+
+    def _mark_dirty(self, name: str) -> None:
+        """Record an unsaved file; written now unless inside batch()."""
+        self._dirty.add(name)
+        if not self._batch_depth:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write every file with unsaved changes.
+
+        Raises:
+            StorageError: If a write fails (unwritten files stay dirty)
+        """
+        write_count = self._write_count
+        for name in self._WRITE_ORDER:
+            if name in self._dirty:
+                getattr(self, f"_write_{name}")()
+                self._dirty.discard(name)
+        # The I/O thread syncs the directory itself after each drain
+        if self._write_count != write_count and self._io_pool is None:
+            self._fsync_data_dir()
+
+    def _commit_write(self, path: Path, blob: bytes, fingerprint: bytes) -> None:
+        """Write now, or queue for the I/O thread when background_io is on."""
+        self._write_count += 1
+        if self._io_pool is None:
+            self._atomic_write(path, blob)
+            self._file_digests[path] = fingerprint
+            return
+
+        with QMutexLocker(self._io_mutex):
+            self._file_digests[path] = fingerprint
+            # Newer bytes replace queued ones; re-inserting keeps the flush
+            # order (trash before profiles) for the next drain
+            self._pending_writes.pop(path, None)
+            self._pending_writes[path] = blob
+            if self._io_scheduled:
+                return
+            self._io_scheduled = True
+        self._io_pool.start(_WriteJob(self))
+
+    def _drain_writes(self) -> None:
+        """Write queued files until the queue is empty (I/O thread)."""
+        while True:
+            with QMutexLocker(self._io_mutex):
+                pending = self._pending_writes
+                if not pending:
+                    self._io_scheduled = False
+                    return
+                self._pending_writes = {}
+
+            for path, blob in pending.items():
+                try:
+                    self._atomic_write(path, blob)
+                except StorageError as e:
+                    logger.error("Background write failed: %s", e)
+                    with QMutexLocker(self._io_mutex):
+                        if path not in self._pending_writes:
+                            # Forget the fingerprint so the next save retries
+                            self._file_digests.pop(path, None)
+            self._fsync_data_dir()
+
+    def wait_for_writes(self, timeout_ms: int = -1) -> bool:
+        """Block until queued background writes are on disk.
+
+        Returns:
+            True if all writes finished (always True without background_io)
+        """
+        if self._io_pool is None:
+            return True
+        return self._io_pool.waitForDone(timeout_ms)
+
+    def _read_json(self, path: Path):
+        """Parse a JSON file and remember its fingerprint for _write_blob()."""
+        blob = path.read_bytes()
+        data = orjson.loads(blob)
+        self._file_digests[path] = _digest(blob)
+        return data
+
+    def _write_blob(self, path: Path, blob: bytes) -> None:
+        """Atomically write ``blob`` unless the file already holds it."""
+        self._write_if_changed(path, _digest(blob), lambda: blob)
+
+    def _write_if_changed(
+        self, path: Path, fingerprint: bytes, build: Callable[[], bytes]
+    ) -> None:
+        """Write ``build()`` unless ``fingerprint`` matches the last write.
+
+        Files with encrypted passwords serialize differently on every save
+        (Fernet tokens are salted), so their fingerprint is taken from the
+        plaintext content and ``build`` only runs when it changed.
+        """
+        if self._file_digests.get(path) == fingerprint:
+            return
+        self._commit_write(path, build(), fingerprint)
+
+    def _fsync_data_dir(self) -> None:
+        """Persist the renames of the last flush (one directory sync per flush)."""
+        if os.name != "posix":
+            return  # Directories can't be opened for fsync on Windows
+        try:
+            fd = os.open(self._data_dir, os.O_RDONLY)
+        except OSError as e:
+            logger.debug(f"Cannot open {self._data_dir} for fsync: {e}")
+            return
+        try:
+            os.fsync(fd)
+        except OSError as e:
+            logger.debug(f"fsync of {self._data_dir} failed: {e}")
+        finally:
+            os.close(fd)
+
+    @contextmanager
+    def batch(self) -> Iterator["Storage"]:
+        """Group several modifications into one write per file.
+
+        Example:
+            with storage.batch():
+                for profile in profiles:
+                    storage.update_profile(profile)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+
     def _load_all(self) -> None:
         """Load all data from files."""
         self._load_profiles()
@@ -164,6 +423,7 @@ class Storage:
         self._load_settings()
         self._load_proxy_pool()
         self._load_labels_pool()
+        self._tags_pool_set = set(self._tags_pool)
         self._load_trash()
 
     # === Labels pool (tags/statuses/note templates) ===
@@ -175,7 +435,7 @@ class Storage:
         """
         if self._labels_pool_file.exists():
             try:
-                data = json.loads(self._labels_pool_file.read_text(encoding="utf-8"))
+                data = self._read_json(self._labels_pool_file)
 
                 tags = data.get("tags", [])
                 if isinstance(tags, list):
@@ -206,7 +466,7 @@ class Storage:
                 self._note_templates_pool = templates
 
                 return
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 logger.error("Invalid JSON in labels pool file: %s", e)
                 self._tags_pool = []
                 self._statuses_pool = []
@@ -228,18 +488,21 @@ class Storage:
         """Load legacy tags pool from tags_pool.json (tags-only)."""
         if self._tags_pool_file.exists():
             try:
-                data = json.loads(self._tags_pool_file.read_text(encoding="utf-8"))
+                data = orjson.loads(self._tags_pool_file.read_bytes())
                 tags = data.get("tags", [])
                 if isinstance(tags, list):
                     self._tags_pool = [t for t in tags if isinstance(t, str) and t]
                 else:
                     self._tags_pool = []
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 logger.error("Invalid JSON in tags pool file: %s", e)
                 self._tags_pool = []
 
     def save_labels_pool(self) -> None:
         """Save unified labels pool to labels_pool.json."""
+        self._mark_dirty("labels_pool")
+
+    def _write_labels_pool(self) -> None:
         data = {
             "tags": list(self._tags_pool),
             "statuses": [{"name": n, "color": c} for n, c in self._statuses_pool],
@@ -247,7 +510,7 @@ class Storage:
                 {"name": n, "content": c} for n, c in self._note_templates_pool
             ],
         }
-        self._atomic_write(self._labels_pool_file, json.dumps(data, indent=2))
+        self._write_blob(self._labels_pool_file, _dumps_compact(data))
 
     def _load_profiles(self) -> None:
         """Load profiles from file.
@@ -261,7 +524,7 @@ class Storage:
             return
 
         try:
-            data = json.loads(self._profiles_file.read_text(encoding="utf-8"))
+            data = orjson.loads(self._profiles_file.read_bytes())
             profiles_data = data.get("profiles", [])
 
             if not isinstance(profiles_data, list):
@@ -279,7 +542,7 @@ class Storage:
             self._rebuild_index()
             logger.info(f"Loaded {len(self._profiles)} profiles")
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Invalid JSON in profiles file: {e}")
             raise StorageCorruptedError(f"Profiles file is corrupted: {e}")
         except (KeyError, TypeError) as e:
@@ -293,9 +556,9 @@ class Storage:
         """Load folders from file."""
         if self._folders_file.exists():
             try:
-                data = json.loads(self._folders_file.read_text())
+                data = self._read_json(self._folders_file)
                 self._folders = [Folder.from_dict(f) for f in data.get("folders", [])]
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 logger.error("Invalid JSON in folders file: %s", e)
                 self._folders = []
             except (KeyError, TypeError) as e:
@@ -306,9 +569,9 @@ class Storage:
         """Load settings from file."""
         if self._settings_file.exists():
             try:
-                data = json.loads(self._settings_file.read_text())
+                data = self._read_json(self._settings_file)
                 self._settings = AppSettings.from_dict(data)
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 logger.error("Invalid JSON in settings file: %s", e)
                 self._settings = AppSettings()
             except (KeyError, TypeError) as e:
@@ -319,94 +582,162 @@ class Storage:
         """Load proxy pool from file."""
         if self._proxy_pool_file.exists():
             try:
-                data = json.loads(self._proxy_pool_file.read_text())
-                proxies = []
-                for p in data.get("proxies", []):
-                    # Decrypt password if encrypted
-                    password = p.get("password", "")
-                    if password and p.get("password_encrypted", False):
-                        password = SecurePasswordEncryption.decrypt(password)
-
-                    proxy = ProxyConfig(
-                        enabled=True,
-                        proxy_type=ProxyType(p.get("proxy_type", "http")),
-                        host=p.get("host", ""),
-                        port=p.get("port", 0),
-                        username=p.get("username", ""),
-                        password=password,
-                        country_code=p.get("country_code", ""),
-                        country_name=p.get("country_name", ""),
-                    )
-                    proxies.append(proxy)
-                self._proxy_pool = ProxyPool(proxies=proxies)
-            except json.JSONDecodeError as e:
+                data = orjson.loads(self._proxy_pool_file.read_bytes())
+                # Locals keep global/attribute lookups out of the per-proxy loop
+                decrypt = SecurePasswordEncryption.decrypt
+                proxy_types = _PROXY_TYPES
+                intern = sys.intern
+                self._proxy_pool = ProxyPool(
+                    proxies=[
+                        ProxyConfig(
+                            enabled=True,
+                            proxy_type=proxy_types[p.get("proxy_type", "http")],
+                            host=p.get("host", ""),
+                            port=p.get("port", 0),
+                            username=p.get("username", ""),
+                            # Decrypt password if encrypted
+                            password=(
+                                decrypt(p["password"])
+                                if p.get("password") and p.get("password_encrypted", False)
+                                else p.get("password", "")
+                            ),
+                            country_code=intern(p.get("country_code", "")),
+                            country_name=intern(p.get("country_name", "")),
+                        )
+                        for p in data.get("proxies", [])
+                    ]
+                )
+            except orjson.JSONDecodeError as e:
                 logger.error("Invalid JSON in proxy pool file: %s", e)
                 self._proxy_pool = ProxyPool()
-            except ValueError as e:
+            except (KeyError, ValueError) as e:
                 logger.error("Invalid proxy data: %s", e)
                 self._proxy_pool = ProxyPool()
 
     def save_profiles(self) -> None:
         """Save profiles to file."""
-        data = {"profiles": [p.to_dict() for p in self._profiles]}
-        self._atomic_write(self._profiles_file, json.dumps(data, indent=2, default=str))
         self._rebuild_index()
+        self._mark_dirty("profiles")
+
+    def _write_profiles(self) -> None:
+        profiles = self._profiles
+        plain_dicts = self._plain_dicts
+        plain = []
+        for p in profiles:
+            d = plain_dicts.get(p.id)
+            if d is None:
+                d = plain_dicts[p.id] = p.to_dict(encrypt_password=False)
+            plain.append(d)
+
+        def build() -> bytes:
+            stored_dicts = self._stored_dicts
+            stored = []
+            for p in profiles:
+                d = stored_dicts.get(p.id)
+                if d is None:
+                    d = stored_dicts[p.id] = p.to_dict()
+                stored.append(d)
+            return _dumps_compact({"profiles": stored})
+
+        self._write_if_changed(
+            self._profiles_file, _digest(orjson.dumps(plain, default=str)), build
+        )
+
+    def _forget_profile_dict(self, profile_id: str) -> None:
+        """Drop cached serialized dicts for a changed or removed profile."""
+        self._plain_dicts.pop(profile_id, None)
+        self._stored_dicts.pop(profile_id, None)
 
     def save_folders(self) -> None:
         """Save folders to file."""
+        self._mark_dirty("folders")
+
+    def _write_folders(self) -> None:
         data = {"folders": [f.to_dict() for f in self._folders]}
-        self._atomic_write(self._folders_file, json.dumps(data, indent=2))
+        self._write_blob(self._folders_file, _dumps(data))
 
     def save_settings(self) -> None:
         """Save settings to file."""
-        self._atomic_write(
-            self._settings_file, json.dumps(self._settings.to_dict(), indent=2)
-        )
+        self._mark_dirty("settings")
+
+    def _write_settings(self) -> None:
+        self._write_blob(self._settings_file, _dumps(self._settings.to_dict()))
 
     def save_proxy_pool(self) -> None:
         """Save proxy pool to file with encrypted passwords."""
-        data = {
-            "proxies": [
-                {
-                    "proxy_type": p.proxy_type.value,
-                    "host": p.host,
-                    "port": p.port,
-                    "username": p.username,
-                    "password": (
-                        SecurePasswordEncryption.encrypt(p.password)
-                        if p.password
-                        else ""
-                    ),
-                    "password_encrypted": bool(p.password),
-                    "country_code": p.country_code,
-                    "country_name": p.country_name,
-                }
-                for p in self._proxy_pool.proxies
-            ]
-        }
-        self._atomic_write(self._proxy_pool_file, json.dumps(data, indent=2))
+        self._mark_dirty("proxy_pool")
+
+    def _write_proxy_pool(self) -> None:
+        # Plaintext passwords first (for the fingerprint), encrypted on build
+        rows = [
+            {
+                "proxy_type": p.proxy_type.value,
+                "host": p.host,
+                "port": p.port,
+                "username": p.username,
+                "password": p.password,
+                "password_encrypted": bool(p.password),
+                "country_code": p.country_code,
+                "country_name": p.country_name,
+            }
+            for p in self._proxy_pool.proxies
+        ]
+
+        def build() -> bytes:
+            for row in rows:
+                if row["password"]:
+                    row["password"] = SecurePasswordEncryption.encrypt(row["password"])
+            return _dumps_compact({"proxies": rows})
+
+        self._write_if_changed(self._proxy_pool_file, _digest(orjson.dumps(rows)), build)
 
     # Profiles CRUD
     def get_profiles(
         self, folder_id: str = "", tags: list[str] | None = None, search: str = ""
     ) -> list[BrowserProfile]:
         """Get filtered profiles."""
+        if not (folder_id or tags or search):
+            return self._profiles
+
+        # Table refreshes (status ticks, paging) repeat the same query; the
+        # last result is reused until the next save_profiles()
+        search_lower = search.lower()
+        key = (folder_id, tuple(tags) if tags else (), search_lower)
+        if self._last_query is not None and self._last_query[0] == key:
+            return list(self._last_query[1])
+
         profiles = self._profiles
 
-        # Filter by folder
+        # Narrow by folder via the folder index
         if folder_id:
-            profiles = [p for p in profiles if p.folder_id == folder_id]
+            self._rebuild_folder_index()
+            profiles = self._folder_index.get(folder_id, ())
 
-        # Filter by tags
+        # Tags (any match) via the tag index, search via cached lowercase
+        # names - checked together in a single pass
+        wanted_ids = None
         if tags:
-            profiles = [p for p in profiles if any(t in p.tags for t in tags)]
-
-        # Filter by search
-        if search:
-            search_lower = search.lower()
-            profiles = [p for p in profiles if search_lower in p.name.lower()]
+            self._rebuild_tag_index()
+            tag_index = self._tag_index
+            wanted_ids = set().union(*(tag_index.get(t, ()) for t in tags))
+        names = None
+        if search_lower:
+            self._rebuild_name_index()
+            names = self._name_lower
+
+        if wanted_ids is not None and names is not None:
+            result = [
+                p for p in profiles if p.id in wanted_ids and search_lower in names[p.id]
+            ]
+        elif wanted_ids is not None:
+            result = [p for p in profiles if p.id in wanted_ids]
+        elif names is not None:
+            result = [p for p in profiles if search_lower in names[p.id]]
+        else:
+            result = list(profiles)
 
-        return profiles
+        self._last_query = (key, result)
+        return list(result)
 
     def get_profile(self, profile_id: str) -> BrowserProfile:
         """Get profile by ID with O(1) lookup.
@@ -448,6 +779,7 @@ class Storage:
 
         self._profiles.append(profile)
         self._profile_index[profile.id] = profile
+        self._forget_profile_dict(profile.id)
         self._ensure_tags_in_pool(profile.tags)
         logger.info(f"Added profile: {profile.name} ({profile.id})")
         self.save_profiles()
@@ -467,16 +799,20 @@ class Storage:
             raise ValueError(f"Invalid profile ID format: {profile.id}")
 
         # Check if profile exists
-        if profile.id not in self._profile_index:
+        current = self._profile_index.get(profile.id)
+        if current is None:
             raise ProfileNotFoundError(profile.id)
 
-        for i, p in enumerate(self._profiles):
-            if p.id == profile.id:
-                self._profiles[i] = profile
-                self._profile_index[profile.id] = profile
-                self._ensure_tags_in_pool(profile.tags)
-                logger.info(f"Updated profile: {profile.name} ({profile.id})")
-                break
+        # Callers usually edit the stored instance in place; only a
+        # replacement object needs its list slot located
+        if current is not profile:
+            for i, p in enumerate(self._profiles):
+                if p is current:
+                    self._profiles[i] = profile
+                    break
+        self._forget_profile_dict(profile.id)
+        self._ensure_tags_in_pool(profile.tags)
+        logger.info(f"Updated profile: {profile.name} ({profile.id})")
 
         self.save_profiles()
 
@@ -499,6 +835,11 @@ class Storage:
         if not profile:
             raise ProfileNotFoundError(profile_id)
 
+        with self.batch():
+            self._remove_profile(profile, move_to_trash)
+
+    def _remove_profile(self, profile: BrowserProfile, move_to_trash: bool) -> None:
+        profile_id = profile.id
         if move_to_trash:
             trash_item = {
                 "id": profile.id,
@@ -506,11 +847,14 @@ class Storage:
                 "deleted_at": datetime.now().isoformat(),
                 "profile_data": profile.to_dict(),
             }
-            self._trash.append(trash_item)
-            self._save_trash()
+            # Re-deleting a restored profile moves its entry to the end
+            self._trash.pop(profile.id, None)
+            self._trash[profile.id] = trash_item
+            self._log_trash("add", item=trash_item)
 
-        self._profiles = [p for p in self._profiles if p.id != profile_id]
+        self._profiles = [p for p in self._profiles if p is not profile]
         self._profile_index.pop(profile_id, None)
+        self._forget_profile_dict(profile_id)
         logger.info(f"Deleted profile: {profile.name} ({profile_id})")
         self.save_profiles()
 
@@ -535,15 +879,24 @@ class Storage:
     def delete_folder(self, folder_id: str) -> None:
         """Delete folder and move profiles to root."""
         self._folders = [f for f in self._folders if f.id != folder_id]
-        for p in self._profiles:
-            if p.folder_id == folder_id:
-                p.folder_id = ""
-        self.save_folders()
-        self.save_profiles()
+        self._rebuild_folder_index()
+        affected = self._folder_index.get(folder_id)
+        if not affected:
+            # Empty folder: profiles.json doesn't change
+            self.save_folders()
+            return
+
+        for p in affected:
+            p.folder_id = ""
+            self._forget_profile_dict(p.id)
+        with self.batch():
+            self.save_folders()
+            self.save_profiles()
 
     def get_folder_profile_count(self, folder_id: str) -> int:
         """Get number of profiles in folder."""
-        return len([p for p in self._profiles if p.folder_id == folder_id])
+        self._rebuild_folder_index()
+        return len(self._folder_index.get(folder_id, ()))
 
     # Settings
     def get_settings(self) -> AppSettings:
@@ -570,6 +923,14 @@ class Storage:
         self._proxy_pool.add_proxy(proxy)
         self.save_proxy_pool()
 
+    def add_proxies_to_pool(self, proxies: Iterable[ProxyConfig]) -> None:
+        """Add several proxies to pool with a single save (bulk import)."""
+        count = len(self._proxy_pool.proxies)
+        for proxy in proxies:
+            self._proxy_pool.add_proxy(proxy)
+        if len(self._proxy_pool.proxies) != count:
+            self.save_proxy_pool()
+
     def get_next_proxy(self) -> ProxyConfig | None:
         """Get next proxy from pool."""
         return self._proxy_pool.next_proxy()
@@ -594,7 +955,8 @@ class Storage:
             normalized = tag.strip()
             if not normalized:
                 continue
-            if normalized not in self._tags_pool:
+            if normalized not in self._tags_pool_set:
+                self._tags_pool_set.add(normalized)
                 self._tags_pool.append(normalized)
                 changed = True
         if changed:
@@ -609,17 +971,24 @@ class Storage:
         if tag:
             self._ensure_tags_in_pool([tag])
 
+    def add_tags_to_pool(self, tags: Iterable[str]) -> None:
+        """Add several tags to pool with a single save (bulk import)."""
+        self._ensure_tags_in_pool(list(tags))
+
     def remove_tag_from_pool(self, tag: str) -> None:
         """Remove tag from pool."""
-        if tag in self._tags_pool:
+        if tag in self._tags_pool_set:
+            self._tags_pool_set.discard(tag)
             self._tags_pool.remove(tag)
             self.save_labels_pool()
 
     def rename_tag_in_pool(self, old_name: str, new_name: str) -> None:
         """Rename tag in pool."""
-        if old_name in self._tags_pool and new_name:
+        if old_name in self._tags_pool_set and new_name:
             idx = self._tags_pool.index(old_name)
             self._tags_pool[idx] = new_name
+            self._tags_pool_set.discard(old_name)
+            self._tags_pool_set.add(new_name)
             self.save_labels_pool()
 
     def get_all_tags(self) -> list[str]:
@@ -629,9 +998,7 @@ class Storage:
         """
         self._rebuild_tag_index()  # Only rebuilds if dirty
         # Combine pool tags + tags from index (all tags actually in use)
-        tags = set(self._tags_pool)
-        tags.update(self._tag_index.keys())
-        return sorted(list(tags))
+        return sorted(self._tags_pool_set.union(self._tag_index))
 
     def get_tag_counts(self) -> dict[str, int]:
         """Get tag usage counts across all profiles.
@@ -719,50 +1086,191 @@ class Storage:
             self.save_labels_pool()
 
     # Trash
+    #
+    # trash.json is a snapshot; mutations are appended to trash.log as one
+    # JSON event per line ({"op": "add"|"del"|"clear", ...}) and replayed on
+    # load. Replaying the log over a snapshot that already contains it gives
+    # the same trash, so a crash during compaction is harmless.
+
+    # Compact once the log outgrows the snapshot by this factor
+    _TRASH_LOG_COMPACT_RATIO = 4
+    _TRASH_LOG_MIN_COMPACT = 64 * 1024
+
     def _load_trash(self) -> None:
-        """Load trash from file."""
+        """Load trash snapshot and replay the trash log."""
         if self._trash_file.exists():
             try:
-                data = json.loads(self._trash_file.read_text())
-                self._trash = data.get("items", [])
-            except json.JSONDecodeError as e:
+                blob = self._trash_file.read_bytes()
+                data = orjson.loads(blob)
+                self._trash = {
+                    item["id"]: item
+                    for item in data.get("items", [])
+                    if isinstance(item, dict) and "id" in item
+                }
+                self._trash_snapshot_size = len(blob)
+            except orjson.JSONDecodeError as e:
                 logger.error("Invalid JSON in trash file: %s", e)
-                self._trash = []
+                self._trash = {}
 
-    def _save_trash(self) -> None:
-        """Save trash to file."""
-        data = {"items": self._trash}
-        self._atomic_write(self._trash_file, json.dumps(data, indent=2))
+        if self._trash_log_file.exists():
+            try:
+                log = self._trash_log_file.read_bytes()
+            except OSError as e:
+                logger.error("Cannot read trash log: %s", e)
+                return
+            offset = 0
+            for line in log.splitlines(keepends=True):
+                try:
+                    if not line.endswith(b"\n"):
+                        raise orjson.JSONDecodeError("Missing newline", "", 0)
+                    event = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    # Torn final append from a crash: cut it off so later
+                    # appends don't land behind a broken line
+                    logger.warning("Dropping incomplete trash log entry")
+                    try:
+                        os.truncate(self._trash_log_file, offset)
+                    except OSError as e:
+                        logger.error("Cannot truncate trash log: %s", e)
+                    break
+                self._apply_trash_event(event)
+                offset += len(line)
+            self._trash_log_size = offset
+
+    def _apply_trash_event(self, event: dict) -> None:
+        """Apply one trash log event to the in-memory trash."""
+        op = event.get("op")
+        if op == "add":
+            item = event.get("item")
+            if isinstance(item, dict) and "id" in item:
+                # Re-deleting a restored profile moves its entry to the end
+                self._trash.pop(item["id"], None)
+                self._trash[item["id"]] = item
+        elif op == "del":
+            self._trash.pop(event.get("id"), None)
+        elif op == "clear":
+            self._trash.clear()
+
+    def _log_trash(self, op: str, item: dict | None = None, profile_id: str = "") -> None:
+        """Record a trash mutation; appended to trash.log on flush."""
+        if op == "add":
+            item_blob = orjson.dumps(item, default=str)
+            self._trash_blobs[item["id"]] = (item, item_blob)
+            # Deleted again before the restore was written: drop the restore
+            self._trash_restores_pending.pop(item["id"], None)
+            line = b'{"op":"add","item":' + item_blob + b"}\n"
+        elif op == "del":
+            line = orjson.dumps({"op": "del", "id": profile_id}) + b"\n"
+        else:
+            line = orjson.dumps({"op": op}) + b"\n"
+        self._trash_log_pending.append(line)
+        self._mark_dirty("trash")
+
+    def _log_trash_restore(self, profile_id: str) -> None:
+        """Record a restore; appended to trash.log after profiles.json."""
+        line = orjson.dumps({"op": "del", "id": profile_id}) + b"\n"
+        self._trash_restores_pending[profile_id] = line
+        self._mark_dirty("trash_restores")
+
+    def _write_trash(self) -> None:
+        pending = self._trash_log_pending
+        if not pending:
+            return
+        # No compaction while restores are pending: the snapshot would
+        # already lack the restored profiles
+        self._append_trash_log(b"".join(pending), compact=not self._trash_restores_pending)
+        self._trash_log_pending = []
+
+    def _write_trash_restores(self) -> None:
+        pending = self._trash_restores_pending
+        if not pending:
+            return
+        # The restored profiles must be on disk (rename included) before the
+        # trash forgets them; the I/O thread syncs the directory itself
+        if self._io_pool is None:
+            self._fsync_data_dir()
+        else:
+            self.wait_for_writes()
+        self._append_trash_log(b"".join(pending.values()), compact=True)
+        self._trash_restores_pending = {}
+
+    def _append_trash_log(self, chunk: bytes, compact: bool) -> None:
+        """Append events to trash.log, or compact if the log grew too big."""
+        threshold = max(
+            self._trash_snapshot_size * self._TRASH_LOG_COMPACT_RATIO,
+            self._TRASH_LOG_MIN_COMPACT,
+        )
+        if compact and self._trash_log_size + len(chunk) > threshold:
+            self._compact_trash()
+        else:
+            try:
+                created = self._trash_log_size == 0
+                with open(self._trash_log_file, "ab") as f:
+                    f.write(chunk)
+                    f.flush()
+                    os.fsync(f.fileno())
+            except OSError as e:
+                raise StorageError(f"Failed to append to {self._trash_log_file}: {e}")
+            if created:
+                self._fsync_data_dir()  # Persist the new log's directory entry
+            self._trash_log_size += len(chunk)
+
+    def _compact_trash(self) -> None:
+        """Write a fresh trash.json snapshot and drop the log.
+
+        Written synchronously (even with background_io): the log may only
+        go once the snapshot holding its events is on disk.
+        """
+        cached = self._trash_blobs
+        blobs: dict[str, tuple[dict, bytes]] = {}
+        for profile_id, item in self._trash.items():
+            entry = cached.get(profile_id)
+            if entry is None or entry[0] is not item:
+                entry = (item, orjson.dumps(item, default=str))
+            blobs[profile_id] = entry
+        self._trash_blobs = blobs  # Drops entries of removed items
+
+        # Stitch the pre-encoded items into {"items": [...]}
+        blob = b'{"items":[' + b",".join(entry[1] for entry in blobs.values()) + b"]}"
+        self._atomic_write(self._trash_file, blob)
+        self._write_count += 1
+        self._trash_snapshot_size = len(blob)
+        try:
+            self._trash_log_file.unlink(missing_ok=True)
+        except OSError as e:
+            # Replaying the stale log over the new snapshot is harmless
+            logger.warning("Failed to remove trash log: %s", e)
+        self._trash_log_size = 0
 
     def get_trash(self) -> list[dict]:
         """Get all trashed profiles."""
-        return list(self._trash)
+        return list(self._trash.values())
 
     def restore_from_trash(self, profile_id: str) -> bool:
         """Restore profile from trash."""
-        for item in self._trash:
-            if item["id"] == profile_id:
-                profile = BrowserProfile.from_dict(item["profile_data"])
-                self._profiles.append(profile)
-                self._trash.remove(item)
-                self.save_profiles()
-                self._save_trash()
-                return True
-        return False
+        item = self._trash.get(profile_id)
+        if item is None:
+            return False
+        profile = BrowserProfile.from_dict(item["profile_data"])
+        self._profiles.append(profile)
+        self._forget_profile_dict(profile.id)
+        del self._trash[profile_id]
+        with self.batch():
+            self.save_profiles()
+            self._log_trash_restore(profile_id)
+        return True
 
     def permanently_delete(self, profile_id: str) -> bool:
         """Permanently delete profile from trash."""
-        for item in self._trash:
-            if item["id"] == profile_id:
-                self._trash.remove(item)
-                self._save_trash()
-                return True
-        return False
+        if self._trash.pop(profile_id, None) is None:
+            return False
+        self._log_trash("del", profile_id=profile_id)
+        return True
 
     def empty_trash(self) -> None:
         """Empty all items from trash."""
         self._trash.clear()
-        self._save_trash()
+        self._log_trash("clear")
 
     # Profile data directory
     def get_profile_data_dir(self, profile_id: str) -> Path:
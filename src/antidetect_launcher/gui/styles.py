@@ -4,6 +4,8 @@ DEPRECATED: This module is deprecated. Use theme.py instead.
 This file is kept for backward compatibility only.
 """
 
+import functools
+
 # Import from unified theme system
 from .theme import COLORS as _COLORS, Theme
 
@@ -47,22 +49,26 @@ OS_ICONS = {
 }
 
 
+# Regional Indicator Symbol base: 🇦 = U+1F1E6
+# Each letter A-Z maps to U+1F1E6 through U+1F1FF
+_FLAG_OFFSET = 0x1F1E6 - ord("A")
+
+
+@functools.lru_cache(maxsize=512)
 def get_country_flag(country_code: str) -> str:
     """Get flag emoji for ISO 3166-1 alpha-2 country code.
 
     Converts country code to Unicode Regional Indicator Symbols.
     Example: "US" -> 🇺🇸, "DE" -> 🇩🇪
 
-    Works for all 249 ISO 3166-1 alpha-2 codes.
+    Works for all 249 ISO 3166-1 alpha-2 codes. Memoized - called per
+    proxy row on every list refresh.
     """
     if not country_code or len(country_code) != 2:
         return "🌐"
     code = country_code.upper()
-    # Regional Indicator Symbol base: 🇦 = U+1F1E6
-    # Each letter A-Z maps to U+1F1E6 through U+1F1FF
     try:
-        flag = "".join(chr(0x1F1E6 + ord(c) - ord("A")) for c in code)
-        return flag
+        return chr(_FLAG_OFFSET + ord(code[0])) + chr(_FLAG_OFFSET + ord(code[1]))
     except (ValueError, TypeError):
         return "🌐"
 
@@ -4,62 +4,95 @@ from __future__ import annotations
 
 from typing import Any
 
-from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt, pyqtSignal
+
+# Plain-int roles for dict dispatch in data() (hash-equal to the enum members)
+_DISPLAY_ROLE = int(Qt.ItemDataRole.DisplayRole)
+_ALIGNMENT_ROLE = int(Qt.ItemDataRole.TextAlignmentRole)
+_USER_ROLE = int(Qt.ItemDataRole.UserRole)
 
 
 class SimpleTableModel(QAbstractTableModel):
-    """Lightweight table model for simple row data."""
+    """Lightweight table model for simple row data.
+
+    Cells are stored column-major and stringified once in set_rows(), so
+    data() - called for every visible cell on each repaint - is a plain
+    double index with no per-call conversion.
+    """
 
     def __init__(self, headers: list[str], parent=None):
         super().__init__(parent)
         self._headers = list(headers)
-        self._rows: list[list[Any]] = []
+        self._columns: list[list[str]] = [[] for _ in self._headers]
+        self._row_count = 0
         self._payloads: list[Any] = []
-        self._alignments: dict[int, Qt.AlignmentFlag] = {}
+        self._alignments: list[Qt.AlignmentFlag | None] = [None] * len(self._headers)
 
     def set_rows(self, rows: list[list[Any]], payloads: list[Any] | None = None) -> None:
         """Replace table rows."""
         self.beginResetModel()
-        self._rows = list(rows)
+        rows = list(rows)
+        if rows:
+            # Pad/trim ragged rows to the header width: short rows show
+            # empty cells instead of zip() dropping columns for every row
+            width = len(self._headers)
+            padded = [
+                row if len(row) == width else (list(row) + [None] * width)[:width]
+                for row in rows
+            ]
+            self._columns = [
+                ["" if value is None else str(value) for value in column]
+                for column in zip(*padded, strict=True)
+            ]
+        else:
+            self._columns = [[] for _ in self._headers]
+        self._row_count = len(rows)
         if payloads is None:
-            self._payloads = [None for _ in self._rows]
+            self._payloads = [None] * self._row_count
         else:
             self._payloads = list(payloads)
         self.endResetModel()
 
     def set_alignments(self, alignments: dict[int, Qt.AlignmentFlag]) -> None:
         """Set per-column text alignments."""
-        self._alignments = dict(alignments)
+        self._alignments = [alignments.get(col) for col in range(len(self._headers))]
 
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
         if parent.isValid():
             return 0
-        return len(self._rows)
+        return self._row_count
 
     def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
         if parent.isValid():
             return 0
         return len(self._headers)
 
+    def _display(self, row: int, col: int) -> str:
+        return self._columns[col][row]
+
+    def _alignment(self, _row: int, col: int) -> Qt.AlignmentFlag | None:
+        return self._alignments[col]
+
+    def _payload(self, row: int, _col: int) -> Any:
+        return self._payloads[row] if row < len(self._payloads) else None
+
+    # Qt queries many roles per cell (font, colors, decoration, ...); most
+    # miss, so one dict lookup beats walking an if-chain
+    _ROLE_HANDLERS = {
+        _DISPLAY_ROLE: _display,
+        _ALIGNMENT_ROLE: _alignment,
+        _USER_ROLE: _payload,
+    }
+
     def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
-        if not index.isValid():
+        handler = self._ROLE_HANDLERS.get(role)
+        if handler is None or not index.isValid():
             return None
         row = index.row()
         col = index.column()
-        if row >= len(self._rows) or col >= len(self._headers):
+        if row >= self._row_count or col >= len(self._columns):
             return None
-
-        if role == Qt.ItemDataRole.DisplayRole:
-            value = self._rows[row][col]
-            if value is None:
-                return ""
-            return str(value)
-        if role == Qt.ItemDataRole.TextAlignmentRole:
-            if col in self._alignments:
-                return self._alignments[col]
-        if role == Qt.ItemDataRole.UserRole:
-            return self._payloads[row] if row < len(self._payloads) else None
-        return None
+        return handler(self, row, col)
 
     def headerData(
         self,
@@ -79,3 +112,160 @@ class SimpleTableModel(QAbstractTableModel):
         if 0 <= row < len(self._payloads):
             return self._payloads[row]
         return None
+
+
+class TrashTableModel(QAbstractTableModel):
+    """Trash table model: checkbox / name / deleted-at / actions columns.
+
+    Holds the trash list by reference and keeps row check state in a set,
+    so the view only materializes the visible cells - no per-row widgets.
+    """
+
+    HEADERS = ("", "Name", "Deleted At", "Actions")
+    CHECK_COLUMN = 0
+    ACTIONS_COLUMN = 3
+
+    checked_changed = pyqtSignal(int)  # Number of checked rows
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._profiles: list[dict] = []
+        self._deleted_display: list[str] = []  # Pre-formatted "Deleted At" cells
+        self._checked: set[int] = set()
+
+    @staticmethod
+    def _format_deleted_at(profile: dict) -> str:
+        deleted_at = profile.get("deleted_at", "")
+        return str(deleted_at)[:19] if deleted_at else "—"
+
+    def set_profiles(self, profiles: list[dict]) -> None:
+        """Replace trash rows (kept by reference) and clear check state.
+
+        Rows are reused rather than reset: only the tail is inserted or
+        removed, and persisting rows get a single dataChanged.
+        """
+        old_count = len(self._profiles)
+        new_count = len(profiles)
+        self._checked.clear()
+        # Formatted once here rather than on every paint of the cell
+        display = [self._format_deleted_at(p) for p in profiles]
+
+        if new_count < old_count:
+            self.beginRemoveRows(QModelIndex(), new_count, old_count - 1)
+            self._profiles = profiles
+            self._deleted_display = display
+            self.endRemoveRows()
+        elif new_count > old_count:
+            self.beginInsertRows(QModelIndex(), old_count, new_count - 1)
+            self._profiles = profiles
+            self._deleted_display = display
+            self.endInsertRows()
+        else:
+            self._profiles = profiles
+            self._deleted_display = display
+
+        common = min(old_count, new_count)
+        if common:
+            self.dataChanged.emit(
+                self.index(0, 0), self.index(common - 1, len(self.HEADERS) - 1)
+            )
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._profiles)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self.HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        col = index.column()
+        if row >= len(self._profiles):
+            return None
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            profile = self._profiles[row]
+            if col == 1:
+                return profile.get("name", "Unknown")
+            if col == 2:
+                return self._deleted_display[row]
+            return None
+        if role == Qt.ItemDataRole.CheckStateRole and col == self.CHECK_COLUMN:
+            if row in self._checked:
+                return Qt.CheckState.Checked
+            return Qt.CheckState.Unchecked
+        if role == Qt.ItemDataRole.TextAlignmentRole and col == 2:
+            return Qt.AlignmentFlag.AlignCenter
+        if role == Qt.ItemDataRole.UserRole:
+            return self._profiles[row].get("id")
+        return None
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if (
+            not index.isValid()
+            or index.column() != self.CHECK_COLUMN
+            or role != Qt.ItemDataRole.CheckStateRole
+        ):
+            return False
+        row = index.row()
+        if Qt.CheckState(value) == Qt.CheckState.Checked:
+            self._checked.add(row)
+        else:
+            self._checked.discard(row)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+        self.checked_changed.emit(len(self._checked))
+        return True
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() == self.CHECK_COLUMN:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        return flags
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            if 0 <= section < len(self.HEADERS):
+                return self.HEADERS[section]
+        return None
+
+    def set_all_checked(self, checked: bool) -> None:
+        """Check or uncheck every row.
+
+        Emits one dataChanged spanning only the rows whose state flipped,
+        and nothing at all when every row is already in that state.
+        """
+        new_checked = set(range(len(self._profiles))) if checked else set()
+        changed = new_checked ^ self._checked
+        if not changed:
+            return
+        self._checked = new_checked
+        self.dataChanged.emit(
+            self.index(min(changed), self.CHECK_COLUMN),
+            self.index(max(changed), self.CHECK_COLUMN),
+            [Qt.ItemDataRole.CheckStateRole],
+        )
+        self.checked_changed.emit(len(self._checked))
+
+    def checked_rows(self) -> set[int]:
+        """Rows currently checked."""
+        return self._checked
+
+    def profile_id_at(self, row: int) -> str | None:
+        """Return profile ID for a row."""
+        if 0 <= row < len(self._profiles):
+            return self._profiles[row].get("id")
+        return None
@@ -1,5 +1,6 @@
 """Unified theme system for consistent UI/UX."""
 
+import functools
 from dataclasses import dataclass
 from typing import ClassVar
 
@@ -300,610 +301,620 @@ class Theme:
 
     @classmethod
     def get_stylesheet(cls) -> str:
-        """Generate complete application stylesheet."""
-        c = cls.colors
-        t = cls.typography
-        s = cls.spacing
-        r = cls.radius
-
-        down_arrow_svg = (
-            "data:image/svg+xml;utf8,"
-            "<svg xmlns='http://www.w3.org/2000/svg' width='12' height='12' viewBox='0 0 24 24'>"
-            f"<path fill='{c.text_secondary.replace('#', '%23')}' d='M7 10l5 5 5-5z'/>"
-            "</svg>"
-        )
+        """Generate complete application stylesheet.
 
-        return f"""
-        /* === BASE STYLES === */
-        QMainWindow {{
-            background-color: {c.bg_primary};
-        }}
-
-        QWidget {{
-            background-color: transparent;
-            color: {c.text_primary};
-            font-family: {t.font_family};
-            font-size: {t.font_size_base}px;
-        }}
-
-        /* === BUTTONS === */
-        QPushButton {{
-            background-color: {c.bg_tertiary};
-            color: {c.text_primary};
-            border: 1px solid {c.border};
-            border-radius: {r.sm}px;
-            padding: {s.sm}px {s.lg}px;
-            font-family: {t.font_family};
-            font-size: {t.font_size_base}px;
-            font-weight: 500;
-        }}
-
-        QPushButton:hover {{
-            background-color: {c.bg_hover};
-            border-color: {c.border_light};
-        }}
-
-        QPushButton:pressed {{
-            background-color: {c.bg_selected};
-        }}
-
-        QPushButton:disabled {{
-            background-color: {c.bg_secondary};
-            color: {c.text_muted};
-        }}
-
-        QPushButton[class="primary"] {{
-            background-color: {c.accent};
-            border-color: {c.accent};
-            color: white;
-        }}
-
-        QPushButton[class="primary"]:hover {{
-            background-color: {c.accent_hover};
-        }}
-
-        QPushButton[class="success"] {{
-            background-color: {c.success};
-            border-color: {c.success};
-            color: white;
-        }}
-
-        QPushButton[class="success"]:hover {{
-            background-color: #16a34a;
-        }}
-
-        QPushButton[class="danger"] {{
-            background-color: {c.error};
-            border-color: {c.error};
-            color: white;
-        }}
-
-        QPushButton[class="danger"]:hover {{
-            background-color: #dc2626;
-        }}
-
-        QPushButton[class="ghost"] {{
-            background-color: transparent;
-            border: none;
-        }}
-
-        QPushButton[class="ghost"]:hover {{
-            background-color: {c.bg_hover};
-        }}
-
-        QPushButton[class="icon"] {{
-            padding: 2px;
-            min-width: 24px;
-            max-width: 24px;
-            min-height: 24px;
-            max-height: 24px;
-            border: 1px solid {c.border};
-            background-color: {c.bg_secondary};
-            border-radius: 4px;
-        }}
-
-        QPushButton[class="icon"]:hover {{
-            background-color: {c.bg_hover};
-            border-color: {c.border_light};
-        }}
-
-        QPushButton[class="icon"]:pressed {{
-            background-color: {c.accent};
-            border-color: {c.accent};
-        }}
-
-        /* === INPUTS === */
-        QLineEdit {{
-            background-color: {c.bg_tertiary};
-            color: {c.text_primary};
-            border: 1px solid {c.border};
-            border-radius: {r.sm}px;
-            padding: {s.sm}px {s.md}px;
-            font-family: {t.font_family};
-            font-size: {t.font_size_base}px;
-            selection-background-color: {c.accent};
-        }}
-
-        QLineEdit:focus {{
-            border-color: {c.accent};
-        }}
-
-        QLineEdit[error="true"] {{
-            border-color: {c.error};
-        }}
-
-        QLineEdit:disabled {{
-            background-color: {c.bg_secondary};
-            color: {c.text_muted};
-        }}
-
-        QTextEdit {{
-            background-color: {c.bg_tertiary};
-            color: {c.text_primary};
-            border: 1px solid {c.border};
-            border-radius: {r.sm}px;
-            padding: {s.sm}px;
-            font-family: {t.font_family};
-            font-size: {t.font_size_base}px;
-            selection-background-color: {c.accent};
-        }}
-
-        QTextEdit:focus {{
-            border-color: {c.accent};
-        }}
-
-        QTextEdit[error="true"] {{
-            border-color: {c.error};
-        }}
-
-        /* === COMBOBOX === */
-        QComboBox {{
-            background-color: {c.bg_tertiary};
-            color: {c.text_primary};
-            border: 1px solid {c.border};
-            border-radius: {r.sm}px;
-            padding: {s.sm}px {s.md}px;
-            font-family: {t.font_family};
-            font-size: {t.font_size_base}px;
-            min-width: 80px;
-        }}
-
-        QComboBox:hover {{
-            border-color: {c.border_light};
-        }}
-
-        QComboBox:focus {{
-            border-color: {c.accent};
-        }}
-
-        QComboBox::drop-down {{
-            subcontrol-origin: padding;
-            subcontrol-position: top right;
-            width: 28px;
-            border-left: 1px solid {c.border};
-            background: {c.bg_secondary};
-        }}
-
-        QComboBox::drop-down:hover {{
-            background: {c.bg_hover};
-        }}
-
-        QComboBox::down-arrow {{
-            image: url("{down_arrow_svg}");
-            width: 12px;
-            height: 12px;
-        }}
-
-        QComboBox QAbstractItemView {{
-            background-color: {c.bg_tertiary};
-            border: 1px solid {c.border};
-            border-radius: {r.sm}px;
-            selection-background-color: {c.accent};
-            font-family: {t.font_family};
-        }}
-
-        /* === INLINE ALERT === */
-        QFrame#inlineAlert {{
-            background-color: {c.bg_secondary};
-            border: 1px solid {c.error};
-            border-radius: {r.sm}px;
-        }}
-
-        QLabel#inlineAlertTitle {{
-            color: {c.error};
-            font-weight: 700;
-        }}
-
-        QLabel#inlineAlertMessage {{
-            color: {c.error};
-        }}
-
-        /* === SPINBOX === */
-        QSpinBox {{
-            background-color: {c.bg_tertiary};
-            color: {c.text_primary};
-            border: 1px solid {c.border};
-            border-radius: {r.sm}px;
-            padding: {s.sm}px {s.md}px;
-            font-family: {t.font_family};
-            font-size: {t.font_size_base}px;
-        }}
-
-        QSpinBox:focus {{
-            border-color: {c.accent};
-        }}
-
-        /* === TABLE === */
-        QTableWidget {{
-            background-color: {c.bg_secondary};
-            alternate-background-color: {c.bg_tertiary};
-            border: 1px solid {c.border};
-            border-radius: {r.sm}px;
-            gridline-color: transparent;
-            font-family: {t.font_family};
-            font-size: {t.font_size_base}px;
-            outline: none;
-        }}
-
-        QTableWidget::item {{
-            padding: {s.sm}px {s.md}px;
-            border: none;
-            border-bottom: 1px solid {c.border};
-        }}
-
-        QTableWidget::item:selected {{
-            background-color: {c.bg_selected};
-            color: {c.text_primary};
-        }}
-
-        QTableWidget::item:hover:!selected {{
-            background-color: {c.bg_hover};
-        }}
-
-        QTableWidget::item:focus {{
-            outline: none;
-            border: none;
-        }}
-
-        QHeaderView {{
-            background-color: transparent;
-        }}
-
-        QHeaderView::section {{
-            background-color: {c.bg_tertiary};
-            color: {c.text_secondary};
-            border: none;
-            border-bottom: 1px solid {c.border};
-            border-right: 1px solid {c.border};
-            padding: {s.md}px {s.md}px;
-            font-family: {t.font_family};
-            font-size: {t.font_size_sm}px;
-            font-weight: 600;
-            text-transform: uppercase;
-        }}
-
-        QHeaderView::section:last {{
-            border-right: none;
-        }}
-
-        QHeaderView::section:first {{
-            border-top-left-radius: {r.sm}px;
-        }}
-
-        QHeaderView::section:only-one {{
-            border-top-left-radius: {r.sm}px;
-            border-top-right-radius: {r.sm}px;
-        }}
-
-        /* Table corner button */
-        QTableCornerButton::section {{
-            background-color: {c.bg_tertiary};
-            border: none;
-            border-bottom: 1px solid {c.border};
-        }}
-
-        /* Scrollbar inside table */
-        QTableWidget QScrollBar:vertical {{
-            background-color: {c.bg_secondary};
-            width: 8px;
-            border-radius: 4px;
-            margin: 0;
-        }}
-
-        QTableWidget QScrollBar::handle:vertical {{
-            background-color: {c.border_light};
-            border-radius: 4px;
-            min-height: 30px;
-        }}
-
-        QTableWidget QScrollBar::handle:vertical:hover {{
-            background-color: {c.text_muted};
-        }}
-
-        QTableWidget QScrollBar::add-line:vertical,
-        QTableWidget QScrollBar::sub-line:vertical {{
-            height: 0;
-        }}
-
-        /* === CARDS / PANELS === */
-        QFrame[class="card"] {{
-            background-color: {c.bg_secondary};
-            border: 1px solid {c.border};
-            border-radius: {r.sm}px;
-            padding: {s.lg}px;
-        }}
-
-        QFrame[class="panel"] {{
-            background-color: {c.bg_tertiary};
-            border: 1px solid {c.border};
-            border-radius: {r.sm}px;
-            padding: {s.md}px;
-        }}
-
-        QFrame#addProxyFrame {{
-            background-color: {c.bg_secondary};
-            border: 1px solid {c.border};
-            border-radius: {r.sm}px;
-        }}
-
-        /* === LABELS === */
-        QLabel {{
-            color: {c.text_primary};
-            font-family: {t.font_family};
-            font-size: {t.font_size_base}px;
-        }}
-
-        QLabel[class="heading"] {{
-            font-size: {t.font_size_xl}px;
-            font-weight: 600;
-        }}
-
-        QLabel[class="subheading"] {{
-            font-size: {t.font_size_lg}px;
-            font-weight: 500;
-        }}
-
-        QLabel[class="muted"] {{
-            color: {c.text_muted};
-            font-size: {t.font_size_sm}px;
-        }}
-
-        QLabel[class="secondary"] {{
-            color: {c.text_secondary};
-        }}
-
-        /* === STATUS BADGES === */
-        QLabel[class="badge"] {{
-            border-radius: {r.sm}px;
-            padding: {s.xs}px {s.sm}px;
-            font-size: {t.font_size_sm}px;
-            font-weight: 600;
-        }}
-
-        QLabel[class="badge-success"] {{
-            background-color: {c.success};
-            color: white;
-            border-radius: {r.sm}px;
-            padding: {s.xs}px {s.sm}px;
-            font-size: {t.font_size_sm}px;
-            font-weight: 600;
-        }}
-
-        QLabel[class="badge-error"] {{
-            background-color: {c.error};
-            color: white;
-            border-radius: {r.sm}px;
-            padding: {s.xs}px {s.sm}px;
-            font-size: {t.font_size_sm}px;
-            font-weight: 600;
-        }}
-
-        QLabel[class="badge-muted"] {{
-            background-color: {c.text_muted};
-            color: white;
-            border-radius: {r.sm}px;
-            padding: {s.xs}px {s.sm}px;
-            font-size: {t.font_size_sm}px;
-            font-weight: 600;
-        }}
-
-        /* === TAGS === */
-        QLabel[class="tag"] {{
-            background-color: {c.tag_bg};
-            color: {c.tag_text};
-            border-radius: {r.sm}px;
-            padding: 2px {s.sm}px;
-            font-size: {t.font_size_sm}px;
-        }}
-
-        /* === SCROLLBAR === */
-        QScrollBar:vertical {{
-            background-color: {c.bg_primary};
-            width: 8px;
-            border-radius: {r.sm}px;
-        }}
-
-        QScrollBar::handle:vertical {{
-            background-color: {c.border_light};
-            border-radius: {r.sm}px;
-            min-height: 40px;
-        }}
-
-        QScrollBar::handle:vertical:hover {{
-            background-color: {c.text_muted};
-        }}
-
-        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-            height: 0;
-        }}
-
-        QScrollBar:horizontal {{
-            background-color: {c.bg_primary};
-            height: 8px;
-            border-radius: {r.sm}px;
-        }}
-
-        QScrollBar::handle:horizontal {{
-            background-color: {c.border_light};
-            border-radius: {r.sm}px;
-            min-width: 40px;
-        }}
-
-        QScrollBar::handle:horizontal:hover {{
-            background-color: {c.text_muted};
-        }}
-
-        QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
-            width: 0;
-        }}
-
-        /* === CHECKBOX === */
-        QCheckBox {{
-            color: {c.text_primary};
-            font-family: {t.font_family};
-            font-size: {t.font_size_base}px;
-            spacing: {s.sm}px;
-        }}
-
-        QCheckBox::indicator {{
-            width: 18px;
-            height: 18px;
-            border-radius: {r.sm}px;
-            border: 1px solid {c.border};
-            background-color: {c.bg_tertiary};
-        }}
-
-        QCheckBox::indicator:checked {{
-            background-color: {c.accent};
-            border-color: {c.accent};
-        }}
-
-        QCheckBox::indicator:hover {{
-            border-color: {c.border_light};
-        }}
-
-        /* === GROUPBOX === */
-        QGroupBox {{
-            border: 1px solid {c.border};
-            border-radius: {r.sm}px;
-            margin-top: {s.md}px;
-            padding-top: {s.md}px;
-            font-family: {t.font_family};
-        }}
-
-        QGroupBox::title {{
-            color: {c.text_secondary};
-            subcontrol-origin: margin;
-            subcontrol-position: top left;
-            left: {s.md}px;
-            padding: 0 {s.xs}px;
-        }}
-
-        /* === MENU === */
-        QMenu {{
-            background-color: {c.bg_tertiary};
-            border: 1px solid {c.border};
-            border-radius: {r.lg}px;
-            padding: {s.xs}px;
-            font-family: {t.font_family};
-        }}
-
-        QMenu::item {{
-            padding: {s.sm}px {s.xl}px;
-            border-radius: {r.md}px;
-        }}
-
-        QMenu::item:selected {{
-            background-color: {c.accent};
-        }}
-
-        QMenu::separator {{
-            height: 1px;
-            background-color: {c.border};
-            margin: {s.xs}px {s.sm}px;
-        }}
-
-        /* === DIALOG === */
-        QDialog {{
-            background-color: {c.bg_tertiary};
-            border-radius: {r.lg}px;
-        }}
-
-        /* === TOOLTIP === */
-        QToolTip {{
-            background-color: {c.bg_tertiary};
-            color: {c.text_primary};
-            border: 1px solid {c.border};
-            border-radius: {r.sm}px;
-            padding: {s.xs}px {s.sm}px;
-            font-family: {t.font_family};
-            font-size: {t.font_size_sm}px;
-        }}
-
-        /* === SIDEBAR === */
-        #sidebar {{
-            background-color: {c.bg_secondary};
-            border-right: 1px solid {c.border};
-        }}
-
-        #miniSidebar {{
-            background-color: {c.bg_tertiary};
-            border-right: 1px solid {c.border};
-        }}
-
-        /* === HEADER === */
-        #header {{
-            background-color: {c.bg_tertiary};
-            border-bottom: 1px solid {c.border};
-        }}
-
-        /* === FOOTER === */
-        #footer {{
-            background-color: {c.bg_secondary};
-            border-top: 1px solid {c.border};
-        }}
-
-        /* === SPLITTER === */
-        QSplitter::handle {{
-            background-color: {c.border};
-        }}
-
-        QSplitter::handle:horizontal {{
-            width: 1px;
-        }}
-
-        QSplitter::handle:vertical {{
-            height: 1px;
-        }}
-
-        /* === TAB WIDGET === */
-        QTabWidget::pane {{
-            border: 1px solid {c.border};
-            border-radius: {r.sm}px;
-            background-color: {c.bg_tertiary};
-        }}
-
-        QTabBar::tab {{
-            background-color: {c.bg_secondary};
-            color: {c.text_secondary};
-            border: 1px solid {c.border};
-            border-bottom: none;
-            border-top-left-radius: {r.sm}px;
-            border-top-right-radius: {r.sm}px;
-            padding: {s.sm}px {s.lg}px;
-            font-family: {t.font_family};
-            font-size: {t.font_size_base}px;
-        }}
-
-        QTabBar::tab:selected {{
-            background-color: {c.bg_tertiary};
-            color: {c.text_primary};
-        }}
-
-        QTabBar::tab:hover:!selected {{
-            background-color: {c.bg_hover};
-        }}
+        Rendered once per set of theme values (frozen, hashable dataclasses);
+        later calls return the cached string.
         """
+        return _build_stylesheet(cls.colors, cls.typography, cls.spacing, cls.radius)
+
+
+# Application stylesheet. A plain template rather than an f-string: parsed
+# once at import, then filled by a single str.format pass per theme
+_STYLESHEET_TEMPLATE = """
+    /* === BASE STYLES === */
+    QMainWindow {{
+        background-color: {c.bg_primary};
+    }}
+
+    QWidget {{
+        background-color: transparent;
+        color: {c.text_primary};
+        font-family: {t.font_family};
+        font-size: {t.font_size_base}px;
+    }}
+
+    /* === BUTTONS === */
+    QPushButton {{
+        background-color: {c.bg_tertiary};
+        color: {c.text_primary};
+        border: 1px solid {c.border};
+        border-radius: {r.sm}px;
+        padding: {s.sm}px {s.lg}px;
+        font-family: {t.font_family};
+        font-size: {t.font_size_base}px;
+        font-weight: 500;
+    }}
+
+    QPushButton:hover {{
+        background-color: {c.bg_hover};
+        border-color: {c.border_light};
+    }}
+
+    QPushButton:pressed {{
+        background-color: {c.bg_selected};
+    }}
+
+    QPushButton:disabled {{
+        background-color: {c.bg_secondary};
+        color: {c.text_muted};
+    }}
+
+    QPushButton[class="primary"] {{
+        background-color: {c.accent};
+        border-color: {c.accent};
+        color: white;
+    }}
+
+    QPushButton[class="primary"]:hover {{
+        background-color: {c.accent_hover};
+    }}
+
+    QPushButton[class="success"] {{
+        background-color: {c.success};
+        border-color: {c.success};
+        color: white;
+    }}
+
+    QPushButton[class="success"]:hover {{
+        background-color: #16a34a;
+    }}
+
+    QPushButton[class="danger"] {{
+        background-color: {c.error};
+        border-color: {c.error};
+        color: white;
+    }}
+
+    QPushButton[class="danger"]:hover {{
+        background-color: #dc2626;
+    }}
+
+    QPushButton[class="ghost"] {{
+        background-color: transparent;
+        border: none;
+    }}
+
+    QPushButton[class="ghost"]:hover {{
+        background-color: {c.bg_hover};
+    }}
+
+    QPushButton[class="icon"] {{
+        padding: 2px;
+        min-width: 24px;
+        max-width: 24px;
+        min-height: 24px;
+        max-height: 24px;
+        border: 1px solid {c.border};
+        background-color: {c.bg_secondary};
+        border-radius: 4px;
+    }}
+
+    QPushButton[class="icon"]:hover {{
+        background-color: {c.bg_hover};
+        border-color: {c.border_light};
+    }}
+
+    QPushButton[class="icon"]:pressed {{
+        background-color: {c.accent};
+        border-color: {c.accent};
+    }}
+
+    /* === INPUTS === */
+    QLineEdit {{
+        background-color: {c.bg_tertiary};
+        color: {c.text_primary};
+        border: 1px solid {c.border};
+        border-radius: {r.sm}px;
+        padding: {s.sm}px {s.md}px;
+        font-family: {t.font_family};
+        font-size: {t.font_size_base}px;
+        selection-background-color: {c.accent};
+    }}
+
+    QLineEdit:focus {{
+        border-color: {c.accent};
+    }}
+
+    QLineEdit[error="true"] {{
+        border-color: {c.error};
+    }}
+
+    QLineEdit:disabled {{
+        background-color: {c.bg_secondary};
+        color: {c.text_muted};
+    }}
+
+    QTextEdit {{
+        background-color: {c.bg_tertiary};
+        color: {c.text_primary};
+        border: 1px solid {c.border};
+        border-radius: {r.sm}px;
+        padding: {s.sm}px;
+        font-family: {t.font_family};
+        font-size: {t.font_size_base}px;
+        selection-background-color: {c.accent};
+    }}
+
+    QTextEdit:focus {{
+        border-color: {c.accent};
+    }}
+
+    QTextEdit[error="true"] {{
+        border-color: {c.error};
+    }}
+
+    /* === COMBOBOX === */
+    QComboBox {{
+        background-color: {c.bg_tertiary};
+        color: {c.text_primary};
+        border: 1px solid {c.border};
+        border-radius: {r.sm}px;
+        padding: {s.sm}px {s.md}px;
+        font-family: {t.font_family};
+        font-size: {t.font_size_base}px;
+        min-width: 80px;
+    }}
+
+    QComboBox:hover {{
+        border-color: {c.border_light};
+    }}
+
+    QComboBox:focus {{
+        border-color: {c.accent};
+    }}
+
+    QComboBox::drop-down {{
+        subcontrol-origin: padding;
+        subcontrol-position: top right;
+        width: 28px;
+        border-left: 1px solid {c.border};
+        background: {c.bg_secondary};
+    }}
+
+    QComboBox::drop-down:hover {{
+        background: {c.bg_hover};
+    }}
+
+    QComboBox::down-arrow {{
+        image: url("{down_arrow_svg}");
+        width: 12px;
+        height: 12px;
+    }}
+
+    QComboBox QAbstractItemView {{
+        background-color: {c.bg_tertiary};
+        border: 1px solid {c.border};
+        border-radius: {r.sm}px;
+        selection-background-color: {c.accent};
+        font-family: {t.font_family};
+    }}
+
+    /* === INLINE ALERT === */
+    QFrame#inlineAlert {{
+        background-color: {c.bg_secondary};
+        border: 1px solid {c.error};
+        border-radius: {r.sm}px;
+    }}
+
+    QLabel#inlineAlertTitle {{
+        color: {c.error};
+        font-weight: 700;
+    }}
+
+    QLabel#inlineAlertMessage {{
+        color: {c.error};
+    }}
+
+    /* === SPINBOX === */
+    QSpinBox {{
+        background-color: {c.bg_tertiary};
+        color: {c.text_primary};
+        border: 1px solid {c.border};
+        border-radius: {r.sm}px;
+        padding: {s.sm}px {s.md}px;
+        font-family: {t.font_family};
+        font-size: {t.font_size_base}px;
+    }}
+
+    QSpinBox:focus {{
+        border-color: {c.accent};
+    }}
+
+    /* === TABLE === */
+    QTableWidget {{
+        background-color: {c.bg_secondary};
+        alternate-background-color: {c.bg_tertiary};
+        border: 1px solid {c.border};
+        border-radius: {r.sm}px;
+        gridline-color: transparent;
+        font-family: {t.font_family};
+        font-size: {t.font_size_base}px;
+        outline: none;
+    }}
+
+    QTableWidget::item {{
+        padding: {s.sm}px {s.md}px;
+        border: none;
+        border-bottom: 1px solid {c.border};
+    }}
+
+    QTableWidget::item:selected {{
+        background-color: {c.bg_selected};
+        color: {c.text_primary};
+    }}
+
+    QTableWidget::item:hover:!selected {{
+        background-color: {c.bg_hover};
+    }}
+
+    QTableWidget::item:focus {{
+        outline: none;
+        border: none;
+    }}
+
+    QHeaderView {{
+        background-color: transparent;
+    }}
+
+    QHeaderView::section {{
+        background-color: {c.bg_tertiary};
+        color: {c.text_secondary};
+        border: none;
+        border-bottom: 1px solid {c.border};
+        border-right: 1px solid {c.border};
+        padding: {s.md}px {s.md}px;
+        font-family: {t.font_family};
+        font-size: {t.font_size_sm}px;
+        font-weight: 600;
+        text-transform: uppercase;
+    }}
+
+    QHeaderView::section:last {{
+        border-right: none;
+    }}
+
+    QHeaderView::section:first {{
+        border-top-left-radius: {r.sm}px;
+    }}
+
+    QHeaderView::section:only-one {{
+        border-top-left-radius: {r.sm}px;
+        border-top-right-radius: {r.sm}px;
+    }}
+
+    /* Table corner button */
+    QTableCornerButton::section {{
+        background-color: {c.bg_tertiary};
+        border: none;
+        border-bottom: 1px solid {c.border};
+    }}
+
+    /* Scrollbar inside table */
+    QTableWidget QScrollBar:vertical {{
+        background-color: {c.bg_secondary};
+        width: 8px;
+        border-radius: 4px;
+        margin: 0;
+    }}
+
+    QTableWidget QScrollBar::handle:vertical {{
+        background-color: {c.border_light};
+        border-radius: 4px;
+        min-height: 30px;
+    }}
+
+    QTableWidget QScrollBar::handle:vertical:hover {{
+        background-color: {c.text_muted};
+    }}
+
+    QTableWidget QScrollBar::add-line:vertical,
+    QTableWidget QScrollBar::sub-line:vertical {{
+        height: 0;
+    }}
+
+    /* === CARDS / PANELS === */
+    QFrame[class="card"] {{
+        background-color: {c.bg_secondary};
+        border: 1px solid {c.border};
+        border-radius: {r.sm}px;
+        padding: {s.lg}px;
+    }}
+
+    QFrame[class="panel"] {{
+        background-color: {c.bg_tertiary};
+        border: 1px solid {c.border};
+        border-radius: {r.sm}px;
+        padding: {s.md}px;
+    }}
+
+    QFrame#addProxyFrame {{
+        background-color: {c.bg_secondary};
+        border: 1px solid {c.border};
+        border-radius: {r.sm}px;
+    }}
+
+    /* === LABELS === */
+    QLabel {{
+        color: {c.text_primary};
+        font-family: {t.font_family};
+        font-size: {t.font_size_base}px;
+    }}
+
+    QLabel[class="heading"] {{
+        font-size: {t.font_size_xl}px;
+        font-weight: 600;
+    }}
+
+    QLabel[class="subheading"] {{
+        font-size: {t.font_size_lg}px;
+        font-weight: 500;
+    }}
+
+    QLabel[class="muted"] {{
+        color: {c.text_muted};
+        font-size: {t.font_size_sm}px;
+    }}
+
+    QLabel[class="secondary"] {{
+        color: {c.text_secondary};
+    }}
+
+    /* === STATUS BADGES === */
+    QLabel[class="badge"] {{
+        border-radius: {r.sm}px;
+        padding: {s.xs}px {s.sm}px;
+        font-size: {t.font_size_sm}px;
+        font-weight: 600;
+    }}
+
+    QLabel[class="badge-success"] {{
+        background-color: {c.success};
+        color: white;
+        border-radius: {r.sm}px;
+        padding: {s.xs}px {s.sm}px;
+        font-size: {t.font_size_sm}px;
+        font-weight: 600;
+    }}
+
+    QLabel[class="badge-error"] {{
+        background-color: {c.error};
+        color: white;
+        border-radius: {r.sm}px;
+        padding: {s.xs}px {s.sm}px;
+        font-size: {t.font_size_sm}px;
+        font-weight: 600;
+    }}
+
+    QLabel[class="badge-muted"] {{
+        background-color: {c.text_muted};
+        color: white;
+        border-radius: {r.sm}px;
+        padding: {s.xs}px {s.sm}px;
+        font-size: {t.font_size_sm}px;
+        font-weight: 600;
+    }}
+
+    /* === TAGS === */
+    QLabel[class="tag"] {{
+        background-color: {c.tag_bg};
+        color: {c.tag_text};
+        border-radius: {r.sm}px;
+        padding: 2px {s.sm}px;
+        font-size: {t.font_size_sm}px;
+    }}
+
+    /* === SCROLLBAR === */
+    QScrollBar:vertical {{
+        background-color: {c.bg_primary};
+        width: 8px;
+        border-radius: {r.sm}px;
+    }}
+
+    QScrollBar::handle:vertical {{
+        background-color: {c.border_light};
+        border-radius: {r.sm}px;
+        min-height: 40px;
+    }}
+
+    QScrollBar::handle:vertical:hover {{
+        background-color: {c.text_muted};
+    }}
+
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
+        height: 0;
+    }}
+
+    QScrollBar:horizontal {{
+        background-color: {c.bg_primary};
+        height: 8px;
+        border-radius: {r.sm}px;
+    }}
+
+    QScrollBar::handle:horizontal {{
+        background-color: {c.border_light};
+        border-radius: {r.sm}px;
+        min-width: 40px;
+    }}
+
+    QScrollBar::handle:horizontal:hover {{
+        background-color: {c.text_muted};
+    }}
+
+    QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
+        width: 0;
+    }}
+
+    /* === CHECKBOX === */
+    QCheckBox {{
+        color: {c.text_primary};
+        font-family: {t.font_family};
+        font-size: {t.font_size_base}px;
+        spacing: {s.sm}px;
+    }}
+
+    QCheckBox::indicator {{
+        width: 18px;
+        height: 18px;
+        border-radius: {r.sm}px;
+        border: 1px solid {c.border};
+        background-color: {c.bg_tertiary};
+    }}
+
+    QCheckBox::indicator:checked {{
+        background-color: {c.accent};
+        border-color: {c.accent};
+    }}
+
+    QCheckBox::indicator:hover {{
+        border-color: {c.border_light};
+    }}
+
+    /* === GROUPBOX === */
+    QGroupBox {{
+        border: 1px solid {c.border};
+        border-radius: {r.sm}px;
+        margin-top: {s.md}px;
+        padding-top: {s.md}px;
+        font-family: {t.font_family};
+    }}
+
+    QGroupBox::title {{
+        color: {c.text_secondary};
+        subcontrol-origin: margin;
+        subcontrol-position: top left;
+        left: {s.md}px;
+        padding: 0 {s.xs}px;
+    }}
+
+    /* === MENU === */
+    QMenu {{
+        background-color: {c.bg_tertiary};
+        border: 1px solid {c.border};
+        border-radius: {r.lg}px;
+        padding: {s.xs}px;
+        font-family: {t.font_family};
+    }}
+
+    QMenu::item {{
+        padding: {s.sm}px {s.xl}px;
+        border-radius: {r.md}px;
+    }}
+
+    QMenu::item:selected {{
+        background-color: {c.accent};
+    }}
+
+    QMenu::separator {{
+        height: 1px;
+        background-color: {c.border};
+        margin: {s.xs}px {s.sm}px;
+    }}
+
+    /* === DIALOG === */
+    QDialog {{
+        background-color: {c.bg_tertiary};
+        border-radius: {r.lg}px;
+    }}
+
+    /* === TOOLTIP === */
+    QToolTip {{
+        background-color: {c.bg_tertiary};
+        color: {c.text_primary};
+        border: 1px solid {c.border};
+        border-radius: {r.sm}px;
+        padding: {s.xs}px {s.sm}px;
+        font-family: {t.font_family};
+        font-size: {t.font_size_sm}px;
+    }}
+
+    /* === SIDEBAR === */
+    #sidebar {{
+        background-color: {c.bg_secondary};
+        border-right: 1px solid {c.border};
+    }}
+
+    #miniSidebar {{
+        background-color: {c.bg_tertiary};
+        border-right: 1px solid {c.border};
+    }}
+
+    /* === HEADER === */
+    #header {{
+        background-color: {c.bg_tertiary};
+        border-bottom: 1px solid {c.border};
+    }}
+
+    /* === FOOTER === */
+    #footer {{
+        background-color: {c.bg_secondary};
+        border-top: 1px solid {c.border};
+    }}
+
+    /* === SPLITTER === */
+    QSplitter::handle {{
+        background-color: {c.border};
+    }}
+
+    QSplitter::handle:horizontal {{
+        width: 1px;
+    }}
+
+    QSplitter::handle:vertical {{
+        height: 1px;
+    }}
+
+    /* === TAB WIDGET === */
+    QTabWidget::pane {{
+        border: 1px solid {c.border};
+        border-radius: {r.sm}px;
+        background-color: {c.bg_tertiary};
+    }}
+
+    QTabBar::tab {{
+        background-color: {c.bg_secondary};
+        color: {c.text_secondary};
+        border: 1px solid {c.border};
+        border-bottom: none;
+        border-top-left-radius: {r.sm}px;
+        border-top-right-radius: {r.sm}px;
+        padding: {s.sm}px {s.lg}px;
+        font-family: {t.font_family};
+        font-size: {t.font_size_base}px;
+    }}
+
+    QTabBar::tab:selected {{
+        background-color: {c.bg_tertiary};
+        color: {c.text_primary};
+    }}
+
+    QTabBar::tab:hover:!selected {{
+        background-color: {c.bg_hover};
+    }}
+    """
+
+
+@functools.lru_cache(maxsize=4)
+def _build_stylesheet(c: Colors, t: Typography, s: Spacing, r: BorderRadius) -> str:
+    """Render the application stylesheet for one set of theme values."""
+    down_arrow_svg = (
+        "data:image/svg+xml;utf8,"
+        "<svg xmlns='http://www.w3.org/2000/svg' width='12' height='12' viewBox='0 0 24 24'>"
+        f"<path fill='{c.text_secondary.replace('#', '%23')}' d='M7 10l5 5 5-5z'/>"
+        "</svg>"
+    )
+
+    return _STYLESHEET_TEMPLATE.format(c=c, t=t, s=s, r=r, down_arrow_svg=down_arrow_svg)
 
 
 # Convenience access
@@ -1,5 +1,6 @@
 """System tray icon for Antidetect Launcher."""
 
+import functools
 import logging
 import sys
 from pathlib import Path
@@ -11,15 +12,14 @@ from PyQt6.QtWidgets import QMenu, QSystemTrayIcon
 logger = logging.getLogger(__name__)
 
 
-def find_icon(name: str) -> QIcon:
-    """Find icon file from resources, handling dev and installed modes.
+# Search roots, resolved once at import
+_RESOURCES_DIR = Path(__file__).resolve().parent.parent / "resources"
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
 
-    Search order:
-    1. PyInstaller bundle (_MEIPASS)
-    2. Package resources (relative to this file)
-    3. Project assets/ (dev mode)
-    4. Build icons (PNG fallback)
-    """
+
+@functools.lru_cache(maxsize=32)
+def _find_icon_path(name: str) -> Path | None:
+    """Resolve icon file path (memoized - each candidate costs a stat)."""
     candidates: list[Path] = []
 
     # 1. PyInstaller bundle
@@ -28,19 +28,32 @@ def find_icon(name: str) -> QIcon:
         candidates.append(meipass / "antidetect_launcher" / "resources" / name)
 
     # 2. Package resources
-    resources_dir = Path(__file__).resolve().parent.parent / "resources"
-    candidates.append(resources_dir / name)
+    candidates.append(_RESOURCES_DIR / name)
 
     # 3. Project assets/ (dev mode)
-    project_root = Path(__file__).resolve().parent.parent.parent.parent
-    candidates.append(project_root / "assets" / "icons" / name)
+    candidates.append(_PROJECT_ROOT / "assets" / "icons" / name)
 
     # 4. Build icons PNG fallback
-    candidates.append(project_root / "build" / "icons" / "linux" / "icon_128x128.png")
+    candidates.append(_PROJECT_ROOT / "build" / "icons" / "linux" / "icon_128x128.png")
 
     for path in candidates:
         if path.exists():
-            return QIcon(str(path))
+            return path
+    return None
+
+
+def find_icon(name: str) -> QIcon:
+    """Find icon file from resources, handling dev and installed modes.
+
+    Search order:
+    1. PyInstaller bundle (_MEIPASS)
+    2. Package resources (relative to this file)
+    3. Project assets/ (dev mode)
+    4. Build icons (PNG fallback)
+    """
+    path = _find_icon_path(name)
+    if path is not None:
+        return QIcon(str(path))
 
     logger.warning("Icon not found: %s", name)
     return QIcon()
@@ -2,7 +2,7 @@
 
 import asyncio
 import random
-from collections import deque
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Sequence
@@ -34,16 +34,78 @@ class ProxyManager(ProxyManagerPort):
         validation_timeout: int,
         max_retries: int,
         retry_delay: int,
+        validation_concurrency: int = 64,
+        revalidate_ttl: float = 300.0,
     ) -> None:
         self._rotation_strategy = rotation_strategy
         self._validation_timeout = validation_timeout
         self._max_retries = max_retries
         self._retry_delay = retry_delay
+        self._validation_concurrency = validation_concurrency
+        self._revalidate_ttl = revalidate_ttl
 
         self._proxies: dict[str, ProxyEntry] = {}
-        self._available: deque[str] = deque()
+        # Available keys plus key -> position, so selection is an index and
+        # removal is swap-with-last + pop (both O(1))
+        self._available: list[str] = []
+        self._available_pos: dict[str, int] = {}
         self._lock = asyncio.Lock()
         self._round_robin_index = 0
+        # Kept in step with the entries so get_stats needn't scan or lock
+        self._status_counts: dict[ProxyStatus, int] = {status: 0 for status in ProxyStatus}
+        self._in_use_count = 0
+        # Shared by all validations (keep-alive, DNS cache); created lazily
+        self._session: aiohttp.ClientSession | None = None
+
+    def _add_available(self, key: str) -> None:
+        """Mark proxy as available (no-op if already)."""
+        if key not in self._available_pos:
+            self._available_pos[key] = len(self._available)
+            self._available.append(key)
+
+    def _remove_available(self, key: str) -> None:
+        """Mark proxy as unavailable (no-op if not available)."""
+        pos = self._available_pos.pop(key, None)
+        if pos is None:
+            return
+        last = self._available.pop()
+        if last != key:
+            # Move the last key into the freed slot
+            self._available[pos] = last
+            self._available_pos[last] = pos
+
+    def _set_status(self, entry: ProxyEntry, status: ProxyStatus) -> None:
+        """Change an entry's status, keeping the status counters in step."""
+        self._status_counts[entry.status] -= 1
+        self._status_counts[status] += 1
+        entry.status = status
+
+    def _set_in_use(self, entry: ProxyEntry, in_use: bool) -> None:
+        """Change an entry's in-use flag, keeping the counter in step."""
+        if entry.in_use != in_use:
+            self._in_use_count += 1 if in_use else -1
+            entry.in_use = in_use
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared validation session, creating it on first use."""
+        async with self._lock:
+            if self._session is None or self._session.closed:
+                self._session = aiohttp.ClientSession(
+                    timeout=aiohttp.ClientTimeout(total=self._validation_timeout),
+                    connector=aiohttp.TCPConnector(
+                        limit=256,
+                        ttl_dns_cache=300,
+                        ssl=False,
+                    ),
+                )
+            return self._session
+
+    async def close(self) -> None:
+        """Close the shared validation session."""
+        async with self._lock:
+            session, self._session = self._session, None
+        if session is not None and not session.closed:
+            await session.close()
 
     async def load_proxies(self, source: str) -> int:
         """Load proxies from file."""
@@ -68,7 +130,8 @@ class ProxyManager(ProxyManagerPort):
                     key = proxy.url
                     if key not in self._proxies:
                         self._proxies[key] = ProxyEntry(config=proxy)
-                        self._available.append(key)
+                        self._status_counts[ProxyStatus.UNKNOWN] += 1
+                        self._add_available(key)
                         count += 1
                 except ValueError:
                     continue
@@ -81,18 +144,19 @@ class ProxyManager(ProxyManagerPort):
             if not self._available:
                 return None
 
+            available = self._available
             if self._rotation_strategy == "random":
-                key = random.choice(list(self._available))
+                key = available[random.randrange(len(available))]
             elif self._rotation_strategy == "round_robin":
-                if self._round_robin_index >= len(self._available):
+                if self._round_robin_index >= len(available):
                     self._round_robin_index = 0
-                key = list(self._available)[self._round_robin_index]
+                key = available[self._round_robin_index]
                 self._round_robin_index += 1
             else:
-                key = self._available[0]
+                key = available[0]
 
             entry = self._proxies[key]
-            entry.in_use = True
+            self._set_in_use(entry, True)
             entry.use_count += 1
 
             return entry.config
@@ -102,7 +166,7 @@ class ProxyManager(ProxyManagerPort):
         key = proxy.url
         async with self._lock:
             if key in self._proxies:
-                self._proxies[key].in_use = False
+                self._set_in_use(self._proxies[key], False)
 
     async def mark_proxy_status(
         self,
@@ -114,47 +178,79 @@ class ProxyManager(ProxyManagerPort):
         async with self._lock:
             if key in self._proxies:
                 entry = self._proxies[key]
-                entry.status = status
+                self._set_status(entry, status)
 
                 if status in (ProxyStatus.INVALID, ProxyStatus.BANNED):
                     entry.fail_count += 1
-                    if key in self._available:
-                        self._available.remove(key)
+                    self._remove_available(key)
+
+    async def validate_proxy(
+        self,
+        proxy: ProxyConfig,
+        session: aiohttp.ClientSession | None = None,
+    ) -> ProxyStatus:
+        """Validate proxy connectivity.
 
-    async def validate_proxy(self, proxy: ProxyConfig) -> ProxyStatus:
-        """Validate proxy connectivity."""
+        Uses ``session`` when given, otherwise the manager's shared session.
+        """
         try:
-            timeout = aiohttp.ClientTimeout(total=self._validation_timeout)
-            connector = aiohttp.TCPConnector(ssl=False)
-
-            async with aiohttp.ClientSession(
-                timeout=timeout,
-                connector=connector,
-            ) as session:
-                async with session.get(
-                    "https://httpbin.org/ip",
-                    proxy=proxy.url,
-                ) as response:
-                    if response.status == 200:
-                        return ProxyStatus.VALID
-                    return ProxyStatus.INVALID
+            if session is None:
+                session = await self._get_session()
+            return await self._check_proxy(session, proxy)
         except asyncio.TimeoutError:
             return ProxyStatus.SLOW
         except Exception:
             return ProxyStatus.INVALID
 
+    async def _check_proxy(
+        self,
+        session: aiohttp.ClientSession,
+        proxy: ProxyConfig,
+    ) -> ProxyStatus:
+        """Request the check URL through ``proxy``."""
+        async with session.get(
+            "https://httpbin.org/ip",
+            proxy=proxy.url,
+        ) as response:
+            if response.status == 200:
+                return ProxyStatus.VALID
+            return ProxyStatus.INVALID
+
     async def validate_all(self) -> dict[ProxyStatus, int]:
-        """Validate all proxies concurrently."""
+        """Validate all proxies, at most ``validation_concurrency`` at a time.
+
+        Proxies found VALID or SLOW within the last ``revalidate_ttl``
+        seconds keep their status without a new probe.
+        """
+        stats: dict[ProxyStatus, int] = {status: 0 for status in ProxyStatus}
+        now = time.monotonic()
+        to_check = []
+        async with self._lock:
+            for key, entry in self._proxies.items():
+                if (
+                    entry.last_validated
+                    and entry.status in (ProxyStatus.VALID, ProxyStatus.SLOW)
+                    and now - entry.last_validated < self._revalidate_ttl
+                ):
+                    stats[entry.status] += 1
+                else:
+                    to_check.append(key)
+
+        if not to_check:
+            return stats
+
+        sem = asyncio.Semaphore(self._validation_concurrency)
+        session = await self._get_session()
 
         async def validate_one(key: str) -> tuple[str, ProxyStatus]:
-            entry = self._proxies[key]
-            status = await self.validate_proxy(entry.config)
-            return key, status
+            async with sem:
+                entry = self._proxies[key]
+                status = await self.validate_proxy(entry.config, session)
+                return key, status
 
-        tasks = [validate_one(key) for key in list(self._proxies.keys())]
+        tasks = [validate_one(key) for key in to_check]
         results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        stats: dict[ProxyStatus, int] = {status: 0 for status in ProxyStatus}
+        validated_at = time.monotonic()
 
         async with self._lock:
             for result in results:
@@ -162,31 +258,30 @@ class ProxyManager(ProxyManagerPort):
                     continue
                 key, status = result
                 if key in self._proxies:
-                    self._proxies[key].status = status
+                    entry = self._proxies[key]
+                    self._set_status(entry, status)
+                    entry.last_validated = validated_at
                     stats[status] += 1
 
                     if status == ProxyStatus.VALID:
-                        if key not in self._available:
-                            self._available.append(key)
+                        self._add_available(key)
                     else:
-                        if key in self._available:
-                            self._available.remove(key)
+                        self._remove_available(key)
 
         return stats
 
     async def get_stats(self) -> dict[str, int]:
-        """Get proxy pool statistics."""
-        async with self._lock:
-            status_counts = {status.value: 0 for status in ProxyStatus}
-            for entry in self._proxies.values():
-                status_counts[entry.status.value] += 1
-
-            return {
-                "total": len(self._proxies),
-                "available": len(self._available),
-                "in_use": sum(1 for e in self._proxies.values() if e.in_use),
-                **status_counts,
-            }
+        """Get proxy pool statistics.
+
+        Reads the maintained counters without taking the lock - there is
+        no await in between, so the snapshot is consistent.
+        """
+        return {
+            "total": len(self._proxies),
+            "available": len(self._available),
+            "in_use": self._in_use_count,
+            **{status.value: count for status, count in self._status_counts.items()},
+        }
 
     async def remove_invalid(self) -> int:
         """Remove all invalid proxies."""
@@ -198,8 +293,9 @@ class ProxyManager(ProxyManagerPort):
             ]
 
             for key in to_remove:
-                del self._proxies[key]
-                if key in self._available:
-                    self._available.remove(key)
+                entry = self._proxies.pop(key)
+                self._status_counts[entry.status] -= 1
+                self._set_in_use(entry, False)
+                self._remove_available(key)
 
             return len(to_remove)
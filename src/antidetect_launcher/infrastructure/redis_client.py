@@ -31,6 +31,9 @@ class RedisClient:
 
         self._pool: redis.ConnectionPool | None = None
         self._client: redis.Redis | None = None
+        # Dedicated connection for blocking commands (BLMOVE), so they never
+        # hold connections of the shared pool
+        self._blocking_client: redis.Redis | None = None
 
     async def connect(self) -> None:
         """Initialize connection pool."""
@@ -45,11 +48,23 @@ class RedisClient:
             decode_responses=True,
         )
         self._client = redis.Redis(connection_pool=self._pool)
+        self._blocking_client = redis.Redis(
+            host=self._host,
+            port=self._port,
+            password=self._password,
+            db=self._db,
+            socket_connect_timeout=self._connection_timeout,
+            socket_timeout=self._connection_timeout,
+            decode_responses=True,
+            single_connection_client=True,
+        )
 
         await self._client.ping()
 
     async def disconnect(self) -> None:
         """Close connection pool."""
+        if self._blocking_client:
+            await self._blocking_client.close()
         if self._client:
             await self._client.close()
         if self._pool:
@@ -148,6 +163,18 @@ class RedisClient:
             raise RuntimeError("Redis client not connected")
         return self._client.pipeline()
 
+    @property
+    def connection_timeout(self) -> int:
+        """Socket timeout in seconds (upper bound for blocking commands)."""
+        return self._connection_timeout
+
+    @property
+    def blocking_client(self) -> redis.Redis:
+        """Get the single-connection client reserved for blocking commands."""
+        if not self._blocking_client:
+            raise RuntimeError("Redis client not connected")
+        return self._blocking_client
+
     @property
     def client(self) -> redis.Redis:
         """Get raw client for advanced operations."""
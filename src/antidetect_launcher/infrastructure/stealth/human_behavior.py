@@ -27,9 +27,13 @@ async def type_like_human(page: Page, selector: str, text: str) -> None:
     await element.click()
     await human_delay(100, 300)
 
-    for char in text:
-        await page.keyboard.type(char)
-        await human_typing_delay()
+    # Short runs of characters per call - Playwright applies the per-key
+    # delay itself, and the delay still varies from run to run
+    pos = 0
+    while pos < len(text):
+        run = random.randint(3, 7)
+        await page.keyboard.type(text[pos : pos + run], delay=random.randint(50, 150))
+        pos += run
 
 
 async def click_like_human(page: Page, selector: str) -> None:
@@ -51,6 +55,31 @@ async def click_like_human(page: Page, selector: str) -> None:
     await page.mouse.click(target_x, target_y)
 
 
+def _bezier_path(
+    start_x: float,
+    start_y: float,
+    control_x: float,
+    control_y: float,
+    target_x: float,
+    target_y: float,
+    steps: int,
+) -> list[tuple[float, float]]:
+    """Points of a quadratic Bezier curve, ``steps + 1`` of them."""
+    path = []
+    for i in range(steps + 1):
+        t = i / steps
+        a = (1 - t) ** 2
+        b = 2 * (1 - t) * t
+        c = t * t
+        path.append(
+            (
+                a * start_x + b * control_x + c * target_x,
+                a * start_y + b * control_y + c * target_y,
+            )
+        )
+    return path
+
+
 async def move_mouse_human(
     page: Page,
     target_x: float,
@@ -64,14 +93,14 @@ async def move_mouse_human(
     control_x = (start_x + target_x) / 2 + random.uniform(-50, 50)
     control_y = (start_y + target_y) / 2 + random.uniform(-50, 50)
 
-    for i in range(steps + 1):
-        t = i / steps
-
-        x = (1 - t) ** 2 * start_x + 2 * (1 - t) * t * control_x + t**2 * target_x
-        y = (1 - t) ** 2 * start_y + 2 * (1 - t) * t * control_y + t**2 * target_y
+    # Whole path and pauses up front - the loop below only awaits
+    path = _bezier_path(start_x, start_y, control_x, control_y, target_x, target_y, steps)
+    pauses = [random.uniform(0.01, 0.03) for _ in range(steps + 1)]
 
-        await page.mouse.move(x, y)
-        await asyncio.sleep(random.uniform(0.01, 0.03))
+    move = page.mouse.move
+    for (x, y), pause in zip(path, pauses, strict=True):
+        await move(x, y)
+        await asyncio.sleep(pause)
 
 
 async def scroll_like_human(
@@ -81,17 +110,25 @@ async def scroll_like_human(
 ) -> None:
     """Scroll with human-like behavior."""
     step_size = random.randint(50, 150)
-    current = 0
-
-    while current < amount:
-        scroll = min(step_size, amount - current)
-        if direction == "down":
-            await page.mouse.wheel(0, scroll)
+    sign = 1 if direction == "down" else -1
+
+    # Schedule up front: full steps plus the remainder, with small
+    # neighbouring steps merged so each wheel event stays under 200px
+    wheels: list[int] = []
+    remaining = amount
+    while remaining > 0:
+        scroll = min(step_size, remaining)
+        if wheels and wheels[-1] + scroll < 200:
+            wheels[-1] += scroll
         else:
-            await page.mouse.wheel(0, -scroll)
-
-        current += scroll
-        await asyncio.sleep(random.uniform(0.02, 0.08))
+            wheels.append(scroll)
+        remaining -= scroll
+    pauses = [random.uniform(0.02, 0.08) for _ in wheels]
+
+    wheel = page.mouse.wheel
+    for scroll, pause in zip(wheels, pauses, strict=True):
+        await wheel(0, sign * scroll)
+        await asyncio.sleep(pause)
 
 
 async def random_mouse_movement(page: Page, count: int = 3) -> None:
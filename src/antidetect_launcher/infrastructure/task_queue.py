@@ -1,14 +1,22 @@
 """Redis-based task queue implementation."""
 
-import json
+import asyncio
 from datetime import datetime
-from typing import Sequence
+from typing import Any, Sequence
+
+import orjson
 
 from ..domain.interfaces import TaskQueuePort
 from ..domain.models import Task, TaskResult, TaskStatus
 from .redis_client import RedisClient
 
 
+def _dumps(value: Any) -> str:
+    """Encode a JSON field (the client decodes responses, so store str)."""
+    # NON_STR_KEYS keeps json.dumps' int-key behaviour for metadata/data
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 class RedisTaskQueue(TaskQueuePort):
     """Task queue backed by Redis."""
 
@@ -16,9 +24,19 @@ class RedisTaskQueue(TaskQueuePort):
     RUNNING_KEY = "tasks:running"
     TASK_PREFIX = "task:"
     RESULT_PREFIX = "result:"
-
-    def __init__(self, redis_client: RedisClient) -> None:
+    BATCH_CHUNK_SIZE = 500
+
+    def __init__(self, redis_client: RedisClient, block_timeout: float = 1.0) -> None:
+        if not 0 < block_timeout < redis_client.connection_timeout:
+            # 0 would block forever; at the socket timeout the read times out
+            raise ValueError(
+                f"block_timeout must be between 0 and the Redis connection "
+                f"timeout ({redis_client.connection_timeout}s), got {block_timeout}"
+            )
         self._redis = redis_client
+        self._block_timeout = block_timeout
+        # Workers take turns on the one blocking connection
+        self._dequeue_lock = asyncio.Lock()
 
     def _task_to_dict(self, task: Task) -> dict:
         """Serialize task to dict."""
@@ -32,7 +50,7 @@ class RedisTaskQueue(TaskQueuePort):
             "retry_count": str(task.retry_count),
             "max_retries": str(task.max_retries),
             "timeout": str(task.timeout),
-            "metadata": json.dumps(task.metadata),
+            "metadata": _dumps(task.metadata),
             "started_at": task.started_at.isoformat() if task.started_at else "",
             "completed_at": task.completed_at.isoformat() if task.completed_at else "",
             "error_message": task.error_message or "",
@@ -50,7 +68,7 @@ class RedisTaskQueue(TaskQueuePort):
             retry_count=int(data["retry_count"]),
             max_retries=int(data["max_retries"]),
             timeout=int(data["timeout"]),
-            metadata=json.loads(data["metadata"]) if data.get("metadata") else {},
+            metadata=orjson.loads(data["metadata"]) if data.get("metadata") else {},
             started_at=(
                 datetime.fromisoformat(data["started_at"])
                 if data.get("started_at")
@@ -70,10 +88,10 @@ class RedisTaskQueue(TaskQueuePort):
             "task_id": result.task_id,
             "success": str(result.success),
             "duration_seconds": str(result.duration_seconds),
-            "data": json.dumps(result.data),
+            "data": _dumps(result.data),
             "error": result.error or "",
-            "screenshots": json.dumps(result.screenshots),
-            "logs": json.dumps(result.logs),
+            "screenshots": _dumps(result.screenshots),
+            "logs": _dumps(result.logs),
         }
 
     def _dict_to_result(self, data: dict) -> TaskResult:
@@ -82,14 +100,14 @@ class RedisTaskQueue(TaskQueuePort):
             task_id=data["task_id"],
             success=data["success"] == "True",
             duration_seconds=float(data["duration_seconds"]),
-            data=json.loads(data["data"]) if data.get("data") else {},
+            data=orjson.loads(data["data"]) if data.get("data") else {},
             error=data.get("error") or None,
             screenshots=(
-                tuple(json.loads(data["screenshots"]))
+                tuple(orjson.loads(data["screenshots"]))
                 if data.get("screenshots")
                 else ()
             ),
-            logs=tuple(json.loads(data["logs"])) if data.get("logs") else (),
+            logs=tuple(orjson.loads(data["logs"])) if data.get("logs") else (),
         )
 
     async def enqueue(self, task: Task) -> None:
@@ -101,36 +119,67 @@ class RedisTaskQueue(TaskQueuePort):
         await self._redis.lpush(self.PENDING_KEY, task.id)
 
     async def enqueue_batch(self, tasks: Sequence[Task]) -> int:
-        """Add multiple tasks to queue."""
-        count = 0
-        for task in tasks:
-            await self.enqueue(task)
-            count += 1
-        return count
+        """Add multiple tasks to queue.
+
+        Tasks are sent in pipelined chunks - one round trip per chunk instead
+        of two (HSET + LPUSH) per task.
+        """
+        pending_key = self._redis._make_key(self.PENDING_KEY)
+
+        for start in range(0, len(tasks), self.BATCH_CHUNK_SIZE):
+            chunk = tasks[start : start + self.BATCH_CHUNK_SIZE]
+            async with self._redis.client.pipeline(transaction=False) as pipe:
+                for task in chunk:
+                    task.status = TaskStatus.QUEUED
+                    pipe.hset(
+                        self._redis._make_key(f"{self.TASK_PREFIX}{task.id}"),
+                        mapping=self._task_to_dict(task),
+                    )
+                # Same order as per-task LPUSH calls would produce
+                pipe.lpush(pending_key, *[task.id for task in chunk])
+                await pipe.execute()
+
+        return len(tasks)
 
     async def dequeue(self) -> Task | None:
-        """Get next task from queue."""
-        task_id = await self._redis.client.rpoplpush(
-            self._redis._make_key(self.PENDING_KEY),
-            self._redis._make_key(self.RUNNING_KEY),
-        )
+        """Get next task from queue.
+
+        Blocks up to ``block_timeout`` seconds for a task to arrive, so
+        callers don't have to poll an empty queue. The wait runs on the
+        client's dedicated blocking connection, one caller at a time, so
+        idle workers never tie up the shared pool.
+        """
+        async with self._dequeue_lock:
+            task_id = await self._redis.blocking_client.blmove(
+                self._redis._make_key(self.PENDING_KEY),
+                self._redis._make_key(self.RUNNING_KEY),
+                self._block_timeout,
+                src="RIGHT",
+                dest="LEFT",
+            )
 
         if not task_id:
             return None
 
-        task_data = await self._redis.hgetall(f"{self.TASK_PREFIX}{task_id}")
-        if not task_data:
+        # Mark started and read the task back in one round trip
+        task_key = self._redis._make_key(f"{self.TASK_PREFIX}{task_id}")
+        async with self._redis.client.pipeline(transaction=False) as pipe:
+            pipe.hset(
+                task_key,
+                mapping={
+                    "status": TaskStatus.RUNNING.value,
+                    "started_at": datetime.now().isoformat(),
+                },
+            )
+            pipe.hgetall(task_key)
+            _, task_data = await pipe.execute()
+
+        if "id" not in task_data:
+            # Hash was gone - drop the two fields the HSET just created
+            await self._redis.client.delete(task_key)
             return None
 
-        task = self._dict_to_task(task_data)
-        task.mark_started()
-
-        await self._redis.hset(
-            f"{self.TASK_PREFIX}{task.id}",
-            self._task_to_dict(task),
-        )
-
-        return task
+        return self._dict_to_task(task_data)
 
     async def get_task(self, task_id: str) -> Task | None:
         """Get task by ID."""
@@ -185,12 +234,16 @@ class RedisTaskQueue(TaskQueuePort):
         else:
             return tasks
 
-        for task_id in task_ids:
-            task = await self.get_task(task_id)
-            if task:
-                tasks.append(task)
+        if not task_ids:
+            return tasks
+
+        # One round trip for all hashes instead of one HGETALL per task
+        async with self._redis.client.pipeline(transaction=False) as pipe:
+            for task_id in task_ids:
+                pipe.hgetall(self._redis._make_key(f"{self.TASK_PREFIX}{task_id}"))
+            raw_tasks = await pipe.execute()
 
-        return tasks
+        return [self._dict_to_task(data) for data in raw_tasks if data]
 
     async def cancel_task(self, task_id: str) -> bool:
         """Cancel a task."""